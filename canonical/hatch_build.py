@@ -0,0 +1,34 @@
+"""Hatch build hook that packs the canonical registry into the wheel.
+
+Builds ``canonical/_registry.bundle`` from the loose entity, event and
+semantic files so installed workers load the whole registry with one read.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Add the prebuilt registry bundle to wheel builds."""
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if self.target_name != "wheel":
+            return
+
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from canonical.bundle import build_bundle
+        finally:
+            sys.path.pop(0)
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        bundle_file = build_bundle(Path(self._tmpdir.name) / "_registry.bundle")
+        build_data["force_include"][str(bundle_file)] = "canonical/_registry.bundle"
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        tmpdir = getattr(self, "_tmpdir", None)
+        if tmpdir is not None:
+            tmpdir.cleanup()
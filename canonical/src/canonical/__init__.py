@@ -2,24 +2,129 @@
 
 This library provides access to canonical entity schemas, event schemas,
 and semantic constraints used across all services.
+
+Public names are imported lazily on first attribute access, so ``import
+canonical`` itself is cheap for short-lived CLI tools and forked workers.
 """
 
-from canonical.registry import (
-    load_entity_schema,
-    load_event_schema,
-    load_event_envelope_schema,
-    load_semantic_constraints,
-    list_entities,
-    list_entity_versions,
-    list_events,
-    list_event_versions,
-    get_event_schema_path,
-    SchemaNotFoundError,
-    EventNotFoundError,
-    SemanticNotFoundError,
-)
+from importlib import import_module
+
+# Same as typing.TYPE_CHECKING (type checkers treat it as True) without paying
+# for importing typing
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from canonical.registry import (
+        load_entity_schema,
+        load_event_schema,
+        load_event_envelope_schema,
+        load_semantic_constraints,
+        list_entities,
+        list_entity_versions,
+        list_events,
+        list_event_versions,
+        get_event_schema_path,
+        latest_version,
+        SchemaNotFoundError,
+        EventNotFoundError,
+        SemanticNotFoundError,
+    )
+    from canonical.validator import (
+        compile_validator,
+        compile_schema,
+        validate_event,
+        EventValidationResult,
+        SchemaCompileError,
+    )
+    from canonical.batch import validate_events_batch
+    from canonical.stream import validate_ndjson, iter_ndjson_lines, StreamSummary
+    from canonical.parallel import validate_parallel, ParallelSummary, ShardSummary
+    from canonical.frozen import FrozenDict, FrozenList
+    from canonical.warmup import preload, PreloadReport
+    from canonical.reload import refresh, start_watcher, RefreshReport, SchemaWatcher
+    from canonical.constraints import (
+        compile_semantics,
+        compile_rule,
+        parse_rule,
+        SemanticRuleError,
+    )
+    from canonical.columnar import check_columns
+    from canonical.envelope import EnvelopeView, EnvelopeParseError
+    from canonical.codec import set_json_backend, get_json_backend
+    from canonical.builder import EnvelopeBuilder, EnvelopeBuildError
+    from canonical.registry import schema_fingerprint
+    from canonical.memo import ValidationCache, ValidationCacheStats
+    from canonical.dedup import EventDeduplicator, DedupStats
+    from canonical.aio import (
+        aload_entity_schema,
+        aload_event_envelope_schema,
+        aload_event_schema,
+        aload_semantic_constraints,
+        acompile_validator,
+        avalidate_event,
+    )
 
 __version__ = "1.0.0"
+
+# Public name -> module that defines it
+_LAZY_EXPORTS = {
+    "load_entity_schema": "canonical.registry",
+    "load_event_schema": "canonical.registry",
+    "load_event_envelope_schema": "canonical.registry",
+    "load_semantic_constraints": "canonical.registry",
+    "list_entities": "canonical.registry",
+    "list_entity_versions": "canonical.registry",
+    "list_events": "canonical.registry",
+    "list_event_versions": "canonical.registry",
+    "get_event_schema_path": "canonical.registry",
+    "latest_version": "canonical.registry",
+    "SchemaNotFoundError": "canonical.registry",
+    "EventNotFoundError": "canonical.registry",
+    "SemanticNotFoundError": "canonical.registry",
+    "compile_validator": "canonical.validator",
+    "compile_schema": "canonical.validator",
+    "validate_event": "canonical.validator",
+    "EventValidationResult": "canonical.validator",
+    "SchemaCompileError": "canonical.validator",
+    "validate_events_batch": "canonical.batch",
+    "validate_ndjson": "canonical.stream",
+    "iter_ndjson_lines": "canonical.stream",
+    "StreamSummary": "canonical.stream",
+    "validate_parallel": "canonical.parallel",
+    "ParallelSummary": "canonical.parallel",
+    "ShardSummary": "canonical.parallel",
+    "FrozenDict": "canonical.frozen",
+    "FrozenList": "canonical.frozen",
+    "preload": "canonical.warmup",
+    "PreloadReport": "canonical.warmup",
+    "refresh": "canonical.reload",
+    "start_watcher": "canonical.reload",
+    "RefreshReport": "canonical.reload",
+    "SchemaWatcher": "canonical.reload",
+    "compile_semantics": "canonical.constraints",
+    "compile_rule": "canonical.constraints",
+    "parse_rule": "canonical.constraints",
+    "SemanticRuleError": "canonical.constraints",
+    "check_columns": "canonical.columnar",
+    "EnvelopeView": "canonical.envelope",
+    "EnvelopeParseError": "canonical.envelope",
+    "set_json_backend": "canonical.codec",
+    "get_json_backend": "canonical.codec",
+    "EnvelopeBuilder": "canonical.builder",
+    "EnvelopeBuildError": "canonical.builder",
+    "schema_fingerprint": "canonical.registry",
+    "ValidationCache": "canonical.memo",
+    "ValidationCacheStats": "canonical.memo",
+    "EventDeduplicator": "canonical.dedup",
+    "DedupStats": "canonical.dedup",
+    "aload_entity_schema": "canonical.aio",
+    "aload_event_envelope_schema": "canonical.aio",
+    "aload_event_schema": "canonical.aio",
+    "aload_semantic_constraints": "canonical.aio",
+    "acompile_validator": "canonical.aio",
+    "avalidate_event": "canonical.aio",
+}
+
 __all__ = [
     "load_entity_schema",
     "load_event_schema",
@@ -30,7 +135,64 @@ __all__ = [
     "list_events",
     "list_event_versions",
     "get_event_schema_path",
+    "latest_version",
     "SchemaNotFoundError",
     "EventNotFoundError",
     "SemanticNotFoundError",
+    "compile_validator",
+    "compile_schema",
+    "validate_event",
+    "EventValidationResult",
+    "validate_events_batch",
+    "validate_ndjson",
+    "iter_ndjson_lines",
+    "StreamSummary",
+    "validate_parallel",
+    "ParallelSummary",
+    "ShardSummary",
+    "SchemaCompileError",
+    "FrozenDict",
+    "FrozenList",
+    "preload",
+    "PreloadReport",
+    "refresh",
+    "start_watcher",
+    "RefreshReport",
+    "SchemaWatcher",
+    "compile_semantics",
+    "compile_rule",
+    "parse_rule",
+    "SemanticRuleError",
+    "check_columns",
+    "EnvelopeView",
+    "EnvelopeParseError",
+    "set_json_backend",
+    "get_json_backend",
+    "EnvelopeBuilder",
+    "EnvelopeBuildError",
+    "schema_fingerprint",
+    "ValidationCache",
+    "ValidationCacheStats",
+    "EventDeduplicator",
+    "DedupStats",
+    "aload_entity_schema",
+    "aload_event_envelope_schema",
+    "aload_event_schema",
+    "aload_semantic_constraints",
+    "acompile_validator",
+    "avalidate_event",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'canonical' has no attribute '{name}'")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,63 @@
+"""Ahead-of-time generated canonical validators - do not edit.
+
+Regenerate with ``python -m canonical.codegen``; see canonical.codegen.
+"""
+
+# (kind, name, version) -> (module, sha256 of the schema it was generated from)
+VALIDATORS = {
+    ("entity", "client", "v1"): ("entity__client__v1", "076109a3f81aa982b6a62c88e11284aa98fc383c93fc603a75a2077d31eb6b94"),
+    ("entity", "client_link", "v1"): ("entity__client_link__v1", "f641bc6ff09fc33407657c6804aca621a7f4ac37d02c4fcd6208302a3144769b"),
+    ("entity", "document", "v1"): ("entity__document__v1", "79370a19ccfd7499f0f54538ad319ccfb829ec8fede36a25e0d8adb775615876"),
+    ("entity", "interaction", "v1"): ("entity__interaction__v1", "2fb9961adcc9a1a5f6cfdc17293fd3f3d06ab163532798f710070b5bfcaa0dff"),
+    ("entity", "product", "v1"): ("entity__product__v1", "4c5732ffbbfaed676d005d9991da89ff8a01703021468fda61f9ef498ccbae4f"),
+    ("entity", "relationship", "v1"): ("entity__relationship__v1", "51fd5b1b2f7cdebd57187705998002d675130554abc580a1783b76c31536f104"),
+    ("entity", "riskprofile", "v1"): ("entity__riskprofile__v1", "9941b8e31252781d9e3b2ff9c5c9f9f7ef7b5b665378ed53bb15ba187d27eed7"),
+    ("entity", "suitability_assessment", "v1"): ("entity__suitability_assessment__v1", "556e9cdf989590c030edc01f5602889171231666a520f219c583d86466b955ad"),
+    ("entity", "task", "v1"): ("entity__task__v1", "ca38d4220793c260436e3291c41914d34f236f7b85d5457f5df49575b53fcf7f"),
+    ("envelope", "event_envelope", "v1"): ("envelope__event_envelope__v1", "829e0373db97ef4c13e8a4564a2552cb0c4992f20d0c7244adf8c4b95615537b"),
+    ("event", "client.created", "v1"): ("event__client_created__v1", "edf11dfaac5e03d5f76190afb6ea7f4a0aef722d8223b8d7cfa00417c678c58e"),
+    ("event", "client.status_changed", "v1"): ("event__client_status_changed__v1", "aa478358b65a0f26ddcfa9599889a19f7dac45aa8df1ce9d76d4956e42cee015"),
+    ("event", "client.updated", "v1"): ("event__client_updated__v1", "8deeed0d46652691df05f16da8d88df3897387cd891e8e1d257750c1817c5296"),
+    ("event", "client_link.created", "v1"): ("event__client_link_created__v1", "25bff9ee2f81e10923418776cff0222651d151fcc8c8f0699a40f47f87713040"),
+    ("event", "client_link.terminated", "v1"): ("event__client_link_terminated__v1", "49fcacc1c13751008fb1b1be018d6247296198e93f6127ffb641a45e8c02af39"),
+    ("event", "client_link.updated", "v1"): ("event__client_link_updated__v1", "da1435c5733ffef17a772867a9327feb586498282f95cd87ddb50ae00c20eece"),
+    ("event", "document.access_changed", "v1"): ("event__document_access_changed__v1", "ae953f25292fcb71447ee860425822b7e5d9ae62e0ad030422cf758ee578dcd8"),
+    ("event", "document.ingested", "v1"): ("event__document_ingested__v1", "aa7be51d0232e27092aab39963367722aadc9b91a266227d99ab27ab95a4a2fe"),
+    ("event", "document.linked", "v1"): ("event__document_linked__v1", "4111cdc8cc00627cace5d7a245820078c290cf2267cc5e4934be1dc4b97b46f9"),
+    ("event", "document.status_changed", "v1"): ("event__document_status_changed__v1", "fbeadf97ce273e6f2d4f00e2140c100c4774b2a35a76aca426af388459c3e42d"),
+    ("event", "document.superseded", "v1"): ("event__document_superseded__v1", "21873fbed2c61f9a616a941be916abe8c292f553067fb8fcbe123f103e9e7b0e"),
+    ("event", "document.updated", "v1"): ("event__document_updated__v1", "dc726e8eaaf28679c35661119cc814c9b7e1cf91e5d761095e7ee572d56f06de"),
+    ("event", "document.uploaded", "v1"): ("event__document_uploaded__v1", "6f90eca2db2e0aeb290f2d51f2423c54f8616d846dd0ddc91568406c18ce04f7"),
+    ("event", "document.version_added", "v1"): ("event__document_version_added__v1", "d373b32042a2e3e4127775d954d213f3e9b77b042378e5aab19566db970df89b"),
+    ("event", "interaction.cancelled", "v1"): ("event__interaction_cancelled__v1", "e4e128bf5adb21714dfdc665f8e0ab7d3a531586e817cd7e664b6d935221f845"),
+    ("event", "interaction.completed", "v1"): ("event__interaction_completed__v1", "1bcac0b1fee16427176c52c7210ed2181c904c7c9e9ec436e14249450e83bd23"),
+    ("event", "interaction.created", "v1"): ("event__interaction_created__v1", "3babfcae6c95d65feef284ab3a8c0c4fc8a097299763f395c1a19cdd6f9ee014"),
+    ("event", "interaction.documents_attached", "v1"): ("event__interaction_documents_attached__v1", "84b4db06305a815f78fe198707b1294915e168b9f64a2c627b78318dc4b34711"),
+    ("event", "interaction.finalized", "v1"): ("event__interaction_finalized__v1", "0e8578439f32bf998354e53aa487d0debd3dddda46402854b29669d24de902cd"),
+    ("event", "interaction.initiated", "v1"): ("event__interaction_initiated__v1", "036d55083af048ccd654a9c2dd2a29b295b9186985ac0df66f8d3cab307db5b0"),
+    ("event", "interaction.review_started", "v1"): ("event__interaction_review_started__v1", "a64292a7b184d9d78287c9f22c55cecc03ea7f416aa0e7dd0c8fcfbf202e3a5e"),
+    ("event", "interaction.status_changed", "v1"): ("event__interaction_status_changed__v1", "855f4c9a792c87f8cb95c6be737532dc4f38f9fb52d1164e57eccbc14e4ea505"),
+    ("event", "interaction.superseded", "v1"): ("event__interaction_superseded__v1", "d416cef68d17bf709869877c25d4414c84f3101ce5b3d6d9897016e34fc75850"),
+    ("event", "product.artefact.linked", "v1"): ("event__product_artefact_linked__v1", "cfca6435c83c85ce1ac56f0a5e39a4f09789a559073f14916e7892a48977f264"),
+    ("event", "product.created", "v1"): ("event__product_created__v1", "fbd00287e39b52b564d99356c37f657ec04f765f912fa4cb36ee78d8eb7033c6"),
+    ("event", "product.deactivated", "v1"): ("event__product_deactivated__v1", "97aa1c72470e99544a4ff7186fa2d762f002e4e30fe43805841a68896330c97a"),
+    ("event", "product.status_changed", "v1"): ("event__product_status_changed__v1", "2ff0c8924da46c58ff487632ea96a90b50cefacdfafdd00827b0c017dbe8c013"),
+    ("event", "product.updated", "v1"): ("event__product_updated__v1", "43e522917d55406c26a244479c9e084745425fda84ca6f829e63d5276f4e4d2b"),
+    ("event", "relationship.at_risk", "v1"): ("event__relationship_at_risk__v1", "f6e270fe749d3890ccd1130796852e730abafab3193c642f77619eaee2384e74"),
+    ("event", "relationship.created", "v1"): ("event__relationship_created__v1", "3d1e8c3c75a77da0062d92a3c2170090493f99b50841aa38ef5453a1401f5748"),
+    ("event", "relationship.health_updated", "v1"): ("event__relationship_health_updated__v1", "ee729d9e6e64c9931ed763354a760408d06afa530f65cfaf1beb0a1ddc4c4e36"),
+    ("event", "relationship.preferences_updated", "v1"): ("event__relationship_preferences_updated__v1", "b279c1260859635cb36359d9abc1236ebe763fc8dc1479a522b8dc555b7b9d90"),
+    ("event", "relationship.status_changed", "v1"): ("event__relationship_status_changed__v1", "5388bd9bd53a37f8f863dfcbb7097a0facb7d0e4344df0d7450d27f48ef010f8"),
+    ("event", "relationship.terminated", "v1"): ("event__relationship_terminated__v1", "243292eece135fffa67e18eda86fe833b4ba032a54b3f8cc72afad6bd31ff86c"),
+    ("event", "riskprofile.activated", "v1"): ("event__riskprofile_activated__v1", "d09b93116410da042214ddbc1500c3bab0f1dc7ad78555d39508def1614f4468"),
+    ("event", "riskprofile.changed", "v1"): ("event__riskprofile_changed__v1", "302e91cc6d7f166cb8a60f94f9195fffe234993510cc598b79d883337caaaec9"),
+    ("event", "riskprofile.created", "v1"): ("event__riskprofile_created__v1", "bc537596724ae0b60cdcda65722de37ff30e3c1dc8ae7c56fc48f039d828129c"),
+    ("event", "riskprofile.superseded", "v1"): ("event__riskprofile_superseded__v1", "79100026f9c632253f206c651a105df5c8eb2a89c36007ca02badad97a1893f3"),
+    ("event", "riskprofile.updated", "v1"): ("event__riskprofile_updated__v1", "4382942fba6f4205e0f6e78366fdc4ab95c7c0aff7f1d13119e749deebc0e73b"),
+    ("event", "suitability.assessed", "v1"): ("event__suitability_assessed__v1", "31dc1e625f0a52264b13bf95f55b9bcd63aa1634dee1f9f4ac591a00d52a677a"),
+    ("event", "suitability.breached", "v1"): ("event__suitability_breached__v1", "9cc5ed2b0ea6c9307f77719c93128e68577e52cc0a61bb7d9c8c3497b90a7503"),
+    ("event", "task.completed", "v1"): ("event__task_completed__v1", "a77a7d16364c2024b3799e86838aea81396157a7cdd939357996e23e7190b23e"),
+    ("event", "task.created", "v1"): ("event__task_created__v1", "a4ef391c4fa957a047bf8aba820ad0a5d25136558b9cbf8513a144ea810776e0"),
+    ("event", "task.expired", "v1"): ("event__task_expired__v1", "990f8b3ba4f7ea195ad6e2ebc7d60b897125da68819e3e5886f7f5c8cc4d61ca"),
+    ("event", "task.status_changed", "v1"): ("event__task_status_changed__v1", "c8dd146a58e94b8110a210e0eb36fb5aee91cf5c100d5b6004f48d4c6b156783"),
+}
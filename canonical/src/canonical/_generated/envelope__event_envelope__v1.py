@@ -0,0 +1,124 @@
+"""Validator for envelope:event_envelope.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'event_id', 'event_type', 'event_version', 'source', 'tenant_id', 'entity', 'actor', 'occurred_at', 'payload'})
+_C1 = ('event_id', 'event_type', 'event_version', 'source', 'tenant_id', 'entity', 'actor', 'occurred_at', 'payload', )
+_C2 = frozenset({'service'})
+_C3 = ('service', )
+_C4 = frozenset({'dev', 'staging', 'prod'})
+_C5 = frozenset({'entity_type', 'entity_id'})
+_C6 = ('entity_type', 'entity_id', )
+_C7 = frozenset({'client', 'client_link', 'relationship', 'interaction', 'document', 'product', 'riskprofile', 'suitability', 'task'})
+_C8 = frozenset({'actor_id', 'actor_role', 'actor_type'})
+_C9 = ('actor_id', 'actor_role', 'actor_type', )
+_C10 = frozenset({'human_internal', 'human_external', 'system', 'service'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('event_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".event_id: expected type 'string'")
+        v3 = data.get('event_type', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".event_type: expected type 'string'")
+        v4 = data.get('event_version', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".event_version: expected type 'string'")
+        v5 = data.get('source', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, dict)):
+                errors.append(path + ".source: expected type 'object'")
+            else:
+                if not _C2 <= v5.keys():
+                    for _k6 in _C3:
+                        if _k6 not in v5:
+                            errors.append(path + '.source: missing required property ' + repr(_k6))
+                v7 = v5.get('service', _MISSING)
+                if v7 is not _MISSING:
+                    if not (isinstance(v7, str)):
+                        errors.append(path + ".source.service: expected type 'string'")
+                v8 = v5.get('environment', _MISSING)
+                if v8 is not _MISSING:
+                    if not (isinstance(v8, str)):
+                        errors.append(path + ".source.environment: expected type 'string'")
+                    else:
+                        if v8 not in _C4:
+                            errors.append(path + ".source.environment: value is not one of ['dev', 'staging', 'prod']")
+        v9 = data.get('tenant_id', _MISSING)
+        if v9 is not _MISSING:
+            if not (isinstance(v9, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v10 = data.get('entity', _MISSING)
+        if v10 is not _MISSING:
+            if not (isinstance(v10, dict)):
+                errors.append(path + ".entity: expected type 'object'")
+            else:
+                if not _C5 <= v10.keys():
+                    for _k11 in _C6:
+                        if _k11 not in v10:
+                            errors.append(path + '.entity: missing required property ' + repr(_k11))
+                v12 = v10.get('entity_type', _MISSING)
+                if v12 is not _MISSING:
+                    if not (isinstance(v12, str)):
+                        errors.append(path + ".entity.entity_type: expected type 'string'")
+                    else:
+                        if v12 not in _C7:
+                            errors.append(path + ".entity.entity_type: value is not one of ['client', 'client_link', 'relationship', 'interaction', 'document', 'product', 'riskprofile', 'suitability', 'task']")
+                v13 = v10.get('entity_id', _MISSING)
+                if v13 is not _MISSING:
+                    if not (isinstance(v13, str)):
+                        errors.append(path + ".entity.entity_id: expected type 'string'")
+        v14 = data.get('actor', _MISSING)
+        if v14 is not _MISSING:
+            if not (isinstance(v14, dict)):
+                errors.append(path + ".actor: expected type 'object'")
+            else:
+                if not _C8 <= v14.keys():
+                    for _k15 in _C9:
+                        if _k15 not in v14:
+                            errors.append(path + '.actor: missing required property ' + repr(_k15))
+                v16 = v14.get('actor_id', _MISSING)
+                if v16 is not _MISSING:
+                    if not (isinstance(v16, str)):
+                        errors.append(path + ".actor.actor_id: expected type 'string'")
+                v17 = v14.get('actor_role', _MISSING)
+                if v17 is not _MISSING:
+                    if not (isinstance(v17, str)):
+                        errors.append(path + ".actor.actor_role: expected type 'string'")
+                v18 = v14.get('actor_type', _MISSING)
+                if v18 is not _MISSING:
+                    if not (isinstance(v18, str)):
+                        errors.append(path + ".actor.actor_type: expected type 'string'")
+                    else:
+                        if v18 not in _C10:
+                            errors.append(path + ".actor.actor_type: value is not one of ['human_internal', 'human_external', 'system', 'service']")
+        v19 = data.get('occurred_at', _MISSING)
+        if v19 is not _MISSING:
+            if not (isinstance(v19, str)):
+                errors.append(path + ".occurred_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v19) is None:
+                    errors.append(path + ".occurred_at: not a valid 'date-time' string")
+        v20 = data.get('correlation_id', _MISSING)
+        if v20 is not _MISSING:
+            if not (isinstance(v20, str)):
+                errors.append(path + ".correlation_id: expected type 'string'")
+        v21 = data.get('payload', _MISSING)
+        if v21 is not _MISSING:
+            if not (isinstance(v21, dict)):
+                errors.append(path + ".payload: expected type 'object'")
+    return errors
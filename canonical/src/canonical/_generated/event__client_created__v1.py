@@ -0,0 +1,78 @@
+"""Validator for event:client.created.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'client_id', 'tenant_id', 'client_type', 'status', 'identifiers', 'created_at', 'updated_at'})
+_C1 = ('client_id', 'tenant_id', 'client_type', 'status', 'identifiers', 'created_at', 'updated_at', )
+_C2 = frozenset({'individual', 'company', 'family', 'family_office', 'trust', 'partnership', 'fund', 'spv', 'estate', 'llp'})
+_C3 = frozenset({'prospect', 'active', 'inactive', 'restricted', 'closed', 'archived'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('client_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".client_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('client_type', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".client_type: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".client_type: value is not one of ['individual', 'company', 'family', 'family_office', 'trust', 'partnership', 'fund', 'spv', 'estate', 'llp']")
+        v5 = data.get('status', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v5 not in _C3:
+                    errors.append(path + ".status: value is not one of ['prospect', 'active', 'inactive', 'restricted', 'closed', 'archived']")
+        v6 = data.get('identifiers', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, dict)):
+                errors.append(path + ".identifiers: expected type 'object'")
+        v7 = data.get('profile', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, dict)):
+                errors.append(path + ".profile: expected type 'object'")
+        v8 = data.get('roles', _MISSING)
+        if v8 is not _MISSING:
+            if not (isinstance(v8, list)):
+                errors.append(path + ".roles: expected type 'array'")
+            else:
+                for _i9, v10 in enumerate(v8):
+                    if not (isinstance(v10, str)):
+                        errors.append(path + '.roles[' + str(_i9) + "]: expected type 'string'")
+        v11 = data.get('attributes', _MISSING)
+        if v11 is not _MISSING:
+            if not (isinstance(v11, dict)):
+                errors.append(path + ".attributes: expected type 'object'")
+        v12 = data.get('created_at', _MISSING)
+        if v12 is not _MISSING:
+            if not (isinstance(v12, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v12) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v13 = data.get('updated_at', _MISSING)
+        if v13 is not _MISSING:
+            if not (isinstance(v13, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v13) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,31 @@
+"""Validator for event:client_link.terminated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'link_id', 'status'})
+_C1 = ('link_id', 'status', )
+_C2 = frozenset({'active', 'inactive', 'terminated'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('link_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".link_id: expected type 'string'")
+        v3 = data.get('status', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v3 not in _C2:
+                    errors.append(path + ".status: value is not one of ['active', 'inactive', 'terminated']")
+    return errors
@@ -0,0 +1,81 @@
+"""Validator for event:client_link.updated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'link_id', 'tenant_id', 'from_client_id', 'to_client_id', 'link_type', 'status', 'created_at'})
+_C1 = ('link_id', 'tenant_id', 'from_client_id', 'to_client_id', 'link_type', 'status', 'created_at', )
+_C2 = frozenset({'owns', 'controls', 'manages', 'beneficiary_of', 'guarantor_for', 'director_of', 'shareholder_of', 'member_of', 'related_to', 'advisor_to'})
+_C3 = frozenset({'active', 'inactive', 'terminated'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('link_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".link_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('from_client_id', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".from_client_id: expected type 'string'")
+        v5 = data.get('to_client_id', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".to_client_id: expected type 'string'")
+        v6 = data.get('link_type', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, str)):
+                errors.append(path + ".link_type: expected type 'string'")
+            else:
+                if v6 not in _C2:
+                    errors.append(path + ".link_type: value is not one of ['owns', 'controls', 'manages', 'beneficiary_of', 'guarantor_for', 'director_of', 'shareholder_of', 'member_of', 'related_to', 'advisor_to']")
+        v7 = data.get('roles', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, list)):
+                errors.append(path + ".roles: expected type 'array'")
+            else:
+                for _i8, v9 in enumerate(v7):
+                    if not (isinstance(v9, str)):
+                        errors.append(path + '.roles[' + str(_i8) + "]: expected type 'string'")
+        v10 = data.get('status', _MISSING)
+        if v10 is not _MISSING:
+            if not (isinstance(v10, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v10 not in _C3:
+                    errors.append(path + ".status: value is not one of ['active', 'inactive', 'terminated']")
+        v11 = data.get('effective_from', _MISSING)
+        if v11 is not _MISSING:
+            if not (isinstance(v11, str)):
+                errors.append(path + ".effective_from: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v11) is None:
+                    errors.append(path + ".effective_from: not a valid 'date-time' string")
+        v12 = data.get('effective_to', _MISSING)
+        if v12 is not _MISSING:
+            if not (isinstance(v12, str)):
+                errors.append(path + ".effective_to: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v12) is None:
+                    errors.append(path + ".effective_to: not a valid 'date-time' string")
+        v13 = data.get('created_at', _MISSING)
+        if v13 is not _MISSING:
+            if not (isinstance(v13, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v13) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,93 @@
+"""Validator for event:document.access_changed.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'document_id', 'access'})
+_C1 = ('document_id', 'access', )
+_C2 = frozenset({'scope'})
+_C3 = ('scope', )
+_C4 = frozenset({'tenant', 'team', 'rm', 'client', 'relationship', 'system'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('document_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".document_id: expected type 'string'")
+        v3 = data.get('access', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, dict)):
+                errors.append(path + ".access: expected type 'object'")
+            else:
+                if not _C2 <= v3.keys():
+                    for _k4 in _C3:
+                        if _k4 not in v3:
+                            errors.append(path + '.access: missing required property ' + repr(_k4))
+                v5 = v3.get('scope', _MISSING)
+                if v5 is not _MISSING:
+                    if not (isinstance(v5, str)):
+                        errors.append(path + ".access.scope: expected type 'string'")
+                    else:
+                        if v5 not in _C4:
+                            errors.append(path + ".access.scope: value is not one of ['tenant', 'team', 'rm', 'client', 'relationship', 'system']")
+                v6 = v3.get('team_ids', _MISSING)
+                if v6 is not _MISSING:
+                    if not (isinstance(v6, list)):
+                        errors.append(path + ".access.team_ids: expected type 'array'")
+                    else:
+                        for _i7, v8 in enumerate(v6):
+                            if not (isinstance(v8, str)):
+                                errors.append(path + '.access.team_ids[' + str(_i7) + "]: expected type 'string'")
+                v9 = v3.get('rm_ids', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, list)):
+                        errors.append(path + ".access.rm_ids: expected type 'array'")
+                    else:
+                        for _i10, v11 in enumerate(v9):
+                            if not (isinstance(v11, str)):
+                                errors.append(path + '.access.rm_ids[' + str(_i10) + "]: expected type 'string'")
+                v12 = v3.get('client_ids', _MISSING)
+                if v12 is not _MISSING:
+                    if not (isinstance(v12, list)):
+                        errors.append(path + ".access.client_ids: expected type 'array'")
+                    else:
+                        for _i13, v14 in enumerate(v12):
+                            if not (isinstance(v14, str)):
+                                errors.append(path + '.access.client_ids[' + str(_i13) + "]: expected type 'string'")
+                v15 = v3.get('relationship_ids', _MISSING)
+                if v15 is not _MISSING:
+                    if not (isinstance(v15, list)):
+                        errors.append(path + ".access.relationship_ids: expected type 'array'")
+                    else:
+                        for _i16, v17 in enumerate(v15):
+                            if not (isinstance(v17, str)):
+                                errors.append(path + '.access.relationship_ids[' + str(_i16) + "]: expected type 'string'")
+                v18 = v3.get('effective_from', _MISSING)
+                if v18 is not _MISSING:
+                    if not (isinstance(v18, str)):
+                        errors.append(path + ".access.effective_from: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v18) is None:
+                            errors.append(path + ".access.effective_from: not a valid 'date-time' string")
+                v19 = v3.get('effective_to', _MISSING)
+                if v19 is not _MISSING:
+                    if not (isinstance(v19, str)):
+                        errors.append(path + ".access.effective_to: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v19) is None:
+                            errors.append(path + ".access.effective_to: not a valid 'date-time' string")
+                v20 = v3.get('read_only', _MISSING)
+                if v20 is not _MISSING:
+                    if not ((v20 is True or v20 is False)):
+                        errors.append(path + ".access.read_only: expected type 'boolean'")
+    return errors
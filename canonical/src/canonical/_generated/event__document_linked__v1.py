@@ -0,0 +1,50 @@
+"""Validator for event:document.linked.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'document_id', 'links'})
+_C1 = ('document_id', 'links', )
+_C2 = frozenset({'entity_type', 'entity_id'})
+_C3 = ('entity_type', 'entity_id', )
+_C4 = frozenset({'client', 'product', 'portfolio', 'proposal', 'interaction', 'relationship'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('document_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".document_id: expected type 'string'")
+        v3 = data.get('links', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, list)):
+                errors.append(path + ".links: expected type 'array'")
+            else:
+                for _i4, v5 in enumerate(v3):
+                    if not (isinstance(v5, dict)):
+                        errors.append(path + '.links[' + str(_i4) + "]: expected type 'object'")
+                    else:
+                        if not _C2 <= v5.keys():
+                            for _k6 in _C3:
+                                if _k6 not in v5:
+                                    errors.append(path + '.links[' + str(_i4) + ']: missing required property ' + repr(_k6))
+                        v7 = v5.get('entity_type', _MISSING)
+                        if v7 is not _MISSING:
+                            if not (isinstance(v7, str)):
+                                errors.append(path + '.links[' + str(_i4) + "].entity_type: expected type 'string'")
+                            else:
+                                if v7 not in _C4:
+                                    errors.append(path + '.links[' + str(_i4) + "].entity_type: value is not one of ['client', 'product', 'portfolio', 'proposal', 'interaction', 'relationship']")
+                        v8 = v5.get('entity_id', _MISSING)
+                        if v8 is not _MISSING:
+                            if not (isinstance(v8, str)):
+                                errors.append(path + '.links[' + str(_i4) + "].entity_id: expected type 'string'")
+    return errors
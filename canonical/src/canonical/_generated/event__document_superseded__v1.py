@@ -0,0 +1,31 @@
+"""Validator for event:document.superseded.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'document_id', 'superseded_by', 'version'})
+_C1 = ('document_id', 'superseded_by', 'version', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('document_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".document_id: expected type 'string'")
+        v3 = data.get('superseded_by', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".superseded_by: expected type 'string'")
+        v4 = data.get('version', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".version: expected type 'string'")
+    return errors
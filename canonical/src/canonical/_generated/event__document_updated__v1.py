@@ -0,0 +1,241 @@
+"""Validator for event:document.updated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'document_id', 'tenant_id', 'document_type', 'status', 'access', 'storage', 'provenance', 'created_at', 'updated_at'})
+_C1 = ('document_id', 'tenant_id', 'document_type', 'status', 'access', 'storage', 'provenance', 'created_at', 'updated_at', )
+_C2 = frozenset({'pdf', 'email', 'note', 'audio', 'video', 'transcript', 'image', 'spreadsheet', 'presentation', 'ai_generated', 'other'})
+_C3 = frozenset({'draft', 'under_review', 'active', 'superseded', 'archived', 'suspended', 'removed'})
+_C4 = frozenset({'scope'})
+_C5 = ('scope', )
+_C6 = frozenset({'tenant', 'team', 'rm', 'client', 'relationship', 'system'})
+_C7 = frozenset({'provider', 'uri'})
+_C8 = ('provider', 'uri', )
+_C9 = frozenset({'s3', 'gcs', 'azure_blob', 'filesystem'})
+_C10 = frozenset({'entity_type', 'entity_id'})
+_C11 = ('entity_type', 'entity_id', )
+_C12 = frozenset({'client', 'product', 'portfolio', 'proposal', 'interaction', 'relationship'})
+_C13 = frozenset({'source'})
+_C14 = ('source', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('document_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".document_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('document_type', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".document_type: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".document_type: value is not one of ['pdf', 'email', 'note', 'audio', 'video', 'transcript', 'image', 'spreadsheet', 'presentation', 'ai_generated', 'other']")
+        v5 = data.get('status', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v5 not in _C3:
+                    errors.append(path + ".status: value is not one of ['draft', 'under_review', 'active', 'superseded', 'archived', 'suspended', 'removed']")
+        v6 = data.get('title', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, str)):
+                errors.append(path + ".title: expected type 'string'")
+        v7 = data.get('description', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, str)):
+                errors.append(path + ".description: expected type 'string'")
+        v8 = data.get('category', _MISSING)
+        if v8 is not _MISSING:
+            if not (isinstance(v8, str)):
+                errors.append(path + ".category: expected type 'string'")
+        v9 = data.get('access', _MISSING)
+        if v9 is not _MISSING:
+            if not (isinstance(v9, dict)):
+                errors.append(path + ".access: expected type 'object'")
+            else:
+                if not _C4 <= v9.keys():
+                    for _k10 in _C5:
+                        if _k10 not in v9:
+                            errors.append(path + '.access: missing required property ' + repr(_k10))
+                v11 = v9.get('scope', _MISSING)
+                if v11 is not _MISSING:
+                    if not (isinstance(v11, str)):
+                        errors.append(path + ".access.scope: expected type 'string'")
+                    else:
+                        if v11 not in _C6:
+                            errors.append(path + ".access.scope: value is not one of ['tenant', 'team', 'rm', 'client', 'relationship', 'system']")
+                v12 = v9.get('team_ids', _MISSING)
+                if v12 is not _MISSING:
+                    if not (isinstance(v12, list)):
+                        errors.append(path + ".access.team_ids: expected type 'array'")
+                    else:
+                        for _i13, v14 in enumerate(v12):
+                            if not (isinstance(v14, str)):
+                                errors.append(path + '.access.team_ids[' + str(_i13) + "]: expected type 'string'")
+                v15 = v9.get('rm_ids', _MISSING)
+                if v15 is not _MISSING:
+                    if not (isinstance(v15, list)):
+                        errors.append(path + ".access.rm_ids: expected type 'array'")
+                    else:
+                        for _i16, v17 in enumerate(v15):
+                            if not (isinstance(v17, str)):
+                                errors.append(path + '.access.rm_ids[' + str(_i16) + "]: expected type 'string'")
+                v18 = v9.get('client_ids', _MISSING)
+                if v18 is not _MISSING:
+                    if not (isinstance(v18, list)):
+                        errors.append(path + ".access.client_ids: expected type 'array'")
+                    else:
+                        for _i19, v20 in enumerate(v18):
+                            if not (isinstance(v20, str)):
+                                errors.append(path + '.access.client_ids[' + str(_i19) + "]: expected type 'string'")
+                v21 = v9.get('relationship_ids', _MISSING)
+                if v21 is not _MISSING:
+                    if not (isinstance(v21, list)):
+                        errors.append(path + ".access.relationship_ids: expected type 'array'")
+                    else:
+                        for _i22, v23 in enumerate(v21):
+                            if not (isinstance(v23, str)):
+                                errors.append(path + '.access.relationship_ids[' + str(_i22) + "]: expected type 'string'")
+                v24 = v9.get('effective_from', _MISSING)
+                if v24 is not _MISSING:
+                    if not (isinstance(v24, str)):
+                        errors.append(path + ".access.effective_from: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v24) is None:
+                            errors.append(path + ".access.effective_from: not a valid 'date-time' string")
+                v25 = v9.get('effective_to', _MISSING)
+                if v25 is not _MISSING:
+                    if not (isinstance(v25, str)):
+                        errors.append(path + ".access.effective_to: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v25) is None:
+                            errors.append(path + ".access.effective_to: not a valid 'date-time' string")
+                v26 = v9.get('read_only', _MISSING)
+                if v26 is not _MISSING:
+                    if not ((v26 is True or v26 is False)):
+                        errors.append(path + ".access.read_only: expected type 'boolean'")
+        v27 = data.get('storage', _MISSING)
+        if v27 is not _MISSING:
+            if not (isinstance(v27, dict)):
+                errors.append(path + ".storage: expected type 'object'")
+            else:
+                if not _C7 <= v27.keys():
+                    for _k28 in _C8:
+                        if _k28 not in v27:
+                            errors.append(path + '.storage: missing required property ' + repr(_k28))
+                v29 = v27.get('provider', _MISSING)
+                if v29 is not _MISSING:
+                    if not (isinstance(v29, str)):
+                        errors.append(path + ".storage.provider: expected type 'string'")
+                    else:
+                        if v29 not in _C9:
+                            errors.append(path + ".storage.provider: value is not one of ['s3', 'gcs', 'azure_blob', 'filesystem']")
+                v30 = v27.get('uri', _MISSING)
+                if v30 is not _MISSING:
+                    if not (isinstance(v30, str)):
+                        errors.append(path + ".storage.uri: expected type 'string'")
+                v31 = v27.get('content_hash', _MISSING)
+                if v31 is not _MISSING:
+                    if not (isinstance(v31, str)):
+                        errors.append(path + ".storage.content_hash: expected type 'string'")
+                v32 = v27.get('size_bytes', _MISSING)
+                if v32 is not _MISSING:
+                    if not ((isinstance(v32, (int, float)) and not isinstance(v32, bool))):
+                        errors.append(path + ".storage.size_bytes: expected type 'number'")
+                v33 = v27.get('mime_type', _MISSING)
+                if v33 is not _MISSING:
+                    if not (isinstance(v33, str)):
+                        errors.append(path + ".storage.mime_type: expected type 'string'")
+        v34 = data.get('links', _MISSING)
+        if v34 is not _MISSING:
+            if not (isinstance(v34, list)):
+                errors.append(path + ".links: expected type 'array'")
+            else:
+                for _i35, v36 in enumerate(v34):
+                    if not (isinstance(v36, dict)):
+                        errors.append(path + '.links[' + str(_i35) + "]: expected type 'object'")
+                    else:
+                        if not _C10 <= v36.keys():
+                            for _k37 in _C11:
+                                if _k37 not in v36:
+                                    errors.append(path + '.links[' + str(_i35) + ']: missing required property ' + repr(_k37))
+                        v38 = v36.get('entity_type', _MISSING)
+                        if v38 is not _MISSING:
+                            if not (isinstance(v38, str)):
+                                errors.append(path + '.links[' + str(_i35) + "].entity_type: expected type 'string'")
+                            else:
+                                if v38 not in _C12:
+                                    errors.append(path + '.links[' + str(_i35) + "].entity_type: value is not one of ['client', 'product', 'portfolio', 'proposal', 'interaction', 'relationship']")
+                        v39 = v36.get('entity_id', _MISSING)
+                        if v39 is not _MISSING:
+                            if not (isinstance(v39, str)):
+                                errors.append(path + '.links[' + str(_i35) + "].entity_id: expected type 'string'")
+        v40 = data.get('tags', _MISSING)
+        if v40 is not _MISSING:
+            if not (isinstance(v40, list)):
+                errors.append(path + ".tags: expected type 'array'")
+            else:
+                for _i41, v42 in enumerate(v40):
+                    if not (isinstance(v42, str)):
+                        errors.append(path + '.tags[' + str(_i41) + "]: expected type 'string'")
+        v43 = data.get('version', _MISSING)
+        if v43 is not _MISSING:
+            if not (isinstance(v43, str)):
+                errors.append(path + ".version: expected type 'string'")
+        v44 = data.get('provenance', _MISSING)
+        if v44 is not _MISSING:
+            if not (isinstance(v44, dict)):
+                errors.append(path + ".provenance: expected type 'object'")
+            else:
+                if not _C13 <= v44.keys():
+                    for _k45 in _C14:
+                        if _k45 not in v44:
+                            errors.append(path + '.provenance: missing required property ' + repr(_k45))
+                v46 = v44.get('source', _MISSING)
+                if v46 is not _MISSING:
+                    if not (isinstance(v46, str)):
+                        errors.append(path + ".provenance.source: expected type 'string'")
+                v47 = v44.get('generated_by', _MISSING)
+                if v47 is not _MISSING:
+                    if not (isinstance(v47, str)):
+                        errors.append(path + ".provenance.generated_by: expected type 'string'")
+                v48 = v44.get('confidence', _MISSING)
+                if v48 is not _MISSING:
+                    if not ((isinstance(v48, (int, float)) and not isinstance(v48, bool))):
+                        errors.append(path + ".provenance.confidence: expected type 'number'")
+                    else:
+                        if v48 < 0:
+                            errors.append(path + '.provenance.confidence: less than minimum 0')
+                        if v48 > 1:
+                            errors.append(path + '.provenance.confidence: greater than maximum 1')
+        v49 = data.get('created_at', _MISSING)
+        if v49 is not _MISSING:
+            if not (isinstance(v49, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v49) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v50 = data.get('updated_at', _MISSING)
+        if v50 is not _MISSING:
+            if not (isinstance(v50, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v50) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,161 @@
+"""Validator for event:interaction.cancelled.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'interaction_id', 'tenant_id', 'interaction_type', 'status', 'participants', 'timestamp', 'provenance', 'created_at', 'updated_at'})
+_C1 = ('interaction_id', 'tenant_id', 'interaction_type', 'status', 'participants', 'timestamp', 'provenance', 'created_at', 'updated_at', )
+_C2 = frozenset({'meeting', 'call', 'email', 'chat', 'note', 'audio', 'video', 'system'})
+_C3 = frozenset({'initiated', 'in_progress', 'completed', 'documents_attached', 'under_review', 'finalized', 'superseded', 'archived', 'cancelled'})
+_C4 = frozenset({'actor_id', 'actor_role', 'actor_type'})
+_C5 = ('actor_id', 'actor_role', 'actor_type', )
+_C6 = frozenset({'human_internal', 'human_external', 'system', 'service'})
+_C7 = frozenset({'actor_id', 'actor_role', 'actor_type', 'display_name'})
+_C8 = frozenset({'source'})
+_C9 = ('source', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('interaction_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".interaction_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('interaction_type', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".interaction_type: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".interaction_type: value is not one of ['meeting', 'call', 'email', 'chat', 'note', 'audio', 'video', 'system']")
+        v5 = data.get('status', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v5 not in _C3:
+                    errors.append(path + ".status: value is not one of ['initiated', 'in_progress', 'completed', 'documents_attached', 'under_review', 'finalized', 'superseded', 'archived', 'cancelled']")
+        v6 = data.get('participants', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, list)):
+                errors.append(path + ".participants: expected type 'array'")
+            else:
+                if len(v6) < 1:
+                    errors.append(path + '.participants: fewer than 1 items')
+                for _i7, v8 in enumerate(v6):
+                    if not (isinstance(v8, dict)):
+                        errors.append(path + '.participants[' + str(_i7) + "]: expected type 'object'")
+                    else:
+                        if not _C4 <= v8.keys():
+                            for _k9 in _C5:
+                                if _k9 not in v8:
+                                    errors.append(path + '.participants[' + str(_i7) + ']: missing required property ' + repr(_k9))
+                        v10 = v8.get('actor_id', _MISSING)
+                        if v10 is not _MISSING:
+                            if not (isinstance(v10, str)):
+                                errors.append(path + '.participants[' + str(_i7) + "].actor_id: expected type 'string'")
+                        v11 = v8.get('actor_role', _MISSING)
+                        if v11 is not _MISSING:
+                            if not (isinstance(v11, str)):
+                                errors.append(path + '.participants[' + str(_i7) + "].actor_role: expected type 'string'")
+                        v12 = v8.get('actor_type', _MISSING)
+                        if v12 is not _MISSING:
+                            if not (isinstance(v12, str)):
+                                errors.append(path + '.participants[' + str(_i7) + "].actor_type: expected type 'string'")
+                            else:
+                                if v12 not in _C6:
+                                    errors.append(path + '.participants[' + str(_i7) + "].actor_type: value is not one of ['human_internal', 'human_external', 'system', 'service']")
+                        v13 = v8.get('display_name', _MISSING)
+                        if v13 is not _MISSING:
+                            if not (isinstance(v13, str)):
+                                errors.append(path + '.participants[' + str(_i7) + "].display_name: expected type 'string'")
+                        if not v8.keys() <= _C7:
+                            for _k14 in sorted(v8.keys() - _C7):
+                                errors.append(path + '.participants[' + str(_i7) + ']: unexpected property ' + repr(_k14))
+        v15 = data.get('timestamp', _MISSING)
+        if v15 is not _MISSING:
+            if not (isinstance(v15, str)):
+                errors.append(path + ".timestamp: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v15) is None:
+                    errors.append(path + ".timestamp: not a valid 'date-time' string")
+        v16 = data.get('duration_seconds', _MISSING)
+        if v16 is not _MISSING:
+            if not ((isinstance(v16, int) and not isinstance(v16, bool))):
+                errors.append(path + ".duration_seconds: expected type 'integer'")
+            else:
+                if v16 < 0:
+                    errors.append(path + '.duration_seconds: less than minimum 0')
+        v17 = data.get('summary', _MISSING)
+        if v17 is not _MISSING:
+            if not (isinstance(v17, str)):
+                errors.append(path + ".summary: expected type 'string'")
+        v18 = data.get('documents', _MISSING)
+        if v18 is not _MISSING:
+            if not (isinstance(v18, list)):
+                errors.append(path + ".documents: expected type 'array'")
+            else:
+                for _i19, v20 in enumerate(v18):
+                    if not (isinstance(v20, str)):
+                        errors.append(path + '.documents[' + str(_i19) + "]: expected type 'string'")
+        v21 = data.get('signals', _MISSING)
+        if v21 is not _MISSING:
+            if not (isinstance(v21, dict)):
+                errors.append(path + ".signals: expected type 'object'")
+        v22 = data.get('tags', _MISSING)
+        if v22 is not _MISSING:
+            if not (isinstance(v22, list)):
+                errors.append(path + ".tags: expected type 'array'")
+            else:
+                for _i23, v24 in enumerate(v22):
+                    if not (isinstance(v24, str)):
+                        errors.append(path + '.tags[' + str(_i23) + "]: expected type 'string'")
+        v25 = data.get('provenance', _MISSING)
+        if v25 is not _MISSING:
+            if not (isinstance(v25, dict)):
+                errors.append(path + ".provenance: expected type 'object'")
+            else:
+                if not _C8 <= v25.keys():
+                    for _k26 in _C9:
+                        if _k26 not in v25:
+                            errors.append(path + '.provenance: missing required property ' + repr(_k26))
+                v27 = v25.get('source', _MISSING)
+                if v27 is not _MISSING:
+                    if not (isinstance(v27, str)):
+                        errors.append(path + ".provenance.source: expected type 'string'")
+                v28 = v25.get('confidence', _MISSING)
+                if v28 is not _MISSING:
+                    if not ((isinstance(v28, (int, float)) and not isinstance(v28, bool))):
+                        errors.append(path + ".provenance.confidence: expected type 'number'")
+                    else:
+                        if v28 < 0:
+                            errors.append(path + '.provenance.confidence: less than minimum 0')
+                        if v28 > 1:
+                            errors.append(path + '.provenance.confidence: greater than maximum 1')
+        v29 = data.get('created_at', _MISSING)
+        if v29 is not _MISSING:
+            if not (isinstance(v29, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v29) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v30 = data.get('updated_at', _MISSING)
+        if v30 is not _MISSING:
+            if not (isinstance(v30, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v30) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,69 @@
+"""Validator for event:product.artefact.linked.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])\\Z', re.ASCII)
+_C0 = frozenset({'product_id', 'artefact'})
+_C1 = ('product_id', 'artefact', )
+_C2 = frozenset({'artefact_id', 'type'})
+_C3 = ('artefact_id', 'type', )
+_C4 = frozenset({'factsheet', 'brochure', 'sid', 'fund_manager_note', 'risk_disclosure', 'presentation', 'video', 'other'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('product_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".product_id: expected type 'string'")
+        v3 = data.get('artefact', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, dict)):
+                errors.append(path + ".artefact: expected type 'object'")
+            else:
+                if not _C2 <= v3.keys():
+                    for _k4 in _C3:
+                        if _k4 not in v3:
+                            errors.append(path + '.artefact: missing required property ' + repr(_k4))
+                v5 = v3.get('artefact_id', _MISSING)
+                if v5 is not _MISSING:
+                    if not (isinstance(v5, str)):
+                        errors.append(path + ".artefact.artefact_id: expected type 'string'")
+                v6 = v3.get('type', _MISSING)
+                if v6 is not _MISSING:
+                    if not (isinstance(v6, str)):
+                        errors.append(path + ".artefact.type: expected type 'string'")
+                    else:
+                        if v6 not in _C4:
+                            errors.append(path + ".artefact.type: value is not one of ['factsheet', 'brochure', 'sid', 'fund_manager_note', 'risk_disclosure', 'presentation', 'video', 'other']")
+                v7 = v3.get('version', _MISSING)
+                if v7 is not _MISSING:
+                    if not (isinstance(v7, str)):
+                        errors.append(path + ".artefact.version: expected type 'string'")
+                v8 = v3.get('effective_from', _MISSING)
+                if v8 is not _MISSING:
+                    if not (isinstance(v8, str)):
+                        errors.append(path + ".artefact.effective_from: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE.match(v8) is None:
+                            errors.append(path + ".artefact.effective_from: not a valid 'date' string")
+                v9 = v3.get('effective_to', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, str)):
+                        errors.append(path + ".artefact.effective_to: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE.match(v9) is None:
+                            errors.append(path + ".artefact.effective_to: not a valid 'date' string")
+                v10 = v3.get('mandatory_for_advice', _MISSING)
+                if v10 is not _MISSING:
+                    if not ((v10 is True or v10 is False)):
+                        errors.append(path + ".artefact.mandatory_for_advice: expected type 'boolean'")
+    return errors
@@ -0,0 +1,259 @@
+"""Validator for event:product.deactivated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])\\Z', re.ASCII)
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'product_id', 'tenant_id', 'name', 'product_type', 'asset_class', 'status', 'risk', 'eligibility', 'provenance', 'created_at', 'updated_at'})
+_C1 = ('product_id', 'tenant_id', 'name', 'product_type', 'asset_class', 'status', 'risk', 'eligibility', 'provenance', 'created_at', 'updated_at', )
+_C2 = frozenset({'mutual_fund', 'pms', 'aif', 'bond', 'structured_product', 'insurance', 'reit', 'invit', 'private_credit', 'pe_vc_fund', 'cash'})
+_C3 = frozenset({'equity', 'debt', 'hybrid', 'alternatives', 'cash'})
+_C4 = frozenset({'under_review', 'active', 'rejected', 'on_hold', 'inactive', 'restricted', 'closed'})
+_C5 = frozenset({'risk_level'})
+_C6 = ('risk_level', )
+_C7 = frozenset({'low', 'moderate', 'high', 'very_high'})
+_C8 = frozenset({'min_investment'})
+_C9 = ('min_investment', )
+_C10 = ('retail', 'hni', 'uhni', 'institutional',)
+_C11 = frozenset({'daily', 'monthly', 'quarterly', 'illiquid'})
+_C12 = frozenset({'artefact_id', 'type'})
+_C13 = ('artefact_id', 'type', )
+_C14 = frozenset({'factsheet', 'brochure', 'sid', 'fund_manager_note', 'risk_disclosure', 'presentation', 'video', 'other'})
+_C15 = frozenset({'source'})
+_C16 = ('source', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('product_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".product_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('name', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".name: expected type 'string'")
+        v5 = data.get('product_type', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".product_type: expected type 'string'")
+            else:
+                if v5 not in _C2:
+                    errors.append(path + ".product_type: value is not one of ['mutual_fund', 'pms', 'aif', 'bond', 'structured_product', 'insurance', 'reit', 'invit', 'private_credit', 'pe_vc_fund', 'cash']")
+        v6 = data.get('asset_class', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, str)):
+                errors.append(path + ".asset_class: expected type 'string'")
+            else:
+                if v6 not in _C3:
+                    errors.append(path + ".asset_class: value is not one of ['equity', 'debt', 'hybrid', 'alternatives', 'cash']")
+        v7 = data.get('status', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v7 not in _C4:
+                    errors.append(path + ".status: value is not one of ['under_review', 'active', 'rejected', 'on_hold', 'inactive', 'restricted', 'closed']")
+        v8 = data.get('issuer', _MISSING)
+        if v8 is not _MISSING:
+            if not (isinstance(v8, str)):
+                errors.append(path + ".issuer: expected type 'string'")
+        v9 = data.get('risk', _MISSING)
+        if v9 is not _MISSING:
+            if not (isinstance(v9, dict)):
+                errors.append(path + ".risk: expected type 'object'")
+            else:
+                if not _C5 <= v9.keys():
+                    for _k10 in _C6:
+                        if _k10 not in v9:
+                            errors.append(path + '.risk: missing required property ' + repr(_k10))
+                v11 = v9.get('risk_level', _MISSING)
+                if v11 is not _MISSING:
+                    if not (isinstance(v11, str)):
+                        errors.append(path + ".risk.risk_level: expected type 'string'")
+                    else:
+                        if v11 not in _C7:
+                            errors.append(path + ".risk.risk_level: value is not one of ['low', 'moderate', 'high', 'very_high']")
+                v12 = v9.get('volatility_band', _MISSING)
+                if v12 is not _MISSING:
+                    if not (isinstance(v12, str)):
+                        errors.append(path + ".risk.volatility_band: expected type 'string'")
+                v13 = v9.get('drawdown_profile', _MISSING)
+                if v13 is not _MISSING:
+                    if not (isinstance(v13, str)):
+                        errors.append(path + ".risk.drawdown_profile: expected type 'string'")
+        v14 = data.get('eligibility', _MISSING)
+        if v14 is not _MISSING:
+            if not (isinstance(v14, dict)):
+                errors.append(path + ".eligibility: expected type 'object'")
+            else:
+                if not _C8 <= v14.keys():
+                    for _k15 in _C9:
+                        if _k15 not in v14:
+                            errors.append(path + '.eligibility: missing required property ' + repr(_k15))
+                v16 = v14.get('min_investment', _MISSING)
+                if v16 is not _MISSING:
+                    if not ((isinstance(v16, (int, float)) and not isinstance(v16, bool))):
+                        errors.append(path + ".eligibility.min_investment: expected type 'number'")
+                v17 = v14.get('investor_types', _MISSING)
+                if v17 is not _MISSING:
+                    if not (isinstance(v17, list)):
+                        errors.append(path + ".eligibility.investor_types: expected type 'array'")
+                    else:
+                        for _i18, v19 in enumerate(v17):
+                            if v19 not in _C10:
+                                errors.append(path + '.eligibility.investor_types[' + str(_i18) + "]: value is not one of ['retail', 'hni', 'uhni', 'institutional']")
+                v20 = v14.get('allowed_risk_profiles', _MISSING)
+                if v20 is not _MISSING:
+                    if not (isinstance(v20, list)):
+                        errors.append(path + ".eligibility.allowed_risk_profiles: expected type 'array'")
+                    else:
+                        for _i21, v22 in enumerate(v20):
+                            if not (isinstance(v22, str)):
+                                errors.append(path + '.eligibility.allowed_risk_profiles[' + str(_i21) + "]: expected type 'string'")
+                v23 = v14.get('lock_in_months', _MISSING)
+                if v23 is not _MISSING:
+                    if not ((isinstance(v23, int) and not isinstance(v23, bool))):
+                        errors.append(path + ".eligibility.lock_in_months: expected type 'integer'")
+                v24 = v14.get('liquidity', _MISSING)
+                if v24 is not _MISSING:
+                    if not (isinstance(v24, str)):
+                        errors.append(path + ".eligibility.liquidity: expected type 'string'")
+                    else:
+                        if v24 not in _C11:
+                            errors.append(path + ".eligibility.liquidity: value is not one of ['daily', 'monthly', 'quarterly', 'illiquid']")
+        v25 = data.get('artefacts', _MISSING)
+        if v25 is not _MISSING:
+            if not (isinstance(v25, list)):
+                errors.append(path + ".artefacts: expected type 'array'")
+            else:
+                for _i26, v27 in enumerate(v25):
+                    if not (isinstance(v27, dict)):
+                        errors.append(path + '.artefacts[' + str(_i26) + "]: expected type 'object'")
+                    else:
+                        if not _C12 <= v27.keys():
+                            for _k28 in _C13:
+                                if _k28 not in v27:
+                                    errors.append(path + '.artefacts[' + str(_i26) + ']: missing required property ' + repr(_k28))
+                        v29 = v27.get('artefact_id', _MISSING)
+                        if v29 is not _MISSING:
+                            if not (isinstance(v29, str)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].artefact_id: expected type 'string'")
+                        v30 = v27.get('type', _MISSING)
+                        if v30 is not _MISSING:
+                            if not (isinstance(v30, str)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].type: expected type 'string'")
+                            else:
+                                if v30 not in _C14:
+                                    errors.append(path + '.artefacts[' + str(_i26) + "].type: value is not one of ['factsheet', 'brochure', 'sid', 'fund_manager_note', 'risk_disclosure', 'presentation', 'video', 'other']")
+                        v31 = v27.get('version', _MISSING)
+                        if v31 is not _MISSING:
+                            if not (isinstance(v31, str)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].version: expected type 'string'")
+                        v32 = v27.get('effective_from', _MISSING)
+                        if v32 is not _MISSING:
+                            if not (isinstance(v32, str)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].effective_from: expected type 'string'")
+                            else:
+                                if _FORMAT_DATE.match(v32) is None:
+                                    errors.append(path + '.artefacts[' + str(_i26) + "].effective_from: not a valid 'date' string")
+                        v33 = v27.get('effective_to', _MISSING)
+                        if v33 is not _MISSING:
+                            if not (isinstance(v33, str)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].effective_to: expected type 'string'")
+                            else:
+                                if _FORMAT_DATE.match(v33) is None:
+                                    errors.append(path + '.artefacts[' + str(_i26) + "].effective_to: not a valid 'date' string")
+                        v34 = v27.get('mandatory_for_advice', _MISSING)
+                        if v34 is not _MISSING:
+                            if not ((v34 is True or v34 is False)):
+                                errors.append(path + '.artefacts[' + str(_i26) + "].mandatory_for_advice: expected type 'boolean'")
+        v35 = data.get('regulatory', _MISSING)
+        if v35 is not _MISSING:
+            if not (isinstance(v35, dict)):
+                errors.append(path + ".regulatory: expected type 'object'")
+            else:
+                v36 = v35.get('regulator', _MISSING)
+                if v36 is not _MISSING:
+                    if not (isinstance(v36, str)):
+                        errors.append(path + ".regulatory.regulator: expected type 'string'")
+                v37 = v35.get('category_code', _MISSING)
+                if v37 is not _MISSING:
+                    if not (isinstance(v37, str)):
+                        errors.append(path + ".regulatory.category_code: expected type 'string'")
+                v38 = v35.get('restricted_jurisdictions', _MISSING)
+                if v38 is not _MISSING:
+                    if not (isinstance(v38, list)):
+                        errors.append(path + ".regulatory.restricted_jurisdictions: expected type 'array'")
+                    else:
+                        for _i39, v40 in enumerate(v38):
+                            if not (isinstance(v40, str)):
+                                errors.append(path + '.regulatory.restricted_jurisdictions[' + str(_i39) + "]: expected type 'string'")
+        v41 = data.get('attributes', _MISSING)
+        if v41 is not _MISSING:
+            if not (isinstance(v41, dict)):
+                errors.append(path + ".attributes: expected type 'object'")
+        v42 = data.get('tags', _MISSING)
+        if v42 is not _MISSING:
+            if not (isinstance(v42, list)):
+                errors.append(path + ".tags: expected type 'array'")
+            else:
+                for _i43, v44 in enumerate(v42):
+                    if not (isinstance(v44, str)):
+                        errors.append(path + '.tags[' + str(_i43) + "]: expected type 'string'")
+        v45 = data.get('provenance', _MISSING)
+        if v45 is not _MISSING:
+            if not (isinstance(v45, dict)):
+                errors.append(path + ".provenance: expected type 'object'")
+            else:
+                if not _C15 <= v45.keys():
+                    for _k46 in _C16:
+                        if _k46 not in v45:
+                            errors.append(path + '.provenance: missing required property ' + repr(_k46))
+                v47 = v45.get('source', _MISSING)
+                if v47 is not _MISSING:
+                    if not (isinstance(v47, str)):
+                        errors.append(path + ".provenance.source: expected type 'string'")
+                v48 = v45.get('confidence', _MISSING)
+                if v48 is not _MISSING:
+                    if not ((isinstance(v48, (int, float)) and not isinstance(v48, bool))):
+                        errors.append(path + ".provenance.confidence: expected type 'number'")
+                    else:
+                        if v48 < 0:
+                            errors.append(path + '.provenance.confidence: less than minimum 0')
+                        if v48 > 1:
+                            errors.append(path + '.provenance.confidence: greater than maximum 1')
+                v49 = v45.get('last_verified_at', _MISSING)
+                if v49 is not _MISSING:
+                    if not (isinstance(v49, str)):
+                        errors.append(path + ".provenance.last_verified_at: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v49) is None:
+                            errors.append(path + ".provenance.last_verified_at: not a valid 'date-time' string")
+        v50 = data.get('created_at', _MISSING)
+        if v50 is not _MISSING:
+            if not (isinstance(v50, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v50) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v51 = data.get('updated_at', _MISSING)
+        if v51 is not _MISSING:
+            if not (isinstance(v51, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v51) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,38 @@
+"""Validator for event:product.status_changed.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'product_id', 'old_status', 'new_status'})
+_C1 = ('product_id', 'old_status', 'new_status', )
+_C2 = frozenset({'under_review', 'active', 'rejected', 'on_hold', 'inactive', 'restricted', 'closed'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('product_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".product_id: expected type 'string'")
+        v3 = data.get('old_status', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".old_status: expected type 'string'")
+            else:
+                if v3 not in _C2:
+                    errors.append(path + ".old_status: value is not one of ['under_review', 'active', 'rejected', 'on_hold', 'inactive', 'restricted', 'closed']")
+        v4 = data.get('new_status', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".new_status: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".new_status: value is not one of ['under_review', 'active', 'rejected', 'on_hold', 'inactive', 'restricted', 'closed']")
+    return errors
@@ -0,0 +1,40 @@
+"""Validator for event:relationship.at_risk.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'relationship_id', 'health_score'})
+_C1 = ('relationship_id', 'health_score', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('relationship_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".relationship_id: expected type 'string'")
+        v3 = data.get('health_score', _MISSING)
+        if v3 is not _MISSING:
+            if not ((isinstance(v3, (int, float)) and not isinstance(v3, bool))):
+                errors.append(path + ".health_score: expected type 'number'")
+            else:
+                if v3 < 0:
+                    errors.append(path + '.health_score: less than minimum 0')
+                if v3 > 100:
+                    errors.append(path + '.health_score: greater than maximum 100')
+        v4 = data.get('risk_factors', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, list)):
+                errors.append(path + ".risk_factors: expected type 'array'")
+            else:
+                for _i5, v6 in enumerate(v4):
+                    if not (isinstance(v6, str)):
+                        errors.append(path + '.risk_factors[' + str(_i5) + "]: expected type 'string'")
+    return errors
@@ -0,0 +1,187 @@
+"""Validator for event:relationship.created.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'relationship_id', 'tenant_id', 'primary_client_id', 'actors', 'relationship_type', 'status', 'health', 'created_at', 'updated_at'})
+_C1 = ('relationship_id', 'tenant_id', 'primary_client_id', 'actors', 'relationship_type', 'status', 'health', 'created_at', 'updated_at', )
+_C2 = frozenset({'actor_id', 'actor_role', 'actor_type'})
+_C3 = ('actor_id', 'actor_role', 'actor_type', )
+_C4 = frozenset({'human_internal', 'human_external', 'system', 'service'})
+_C5 = frozenset({'primary_coverage', 'secondary_coverage', 'investment_specialist', 'product_specialist', 'relationship_manager', 'system_managed'})
+_C6 = frozenset({'prospective', 'active', 'dormant', 'at_risk', 'terminated', 'archived'})
+_C7 = frozenset({'overall_score'})
+_C8 = ('overall_score', )
+_C9 = frozenset({'improving', 'stable', 'declining'})
+_C10 = frozenset({'client', 'client_link'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('relationship_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".relationship_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('primary_client_id', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".primary_client_id: expected type 'string'")
+        v5 = data.get('scope_client_ids', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, list)):
+                errors.append(path + ".scope_client_ids: expected type 'array'")
+            else:
+                for _i6, v7 in enumerate(v5):
+                    if not (isinstance(v7, str)):
+                        errors.append(path + '.scope_client_ids[' + str(_i6) + "]: expected type 'string'")
+        v8 = data.get('actors', _MISSING)
+        if v8 is not _MISSING:
+            if not (isinstance(v8, list)):
+                errors.append(path + ".actors: expected type 'array'")
+            else:
+                if len(v8) < 1:
+                    errors.append(path + '.actors: fewer than 1 items')
+                for _i9, v10 in enumerate(v8):
+                    if not (isinstance(v10, dict)):
+                        errors.append(path + '.actors[' + str(_i9) + "]: expected type 'object'")
+                    else:
+                        if not _C2 <= v10.keys():
+                            for _k11 in _C3:
+                                if _k11 not in v10:
+                                    errors.append(path + '.actors[' + str(_i9) + ']: missing required property ' + repr(_k11))
+                        v12 = v10.get('actor_id', _MISSING)
+                        if v12 is not _MISSING:
+                            if not (isinstance(v12, str)):
+                                errors.append(path + '.actors[' + str(_i9) + "].actor_id: expected type 'string'")
+                        v13 = v10.get('actor_role', _MISSING)
+                        if v13 is not _MISSING:
+                            if not (isinstance(v13, str)):
+                                errors.append(path + '.actors[' + str(_i9) + "].actor_role: expected type 'string'")
+                        v14 = v10.get('actor_type', _MISSING)
+                        if v14 is not _MISSING:
+                            if not (isinstance(v14, str)):
+                                errors.append(path + '.actors[' + str(_i9) + "].actor_type: expected type 'string'")
+                            else:
+                                if v14 not in _C4:
+                                    errors.append(path + '.actors[' + str(_i9) + "].actor_type: value is not one of ['human_internal', 'human_external', 'system', 'service']")
+                        v15 = v10.get('display_name', _MISSING)
+                        if v15 is not _MISSING:
+                            if not (isinstance(v15, str)):
+                                errors.append(path + '.actors[' + str(_i9) + "].display_name: expected type 'string'")
+        v16 = data.get('relationship_type', _MISSING)
+        if v16 is not _MISSING:
+            if not (isinstance(v16, str)):
+                errors.append(path + ".relationship_type: expected type 'string'")
+            else:
+                if v16 not in _C5:
+                    errors.append(path + ".relationship_type: value is not one of ['primary_coverage', 'secondary_coverage', 'investment_specialist', 'product_specialist', 'relationship_manager', 'system_managed']")
+        v17 = data.get('status', _MISSING)
+        if v17 is not _MISSING:
+            if not (isinstance(v17, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v17 not in _C6:
+                    errors.append(path + ".status: value is not one of ['prospective', 'active', 'dormant', 'at_risk', 'terminated', 'archived']")
+        v18 = data.get('health', _MISSING)
+        if v18 is not _MISSING:
+            if not (isinstance(v18, dict)):
+                errors.append(path + ".health: expected type 'object'")
+            else:
+                if not _C7 <= v18.keys():
+                    for _k19 in _C8:
+                        if _k19 not in v18:
+                            errors.append(path + '.health: missing required property ' + repr(_k19))
+                v20 = v18.get('overall_score', _MISSING)
+                if v20 is not _MISSING:
+                    if not ((isinstance(v20, (int, float)) and not isinstance(v20, bool))):
+                        errors.append(path + ".health.overall_score: expected type 'number'")
+                    else:
+                        if v20 < 0:
+                            errors.append(path + '.health.overall_score: less than minimum 0')
+                        if v20 > 100:
+                            errors.append(path + '.health.overall_score: greater than maximum 100')
+                v21 = v18.get('engagement_score', _MISSING)
+                if v21 is not _MISSING:
+                    if not ((isinstance(v21, (int, float)) and not isinstance(v21, bool))):
+                        errors.append(path + ".health.engagement_score: expected type 'number'")
+                v22 = v18.get('responsiveness', _MISSING)
+                if v22 is not _MISSING:
+                    if not ((isinstance(v22, (int, float)) and not isinstance(v22, bool))):
+                        errors.append(path + ".health.responsiveness: expected type 'number'")
+                v23 = v18.get('trust_signal', _MISSING)
+                if v23 is not _MISSING:
+                    if not ((isinstance(v23, (int, float)) and not isinstance(v23, bool))):
+                        errors.append(path + ".health.trust_signal: expected type 'number'")
+                v24 = v18.get('satisfaction_signal', _MISSING)
+                if v24 is not _MISSING:
+                    if not ((isinstance(v24, (int, float)) and not isinstance(v24, bool))):
+                        errors.append(path + ".health.satisfaction_signal: expected type 'number'")
+                v25 = v18.get('trend', _MISSING)
+                if v25 is not _MISSING:
+                    if not (isinstance(v25, str)):
+                        errors.append(path + ".health.trend: expected type 'string'")
+                    else:
+                        if v25 not in _C9:
+                            errors.append(path + ".health.trend: value is not one of ['improving', 'stable', 'declining']")
+                v26 = v18.get('last_calculated_at', _MISSING)
+                if v26 is not _MISSING:
+                    if not (isinstance(v26, str)):
+                        errors.append(path + ".health.last_calculated_at: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v26) is None:
+                            errors.append(path + ".health.last_calculated_at: not a valid 'date-time' string")
+        v27 = data.get('preferences', _MISSING)
+        if v27 is not _MISSING:
+            if not (isinstance(v27, dict)):
+                errors.append(path + ".preferences: expected type 'object'")
+        v28 = data.get('engagement_signals', _MISSING)
+        if v28 is not _MISSING:
+            if not (isinstance(v28, dict)):
+                errors.append(path + ".engagement_signals: expected type 'object'")
+        v29 = data.get('notes', _MISSING)
+        if v29 is not _MISSING:
+            if not (isinstance(v29, str)):
+                errors.append(path + ".notes: expected type 'string'")
+        v30 = data.get('derived_from', _MISSING)
+        if v30 is not _MISSING:
+            if not (isinstance(v30, dict)):
+                errors.append(path + ".derived_from: expected type 'object'")
+            else:
+                v31 = v30.get('entity_type', _MISSING)
+                if v31 is not _MISSING:
+                    if not (isinstance(v31, str)):
+                        errors.append(path + ".derived_from.entity_type: expected type 'string'")
+                    else:
+                        if v31 not in _C10:
+                            errors.append(path + ".derived_from.entity_type: value is not one of ['client', 'client_link']")
+                v32 = v30.get('entity_id', _MISSING)
+                if v32 is not _MISSING:
+                    if not (isinstance(v32, str)):
+                        errors.append(path + ".derived_from.entity_id: expected type 'string'")
+        v33 = data.get('created_at', _MISSING)
+        if v33 is not _MISSING:
+            if not (isinstance(v33, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v33) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v34 = data.get('updated_at', _MISSING)
+        if v34 is not _MISSING:
+            if not (isinstance(v34, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v34) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
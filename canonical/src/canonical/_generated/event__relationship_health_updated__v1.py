@@ -0,0 +1,75 @@
+"""Validator for event:relationship.health_updated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'relationship_id', 'health'})
+_C1 = ('relationship_id', 'health', )
+_C2 = frozenset({'overall_score'})
+_C3 = ('overall_score', )
+_C4 = frozenset({'improving', 'stable', 'declining'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('relationship_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".relationship_id: expected type 'string'")
+        v3 = data.get('health', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, dict)):
+                errors.append(path + ".health: expected type 'object'")
+            else:
+                if not _C2 <= v3.keys():
+                    for _k4 in _C3:
+                        if _k4 not in v3:
+                            errors.append(path + '.health: missing required property ' + repr(_k4))
+                v5 = v3.get('overall_score', _MISSING)
+                if v5 is not _MISSING:
+                    if not ((isinstance(v5, (int, float)) and not isinstance(v5, bool))):
+                        errors.append(path + ".health.overall_score: expected type 'number'")
+                    else:
+                        if v5 < 0:
+                            errors.append(path + '.health.overall_score: less than minimum 0')
+                        if v5 > 100:
+                            errors.append(path + '.health.overall_score: greater than maximum 100')
+                v6 = v3.get('engagement_score', _MISSING)
+                if v6 is not _MISSING:
+                    if not ((isinstance(v6, (int, float)) and not isinstance(v6, bool))):
+                        errors.append(path + ".health.engagement_score: expected type 'number'")
+                v7 = v3.get('responsiveness', _MISSING)
+                if v7 is not _MISSING:
+                    if not ((isinstance(v7, (int, float)) and not isinstance(v7, bool))):
+                        errors.append(path + ".health.responsiveness: expected type 'number'")
+                v8 = v3.get('trust_signal', _MISSING)
+                if v8 is not _MISSING:
+                    if not ((isinstance(v8, (int, float)) and not isinstance(v8, bool))):
+                        errors.append(path + ".health.trust_signal: expected type 'number'")
+                v9 = v3.get('satisfaction_signal', _MISSING)
+                if v9 is not _MISSING:
+                    if not ((isinstance(v9, (int, float)) and not isinstance(v9, bool))):
+                        errors.append(path + ".health.satisfaction_signal: expected type 'number'")
+                v10 = v3.get('trend', _MISSING)
+                if v10 is not _MISSING:
+                    if not (isinstance(v10, str)):
+                        errors.append(path + ".health.trend: expected type 'string'")
+                    else:
+                        if v10 not in _C4:
+                            errors.append(path + ".health.trend: value is not one of ['improving', 'stable', 'declining']")
+                v11 = v3.get('last_calculated_at', _MISSING)
+                if v11 is not _MISSING:
+                    if not (isinstance(v11, str)):
+                        errors.append(path + ".health.last_calculated_at: expected type 'string'")
+                    else:
+                        if _FORMAT_DATE_TIME.match(v11) is None:
+                            errors.append(path + ".health.last_calculated_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,27 @@
+"""Validator for event:relationship.preferences_updated.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'relationship_id', 'preferences'})
+_C1 = ('relationship_id', 'preferences', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('relationship_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".relationship_id: expected type 'string'")
+        v3 = data.get('preferences', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, dict)):
+                errors.append(path + ".preferences: expected type 'object'")
+    return errors
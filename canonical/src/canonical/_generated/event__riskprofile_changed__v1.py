@@ -0,0 +1,60 @@
+"""Validator for event:riskprofile.changed.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'primary_client_id'})
+_C1 = ('primary_client_id', )
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('primary_client_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".primary_client_id: expected type 'string'")
+        v3 = data.get('relationship_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".relationship_id: expected type 'string'")
+        v4 = data.get('scope_client_ids', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, list)):
+                errors.append(path + ".scope_client_ids: expected type 'array'")
+            else:
+                for _i5, v6 in enumerate(v4):
+                    if not (isinstance(v6, str)):
+                        errors.append(path + '.scope_client_ids[' + str(_i5) + "]: expected type 'string'")
+        v7 = data.get('riskprofile', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, dict)):
+                errors.append(path + ".riskprofile: expected type 'object'")
+            else:
+                v8 = v7.get('change_significant', _MISSING)
+                if v8 is not _MISSING:
+                    if not ((v8 is True or v8 is False)):
+                        errors.append(path + ".riskprofile.change_significant: expected type 'boolean'")
+                v9 = v7.get('previous_risk_level', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, str)):
+                        errors.append(path + ".riskprofile.previous_risk_level: expected type 'string'")
+                v10 = v7.get('new_risk_level', _MISSING)
+                if v10 is not _MISSING:
+                    if not (isinstance(v10, str)):
+                        errors.append(path + ".riskprofile.new_risk_level: expected type 'string'")
+        v11 = data.get('primary_rm_id', _MISSING)
+        if v11 is not _MISSING:
+            if not (isinstance(v11, str)):
+                errors.append(path + ".primary_rm_id: expected type 'string'")
+        v12 = data.get('relationship_manager_id', _MISSING)
+        if v12 is not _MISSING:
+            if not (isinstance(v12, str)):
+                errors.append(path + ".relationship_manager_id: expected type 'string'")
+    return errors
@@ -0,0 +1,170 @@
+"""Validator for event:riskprofile.created.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'riskprofile_id', 'tenant_id', 'client_id', 'status', 'risk_dimensions', 'score', 'created_at', 'updated_at'})
+_C1 = ('riskprofile_id', 'tenant_id', 'client_id', 'status', 'risk_dimensions', 'score', 'created_at', 'updated_at', )
+_C2 = frozenset({'draft', 'under_review', 'active', 'superseded', 'expired', 'archived'})
+_C3 = frozenset({'risk_tolerance', 'risk_capacity', 'investment_objectives', 'time_horizon'})
+_C4 = ('risk_tolerance', 'risk_capacity', 'investment_objectives', 'time_horizon', )
+_C5 = frozenset({'numeric_score', 'risk_band'})
+_C6 = ('numeric_score', 'risk_band', )
+_C7 = frozenset({'conservative', 'moderate', 'balanced', 'aggressive'})
+_C8 = frozenset({'entity_type', 'entity_id'})
+_C9 = ('entity_type', 'entity_id', )
+_C10 = frozenset({'interaction', 'document'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('riskprofile_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".riskprofile_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('client_id', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".client_id: expected type 'string'")
+        v5 = data.get('status', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v5 not in _C2:
+                    errors.append(path + ".status: value is not one of ['draft', 'under_review', 'active', 'superseded', 'expired', 'archived']")
+        v6 = data.get('risk_dimensions', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, dict)):
+                errors.append(path + ".risk_dimensions: expected type 'object'")
+            else:
+                if not _C3 <= v6.keys():
+                    for _k7 in _C4:
+                        if _k7 not in v6:
+                            errors.append(path + '.risk_dimensions: missing required property ' + repr(_k7))
+                v8 = v6.get('risk_tolerance', _MISSING)
+                if v8 is not _MISSING:
+                    if not (isinstance(v8, str)):
+                        errors.append(path + ".risk_dimensions.risk_tolerance: expected type 'string'")
+                v9 = v6.get('risk_capacity', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, str)):
+                        errors.append(path + ".risk_dimensions.risk_capacity: expected type 'string'")
+                v10 = v6.get('investment_objectives', _MISSING)
+                if v10 is not _MISSING:
+                    if not (isinstance(v10, list)):
+                        errors.append(path + ".risk_dimensions.investment_objectives: expected type 'array'")
+                    else:
+                        for _i11, v12 in enumerate(v10):
+                            if not (isinstance(v12, str)):
+                                errors.append(path + '.risk_dimensions.investment_objectives[' + str(_i11) + "]: expected type 'string'")
+                v13 = v6.get('time_horizon', _MISSING)
+                if v13 is not _MISSING:
+                    if not (isinstance(v13, str)):
+                        errors.append(path + ".risk_dimensions.time_horizon: expected type 'string'")
+                v14 = v6.get('liquidity_needs', _MISSING)
+                if v14 is not _MISSING:
+                    if not (isinstance(v14, str)):
+                        errors.append(path + ".risk_dimensions.liquidity_needs: expected type 'string'")
+                v15 = v6.get('knowledge_experience', _MISSING)
+                if v15 is not _MISSING:
+                    if not (isinstance(v15, str)):
+                        errors.append(path + ".risk_dimensions.knowledge_experience: expected type 'string'")
+                v16 = v6.get('constraints', _MISSING)
+                if v16 is not _MISSING:
+                    if not (isinstance(v16, list)):
+                        errors.append(path + ".risk_dimensions.constraints: expected type 'array'")
+                    else:
+                        for _i17, v18 in enumerate(v16):
+                            if not (isinstance(v18, str)):
+                                errors.append(path + '.risk_dimensions.constraints[' + str(_i17) + "]: expected type 'string'")
+        v19 = data.get('score', _MISSING)
+        if v19 is not _MISSING:
+            if not (isinstance(v19, dict)):
+                errors.append(path + ".score: expected type 'object'")
+            else:
+                if not _C5 <= v19.keys():
+                    for _k20 in _C6:
+                        if _k20 not in v19:
+                            errors.append(path + '.score: missing required property ' + repr(_k20))
+                v21 = v19.get('numeric_score', _MISSING)
+                if v21 is not _MISSING:
+                    if not ((isinstance(v21, (int, float)) and not isinstance(v21, bool))):
+                        errors.append(path + ".score.numeric_score: expected type 'number'")
+                    else:
+                        if v21 < 0:
+                            errors.append(path + '.score.numeric_score: less than minimum 0')
+                        if v21 > 100:
+                            errors.append(path + '.score.numeric_score: greater than maximum 100')
+                v22 = v19.get('risk_band', _MISSING)
+                if v22 is not _MISSING:
+                    if not (isinstance(v22, str)):
+                        errors.append(path + ".score.risk_band: expected type 'string'")
+                    else:
+                        if v22 not in _C7:
+                            errors.append(path + ".score.risk_band: value is not one of ['conservative', 'moderate', 'balanced', 'aggressive']")
+        v23 = data.get('derived_from', _MISSING)
+        if v23 is not _MISSING:
+            if not (isinstance(v23, list)):
+                errors.append(path + ".derived_from: expected type 'array'")
+            else:
+                for _i24, v25 in enumerate(v23):
+                    if not (isinstance(v25, dict)):
+                        errors.append(path + '.derived_from[' + str(_i24) + "]: expected type 'object'")
+                    else:
+                        if not _C8 <= v25.keys():
+                            for _k26 in _C9:
+                                if _k26 not in v25:
+                                    errors.append(path + '.derived_from[' + str(_i24) + ']: missing required property ' + repr(_k26))
+                        v27 = v25.get('entity_type', _MISSING)
+                        if v27 is not _MISSING:
+                            if not (isinstance(v27, str)):
+                                errors.append(path + '.derived_from[' + str(_i24) + "].entity_type: expected type 'string'")
+                            else:
+                                if v27 not in _C10:
+                                    errors.append(path + '.derived_from[' + str(_i24) + "].entity_type: value is not one of ['interaction', 'document']")
+                        v28 = v25.get('entity_id', _MISSING)
+                        if v28 is not _MISSING:
+                            if not (isinstance(v28, str)):
+                                errors.append(path + '.derived_from[' + str(_i24) + "].entity_id: expected type 'string'")
+        v29 = data.get('valid_from', _MISSING)
+        if v29 is not _MISSING:
+            if not (isinstance(v29, str)):
+                errors.append(path + ".valid_from: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v29) is None:
+                    errors.append(path + ".valid_from: not a valid 'date-time' string")
+        v30 = data.get('valid_to', _MISSING)
+        if v30 is not _MISSING:
+            if not (isinstance(v30, str)):
+                errors.append(path + ".valid_to: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v30) is None:
+                    errors.append(path + ".valid_to: not a valid 'date-time' string")
+        v31 = data.get('created_at', _MISSING)
+        if v31 is not _MISSING:
+            if not (isinstance(v31, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v31) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v32 = data.get('updated_at', _MISSING)
+        if v32 is not _MISSING:
+            if not (isinstance(v32, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v32) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
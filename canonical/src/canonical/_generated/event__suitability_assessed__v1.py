@@ -0,0 +1,98 @@
+"""Validator for event:suitability.assessed.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'assessment_id', 'tenant_id', 'client_id', 'product_id', 'riskprofile_id', 'outcome', 'assessed_at'})
+_C1 = ('assessment_id', 'tenant_id', 'client_id', 'product_id', 'riskprofile_id', 'outcome', 'assessed_at', )
+_C2 = frozenset({'suitable', 'conditionally_suitable', 'unsuitable'})
+_C3 = frozenset({'entity_type', 'entity_id'})
+_C4 = ('entity_type', 'entity_id', )
+_C5 = frozenset({'riskprofile', 'product', 'document'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('assessment_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".assessment_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('client_id', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".client_id: expected type 'string'")
+        v5 = data.get('product_id', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".product_id: expected type 'string'")
+        v6 = data.get('riskprofile_id', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, str)):
+                errors.append(path + ".riskprofile_id: expected type 'string'")
+        v7 = data.get('outcome', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, str)):
+                errors.append(path + ".outcome: expected type 'string'")
+            else:
+                if v7 not in _C2:
+                    errors.append(path + ".outcome: value is not one of ['suitable', 'conditionally_suitable', 'unsuitable']")
+        v8 = data.get('reasons', _MISSING)
+        if v8 is not _MISSING:
+            if not (isinstance(v8, list)):
+                errors.append(path + ".reasons: expected type 'array'")
+            else:
+                for _i9, v10 in enumerate(v8):
+                    if not (isinstance(v10, str)):
+                        errors.append(path + '.reasons[' + str(_i9) + "]: expected type 'string'")
+        v11 = data.get('constraints_triggered', _MISSING)
+        if v11 is not _MISSING:
+            if not (isinstance(v11, list)):
+                errors.append(path + ".constraints_triggered: expected type 'array'")
+            else:
+                for _i12, v13 in enumerate(v11):
+                    if not (isinstance(v13, str)):
+                        errors.append(path + '.constraints_triggered[' + str(_i12) + "]: expected type 'string'")
+        v14 = data.get('derived_from', _MISSING)
+        if v14 is not _MISSING:
+            if not (isinstance(v14, list)):
+                errors.append(path + ".derived_from: expected type 'array'")
+            else:
+                for _i15, v16 in enumerate(v14):
+                    if not (isinstance(v16, dict)):
+                        errors.append(path + '.derived_from[' + str(_i15) + "]: expected type 'object'")
+                    else:
+                        if not _C3 <= v16.keys():
+                            for _k17 in _C4:
+                                if _k17 not in v16:
+                                    errors.append(path + '.derived_from[' + str(_i15) + ']: missing required property ' + repr(_k17))
+                        v18 = v16.get('entity_type', _MISSING)
+                        if v18 is not _MISSING:
+                            if not (isinstance(v18, str)):
+                                errors.append(path + '.derived_from[' + str(_i15) + "].entity_type: expected type 'string'")
+                            else:
+                                if v18 not in _C5:
+                                    errors.append(path + '.derived_from[' + str(_i15) + "].entity_type: value is not one of ['riskprofile', 'product', 'document']")
+                        v19 = v16.get('entity_id', _MISSING)
+                        if v19 is not _MISSING:
+                            if not (isinstance(v19, str)):
+                                errors.append(path + '.derived_from[' + str(_i15) + "].entity_id: expected type 'string'")
+        v20 = data.get('assessed_at', _MISSING)
+        if v20 is not _MISSING:
+            if not (isinstance(v20, str)):
+                errors.append(path + ".assessed_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v20) is None:
+                    errors.append(path + ".assessed_at: not a valid 'date-time' string")
+    return errors
@@ -0,0 +1,165 @@
+"""Validator for event:task.expired.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_FORMAT_DATE_TIME = re.compile('^\\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\\d|3[01])[Tt ](?:[01]\\d|2[0-3]):[0-5]\\d:(?:[0-5]\\d|60)(?:\\.\\d+)?(?:[Zz]|[+-](?:[01]\\d|2[0-3]):[0-5]\\d)\\Z', re.ASCII)
+_C0 = frozenset({'task_id', 'tenant_id', 'task_type', 'status', 'priority', 'assignee', 'scope', 'source_event', 'created_at', 'updated_at'})
+_C1 = ('task_id', 'tenant_id', 'task_type', 'status', 'priority', 'assignee', 'scope', 'source_event', 'created_at', 'updated_at', )
+_C2 = frozenset({'review_document', 'review_interaction', 'follow_up_client', 'relationship_intervention', 'update_risk_profile', 'suitability_check', 'compliance_review', 'product_update_required', 'information_missing', 'client_structure_review', 'system_followup'})
+_C3 = frozenset({'open', 'in_progress', 'blocked', 'completed', 'cancelled', 'expired', 'superseded', 'archived'})
+_C4 = frozenset({'low', 'medium', 'high', 'critical'})
+_C5 = frozenset({'actor_id', 'actor_role', 'actor_type'})
+_C6 = ('actor_id', 'actor_role', 'actor_type', )
+_C7 = frozenset({'human_internal', 'human_external', 'system', 'service'})
+_C8 = frozenset({'primary_client_id'})
+_C9 = ('primary_client_id', )
+_C10 = frozenset({'event_type', 'entity_type', 'entity_id'})
+_C11 = ('event_type', 'entity_type', 'entity_id', )
+_C12 = frozenset({'client', 'client_link', 'relationship', 'interaction', 'document', 'product', 'riskprofile', 'suitability'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('task_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".task_id: expected type 'string'")
+        v3 = data.get('tenant_id', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".tenant_id: expected type 'string'")
+        v4 = data.get('task_type', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".task_type: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".task_type: value is not one of ['review_document', 'review_interaction', 'follow_up_client', 'relationship_intervention', 'update_risk_profile', 'suitability_check', 'compliance_review', 'product_update_required', 'information_missing', 'client_structure_review', 'system_followup']")
+        v5 = data.get('status', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".status: expected type 'string'")
+            else:
+                if v5 not in _C3:
+                    errors.append(path + ".status: value is not one of ['open', 'in_progress', 'blocked', 'completed', 'cancelled', 'expired', 'superseded', 'archived']")
+        v6 = data.get('priority', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, str)):
+                errors.append(path + ".priority: expected type 'string'")
+            else:
+                if v6 not in _C4:
+                    errors.append(path + ".priority: value is not one of ['low', 'medium', 'high', 'critical']")
+        v7 = data.get('assignee', _MISSING)
+        if v7 is not _MISSING:
+            if not (isinstance(v7, dict)):
+                errors.append(path + ".assignee: expected type 'object'")
+            else:
+                if not _C5 <= v7.keys():
+                    for _k8 in _C6:
+                        if _k8 not in v7:
+                            errors.append(path + '.assignee: missing required property ' + repr(_k8))
+                v9 = v7.get('actor_id', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, str)):
+                        errors.append(path + ".assignee.actor_id: expected type 'string'")
+                v10 = v7.get('actor_role', _MISSING)
+                if v10 is not _MISSING:
+                    if not (isinstance(v10, str)):
+                        errors.append(path + ".assignee.actor_role: expected type 'string'")
+                v11 = v7.get('actor_type', _MISSING)
+                if v11 is not _MISSING:
+                    if not (isinstance(v11, str)):
+                        errors.append(path + ".assignee.actor_type: expected type 'string'")
+                    else:
+                        if v11 not in _C7:
+                            errors.append(path + ".assignee.actor_type: value is not one of ['human_internal', 'human_external', 'system', 'service']")
+        v12 = data.get('scope', _MISSING)
+        if v12 is not _MISSING:
+            if not (isinstance(v12, dict)):
+                errors.append(path + ".scope: expected type 'object'")
+            else:
+                if not _C8 <= v12.keys():
+                    for _k13 in _C9:
+                        if _k13 not in v12:
+                            errors.append(path + '.scope: missing required property ' + repr(_k13))
+                v14 = v12.get('relationship_id', _MISSING)
+                if v14 is not _MISSING:
+                    if not (isinstance(v14, str)):
+                        errors.append(path + ".scope.relationship_id: expected type 'string'")
+                v15 = v12.get('primary_client_id', _MISSING)
+                if v15 is not _MISSING:
+                    if not (isinstance(v15, str)):
+                        errors.append(path + ".scope.primary_client_id: expected type 'string'")
+                v16 = v12.get('scope_client_ids', _MISSING)
+                if v16 is not _MISSING:
+                    if not (isinstance(v16, list)):
+                        errors.append(path + ".scope.scope_client_ids: expected type 'array'")
+                    else:
+                        for _i17, v18 in enumerate(v16):
+                            if not (isinstance(v18, str)):
+                                errors.append(path + '.scope.scope_client_ids[' + str(_i17) + "]: expected type 'string'")
+        v19 = data.get('source_event', _MISSING)
+        if v19 is not _MISSING:
+            if not (isinstance(v19, dict)):
+                errors.append(path + ".source_event: expected type 'object'")
+            else:
+                if not _C10 <= v19.keys():
+                    for _k20 in _C11:
+                        if _k20 not in v19:
+                            errors.append(path + '.source_event: missing required property ' + repr(_k20))
+                v21 = v19.get('event_type', _MISSING)
+                if v21 is not _MISSING:
+                    if not (isinstance(v21, str)):
+                        errors.append(path + ".source_event.event_type: expected type 'string'")
+                v22 = v19.get('entity_type', _MISSING)
+                if v22 is not _MISSING:
+                    if not (isinstance(v22, str)):
+                        errors.append(path + ".source_event.entity_type: expected type 'string'")
+                    else:
+                        if v22 not in _C12:
+                            errors.append(path + ".source_event.entity_type: value is not one of ['client', 'client_link', 'relationship', 'interaction', 'document', 'product', 'riskprofile', 'suitability']")
+                v23 = v19.get('entity_id', _MISSING)
+                if v23 is not _MISSING:
+                    if not (isinstance(v23, str)):
+                        errors.append(path + ".source_event.entity_id: expected type 'string'")
+        v24 = data.get('due_by', _MISSING)
+        if v24 is not _MISSING:
+            if not (isinstance(v24, str)):
+                errors.append(path + ".due_by: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v24) is None:
+                    errors.append(path + ".due_by: not a valid 'date-time' string")
+        v25 = data.get('context', _MISSING)
+        if v25 is not _MISSING:
+            if not (isinstance(v25, dict)):
+                errors.append(path + ".context: expected type 'object'")
+        v26 = data.get('expired_at', _MISSING)
+        if v26 is not _MISSING:
+            if not (isinstance(v26, str)):
+                errors.append(path + ".expired_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v26) is None:
+                    errors.append(path + ".expired_at: not a valid 'date-time' string")
+        v27 = data.get('created_at', _MISSING)
+        if v27 is not _MISSING:
+            if not (isinstance(v27, str)):
+                errors.append(path + ".created_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v27) is None:
+                    errors.append(path + ".created_at: not a valid 'date-time' string")
+        v28 = data.get('updated_at', _MISSING)
+        if v28 is not _MISSING:
+            if not (isinstance(v28, str)):
+                errors.append(path + ".updated_at: expected type 'string'")
+            else:
+                if _FORMAT_DATE_TIME.match(v28) is None:
+                    errors.append(path + ".updated_at: not a valid 'date-time' string")
+    return errors
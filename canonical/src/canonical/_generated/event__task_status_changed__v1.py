@@ -0,0 +1,63 @@
+"""Validator for event:task.status_changed.v1 - generated by canonical.codegen, do not edit."""
+
+import re
+
+_MISSING = object()
+_C0 = frozenset({'task_id', 'previous_status', 'new_status'})
+_C1 = ('task_id', 'previous_status', 'new_status', )
+_C2 = frozenset({'open', 'in_progress', 'blocked', 'completed', 'cancelled', 'expired', 'superseded', 'archived'})
+_C3 = frozenset({'human_internal', 'human_external', 'system', 'service'})
+
+
+def validate(data, path='$'):
+    errors = []
+    if not (isinstance(data, dict)):
+        errors.append(path + ": expected type 'object'")
+    else:
+        if not _C0 <= data.keys():
+            for _k1 in _C1:
+                if _k1 not in data:
+                    errors.append(path + ': missing required property ' + repr(_k1))
+        v2 = data.get('task_id', _MISSING)
+        if v2 is not _MISSING:
+            if not (isinstance(v2, str)):
+                errors.append(path + ".task_id: expected type 'string'")
+        v3 = data.get('previous_status', _MISSING)
+        if v3 is not _MISSING:
+            if not (isinstance(v3, str)):
+                errors.append(path + ".previous_status: expected type 'string'")
+            else:
+                if v3 not in _C2:
+                    errors.append(path + ".previous_status: value is not one of ['open', 'in_progress', 'blocked', 'completed', 'cancelled', 'expired', 'superseded', 'archived']")
+        v4 = data.get('new_status', _MISSING)
+        if v4 is not _MISSING:
+            if not (isinstance(v4, str)):
+                errors.append(path + ".new_status: expected type 'string'")
+            else:
+                if v4 not in _C2:
+                    errors.append(path + ".new_status: value is not one of ['open', 'in_progress', 'blocked', 'completed', 'cancelled', 'expired', 'superseded', 'archived']")
+        v5 = data.get('task_type', _MISSING)
+        if v5 is not _MISSING:
+            if not (isinstance(v5, str)):
+                errors.append(path + ".task_type: expected type 'string'")
+        v6 = data.get('changed_by', _MISSING)
+        if v6 is not _MISSING:
+            if not (isinstance(v6, dict)):
+                errors.append(path + ".changed_by: expected type 'object'")
+            else:
+                v7 = v6.get('actor_id', _MISSING)
+                if v7 is not _MISSING:
+                    if not (isinstance(v7, str)):
+                        errors.append(path + ".changed_by.actor_id: expected type 'string'")
+                v8 = v6.get('actor_role', _MISSING)
+                if v8 is not _MISSING:
+                    if not (isinstance(v8, str)):
+                        errors.append(path + ".changed_by.actor_role: expected type 'string'")
+                v9 = v6.get('actor_type', _MISSING)
+                if v9 is not _MISSING:
+                    if not (isinstance(v9, str)):
+                        errors.append(path + ".changed_by.actor_type: expected type 'string'")
+                    else:
+                        if v9 not in _C3:
+                            errors.append(path + ".changed_by.actor_type: value is not one of ['human_internal', 'human_external', 'system', 'service']")
+    return errors
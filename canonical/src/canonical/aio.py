@@ -0,0 +1,239 @@
+"""Asyncio API for the registry and event validation.
+
+The ``load_*`` functions read files (``open``, JSON and YAML parsing) on a
+cache miss, which would block the event loop of an async service. The
+``aload_*`` coroutines here return cached entries inline and run cold loads
+on a small, bounded thread pool. Concurrent awaits of the same key share one
+load (single-flight), so a burst of first requests triggers a single read.
+
+Cached results are the same objects the synchronous API returns; the caches,
+locks, ``refresh()`` and ``preload()`` apply to both.
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+from canonical import codec, registry
+from canonical.registry import EventNotFoundError
+from canonical.validator import (
+    EventValidationResult,
+    Validator,
+    compile_validator,
+    validate_event,
+)
+
+DEFAULT_MAX_WORKERS = 4
+
+_executor: Executor | None = None
+_default_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Loads in flight, per event loop (asyncio futures belong to a single loop)
+_inflight: "weakref.WeakKeyDictionary[Any, dict[Hashable, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_executor(executor: Executor | None) -> None:
+    """
+    Run cold loads on another executor.
+
+    Args:
+        executor: Executor to use, or None for the default pool of
+            ``DEFAULT_MAX_WORKERS`` threads (created on first use)
+    """
+    global _executor
+
+    _executor = executor
+
+
+def _get_executor() -> Executor:
+    global _default_executor
+
+    executor = _executor or _default_executor
+    if executor is None:
+        with _executor_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="canonical-aio"
+                )
+            executor = _default_executor
+    return executor
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # Every waiter may have been cancelled; don't log the error as unretrieved
+    if not future.cancelled():
+        future.exception()
+
+
+async def _single_flight(key: Hashable, function: Callable[..., Any], *args: Any) -> Any:
+    """Run ``function(*args)`` on the executor, sharing one call per key."""
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.get(loop)
+    if inflight is None:
+        inflight = _inflight[loop] = {}
+
+    future = inflight.get(key)
+    if future is None:
+        future = loop.run_in_executor(_get_executor(), function, *args)
+        inflight[key] = future
+
+        def _done(done: asyncio.Future) -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            _consume_exception(done)
+
+        future.add_done_callback(_done)
+    # A cancelled waiter must not cancel the load the other waiters share
+    return await asyncio.shield(future)
+
+
+async def aload_entity_schema(entity: str, version: str = "v1") -> dict[str, Any]:
+    """
+    Async ``load_entity_schema``.
+
+    Args:
+        entity: Entity name (e.g., "client", "task", "document")
+        version: Schema version (default: "v1")
+
+    Returns:
+        JSON Schema definition as a read-only (deeply frozen) dictionary
+
+    Raises:
+        SchemaNotFoundError: If schema file not found
+    """
+    schema = registry._entity_schemas.get(f"{entity}.{version}")
+    if schema is not None:
+        return schema
+    return await _single_flight(
+        ("entity", entity, version), registry.load_entity_schema, entity, version
+    )
+
+
+async def aload_event_envelope_schema() -> dict[str, Any]:
+    """
+    Async ``load_event_envelope_schema``.
+
+    Returns:
+        Event envelope JSON schema definition (read-only, deeply frozen)
+
+    Raises:
+        SchemaNotFoundError: If envelope schema file not found
+    """
+    schema = registry._envelope_schema
+    if schema is not None:
+        return schema
+    return await _single_flight(("envelope",), registry.load_event_envelope_schema)
+
+
+async def aload_event_schema(event_type: str, version: str = "v1") -> dict[str, Any]:
+    """
+    Async ``load_event_schema``.
+
+    Args:
+        event_type: Event type (e.g., "client.created", "task.completed")
+        version: Schema version (default: "v1")
+
+    Returns:
+        Event JSON schema definition as a read-only (deeply frozen) dictionary
+
+    Raises:
+        EventNotFoundError: If event schema file not found
+    """
+    schema = registry._event_schemas.get(f"{event_type}.{version}")
+    if schema is not None:
+        return schema
+    return await _single_flight(
+        ("event", event_type, version), registry.load_event_schema, event_type, version
+    )
+
+
+async def aload_semantic_constraints(entity: str, version: str = "v1") -> dict[str, Any]:
+    """
+    Async ``load_semantic_constraints``.
+
+    Args:
+        entity: Entity name (e.g., "client")
+        version: Schema version (default: "v1")
+
+    Returns:
+        Semantic constraint definition as a read-only (deeply frozen) dictionary.
+        Returns empty constraints if file not found (semantics are optional).
+
+    Raises:
+        SemanticNotFoundError: If semantic file exists but cannot be loaded
+    """
+    constraints = registry._semantic_constraints.get(f"{entity}.{version}")
+    if constraints is not None:
+        return constraints
+    return await _single_flight(
+        ("semantic", entity, version), registry.load_semantic_constraints, entity, version
+    )
+
+
+async def acompile_validator(kind: str, name: str, version: str = "v1") -> Validator:
+    """
+    Async ``compile_validator``: loading and compiling run on the executor.
+
+    Args:
+        kind: Schema kind - "entity", "event" or "envelope"
+        name: Entity name or event type. Use "event_envelope" for the envelope.
+        version: Schema version (default: "v1")
+
+    Returns:
+        Callable ``validator(instance, path="$") -> list[str]``
+
+    Raises:
+        SchemaNotFoundError: If an entity or envelope schema is not found
+        EventNotFoundError: If an event schema is not found
+        SchemaCompileError: If the schema uses unsupported keywords
+    """
+    key = (kind, name, version)
+    validator = registry._compiled_validators.get(key)
+    if validator is not None:
+        return validator
+    return await _single_flight(("validator",) + key, compile_validator, kind, name, version)
+
+
+async def avalidate_event(
+    raw: bytes | bytearray | memoryview | str | dict[str, Any],
+) -> EventValidationResult:
+    """
+    Async ``validate_event``.
+
+    Validators that are not compiled yet are loaded on the executor; the
+    validation itself is CPU-bound and runs inline, as with a warm cache it
+    takes microseconds.
+
+    Args:
+        raw: Event as JSON bytes/str (or another bytes-like buffer), or an
+            already decoded dict
+
+    Returns:
+        EventValidationResult describing the outcome
+    """
+    if isinstance(raw, dict):
+        event = raw
+    else:
+        try:
+            event = codec.loads(raw)
+        except (ValueError, TypeError):
+            # Reported by validate_event, which needs no schema for this
+            return validate_event(raw)
+
+    await acompile_validator("envelope", "event_envelope")
+    if isinstance(event, dict):
+        event_type = event.get("event_type")
+        event_version = event.get("event_version")
+        if isinstance(event_type, str) and isinstance(event_version, str):
+            try:
+                await acompile_validator("event", event_type, event_version)
+            except EventNotFoundError:
+                pass  # Reported by validate_event (from the negative cache)
+        return validate_event(event)
+    # JSON that is not an object: validate_event only decodes str/bytes input
+    return validate_event(raw)
@@ -0,0 +1,87 @@
+"""Batch validation of canonical events, grouped by event type.
+
+Events are bucketed by ``(event_type, event_version)``. The compiled envelope
+validator runs once over the whole batch and each bucket's compiled payload
+validator runs once over that bucket as a single ``map()`` pass, so there is no
+per-record dispatch, schema lookup or result object.
+"""
+
+import logging
+from itertools import repeat
+from typing import Any, Iterable
+
+from canonical import codec, registry
+from canonical.registry import EventNotFoundError
+from canonical.validator import _ENVELOPE_KEY, compile_validator
+
+logger = logging.getLogger(__name__)
+
+
+def validate_events_batch(events: Iterable[bytes | str | dict[str, Any]]) -> list[list[str]]:
+    """
+    Validate many events at once, grouping them by event type.
+
+    Args:
+        events: Events as JSON bytes/str or already decoded dicts
+
+    Returns:
+        One list of error messages per input event, in input order (empty
+        when the event is valid). Messages are the same as those reported by
+        ``validate_event``.
+    """
+    decoded: list[Any] = []
+    errors: list[list[str]] = []
+    rows: list[int] = []
+    for raw in events:
+        if isinstance(raw, dict):
+            event = raw
+        else:
+            try:
+                event = codec.loads(raw)
+            except (ValueError, TypeError) as e:
+                errors.append([f"$: invalid JSON: {e}"])
+                decoded.append(None)
+                continue
+        rows.append(len(decoded))
+        decoded.append(event)
+        errors.append([])
+
+    _validate_decoded(decoded, rows, errors)
+    logger.debug(f"Validated batch of {len(errors)} events")
+    return errors
+
+
+def _validate_decoded(decoded: list[Any], rows: list[int], errors: list[list[str]]) -> None:
+    """Validate the decoded events at positions ``rows``, extending ``errors`` in place."""
+    validators = registry._compiled_validators
+    envelope_validator = validators.get(_ENVELOPE_KEY) or compile_validator(*_ENVELOPE_KEY)
+
+    buckets: dict[tuple[str, str], list[int]] = {}
+    events_ok = [decoded[i] for i in rows]
+    for i, event, found in zip(rows, events_ok, map(envelope_validator, events_ok)):
+        if found:
+            errors[i].extend(found)
+        if not isinstance(event, dict):
+            continue
+        event_type = event.get("event_type")
+        event_version = event.get("event_version")
+        if isinstance(event_type, str) and isinstance(event_version, str):
+            bucket = buckets.get((event_type, event_version))
+            if bucket is None:
+                buckets[(event_type, event_version)] = bucket = []
+            bucket.append(i)
+
+    for (event_type, event_version), bucket in buckets.items():
+        try:
+            payload_validator = compile_validator("event", event_type, event_version)
+        except EventNotFoundError:
+            message = f"$.event_type: unknown event type '{event_type}' version '{event_version}'"
+            for i in bucket:
+                errors[i].append(message)
+            continue
+        # A missing or non-object payload is already reported by the envelope check
+        bucket = [i for i in bucket if isinstance(decoded[i].get("payload"), dict)]
+        payloads = [decoded[i]["payload"] for i in bucket]
+        for i, found in zip(bucket, map(payload_validator, payloads, repeat("$.payload"))):
+            if found:
+                errors[i].extend(found)
@@ -0,0 +1,348 @@
+"""Fast construction of serialized canonical event envelopes.
+
+Producers used to build ``event_envelope.v1`` dicts by hand (``uuid4()``,
+``datetime.now().isoformat()``, ``source.service``) and serialize the whole
+dict for every event. ``EnvelopeBuilder`` is created once per service and
+writes the envelope JSON directly:
+
+- constant fragments (``source``, ``event_type``/``event_version`` pairs,
+  actors) are encoded once and reused
+- ``event_id`` is a time-ordered UUIDv7 and ``occurred_at`` is taken from the
+  same millisecond, formatted from a per-second cached prefix
+- the payload is encoded (or spliced in, if already encoded) last, so
+  ``EnvelopeView`` consumers never have to decode it to route the event
+
+Every fragment is checked against the envelope schema when it is first
+encoded and payloads against the compiled event schema, so the bytes returned
+by ``build`` validate without re-checking them on the way out (unless the
+payload check is turned off with ``validate_payloads=False``).
+"""
+
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from json.encoder import encode_basestring as _quote
+from typing import Any, Mapping
+
+from canonical import codec, registry
+from canonical.validator import (
+    _ENVELOPE_KEY,
+    _FORMAT_PATTERNS,
+    Validator,
+    compile_schema,
+    compile_validator,
+)
+
+_DATE_TIME = re.compile(_FORMAT_PATTERNS["date-time"], re.ASCII)
+
+# Envelope fields written by the builder, in output order
+_FIELDS = (
+    "event_id",
+    "event_type",
+    "event_version",
+    "source",
+    "tenant_id",
+    "entity",
+    "actor",
+    "occurred_at",
+    "correlation_id",
+    "payload",
+)
+
+_RANDOM_POOL_SIZE = 8 * 512
+_RAND_B_MASK = (1 << 62) - 1
+_MAX_SEQUENCE = 0xFFF
+
+
+class EnvelopeBuildError(ValueError):
+    """Raised when an event cannot be built into a valid canonical envelope."""
+
+    pass
+
+
+class _UUIDv7:
+    """Generator of monotonic UUIDv7 strings (RFC 9562).
+
+    48-bit Unix time in milliseconds, a 12-bit sequence in ``rand_a`` that
+    keeps ids strictly increasing within a process (borrowing the next
+    millisecond if 4096 ids are generated in one), and 62 random bits from a
+    buffered ``os.urandom`` pool that is discarded after a fork.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+        self._pool = b""
+        self._offset = 0
+        self._pid = 0
+
+    def next(self) -> tuple[str, int]:
+        """Return a new id and its timestamp in milliseconds."""
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                self._sequence += 1
+                if self._sequence > _MAX_SEQUENCE:
+                    self._last_ms += 1
+                    self._sequence = 0
+            ms, sequence = self._last_ms, self._sequence
+
+            offset = self._offset
+            if offset >= len(self._pool) or self._pid != os.getpid():
+                # A forked child must not reuse the parent's random bytes
+                self._pool = os.urandom(_RANDOM_POOL_SIZE)
+                self._pid = os.getpid()
+                offset = 0
+            self._offset = offset + 8
+            rand_b = int.from_bytes(self._pool[offset : offset + 8], "big") & _RAND_B_MASK
+
+        value = (ms << 80) | (0x7 << 76) | (sequence << 64) | (0b10 << 62) | rand_b
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}", ms
+
+
+class EnvelopeBuilder:
+    """Builds serialized ``event_envelope.v1`` events for one service.
+
+    Thread-safe; create one per service (or per process) and reuse it.
+
+    Args:
+        service: Emitting service name, written to ``source.service``
+        environment: Optional ``source.environment`` (``dev``, ``staging`` or
+            ``prod``)
+        validate_payloads: Check dict payloads (and decode and check encoded
+            ones) against the event schema. Turn off only if payloads come
+            from an already validated source, e.g. the strict
+            ``canonical_schemas`` models. Encoded payloads are then spliced
+            in without being decoded, so only a rough object check (``{...}``)
+            guards the output against malformed payload bytes.
+        max_actors: Number of distinct actors whose encoded form is cached
+
+    Raises:
+        EnvelopeBuildError: If ``service`` or ``environment`` is not valid
+
+    Example:
+        >>> builder = EnvelopeBuilder("cds_client", environment="prod")
+        >>> message = builder.build(
+        ...     "client.created",
+        ...     payload,
+        ...     tenant_id=tenant_id,
+        ...     entity_type="client",
+        ...     entity_id=client_id,
+        ...     actor=actor,
+        ... )
+        >>> publish(message)  # bytes
+    """
+
+    def __init__(
+        self,
+        service: str,
+        environment: str | None = None,
+        validate_payloads: bool = True,
+        max_actors: int = 4096,
+    ):
+        envelope = registry.load_event_envelope_schema()
+        properties = envelope["properties"]
+        self._check_source = compile_schema(properties["source"], name="envelope.source")
+        self._check_entity = compile_schema(properties["entity"], name="envelope.entity")
+        self._check_actor = compile_schema(properties["actor"], name="envelope.actor")
+        missing = set(envelope.get("required", ())) - set(_FIELDS)
+        if missing:
+            raise EnvelopeBuildError(
+                f"Envelope schema requires fields the builder does not write: {sorted(missing)}"
+            )
+
+        source: dict[str, Any] = {"service": service}
+        if environment is not None:
+            source["environment"] = environment
+        _raise_errors(self._check_source(source, "$.source"))
+
+        self.service = service
+        self.environment = environment
+        self.validate_payloads = validate_payloads
+        self.max_actors = max_actors
+        self._source = ',"source":' + codec.dumps(source).decode("utf-8")
+        self._ids = _UUIDv7()
+        # (event_type, event_version) -> (encoded fragment, payload validator)
+        self._event_types: dict[tuple[str, str], tuple[str, Validator]] = {}
+        # actor key -> encoded fragment, oldest first; guarded by _actors_lock
+        self._actors: dict[tuple[Any, ...], str] = {}
+        self._actors_lock = threading.Lock()
+        # (second, "YYYY-MM-DDTHH:MM:SS") prefix for occurred_at, swapped as one tuple
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+        # Self-check: the envelope layout written by build() must satisfy the schema
+        envelope_validator = compile_validator(*_ENVELOPE_KEY)
+        sample = {
+            "event_id": self.new_event_id(),
+            "event_type": "",
+            "event_version": "v1",
+            "source": source,
+            "tenant_id": "",
+            "entity": {"entity_type": "client", "entity_id": ""},
+            "actor": {"actor_id": "", "actor_role": "", "actor_type": "system"},
+            "occurred_at": "1970-01-01T00:00:00.000Z",
+            "payload": {},
+        }
+        _raise_errors(envelope_validator(sample))
+
+    def new_event_id(self) -> str:
+        """Return a new time-ordered UUIDv7 event id."""
+        return self._ids.next()[0]
+
+    def _occurred_at(self, ms: int) -> str:
+        second, millis = divmod(ms, 1000)
+        cached = self._second_prefix
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+            self._second_prefix = cached
+        return f"{cached[1]}.{millis:03d}Z"
+
+    def _event_type(self, event_type: str, event_version: str) -> tuple[str, Validator]:
+        key = (event_type, event_version)
+        cached = self._event_types.get(key)
+        if cached is None:
+            if not isinstance(event_type, str) or not isinstance(event_version, str):
+                raise EnvelopeBuildError("$.event_type/$.event_version: expected strings")
+            # Raises EventNotFoundError for an unknown type or version
+            validator = compile_validator("event", event_type, event_version)
+            fragment = f',"event_type":{_quote(event_type)},"event_version":{_quote(event_version)}'
+            cached = self._event_types[key] = (fragment, validator)
+        return cached
+
+    def _actor(self, actor: Mapping[str, Any]) -> str:
+        try:
+            key = tuple(actor.items())
+            with self._actors_lock:
+                fragment = self._actors.get(key)
+        except (AttributeError, TypeError):
+            key, fragment = None, None
+        if fragment is not None:
+            return fragment
+
+        actor_dict = dict(actor) if isinstance(actor, Mapping) else actor
+        _raise_errors(self._check_actor(actor_dict, "$.actor"))
+        fragment = ',"actor":' + codec.dumps(actor_dict).decode("utf-8")
+        if key is not None:
+            with self._actors_lock:
+                if key not in self._actors and len(self._actors) >= self.max_actors:
+                    # Evict the oldest entry
+                    self._actors.pop(next(iter(self._actors)))
+                self._actors[key] = fragment
+        return fragment
+
+    def build(
+        self,
+        event_type: str,
+        payload: Mapping[str, Any] | bytes | bytearray | memoryview,
+        *,
+        tenant_id: str,
+        entity_type: str,
+        entity_id: str,
+        actor: Mapping[str, Any],
+        event_version: str = "v1",
+        occurred_at: str | datetime | None = None,
+        correlation_id: str | None = None,
+        event_id: str | None = None,
+    ) -> bytes:
+        """
+        Build one serialized event envelope.
+
+        Args:
+            event_type: Canonical event name, e.g. ``client.created``
+            payload: Event payload as a dict, or as already encoded JSON object
+                bytes, which are spliced in verbatim
+            tenant_id: Tenant identifier
+            entity_type: ``entity.entity_type`` (one of the canonical entities)
+            entity_id: ``entity.entity_id``
+            actor: ``actor_id``, ``actor_role``, ``actor_type`` and optional
+                ``display_name``
+            event_version: Payload schema version
+            occurred_at: Timestamp (RFC 3339 string or timezone-aware
+                datetime); defaults to the time encoded in the event id
+            correlation_id: Optional workflow correlation id
+            event_id: Explicit event id (e.g. when retrying); defaults to a
+                new UUIDv7
+
+        Returns:
+            UTF-8 JSON bytes of the envelope, with ``payload`` last
+
+        Raises:
+            EnvelopeBuildError: If a field or the payload is not valid
+            EventNotFoundError: If the event type/version is not in the registry
+        """
+        event_fragment, validate_payload = self._event_type(event_type, event_version)
+
+        if event_id is None:
+            event_id, ms = self._ids.next()
+            # Generated ids never need escaping
+            quoted_id = f'"{event_id}"'
+        elif isinstance(event_id, str):
+            ms = time.time_ns() // 1_000_000
+            quoted_id = _quote(event_id)
+        else:
+            raise EnvelopeBuildError("$.event_id: expected string")
+
+        if occurred_at is None:
+            occurred_at = self._occurred_at(ms)
+        elif isinstance(occurred_at, datetime):
+            if occurred_at.tzinfo is None:
+                raise EnvelopeBuildError("$.occurred_at: datetime must be timezone-aware")
+            text = occurred_at.isoformat()
+            if _DATE_TIME.match(text) is None:
+                # e.g. an offset with seconds ("+05:30:15"), which RFC 3339 lacks
+                text = occurred_at.astimezone(timezone.utc).isoformat()
+            occurred_at = text
+        elif not isinstance(occurred_at, str) or _DATE_TIME.match(occurred_at) is None:
+            raise EnvelopeBuildError("$.occurred_at: not a valid 'date-time' string")
+
+        entity = {"entity_type": entity_type, "entity_id": entity_id}
+        errors = self._check_entity(entity, "$.entity")
+        if not isinstance(tenant_id, str):
+            errors.append("$.tenant_id: expected string")
+        if correlation_id is not None and not isinstance(correlation_id, str):
+            errors.append("$.correlation_id: expected string")
+        _raise_errors(errors)
+        actor_fragment = self._actor(actor)
+
+        # Plain dicts are checked first: isinstance() against Mapping is slow
+        if not isinstance(payload, (dict, bytes, bytearray, memoryview)):
+            if not isinstance(payload, Mapping):
+                raise EnvelopeBuildError("$.payload: expected object")
+            payload = dict(payload)
+        if isinstance(payload, dict):
+            if self.validate_payloads:
+                _raise_errors(validate_payload(payload, "$.payload"))
+            encoded = codec.dumps(payload)
+        else:
+            encoded = bytes(payload).strip()
+            if encoded[:1] != b"{" or encoded[-1:] != b"}":
+                raise EnvelopeBuildError("$.payload: encoded payload is not a JSON object")
+            if self.validate_payloads:
+                try:
+                    decoded = codec.loads(encoded)
+                except ValueError as e:
+                    raise EnvelopeBuildError(f"$.payload: invalid JSON: {e}") from e
+                _raise_errors(validate_payload(decoded, "$.payload"))
+
+        # occurred_at is generated, regex-checked or isoformat(): plain ASCII
+        header = (
+            f'{{"event_id":{quoted_id}{event_fragment}{self._source}'
+            f',"tenant_id":{_quote(tenant_id)}'
+            f',"entity":{{"entity_type":{_quote(entity_type)},"entity_id":{_quote(entity_id)}}}'
+            f'{actor_fragment},"occurred_at":"{occurred_at}"'
+        )
+        if correlation_id is not None:
+            header += f',"correlation_id":{_quote(correlation_id)}'
+        return b"".join((header.encode("utf-8"), b',"payload":', encoded, b"}"))
+
+
+def _raise_errors(errors: list[str]) -> None:
+    if errors:
+        raise EnvelopeBuildError("; ".join(errors))
@@ -0,0 +1,205 @@
+"""Prebuilt registry bundle.
+
+Packs every entity schema, event schema and semantic constraint file into a
+single JSON file holding the parsed content of each file, a manifest with
+content hashes and the directory listing. When the bundle is present next to
+the package, ``canonical.registry`` serves all loads and listings from it with
+a single read and parse; otherwise it falls back to the loose files. YAML is
+parsed at build time, so a bundled process never imports ``yaml``. The bundle
+is plain data: loading it never runs code, and every artifact is checked
+against its manifest hash before the bundle is used.
+
+The bundle is produced at wheel build time (see ``hatch_build.py``) and can be
+built or checked manually:
+
+    python -m canonical.bundle            # build build/_registry.bundle
+    python -m canonical.bundle --check    # fail if the bundle is stale
+
+Manual builds go to ``build/`` (relative to the working directory) rather than
+into the package, so a source checkout keeps reading the loose files it edits.
+Point ``CANONICAL_REGISTRY_BUNDLE`` at a built bundle to try it out.
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from canonical import __version__, codec
+from canonical.registry import (
+    _BASE_DIR,
+    _BUNDLE_FILE,
+    _ENTITIES_DIR,
+    _EVENTS_DIR,
+    _SEMANTICS_DIR,
+    BUNDLE_FORMAT_VERSION,
+    _read_bundle,
+    schema_digest,
+)
+
+# Default output of manual builds (the wheel build hook passes its own path)
+DEFAULT_OUTPUT = Path("build") / _BUNDLE_FILE.name
+
+
+def _registry_files(base_dir: Path = _BASE_DIR) -> list[Path]:
+    """Return every registry artifact under ``base_dir`` in a stable order."""
+    entities = base_dir / _ENTITIES_DIR.name
+    events = base_dir / _EVENTS_DIR.name
+    semantics = base_dir / _SEMANTICS_DIR.name
+    files = list(entities.glob("*.json"))
+    files.extend(events.rglob("*.json"))
+    files.extend(semantics.glob("*.semantic.yaml"))
+    return sorted(files)
+
+
+def _parse(path: Path, raw: bytes) -> Any:
+    """
+    Parse a registry file into the value the bundle stores for it.
+
+    Raises:
+        ValueError: If the file is malformed, or is YAML holding values that
+            JSON cannot represent (dates, non-string keys, ...)
+    """
+    if path.suffix == ".json":
+        return codec.loads(raw)
+    import yaml
+
+    try:
+        data = yaml.safe_load(raw)
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid YAML in {path.name}: {str(e)}") from e
+    try:
+        round_trip = codec.loads(codec.dumps(data))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{path.name} cannot be stored as JSON: {str(e)}") from e
+    if round_trip != data:
+        raise ValueError(f"{path.name} cannot be stored as JSON: it changes in a round trip")
+    return data
+
+
+def collect_registry(base_dir: Path = _BASE_DIR) -> dict[str, Any]:
+    """
+    Read and parse every registry artifact into a bundle structure.
+
+    Args:
+        base_dir: Package directory holding entities/, events/ and semantics/
+
+    Returns:
+        Bundle dict with ``format_version``, ``canonical_version``,
+        ``built_at``, ``manifest`` (relative path -> ``sha256``, the
+        ``schema_digest`` of the parsed content), ``directories`` (relative
+        directory -> file names) and ``artifacts`` (relative path -> parsed
+        content)
+
+    Raises:
+        ValueError: If a file is malformed or cannot be stored as JSON
+    """
+    manifest: dict[str, dict[str, Any]] = {}
+    directories: dict[str, list[str]] = {}
+    artifacts: dict[str, Any] = {}
+
+    for path in _registry_files(base_dir):
+        rel = path.relative_to(base_dir).as_posix()
+        data = _parse(path, path.read_bytes())
+        manifest[rel] = {"sha256": schema_digest(data)}
+        artifacts[rel] = data
+        directory, _, name = rel.rpartition("/")
+        directories.setdefault(directory, []).append(name)
+
+    return {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "canonical_version": __version__,
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "manifest": manifest,
+        "directories": directories,
+        "artifacts": artifacts,
+    }
+
+
+def build_bundle(output: Path | None = None, base_dir: Path = _BASE_DIR) -> Path:
+    """
+    Build the registry bundle file.
+
+    Args:
+        output: Destination file (default: ``build/_registry.bundle``)
+        base_dir: Package directory holding entities/, events/ and semantics/
+
+    Returns:
+        Path of the written bundle
+    """
+    output = Path(output) if output is not None else DEFAULT_OUTPUT
+    output.parent.mkdir(parents=True, exist_ok=True)
+    bundle = collect_registry(base_dir)
+    tmp = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(codec.dumps(bundle))
+    tmp.replace(output)
+    return output
+
+
+def check_bundle(bundle_file: Path | None = None, base_dir: Path = _BASE_DIR) -> list[str]:
+    """
+    Compare a bundle's manifest with the loose files.
+
+    Files are compared by parsed content, so a formatting-only edit does not
+    make the bundle stale.
+
+    Args:
+        bundle_file: Bundle to check (default: ``build/_registry.bundle``)
+        base_dir: Package directory holding entities/, events/ and semantics/
+
+    Returns:
+        List of differences (empty if the bundle is up to date)
+    """
+    bundle_file = Path(bundle_file) if bundle_file is not None else DEFAULT_OUTPUT
+    if not bundle_file.exists():
+        return [f"bundle not found: {bundle_file}"]
+    try:
+        bundle = _read_bundle(bundle_file)
+    except ValueError as e:
+        return [f"invalid bundle: {str(e)}"]
+
+    problems = []
+    current = {path.relative_to(base_dir).as_posix(): path for path in _registry_files(base_dir)}
+    manifest = bundle["manifest"]
+    for rel in sorted(current.keys() - manifest.keys()):
+        problems.append(f"missing from bundle: {rel}")
+    for rel in sorted(manifest.keys() - current.keys()):
+        problems.append(f"no longer on disk: {rel}")
+    for rel in sorted(current.keys() & manifest.keys()):
+        path = current[rel]
+        try:
+            digest = schema_digest(_parse(path, path.read_bytes()))
+        except ValueError as e:
+            problems.append(f"cannot parse {rel}: {str(e)}")
+            continue
+        if digest != manifest[rel]["sha256"]:
+            problems.append(f"content changed: {rel}")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m canonical.bundle",
+        description="Build or check the prebuilt canonical registry bundle.",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Bundle file to write/check")
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 if the bundle is missing or stale"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        problems = check_bundle(args.output)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if problems else 0
+
+    output = build_bundle(args.output)
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
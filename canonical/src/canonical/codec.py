@@ -0,0 +1,165 @@
+"""Pluggable JSON backend.
+
+Schema loading, event decoding (``validate_event``, ``validate_events_batch``,
+``validate_ndjson``) and event encoding go through ``loads``/``dumps`` here
+instead of calling the stdlib ``json`` module directly, so a faster parser can
+be used when it is installed:
+
+- ``orjson`` (``pip install canonical[orjson]``)
+- ``msgspec`` (``pip install canonical[msgspec]``)
+- ``json``: the standard library, always available
+
+By default (``auto``) the first installed backend in that order is used. Set
+``CANONICAL_JSON_BACKEND`` to ``orjson``, ``msgspec``, ``json`` or ``auto``,
+or call ``set_json_backend()``, to choose one explicitly.
+
+All backends raise ``ValueError`` (or a subclass) for malformed input and
+``TypeError`` for values that cannot be encoded. ``dumps`` always returns
+compact UTF-8 bytes.
+
+Numbers decode the same way with every backend, so the choice of backend
+never changes a validation result: ``NaN``, ``Infinity`` and floats that
+overflow to infinity are rejected as malformed, and integers outside the
+64-bit range (``-2**63`` to ``2**64 - 1``) are decoded as ``float``, as orjson
+does. Bytes must be UTF-8 without a BOM. The standard library backend enforces
+this with number hooks, which makes it somewhat slower on number-heavy
+documents.
+"""
+
+import json
+import logging
+import math
+import os
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+# Integers outside this range decode as float (orjson's limits)
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+_ENV_VAR = "CANONICAL_JSON_BACKEND"
+
+Loads = Callable[[bytes | bytearray | memoryview | str], Any]
+Dumps = Callable[[Any], bytes]
+
+
+def _orjson() -> tuple[Loads, Dumps]:
+    import orjson
+
+    return orjson.loads, orjson.dumps
+
+
+def _msgspec() -> tuple[Loads, Dumps]:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+    DecodeError = msgspec.DecodeError
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        try:
+            return decode(data)
+        except DecodeError as e:
+            # msgspec errors are not ValueErrors; keep one contract for callers
+            raise ValueError(str(e)) from e
+
+    return loads, msgspec.json.Encoder().encode
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _parse_int(text: str) -> int | float:
+    if len(text) < 19:
+        # Always within the 64-bit range
+        return int(text)
+    value = int(text)
+    return value if _INT_MIN <= value <= _INT_MAX else float(value)
+
+
+def _parse_float(text: str) -> float:
+    value = float(text)
+    if math.isinf(value):
+        raise ValueError(f"number out of range: {text}")
+    return value
+
+
+def _stdlib() -> tuple[Loads, Dumps]:
+    decode = json.JSONDecoder(
+        parse_constant=_reject_constant, parse_int=_parse_int, parse_float=_parse_float
+    ).decode
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def loads(data: bytes | bytearray | memoryview | str) -> Any:
+        # Bytes must be UTF-8 without a BOM, as with orjson and msgspec
+        if not isinstance(data, str):
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(
+                    f"the JSON object must be str, bytes or bytearray, not {type(data).__name__}"
+                )
+            data = str(data, "utf-8")
+        return decode(data)
+
+    def dumps(obj: Any) -> bytes:
+        return encode(obj).encode("utf-8")
+
+    return loads, dumps
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+_backend = "json"
+loads, dumps = _stdlib()
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """
+    Select the JSON backend used by the registry and the validation paths.
+
+    Args:
+        name: "orjson", "msgspec", "json", or "auto" for the first installed
+            backend in that order
+
+    Returns:
+        Name of the backend now in use
+
+    Raises:
+        ValueError: If name is not a known backend
+        ImportError: If the named backend is not installed
+    """
+    global _backend, loads, dumps
+
+    if name == "auto":
+        for candidate in BACKENDS:
+            try:
+                loads, dumps = _FACTORIES[candidate]()
+            except ImportError:
+                continue
+            _backend = candidate
+            break
+    elif name in _FACTORIES:
+        loads, dumps = _FACTORIES[name]()
+        _backend = name
+    else:
+        raise ValueError(f"Unknown JSON backend '{name}'. Available: auto, {', '.join(BACKENDS)}")
+    logger.debug(f"Canonical JSON backend: {_backend}")
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Return the name of the JSON backend in use ("orjson", "msgspec" or "json")."""
+    return _backend
+
+
+def _configure() -> None:
+    name = os.environ.get(_ENV_VAR, "auto").strip().lower() or "auto"
+    try:
+        set_json_backend(name)
+    except (ValueError, ImportError) as e:
+        logger.warning(f"Ignoring {_ENV_VAR}={name!r} ({str(e)}); using auto")
+        set_json_backend("auto")
+
+
+_configure()
@@ -0,0 +1,209 @@
+"""Ahead-of-time generated validators.
+
+``compile_validator`` normally generates and compiles each validator's source
+at runtime, which every worker process pays again at startup. This module
+writes that source for every entity, envelope and event schema as a plain
+Python module under ``canonical/_generated/``, so it ships with the package
+(and the wheel) as ordinary bytecode-cached modules.
+
+``canonical/_generated/__init__.py`` maps ``(kind, name, version)`` to the
+module and the content hash of the schema it was generated from.
+``compile_validator`` imports a generated module only when that hash matches
+the schema it loaded; otherwise (no generated code, a stale module, or
+``CANONICAL_PRECOMPILED_VALIDATORS=0``) it compiles at runtime as before.
+
+    python -m canonical.codegen            # regenerate src/canonical/_generated/
+    python -m canonical.codegen --check    # fail if the generated code is stale
+"""
+
+import logging
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable
+
+from canonical import registry
+from canonical.registry import schema_digest
+from canonical.validator import generate_validator_source
+
+logger = logging.getLogger(__name__)
+
+GENERATED_PACKAGE = "canonical._generated"
+_GENERATED_DIR = registry._BASE_DIR / "_generated"
+
+# Generated index, imported on first use: False before the lookup, None if
+# there is no usable generated code
+_index: Any = False
+
+
+def module_name(kind: str, name: str, version: str) -> str:
+    """Module name for a validator, e.g. ``event__client_created__v1``."""
+    return f"{kind}__{name.replace('.', '_')}__{version}"
+
+
+def _schemas() -> list[tuple[str, str, str, dict[str, Any]]]:
+    """Every entity, envelope and event schema, in a stable order."""
+    schemas = []
+    for entity in registry.list_entities():
+        for version in registry.list_entity_versions(entity):
+            schema = registry.load_entity_schema(entity, version)
+            schemas.append(("entity", entity, version, schema))
+    schemas.append(("envelope", "event_envelope", "v1", registry.load_event_envelope_schema()))
+    for event_type in registry.list_events():
+        for version in registry.list_event_versions(event_type):
+            schema = registry.load_event_schema(event_type, version)
+            schemas.append(("event", event_type, version, schema))
+    return schemas
+
+
+def generate_modules() -> dict[str, str]:
+    """
+    Generate the source of every validator module and of the index.
+
+    Returns:
+        File name (relative to ``canonical/_generated/``) -> source
+    """
+    files: dict[str, str] = {}
+    index_lines = []
+    for kind, name, version, schema in _schemas():
+        module = module_name(kind, name, version)
+        if f"{module}.py" in files:
+            raise ValueError(f"Generated module name clash: {module} ({kind}:{name}.{version})")
+        digest = schema_digest(schema)
+        files[f"{module}.py"] = (
+            f'"""Validator for {kind}:{name}.{version} - generated by canonical.codegen, '
+            'do not edit."""\n\n' + generate_validator_source(schema)
+        )
+        index_lines.append(f'    ("{kind}", "{name}", "{version}"): ("{module}", "{digest}"),\n')
+
+    files["__init__.py"] = (
+        '"""Ahead-of-time generated canonical validators - do not edit.\n\n'
+        "Regenerate with ``python -m canonical.codegen``; see canonical.codegen.\n"
+        '"""\n\n'
+        "# (kind, name, version) -> (module, sha256 of the schema it was generated from)\n"
+        "VALIDATORS = {\n" + "".join(index_lines) + "}\n"
+    )
+    return files
+
+
+def write_modules(output_dir: Path = _GENERATED_DIR) -> list[str]:
+    """
+    Regenerate the validator modules, removing modules for deleted schemas.
+
+    Args:
+        output_dir: Directory to write (default: ``canonical/_generated/``)
+
+    Returns:
+        File names that were written or removed
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = generate_modules()
+    touched = []
+    for path in sorted(output_dir.glob("*.py")):
+        if path.name not in files:
+            path.unlink()
+            touched.append(path.name)
+    for filename, source in files.items():
+        target = output_dir / filename
+        if not target.exists() or target.read_text() != source:
+            target.write_text(source)
+            touched.append(filename)
+    return touched
+
+
+def check_modules(output_dir: Path = _GENERATED_DIR) -> list[str]:
+    """
+    Compare the generated modules on disk with what the schemas produce now.
+
+    Args:
+        output_dir: Directory to check (default: ``canonical/_generated/``)
+
+    Returns:
+        List of differences (empty if the generated code is up to date)
+    """
+    output_dir = Path(output_dir)
+    files = generate_modules()
+    problems = []
+    on_disk = {path.name for path in output_dir.glob("*.py")}
+    for filename in sorted(on_disk - files.keys()):
+        problems.append(f"no longer generated: {filename}")
+    for filename, source in sorted(files.items()):
+        target = output_dir / filename
+        if filename not in on_disk:
+            problems.append(f"missing: {filename}")
+        elif target.read_text() != source:
+            problems.append(f"out of date: {filename}")
+    return problems
+
+
+def _load_index() -> dict[tuple[str, str, str], tuple[str, str]] | None:
+    if os.environ.get("CANONICAL_PRECOMPILED_VALIDATORS", "") == "0":
+        return None
+    try:
+        return import_module(GENERATED_PACKAGE).VALIDATORS
+    except ImportError:
+        return None
+
+
+def load_validator(
+    kind: str, name: str, version: str, schema: dict[str, Any]
+) -> Callable[..., list[str]] | None:
+    """
+    Import the generated validator for a schema, if it is up to date.
+
+    Args:
+        kind: "entity", "event" or "envelope"
+        name: Entity name or event type
+        version: Schema version
+        schema: The schema as loaded by the registry
+
+    Returns:
+        The generated ``validate`` function, or None if there is no generated
+        module for this schema or it was generated from different content
+    """
+    global _index
+
+    if _index is False:
+        _index = _load_index()
+    entry = _index.get((kind, name, version)) if _index else None
+    if entry is None:
+        return None
+    module, digest = entry
+    if digest != schema_digest(schema):
+        logger.debug(f"Generated validator for {kind}:{name}.{version} is stale; compiling")
+        return None
+    return import_module(f"{GENERATED_PACKAGE}.{module}").validate
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m canonical.codegen",
+        description="Generate or check the ahead-of-time canonical validators.",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=_GENERATED_DIR, help="Directory to write/check"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 if the generated code is missing or stale"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        problems = check_modules(args.output)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        if problems:
+            print("Run: python -m canonical.codegen", file=sys.stderr)
+        return 1 if problems else 0
+
+    touched = write_modules(args.output)
+    print(f"Updated {len(touched)} files in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
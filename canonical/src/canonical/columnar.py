@@ -0,0 +1,393 @@
+"""Column-batch evaluation of semantic constraints.
+
+Applies the same rules as ``canonical.constraints.compile_semantics`` to
+columnar data - a mapping of field name to a list or NumPy array of values,
+one element per row - and returns one violation mask per rule instead of
+error messages per record. This is intended for bulk data quality jobs over
+millions of rows.
+
+Lists are evaluated with one tight Python pass per rule and column. NumPy
+arrays with numeric or string dtypes use vectorised operations; other arrays
+(e.g. object dtype) fall back to the Python path, so results are always the
+same as the record-by-record check. NumPy is only imported when an array is
+passed in, so it is an optional dependency.
+
+In columnar input ``None`` and float NaN both mean "missing".
+"""
+
+import logging
+import math
+from itertools import repeat
+from typing import Any, Callable, Mapping, Sequence
+
+from canonical import registry
+from canonical.constraints import (
+    _COMPARISONS,
+    BoolOp,
+    Compare,
+    Field,
+    Implies,
+    Literal,
+    Not,
+    SemanticRuleError,
+    _cross_field_rules,
+    _field_rules,
+    _is_number,
+    parse_rule,
+)
+from canonical.validator import _COMPILE_LOCKS
+
+logger = logging.getLogger(__name__)
+
+Mask = Any  # list[bool], or a NumPy bool array when any input column is an array
+ColumnCheck = Callable[[Mapping[str, Sequence[Any]]], dict[str, Mask]]
+
+# Python type each NumPy dtype kind turns into via .tolist()
+_KIND_SAMPLES = {"b": True, "i": 0, "u": 0, "f": 0.0, "U": ""}
+
+# Exact classes that always satisfy a "type" rule (other values go through the rule)
+_TYPE_CLASSES = {
+    "string": frozenset({str}),
+    "number": frozenset({int, float}),
+    "integer": frozenset({int}),
+    "boolean": frozenset({bool}),
+    "array": frozenset({list}),
+    "object": frozenset({dict}),
+}
+
+
+class _Scalar:
+    """Constant operand broadcast over all rows."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _numpy() -> Any:
+    """Import NumPy, only once an array column is seen."""
+    import numpy
+
+    return numpy
+
+
+def _is_array(column: Any) -> bool:
+    return hasattr(column, "dtype") and hasattr(column, "shape")
+
+
+def _kind(column: Any) -> str:
+    """NumPy dtype kind of an array column ("" for lists)."""
+    return column.dtype.kind if _is_array(column) else ""
+
+
+def _normalize(values: Sequence[Any]) -> list[Any]:
+    """Copy of ``values`` with NaN replaced by None."""
+    return [None if v.__class__ is float and math.isnan(v) else v for v in values]
+
+
+def _to_list(column: Any) -> list[Any]:
+    """Python values of a column (list columns are normalized up front)."""
+    return _normalize(column.tolist()) if _is_array(column) else column
+
+
+def _null_mask(np: Any, column: Any) -> Any:
+    kind = _kind(column)
+    if kind == "f":
+        return np.isnan(column)
+    if kind in _KIND_SAMPLES:
+        return np.zeros(len(column), dtype=bool)
+    return np.fromiter((v is None for v in _to_list(column)), dtype=bool, count=len(column))
+
+
+def _field_mask(
+    np: Any, column: Any, keyword: str, argument: Any, violates: Callable[[Any], bool]
+) -> Mask:
+    """Violation mask for one per-field rule (null values never violate)."""
+    kind = _kind(column)
+    if np is not None and kind in _KIND_SAMPLES:
+        null = _null_mask(np, column)
+        if keyword == "type":
+            # Every element of a typed array has the same Python type
+            if violates(_KIND_SAMPLES[kind]):
+                return ~null
+            return np.zeros(len(column), dtype=bool)
+        if keyword == "allowed" and kind in "iufU":
+            values: list[Any]
+            if kind == "U":
+                values = [v for v in argument if isinstance(v, str)]
+            else:
+                values = [v for v in argument if isinstance(v, (int, float))]
+            return ~np.isin(column, values) & ~null
+        if keyword in ("min", "max") and _is_number(argument):
+            if kind in "iuf":
+                # NaN compares False, so nulls never violate
+                return column < argument if keyword == "min" else column > argument
+            return np.zeros(len(column), dtype=bool)
+        if keyword == "uppercase":
+            if kind == "U":
+                return np.char.upper(column) != column
+            return np.zeros(len(column), dtype=bool)
+
+    values = _to_list(column)
+    if keyword == "type":
+        classes = _TYPE_CLASSES[argument]
+        mask = [v.__class__ not in classes and v is not None and violates(v) for v in values]
+    elif keyword == "allowed":
+        try:
+            allowed = frozenset(argument)
+            mask = [v is not None and v not in allowed for v in values]
+        except TypeError:
+            mask = [v is not None and violates(v) for v in values]
+    elif keyword in ("min", "max") and _is_number(argument):
+        # Exact int/float values inline; anything else goes through the rule
+        if keyword == "min":
+            mask = [
+                (
+                    v < argument
+                    if v.__class__ is int or v.__class__ is float
+                    else v is not None and violates(v)
+                )
+                for v in values
+            ]
+        else:
+            mask = [
+                (
+                    v > argument
+                    if v.__class__ is int or v.__class__ is float
+                    else v is not None and violates(v)
+                )
+                for v in values
+            ]
+    elif keyword == "uppercase":
+        mask = [isinstance(v, str) and v != v.upper() for v in values]
+    else:
+        mask = [v is not None and violates(v) for v in values]
+    return np.asarray(mask, dtype=bool) if np is not None else mask
+
+
+def _values(operand: Any, n: int) -> Any:
+    """Python values of an operand, broadcasting scalars."""
+    if isinstance(operand, _Scalar):
+        return repeat(operand.value, n)
+    return _to_list(operand)
+
+
+def _truth(np: Any, operand: Any, n: int) -> Mask:
+    """Elementwise truthiness of an operand (nulls are false)."""
+    kind = _kind(operand)
+    if np is not None and kind == "b":
+        return operand
+    if np is not None and kind in ("i", "u"):
+        return operand != 0
+    if np is not None and kind == "f":
+        return (operand != 0) & ~np.isnan(operand)
+    if isinstance(operand, _Scalar):
+        mask = [bool(operand.value)] * n
+    else:
+        mask = [bool(v) for v in _values(operand, n)]
+    return np.asarray(mask, dtype=bool) if np is not None else mask
+
+
+def _family(operand: Any) -> str:
+    """Family of a compare operand: "num", "str" or "" (no vectorised fast path)."""
+    if isinstance(operand, _Scalar):
+        if _is_number(operand.value):
+            return "num"
+        return "str" if isinstance(operand.value, str) else ""
+    kind = _kind(operand)
+    if kind in ("i", "u", "f"):
+        return "num"
+    return "str" if kind == "U" else ""
+
+
+def _np_compare(np: Any, op: str, left: Any, right: Any) -> Any:
+    """Vectorised comparison, or None when there is no exact fast path."""
+    if not (_is_array(left) or _is_array(right)):
+        return None
+    lhs = left.value if isinstance(left, _Scalar) else left
+    if op in ("in", "not in"):
+        if not (isinstance(right, _Scalar) and isinstance(right.value, tuple)):
+            return None
+        family = _family(left)
+        if not family or None in right.value:
+            return None
+        values: list[Any]
+        if family == "num":
+            values = [v for v in right.value if isinstance(v, (int, float))]
+        else:
+            values = [v for v in right.value if isinstance(v, str)]
+        contained = np.isin(lhs, values)
+        return contained if op == "in" else ~contained
+
+    family = _family(left)
+    if not family or family != _family(right):
+        return None
+    rhs = right.value if isinstance(right, _Scalar) else right
+    if op == "==":
+        result = lhs == rhs
+        if _kind(left) == "f" and _kind(right) == "f":
+            # None == None is true record-wise
+            result = result | (np.isnan(lhs) & np.isnan(rhs))
+        return result
+    if op == "!=":
+        result = lhs != rhs
+        if _kind(left) == "f" and _kind(right) == "f":
+            result = result & ~(np.isnan(lhs) & np.isnan(rhs))
+        return result
+    # Ordered comparisons: NaN compares False, matching null handling
+    return {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal}[op](
+        lhs, rhs
+    )
+
+
+def _column(columns: Mapping[str, Sequence[Any]], path: tuple[str, ...], n: int) -> Any:
+    """Column for a (possibly dotted) field; missing columns are all null."""
+    name = ".".join(path)
+    if name in columns:
+        return columns[name]
+    if len(path) > 1 and path[0] in columns:
+        values = []
+        for value in _to_list(columns[path[0]]):
+            for key in path[1:]:
+                value = value.get(key) if isinstance(value, dict) else None
+            values.append(value)
+        return values
+    return _Scalar(None)
+
+
+def _evaluate(np: Any, node: Any, columns: Mapping[str, Sequence[Any]], n: int) -> Any:
+    """Evaluate a rule AST node over all rows (a column, mask or _Scalar)."""
+    if isinstance(node, Literal):
+        return _Scalar(node.value)
+    if isinstance(node, Field):
+        return _column(columns, node.path, n)
+    if isinstance(node, Compare):
+        left = _evaluate(np, node.left, columns, n)
+        right = _evaluate(np, node.right, columns, n)
+        if np is not None:
+            result = _np_compare(np, node.op, left, right)
+            if result is not None:
+                return result
+        compare = _COMPARISONS[node.op]
+        mask = [compare(a, b) for a, b in zip(_values(left, n), _values(right, n))]
+        return np.asarray(mask, dtype=bool) if np is not None else mask
+    if isinstance(node, Not):
+        operand = _truth(np, _evaluate(np, node.operand, columns, n), n)
+        return ~operand if np is not None else [not v for v in operand]
+    if isinstance(node, BoolOp):
+        operands = [_truth(np, _evaluate(np, o, columns, n), n) for o in node.operands]
+        if np is not None:
+            combine = np.logical_and if node.op == "and" else np.logical_or
+            return combine.reduce(operands)
+        if node.op == "and":
+            return [all(values) for values in zip(*operands)]
+        return [any(values) for values in zip(*operands)]
+    if isinstance(node, Implies):
+        condition = _truth(np, _evaluate(np, node.condition, columns, n), n)
+        consequence = _truth(np, _evaluate(np, node.consequence, columns, n), n)
+        if np is not None:
+            return ~condition | consequence
+        return [not c or q for c, q in zip(condition, consequence)]
+    raise SemanticRuleError(f"Unknown rule node: {node!r}")
+
+
+def compile_column_constraints(constraints: dict[str, Any]) -> ColumnCheck:
+    """
+    Compile a parsed semantic constraints document for columnar evaluation.
+
+    Args:
+        constraints: Semantic constraints as returned by ``load_semantic_constraints``
+
+    Returns:
+        Callable ``check(columns) -> {rule: violation_mask}``; see ``check_columns``
+
+    Raises:
+        SemanticRuleError: If a constraint or rule is not supported
+    """
+    required = tuple(constraints.get("required_fields") or ())
+    field_rules = [
+        (field, keyword, argument, violates)
+        for field, rules in (constraints.get("semantic_constraints") or {}).items()
+        for keyword, argument, violates, _ in _field_rules(field, rules)
+    ]
+    cross_field = [(rule, parse_rule(rule)) for rule, _ in _cross_field_rules(constraints)]
+
+    def check(columns: Mapping[str, Sequence[Any]]) -> dict[str, Mask]:
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 0
+        np = _numpy() if any(_is_array(column) for column in columns.values()) else None
+        columns = {
+            name: column if _is_array(column) else _normalize(column)
+            for name, column in columns.items()
+        }
+
+        def constant(value: bool) -> Mask:
+            return np.full(n, value, dtype=bool) if np is not None else [value] * n
+
+        masks: dict[str, Mask] = {}
+        for field in required:
+            column = columns.get(field)
+            if column is None:
+                masks[f"required:{field}"] = constant(True)
+            elif np is not None:
+                masks[f"required:{field}"] = _null_mask(np, column)
+            else:
+                masks[f"required:{field}"] = [v is None for v in _to_list(column)]
+        for field, keyword, argument, violates in field_rules:
+            column = columns.get(field)
+            if column is None:
+                masks[f"{field}:{keyword}"] = constant(False)
+            else:
+                masks[f"{field}:{keyword}"] = _field_mask(np, column, keyword, argument, violates)
+        for rule, tree in cross_field:
+            satisfied = _truth(np, _evaluate(np, tree, columns, n), n)
+            masks[f"rule:{rule}"] = ~satisfied if np is not None else [not v for v in satisfied]
+        return masks
+
+    return check
+
+
+def check_columns(
+    entity: str, columns: Mapping[str, Sequence[Any]], version: str = "v1"
+) -> dict[str, Mask]:
+    """
+    Evaluate an entity's semantic constraints over a batch of columns.
+
+    Args:
+        entity: Entity name (e.g., "client")
+        columns: Field name -> values, one per row (lists or NumPy arrays of
+            equal length). Nested fields may be given as dotted names
+            (``"address.country"``) or as a column of dicts. Missing columns
+            are treated as all null.
+        version: Schema version (default: "v1")
+
+    Returns:
+        Violation mask per rule, True where the row violates the rule. Keys
+        are ``"required:<field>"``, ``"<field>:<keyword>"`` (e.g.
+        ``"aum:min"``) and ``"rule:<cross-field rule>"``. Masks are NumPy
+        bool arrays if any input column is an array, else lists of bool.
+
+    Raises:
+        SemanticNotFoundError: If the semantic file exists but cannot be loaded
+        SemanticRuleError: If a constraint or rule is not supported
+        ValueError: If the columns have different lengths
+
+    Example:
+        >>> masks = check_columns("client", {"status": ["active", "closed"],
+        ...                                  "aum": [10.0, -1.0]})
+        >>> masks["status:allowed"], masks["aum:min"]
+        ([False, True], [False, True])
+    """
+    cache_key = (entity, version)
+    check = registry._semantic_column_checks.get(cache_key)
+    if check is None:
+        with _COMPILE_LOCKS[hash(("columns", entity, version)) % len(_COMPILE_LOCKS)]:
+            check = registry._semantic_column_checks.get(cache_key)
+            if check is None:
+                constraints = registry.load_semantic_constraints(entity, version)
+                check = compile_column_constraints(constraints)
+                registry._semantic_column_checks[cache_key] = check
+    return check(columns)
@@ -0,0 +1,564 @@
+"""Compiled semantic constraint checks.
+
+``*.semantic.yaml`` files describe rules that JSON Schema does not cover:
+
+- ``required_fields``: fields that must be present and not null
+- ``semantic_constraints``: per-field ``allowed``, ``type``, ``min``, ``max``
+  and ``uppercase`` rules
+- ``cross_field_constraints``: rules over several fields written in a small
+  expression language, e.g. ``"risk_profile == 'high' implies aum > 0"``
+
+``compile_semantics(entity, version)`` turns a semantic file into a single
+``check(record) -> list[str]`` callable, cached in the registry. Cross-field
+rules are tokenized and parsed into a small AST (see ``parse_rule``) and then
+compiled into closures - rule text is never passed to ``eval``.
+
+Rule grammar::
+
+    rule       := implies
+    implies    := or_expr ["implies" implies]
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := operand [("==" | "!=" | "<" | "<=" | ">" | ">=" | "in" | "not in") operand]
+    operand    := field | string | number | true | false | null
+                | "(" rule ")" | "[" [operand ("," operand)*] "]"
+    field      := name ("." name)*
+
+A field that is missing from the record evaluates to null; ordering
+comparisons involving null (or incomparable types) are false.
+"""
+
+import logging
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, NoReturn
+
+from canonical import registry
+from canonical.validator import _COMPILE_LOCKS
+
+logger = logging.getLogger(__name__)
+
+SemanticCheck = Callable[[dict[str, Any]], list[str]]
+
+
+class SemanticRuleError(Exception):
+    """Raised when a semantic constraint or cross-field rule cannot be compiled."""
+
+    pass
+
+
+# AST nodes for cross-field rules
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """Reference to a (possibly nested) record field."""
+
+    path: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Literal:
+    """Constant string, number, boolean, null or list of constants."""
+
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Compare:
+    """Binary comparison: ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``, ``not in``."""
+
+    op: str
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Not:
+    """Logical negation."""
+
+    operand: Any
+
+
+@dataclass(frozen=True, slots=True)
+class BoolOp:
+    """``and`` / ``or`` over two or more operands."""
+
+    op: str
+    operands: tuple[Any, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Implies:
+    """``condition implies consequence`` (true whenever the condition is false)."""
+
+    condition: Any
+    consequence: Any
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|<=|>=|<|>|\(|\)|\[|\]|,)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+    )
+    """,
+    re.VERBOSE,
+)
+_KEYWORDS = {"and", "or", "not", "in", "implies"}
+_CONSTANTS = {
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+    "null": None,
+    "None": None,
+}
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _tokenize(rule: str) -> list[tuple[str, Any]]:
+    tokens: list[tuple[str, Any]] = []
+    pos = 0
+    end = len(rule.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(rule, pos)
+        if match is None or match.lastgroup is None:
+            raise SemanticRuleError(f"Unexpected character at position {pos} in rule: {rule!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "number":
+            tokens.append(("literal", float(text) if any(c in text for c in ".eE") else int(text)))
+        elif kind == "string":
+            tokens.append(("literal", _ESCAPE_RE.sub(r"\1", text[1:-1])))
+        elif kind == "name" and text in _KEYWORDS:
+            tokens.append(("keyword", text))
+        elif kind == "name" and text in _CONSTANTS:
+            tokens.append(("literal", _CONSTANTS[text]))
+        elif kind == "name":
+            tokens.append(("field", tuple(text.split("."))))
+        else:
+            tokens.append(("op", text))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing the rule AST."""
+
+    def __init__(self, rule: str):
+        self.rule = rule
+        self.tokens = _tokenize(rule)
+        self.pos = 0
+
+    def peek(self) -> tuple[str, Any] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def accept(self, kind: str, value: Any = None) -> bool:
+        token = self.peek()
+        if token is not None and token[0] == kind and (value is None or token[1] == value):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: Any) -> None:
+        if not self.accept(kind, value):
+            self.fail(f"expected {value!r}")
+
+    def fail(self, message: str) -> NoReturn:
+        token = self.peek()
+        if token is None:
+            found = "end of rule"
+        elif token[0] == "field":
+            found = repr(".".join(token[1]))
+        else:
+            found = repr(token[1])
+        raise SemanticRuleError(f"Invalid rule {self.rule!r}: {message}, found {found}")
+
+    def parse(self) -> Any:
+        node = self.implies()
+        if self.peek() is not None:
+            self.fail("unexpected trailing input")
+        return node
+
+    def implies(self) -> Any:
+        node = self.or_expr()
+        if self.accept("keyword", "implies"):
+            return Implies(node, self.implies())
+        return node
+
+    def or_expr(self) -> Any:
+        operands = [self.and_expr()]
+        while self.accept("keyword", "or"):
+            operands.append(self.and_expr())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def and_expr(self) -> Any:
+        operands = [self.not_expr()]
+        while self.accept("keyword", "and"):
+            operands.append(self.not_expr())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def not_expr(self) -> Any:
+        if self.accept("keyword", "not"):
+            return Not(self.not_expr())
+        return self.comparison()
+
+    def comparison(self) -> Any:
+        left = self.operand()
+        token = self.peek()
+        if token is None:
+            return left
+        if token[0] == "op" and token[1] in ("==", "!=", "<", "<=", ">", ">="):
+            self.pos += 1
+            return Compare(token[1], left, self.operand())
+        if self.accept("keyword", "in"):
+            return Compare("in", left, self.operand())
+        if token == ("keyword", "not") and self.tokens[self.pos + 1 : self.pos + 2] == [
+            ("keyword", "in")
+        ]:
+            self.pos += 2
+            return Compare("not in", left, self.operand())
+        return left
+
+    def operand(self) -> Any:
+        token = self.peek()
+        if token is None:
+            self.fail("expected a field, value or '('")
+        kind, value = token
+        if kind == "literal":
+            self.pos += 1
+            return Literal(value)
+        if kind == "field":
+            self.pos += 1
+            return Field(value)
+        if self.accept("op", "("):
+            node = self.implies()
+            self.expect("op", ")")
+            return node
+        if self.accept("op", "["):
+            items = []
+            if not self.accept("op", "]"):
+                items.append(self.literal())
+                while self.accept("op", ","):
+                    items.append(self.literal())
+                self.expect("op", "]")
+            return Literal(tuple(items))
+        self.fail("expected a field, value or '('")
+
+    def literal(self) -> Any:
+        token = self.peek()
+        if token is None or token[0] != "literal":
+            self.fail("expected a constant in list")
+        self.pos += 1
+        return token[1]
+
+
+def parse_rule(rule: str) -> Any:
+    """
+    Parse a cross-field rule into its AST.
+
+    Args:
+        rule: Rule text, e.g. ``"risk_profile == 'high' implies aum > 0"``
+
+    Returns:
+        Root AST node (``Implies``, ``BoolOp``, ``Not``, ``Compare``,
+        ``Field`` or ``Literal``)
+
+    Raises:
+        SemanticRuleError: If the rule is not valid
+    """
+    if not isinstance(rule, str) or not rule.strip():
+        raise SemanticRuleError(f"Rule must be a non-empty string, got {rule!r}")
+    return _Parser(rule).parse()
+
+
+def _ordered(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def ordered(left: Any, right: Any) -> bool:
+        if left is None or right is None:
+            return False
+        try:
+            return compare(left, right)
+        except TypeError:
+            return False
+
+    return ordered
+
+
+def _contains(left: Any, right: Any) -> bool:
+    try:
+        return left in right
+    except TypeError:
+        return False
+
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": _ordered(operator.lt),
+    "<=": _ordered(operator.le),
+    ">": _ordered(operator.gt),
+    ">=": _ordered(operator.ge),
+    "in": _contains,
+    "not in": lambda left, right: not _contains(left, right),
+}
+
+
+def _compile_node(node: Any) -> Callable[[dict[str, Any]], Any]:
+    """Compile an AST node into a closure evaluating it against a record."""
+    if isinstance(node, Literal):
+        value = node.value
+        return lambda record: value
+    if isinstance(node, Field):
+        if len(node.path) == 1:
+            name = node.path[0]
+            return lambda record: record.get(name)
+        path = node.path
+
+        def get_nested(record: dict[str, Any]) -> Any:
+            value: Any = record
+            for name in path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(name)
+            return value
+
+        return get_nested
+    if isinstance(node, Compare):
+        compare = _COMPARISONS[node.op]
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda record: compare(left(record), right(record))
+    if isinstance(node, Not):
+        operand = _compile_node(node.operand)
+        return lambda record: not operand(record)
+    if isinstance(node, BoolOp):
+        operands = tuple(_compile_node(operand) for operand in node.operands)
+        if node.op == "and":
+            return lambda record: all(operand(record) for operand in operands)
+        return lambda record: any(operand(record) for operand in operands)
+    if isinstance(node, Implies):
+        condition = _compile_node(node.condition)
+        consequence = _compile_node(node.consequence)
+        return lambda record: not condition(record) or bool(consequence(record))
+    raise SemanticRuleError(f"Unknown rule node: {node!r}")
+
+
+def compile_rule(rule: str) -> Callable[[dict[str, Any]], bool]:
+    """
+    Compile a cross-field rule into a predicate.
+
+    Args:
+        rule: Rule text
+
+    Returns:
+        Callable ``predicate(record) -> bool``, True when the record satisfies the rule
+
+    Raises:
+        SemanticRuleError: If the rule is not valid
+    """
+    evaluate = _compile_node(parse_rule(rule))
+    return lambda record: bool(evaluate(record))
+
+
+_FIELD_TYPES: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+_FIELD_KEYWORDS = {"allowed", "type", "min", "max", "uppercase", "description"}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _allowed_violation(allowed_list: list[Any]) -> Callable[[Any], bool]:
+    try:
+        allowed: Any = frozenset(allowed_list)
+    except TypeError:
+        allowed = allowed_list
+
+    def violates(value: Any) -> bool:
+        try:
+            return value not in allowed
+        except TypeError:
+            return True
+
+    return violates
+
+
+def _field_rules(field: str, rules: dict[str, Any]) -> list[tuple[str, Any, Callable, str]]:
+    """
+    Validate one field's constraints and build its per-keyword rules.
+
+    Returns:
+        ``(keyword, argument, violates(value) -> bool, message)`` for each
+        constraint, in evaluation order. ``violates`` is only called for
+        non-null values.
+    """
+    if not isinstance(rules, dict):
+        raise SemanticRuleError(f"Constraints for field '{field}' must be a mapping")
+    unknown = set(rules) - _FIELD_KEYWORDS
+    if unknown:
+        raise SemanticRuleError(
+            f"Unsupported constraint(s) for field '{field}': {', '.join(sorted(unknown))}"
+        )
+
+    prefix = f"$.{field}: "
+    field_rules: list[tuple[str, Any, Callable, str]] = []
+
+    if "type" in rules:
+        type_name = rules["type"]
+        if type_name not in _FIELD_TYPES:
+            raise SemanticRuleError(f"Unsupported type '{type_name}' for field '{field}'")
+        is_type = _FIELD_TYPES[type_name]
+        field_rules.append(
+            ("type", type_name, lambda v: not is_type(v), f"{prefix}expected type '{type_name}'")
+        )
+    if "allowed" in rules:
+        allowed_list = list(rules["allowed"])
+        field_rules.append(
+            (
+                "allowed",
+                allowed_list,
+                _allowed_violation(allowed_list),
+                f"{prefix}value is not one of {allowed_list!r}",
+            )
+        )
+    if "min" in rules:
+        low = rules["min"]
+        message = f"{prefix}value must be >= {low!r}"
+        field_rules.append(("min", low, lambda v: _is_number(v) and v < low, message))
+    if "max" in rules:
+        high = rules["max"]
+        message = f"{prefix}value must be <= {high!r}"
+        field_rules.append(("max", high, lambda v: _is_number(v) and v > high, message))
+    if rules.get("uppercase"):
+        field_rules.append(
+            (
+                "uppercase",
+                True,
+                lambda v: isinstance(v, str) and v != v.upper(),
+                f"{prefix}value must be uppercase",
+            )
+        )
+    return field_rules
+
+
+def _compile_field(field: str, rules: dict[str, Any]) -> Callable[[Any], str | None]:
+    """Compile one field's constraints into ``check(value) -> error or None``."""
+    checks = tuple((violates, message) for _, _, violates, message in _field_rules(field, rules))
+
+    def check_field(value: Any) -> str | None:
+        for violates, message in checks:
+            if violates(value):
+                return message
+        return None
+
+    return check_field
+
+
+def _cross_field_rules(constraints: dict[str, Any]) -> list[tuple[str, str | None]]:
+    """``(rule, description)`` for each entry of ``cross_field_constraints``."""
+    rules = []
+    for entry in constraints.get("cross_field_constraints") or ():
+        rule = entry.get("rule") if isinstance(entry, dict) else entry
+        if not isinstance(rule, str):
+            raise SemanticRuleError(f"Cross-field constraint has no rule string: {entry!r}")
+        description = entry.get("description") if isinstance(entry, dict) else None
+        rules.append((rule, description))
+    return rules
+
+
+def compile_constraints(constraints: dict[str, Any]) -> SemanticCheck:
+    """
+    Compile a parsed semantic constraints document into a check function.
+
+    Args:
+        constraints: Semantic constraints as returned by ``load_semantic_constraints``
+
+    Returns:
+        Callable ``check(record) -> list[str]`` returning error messages
+        (empty when the record satisfies every constraint)
+
+    Raises:
+        SemanticRuleError: If a constraint or rule is not supported
+    """
+    required = tuple(constraints.get("required_fields") or ())
+    fields = tuple(
+        (field, _compile_field(field, rules))
+        for field, rules in (constraints.get("semantic_constraints") or {}).items()
+    )
+    cross_field = []
+    for rule, description in _cross_field_rules(constraints):
+        predicate = compile_rule(rule)
+        message = f"$: cross-field rule violated: {rule}"
+        if description:
+            message += f" ({description})"
+        cross_field.append((predicate, message))
+    cross_field_tuple = tuple(cross_field)
+
+    def check(record: dict[str, Any]) -> list[str]:
+        errors = []
+        get = record.get
+        for field in required:
+            if get(field) is None:
+                errors.append(f"$: missing required field '{field}'")
+        for field, check_field in fields:
+            value = get(field)
+            if value is not None:
+                error = check_field(value)
+                if error is not None:
+                    errors.append(error)
+        for predicate, message in cross_field_tuple:
+            if not predicate(record):
+                errors.append(message)
+        return errors
+
+    return check
+
+
+def compile_semantics(entity: str, version: str = "v1") -> SemanticCheck:
+    """
+    Get the compiled semantic check for an entity.
+
+    Checks are compiled on first use and cached for the lifetime of the
+    process. Entities without a semantic file get a check that always passes.
+
+    Args:
+        entity: Entity name (e.g., "client")
+        version: Schema version (default: "v1")
+
+    Returns:
+        Callable ``check(record) -> list[str]`` returning error messages
+        (empty when the record satisfies every constraint)
+
+    Raises:
+        SemanticNotFoundError: If the semantic file exists but cannot be loaded
+        SemanticRuleError: If a constraint or rule is not supported
+
+    Example:
+        >>> check = compile_semantics("client")
+        >>> check({"client_id": "c1", "name": "Acme", "status": "closed"})
+        ["$.status: value is not one of ['active', 'inactive', 'prospect']"]
+    """
+    cache_key = (entity, version)
+    check = registry._semantic_checks.get(cache_key)
+    if check is not None:
+        return check
+
+    with _COMPILE_LOCKS[hash(("semantic", entity, version)) % len(_COMPILE_LOCKS)]:
+        check = registry._semantic_checks.get(cache_key)
+        if check is None:
+            check = compile_constraints(registry.load_semantic_constraints(entity, version))
+            registry._semantic_checks[cache_key] = check
+            logger.debug(f"Compiled semantic constraints: {entity}.{version}")
+    return check
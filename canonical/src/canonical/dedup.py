@@ -0,0 +1,415 @@
+"""Event-id deduplication for at-least-once pub/sub consumers.
+
+The ``pubsub`` and ``rmbrain-pubsub`` Dapr components deliver events at least
+once, so consumers see the same ``event_id`` again after retries and
+redeliveries. ``EventDeduplicator`` remembers the ids it has seen in bounded
+memory:
+
+- a bounded LRU of exact ids answers without error for the most recent
+  ``lru_size`` distinct ids
+- with ``drop_unconfirmed=True``, a scalable Bloom filter (a series of filters
+  of growing capacity and tightening error rate) also remembers older ids;
+  once its memory budget is reached the oldest filter is dropped, so it
+  forgets the oldest ids instead of growing
+
+The effective dedup window therefore depends on the mode. By default
+(processing an event twice is recoverable, dropping it is not) only exact
+matches count: a redelivery is caught if its id is among the last
+``lru_size`` distinct ids, and the Bloom filter is not kept at all. With
+``drop_unconfirmed=True`` an id the filter has seen is reported as a
+duplicate even when the LRU no longer holds it; the window grows to the ids
+the filters still hold (between about 3 and 6 million ids with the default
+16 MiB budget), at the cost of reporting roughly ``error_rate`` of new ids
+as duplicates.
+
+The state can be snapshotted to a local file so a restarted worker does not
+reprocess its backlog.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from canonical.envelope import EnvelopeView
+
+logger = logging.getLogger(__name__)
+
+# Filter n+1 has _GROWTH times the capacity and _TIGHTENING times the error
+# rate of filter n, which keeps the compound error rate below error_rate
+_GROWTH = 2
+_TIGHTENING = 0.8
+
+_SNAPSHOT_MAGIC = b"CANONICAL-DEDUP\x01"
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+def _hash_pair(event_id: str) -> tuple[int, int]:
+    """Two independent 64-bit hashes for double hashing."""
+    digest = hashlib.blake2b(event_id.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class _BloomFilter:
+    """Fixed-capacity Bloom filter over a bytearray."""
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "count", "bits")
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        count: int = 0,
+        bits: bytearray | None = None,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, math.ceil(-math.log2(error_rate)))
+        self.count = count
+        size = (self.num_bits + 7) // 8
+        if bits is not None and len(bits) != size:
+            raise ValueError(f"expected {size} filter bytes, got {len(bits)}")
+        self.bits = bits if bits is not None else bytearray(size)
+
+    @staticmethod
+    def size_for(capacity: int, error_rate: float) -> int:
+        """Bytes used by a filter with these parameters."""
+        num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        return (num_bits + 7) // 8
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def __contains__(self, hashes: tuple[int, int]) -> bool:
+        h1, h2 = hashes
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            index = (h1 + i * h2) % num_bits
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def add(self, hashes: tuple[int, int]) -> None:
+        h1, h2 = hashes
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            index = (h1 + i * h2) % num_bits
+            bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    """Counters of an EventDeduplicator.
+
+    Attributes:
+        checked: Event ids checked with ``seen()``/``seen_event()``
+        duplicates: Ids reported as duplicates
+        unconfirmed: Ids the Bloom filter had seen but the LRU did not hold
+            (always 0 unless ``drop_unconfirmed`` is set)
+        filters: Bloom filters currently kept (0 unless ``drop_unconfirmed``
+            is set)
+        filter_bytes: Memory used by the Bloom filters' bit arrays
+        tracked: Ids currently held by the exact LRU
+    """
+
+    checked: int
+    duplicates: int
+    unconfirmed: int
+    filters: int
+    filter_bytes: int
+    tracked: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as a JSON-serialisable dict."""
+        return {
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "unconfirmed": self.unconfirmed,
+            "filters": self.filters,
+            "filter_bytes": self.filter_bytes,
+            "tracked": self.tracked,
+        }
+
+
+class EventDeduplicator:
+    """Thread-safe "have I seen this event_id?" filter with bounded memory.
+
+    Example:
+        >>> dedup = EventDeduplicator(snapshot_path="/var/lib/worker/dedup.bin")
+        >>> def on_message(message: bytes) -> None:
+        ...     if dedup.seen_event(message):
+        ...         return  # redelivery
+        ...     handle(message)
+        >>> dedup.snapshot()  # e.g. periodically and on shutdown
+
+    Args:
+        capacity: Ids the first Bloom filter holds before a larger one is added
+        error_rate: Target false positive rate of the Bloom filter as a whole
+        max_filter_bytes: Memory budget for the Bloom filters' bit arrays; the
+            oldest filters are dropped to stay within it
+        lru_size: Number of exact ids kept; by default this is the whole dedup
+            window
+        drop_unconfirmed: Also keep the Bloom filter and report ids it has seen
+            but the LRU no longer holds as duplicates, extending the window to
+            the filters' memory budget (default: only exact matches count and
+            the filter is not kept)
+        snapshot_path: File the state is restored from, if it exists, and
+            written to by ``snapshot()``
+
+    Raises:
+        ValueError: If a size is not positive or error_rate is not in (0, 1)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        max_filter_bytes: int = 16 * 1024 * 1024,
+        lru_size: int = 100_000,
+        drop_unconfirmed: bool = False,
+        snapshot_path: str | Path | None = None,
+    ):
+        if capacity < 1 or lru_size < 1:
+            raise ValueError("capacity and lru_size must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        if _BloomFilter.size_for(capacity, error_rate * (1 - _TIGHTENING)) > max_filter_bytes:
+            raise ValueError(
+                f"max_filter_bytes={max_filter_bytes} is too small for capacity={capacity} "
+                f"at error_rate={error_rate}"
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_filter_bytes = max_filter_bytes
+        self.lru_size = lru_size
+        self.drop_unconfirmed = drop_unconfirmed
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+
+        self._lock = threading.Lock()
+        self._filters: list[_BloomFilter] = []
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self._checked = 0
+        self._duplicates = 0
+        self._unconfirmed = 0
+
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            try:
+                self._restore(self.snapshot_path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring dedup snapshot {self.snapshot_path}: {str(e)}")
+                self._filters.clear()
+                self._recent.clear()
+
+    # -- Bloom filter -------------------------------------------------------
+
+    def _filter_bytes(self) -> int:
+        return sum(len(bloom.bits) for bloom in self._filters)
+
+    def _add_filter(self) -> _BloomFilter:
+        if not self._filters:
+            capacity, error_rate = self.capacity, self.error_rate * (1 - _TIGHTENING)
+        else:
+            last = self._filters[-1]
+            capacity, error_rate = last.capacity * _GROWTH, last.error_rate * _TIGHTENING
+            if self._filter_bytes() + _BloomFilter.size_for(capacity, error_rate) > (
+                self.max_filter_bytes
+            ):
+                # Budget reached: stop growing and rotate filters of the current size
+                capacity, error_rate = last.capacity, last.error_rate
+        size = _BloomFilter.size_for(capacity, error_rate)
+        while self._filters and self._filter_bytes() + size > self.max_filter_bytes:
+            dropped = self._filters.pop(0)
+            logger.debug(f"Dedup filter budget reached; forgetting {dropped.count} ids")
+        bloom = _BloomFilter(capacity, error_rate)
+        self._filters.append(bloom)
+        return bloom
+
+    def _in_filters(self, hashes: tuple[int, int]) -> bool:
+        return any(hashes in bloom for bloom in reversed(self._filters))
+
+    # -- Public API ---------------------------------------------------------
+
+    def seen(self, event_id: str) -> bool:
+        """
+        Record an event id and report whether it was seen before.
+
+        Args:
+            event_id: The envelope's ``event_id``
+
+        Returns:
+            True if the id is a duplicate, False if it is new (it is recorded
+            either way)
+        """
+        hashes = _hash_pair(event_id) if self.drop_unconfirmed else None
+        with self._lock:
+            self._checked += 1
+            recent = self._recent
+            if event_id in recent:
+                recent.move_to_end(event_id)
+                self._duplicates += 1
+                return True
+
+            # Without drop_unconfirmed only exact matches count, so no filter is kept
+            duplicate = False
+            if hashes is not None:
+                if self._in_filters(hashes):
+                    self._unconfirmed += 1
+                    duplicate = True
+                else:
+                    bloom = self._filters[-1] if self._filters else None
+                    if bloom is None or bloom.full:
+                        bloom = self._add_filter()
+                    bloom.add(hashes)
+
+            recent[event_id] = None
+            if len(recent) > self.lru_size:
+                recent.popitem(last=False)
+            if duplicate:
+                self._duplicates += 1
+            return duplicate
+
+    def seen_event(self, event: bytes | bytearray | memoryview | str | dict[str, Any]) -> bool:
+        """
+        ``seen()`` for a raw or decoded event.
+
+        Raw events are read with ``EnvelopeView``, which stops at ``event_id``
+        without decoding the payload.
+
+        Args:
+            event: Event as JSON bytes/str, or decoded dict
+
+        Returns:
+            True if the event's id is a duplicate
+
+        Raises:
+            ValueError: If the event is not a JSON object or has no string
+                ``event_id`` (``EnvelopeParseError`` for malformed JSON)
+        """
+        if isinstance(event, dict):
+            event_id = event.get("event_id")
+        else:
+            event_id = EnvelopeView(event).get("event_id")
+        if not isinstance(event_id, str):
+            raise ValueError("$.event_id: missing or not a string")
+        return self.seen(event_id)
+
+    def __contains__(self, event_id: object) -> bool:
+        """Whether an id would be reported as a duplicate, without recording it."""
+        if not isinstance(event_id, str):
+            return False
+        hashes = _hash_pair(event_id) if self.drop_unconfirmed else None
+        with self._lock:
+            if event_id in self._recent:
+                return True
+            return hashes is not None and self._in_filters(hashes)
+
+    def stats(self) -> DedupStats:
+        """Snapshot of the counters and memory use."""
+        with self._lock:
+            return DedupStats(
+                checked=self._checked,
+                duplicates=self._duplicates,
+                unconfirmed=self._unconfirmed,
+                filters=len(self._filters),
+                filter_bytes=self._filter_bytes(),
+                tracked=len(self._recent),
+            )
+
+    def clear(self) -> None:
+        """Forget every id and reset the counters."""
+        with self._lock:
+            self._filters.clear()
+            self._recent.clear()
+            self._checked = self._duplicates = self._unconfirmed = 0
+
+    # -- Snapshots ----------------------------------------------------------
+
+    def snapshot(self, path: str | Path | None = None) -> Path:
+        """
+        Write the filters and the exact ids to a file.
+
+        The file is written next to its destination and renamed into place,
+        so a crash mid-write leaves the previous snapshot intact.
+
+        Args:
+            path: Destination (default: ``snapshot_path``)
+
+        Returns:
+            Path written
+
+        Raises:
+            ValueError: If no path is given and there is no snapshot_path
+        """
+        target = Path(path) if path is not None else self.snapshot_path
+        if target is None:
+            raise ValueError("No snapshot path given and no snapshot_path configured")
+        with self._lock:
+            header = json.dumps(
+                {
+                    "filters": [
+                        [bloom.capacity, bloom.error_rate, bloom.count] for bloom in self._filters
+                    ],
+                    "recent": list(self._recent),
+                },
+                separators=(",", ":"),
+            ).encode("utf-8")
+            chunks = [_SNAPSHOT_MAGIC, _HEADER_LENGTH.pack(len(header)), header]
+            chunks.extend(bytes(bloom.bits) for bloom in self._filters)
+
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            with open(temporary, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, target)
+        finally:
+            temporary.unlink(missing_ok=True)
+        return target
+
+    def _restore(self, path: Path) -> None:
+        data = path.read_bytes()
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError("not a dedup snapshot")
+        offset = len(_SNAPSHOT_MAGIC)
+        try:
+            (length,) = _HEADER_LENGTH.unpack_from(data, offset)
+        except struct.error as e:
+            raise ValueError(f"truncated snapshot: {e}") from e
+        offset += _HEADER_LENGTH.size
+        header = json.loads(data[offset : offset + length])
+        offset += length
+
+        filters = []
+        for capacity, error_rate, count in header["filters"]:
+            size = _BloomFilter.size_for(capacity, error_rate)
+            bits = bytearray(data[offset : offset + size])
+            filters.append(_BloomFilter(capacity, error_rate, count, bits))
+            offset += size
+        if offset != len(data):
+            raise ValueError("snapshot size does not match its header")
+
+        # Keep the newest filters and ids if this instance has smaller budgets
+        while filters and sum(len(bloom.bits) for bloom in filters) > self.max_filter_bytes:
+            filters.pop(0)
+        # A filter that is never consulted would only hold memory
+        self._filters = filters if self.drop_unconfirmed else []
+        self._recent = OrderedDict.fromkeys(header["recent"][-self.lru_size :])
+        logger.debug(
+            f"Restored dedup snapshot {path}: {len(self._filters)} filters, {len(self._recent)} ids"
+        )
+
+    def __len__(self) -> int:
+        """Ids recorded by the Bloom filters still kept (0 without ``drop_unconfirmed``)."""
+        return sum(bloom.count for bloom in self._filters)
@@ -0,0 +1,262 @@
+"""Header-only view of a raw canonical event.
+
+Routers and filters usually only need ``event_type``, ``event_version``,
+``tenant_id`` and ``entity.entity_type`` to decide whether to handle, forward
+or drop a message, yet ``json.loads`` builds the whole (often multi-KB)
+payload first. ``EnvelopeView`` instead reads the top-level members of the
+event one at a time, with the C scanner of the ``json`` module, and stops as
+soon as it has found the field asked for. Envelopes are written in schema
+order with ``payload`` last, so the header fields are found without ever
+decoding the payload; it is decoded on first access to ``payload``.
+
+Only the part of the message that has been read is checked: a malformed
+payload is reported when the payload (or a field after it) is first accessed.
+Duplicate top-level keys are rejected, so a field never has a different value
+in the view than in ``to_dict()``; like other errors, a duplicate is reported
+once the part of the message holding it is read.
+"""
+
+import json
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, Iterator
+
+from canonical import codec
+
+_WS = re.compile(r"[ \t\n\r]*")
+_WS_CHARS = " \t\n\r"
+
+# C scanner: scan_once(text, index) -> (value, end index). Numbers are decoded
+# with the codec hooks, so a view accepts exactly what every codec backend does
+_scan_once = json.JSONDecoder(  # type: ignore[attr-defined]
+    parse_constant=codec._reject_constant,
+    parse_int=codec._parse_int,
+    parse_float=codec._parse_float,
+).scan_once
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    """Index of the first non-whitespace character at or after ``pos``."""
+    match = _WS.match(text, pos)
+    return match.end() if match is not None else pos
+
+
+class EnvelopeParseError(ValueError):
+    """Raised when a raw event is not a JSON object or cannot be decoded."""
+
+    pass
+
+
+class EnvelopeView:
+    """Lazily decoded, read-only view of a raw canonical event.
+
+    Fields are decoded in document order up to the one requested, and cached.
+    ``payload_raw`` (and ``raw(key)``) return zero-copy ``memoryview`` slices
+    of the original buffer, e.g. for forwarding the payload without
+    re-encoding it.
+
+    Header properties return None when the field is missing or not a string,
+    like ``EventValidationResult``. The view does not validate the event; use
+    ``validate_event(view.to_dict())`` for messages that are handled.
+
+    Example:
+        >>> view = EnvelopeView(message)
+        >>> if view.event_type != "document.ingested" or view.tenant_id != tenant:
+        ...     return  # dropped without decoding the payload
+        >>> process(view.payload)
+
+    Raises:
+        EnvelopeParseError: From the constructor if ``raw`` is not a JSON
+            object, and from field access if the part of the message read to
+            find that field is not valid JSON
+    """
+
+    __slots__ = ("_buffer", "_text", "_pos", "_values", "_spans")
+
+    def __init__(self, raw: bytes | bytearray | memoryview | str):
+        if isinstance(raw, str):
+            self._buffer = None
+            self._text = raw
+        else:
+            self._buffer = raw
+            try:
+                self._text = str(raw, "utf-8")
+            except UnicodeDecodeError as e:
+                raise EnvelopeParseError(f"$: invalid UTF-8: {e}") from e
+        # Decoded fields and their character spans, filled in document order
+        self._values: dict[str, Any] = {}
+        self._spans: dict[str, tuple[int, int]] = {}
+        # Where the next member starts; None once the closing brace was read
+        self._pos: int | None = None
+        pos = _skip_ws(self._text, 0)
+        if self._text[pos : pos + 1] != "{":
+            raise EnvelopeParseError("$: invalid JSON: expected a JSON object")
+        pos = _skip_ws(self._text, pos + 1)
+        if self._text[pos : pos + 1] == "}":
+            self._finish(pos + 1)
+        else:
+            self._pos = pos
+
+    def _error(self, message: str, pos: int) -> EnvelopeParseError:
+        return EnvelopeParseError(f"$: invalid JSON: {message} at char {pos}")
+
+    def _finish(self, pos: int) -> None:
+        if _skip_ws(self._text, pos) != len(self._text):
+            raise self._error("extra data", pos)
+        self._pos = None
+
+    def _read_member(self, pos: int) -> str:
+        """Decode the top-level member starting at ``pos`` and return its key."""
+        # Whitespace is only skipped where present, as in json.decoder, to keep
+        # this loop cheap
+        text = self._text
+        if text[pos : pos + 1] != '"':
+            raise self._error("expected a property name", pos)
+        try:
+            key, pos = scanstring(text, pos + 1)
+        except ValueError as e:
+            raise EnvelopeParseError(f"$: invalid JSON: {e}") from e
+        if text[pos : pos + 1] != ":":
+            pos = _skip_ws(text, pos)
+            if text[pos : pos + 1] != ":":
+                raise self._error("expected ':'", pos)
+        start = pos + 1
+        if text[start : start + 1] in _WS_CHARS:
+            start = _skip_ws(text, start)
+        try:
+            value, end = _scan_once(text, start)
+        except StopIteration:
+            raise EnvelopeParseError(f"$.{key}: invalid JSON: expected a value") from None
+        except ValueError as e:
+            raise EnvelopeParseError(f"$.{key}: invalid JSON: {e}") from e
+        if key in self._values:
+            raise EnvelopeParseError(f"$.{key}: invalid JSON: duplicate key")
+        self._values[key] = value
+        self._spans[key] = (start, end)
+
+        separator = text[end : end + 1]
+        if separator in _WS_CHARS:
+            end = _skip_ws(text, end)
+            separator = text[end : end + 1]
+        if separator == ",":
+            pos = end + 1
+            if text[pos : pos + 1] in _WS_CHARS:
+                pos = _skip_ws(text, pos)
+            self._pos = pos
+        elif separator == "}":
+            self._finish(end + 1)
+        else:
+            raise self._error("expected ',' or '}'", end)
+        return key
+
+    def _find(self, key: str) -> bool:
+        """Read members until ``key`` has been seen; False if it is missing."""
+        while key not in self._values:
+            if self._pos is None:
+                return False
+            self._read_member(self._pos)
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            if not self._find(key):
+                raise
+        return self._values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Decoded value of a top-level field, or ``default`` if it is missing."""
+        if key in self._values or self._find(key):
+            return self._values[key]
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and (key in self._values or self._find(key))
+
+    def _read_all(self) -> dict[str, Any]:
+        while self._pos is not None:
+            self._read_member(self._pos)
+        return self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._read_all())
+
+    def __len__(self) -> int:
+        return len(self._read_all())
+
+    def keys(self):
+        """Top-level field names, in document order (reads the whole event)."""
+        return self._read_all().keys()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode the whole event, reusing the fields already decoded."""
+        return dict(self._read_all())
+
+    def raw(self, key: str) -> memoryview:
+        """
+        Undecoded JSON text of a top-level field.
+
+        Args:
+            key: Top-level field name
+
+        Returns:
+            Zero-copy slice of the original buffer (of the UTF-8 encoded text
+            if the view was built from a str)
+
+        Raises:
+            KeyError: If the field is missing
+        """
+        if not self._find(key):
+            raise KeyError(key)
+        if self._buffer is None:
+            self._buffer = self._text.encode("utf-8")
+        char_start, char_end = self._spans[key]
+        start, end = char_start, char_end
+        buffer = memoryview(self._buffer).cast("B")
+        if len(buffer) != len(self._text):
+            # Non-ASCII text: character offsets are not byte offsets
+            start = len(self._text[:char_start].encode("utf-8"))
+            end = start + len(self._text[char_start:char_end].encode("utf-8"))
+        return buffer[start:end]
+
+    def _string(self, key: str) -> str | None:
+        value = self.get(key)
+        return value if isinstance(value, str) else None
+
+    @property
+    def event_type(self) -> str | None:
+        return self._string("event_type")
+
+    @property
+    def event_version(self) -> str | None:
+        return self._string("event_version")
+
+    @property
+    def tenant_id(self) -> str | None:
+        return self._string("tenant_id")
+
+    @property
+    def entity_type(self) -> str | None:
+        """``entity.entity_type``, or None if missing or not a string."""
+        entity = self.get("entity")
+        if not isinstance(entity, dict):
+            return None
+        entity_type = entity.get("entity_type")
+        return entity_type if isinstance(entity_type, str) else None
+
+    @property
+    def payload(self) -> Any:
+        """Decoded payload (None if missing), decoded on first access."""
+        return self.get("payload")
+
+    @property
+    def payload_raw(self) -> memoryview | None:
+        """Undecoded payload JSON as a zero-copy slice, or None if missing."""
+        return self.raw("payload") if self._find("payload") else None
+
+    def __repr__(self) -> str:
+        return (
+            f"EnvelopeView(event_type={self.event_type!r}, "
+            f"event_version={self.event_version!r}, tenant_id={self.tenant_id!r})"
+        )
@@ -0,0 +1,94 @@
+"""Read-only containers for cached schemas.
+
+Schemas returned by the registry are shared by every caller in the process,
+so they are deeply frozen: ``FrozenDict`` and ``FrozenList`` behave like the
+``dict`` and ``list`` produced by ``json.load`` (``isinstance`` checks, JSON
+serialisation and equality all work) but every mutating method raises
+``TypeError``.
+
+``copy.deepcopy`` of a frozen value returns ordinary mutable ``dict``/``list``
+objects, for callers that need to modify their own copy.
+"""
+
+import copy
+from typing import Any, NoReturn
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"'{type(self).__name__}' object is read-only; use copy.deepcopy() for a mutable copy"
+    )
+
+
+class FrozenDict(dict):
+    """Immutable ``dict`` for shared schema data."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Immutable ``list`` for shared schema data."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a deeply frozen copy of a JSON/YAML value.
+
+    Args:
+        value: Parsed JSON or YAML data
+
+    Returns:
+        The same data with every ``dict`` replaced by a ``FrozenDict`` and
+        every ``list`` by a ``FrozenList``. Scalars are returned unchanged.
+    """
+    if isinstance(value, dict):
+        if isinstance(value, FrozenDict):
+            return value
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        if isinstance(value, FrozenList):
+            return value
+        return FrozenList([freeze(item) for item in value])
+    return value
@@ -0,0 +1,226 @@
+"""Memoized validation outcomes for repeated event bytes.
+
+Retries (``dapr/config/resiliency.yaml``) and at-least-once pub/sub delivery
+mean the same event bytes are validated several times. ``ValidationCache``
+is an opt-in, bounded LRU of validation outcomes keyed by
+``(schema fingerprint, payload digest)``: the fingerprint is the schema's
+content hash (``registry.schema_fingerprint``), so an entry is never served
+for a schema that has since changed, and the digest is a 128-bit BLAKE2b of
+the raw bytes.
+
+Only raw JSON input (bytes, bytearray, memoryview or str) is memoized;
+already decoded dicts are validated directly.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from canonical import codec, registry
+from canonical.registry import EventNotFoundError
+from canonical.validator import EventValidationResult, compile_validator, validate_event
+
+_RAW_TYPES = (bytes, bytearray, memoryview, str)
+
+
+def _digest(raw: bytes | bytearray | memoryview | str) -> bytes:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _payload_fingerprint(event_type: str | None, event_version: str | None) -> str | None:
+    """Fingerprint of the payload schema an event was checked against, if any."""
+    if event_type is None or event_version is None:
+        return None
+    try:
+        return registry.schema_fingerprint("event", event_type, event_version)
+    except EventNotFoundError:
+        return None
+
+
+@dataclass(frozen=True)
+class ValidationCacheStats:
+    """Counters of a ValidationCache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that ran validation (stale entries included)
+        stale: Entries found but dropped because a schema they depend on changed
+        evictions: Entries dropped to stay within maxsize
+        size: Entries currently cached
+        maxsize: Maximum number of entries
+    """
+
+    hits: int
+    misses: int
+    stale: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as a JSON-serialisable dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "size": self.size,
+            "maxsize": self.maxsize,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ValidationCache:
+    """Bounded, thread-safe LRU of validation outcomes.
+
+    Example:
+        >>> cache = ValidationCache(maxsize=100_000)
+        >>> result = cache.validate_event(message_bytes)  # like validate_event()
+        >>> errors = cache.validate("entity", "client", client_json)
+        >>> cache.stats().hit_rate
+        0.42
+
+    Args:
+        maxsize: Maximum number of outcomes kept
+    """
+
+    def __init__(self, maxsize: int = 65_536):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, bytes], tuple[Any, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def _get(self, key: tuple[str, bytes]) -> tuple[Any, ...] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+            return entry
+
+    def _put(self, key: tuple[str, bytes], entry: tuple[Any, ...]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _drop_stale(self, key: tuple[str, bytes]) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                # The lookup was counted as a hit; it turned out to be a miss
+                self._hits -= 1
+                self._misses += 1
+                self._stale += 1
+
+    def validate(
+        self, kind: str, name: str, raw: bytes | bytearray | memoryview | str, version: str = "v1"
+    ) -> list[str]:
+        """
+        Validate a JSON instance against a schema, reusing a previous outcome.
+
+        Args:
+            kind: "entity", "event" (payload schema) or "envelope"
+            name: Entity name or event type
+            raw: Instance as JSON bytes/str (a dict is validated without caching)
+            version: Schema version (default: "v1")
+
+        Returns:
+            Error messages, as returned by the compiled validator (empty if
+            valid); invalid JSON is reported as ``$: invalid JSON: ...``
+        """
+        validator = compile_validator(kind, name, version)
+        if not isinstance(raw, _RAW_TYPES):
+            return validator(raw)
+
+        key = (registry.schema_fingerprint(kind, name, version), _digest(raw))
+        entry = self._get(key)
+        if entry is not None:
+            return list(entry[0])
+
+        try:
+            errors = validator(codec.loads(raw))
+        except (ValueError, TypeError) as e:
+            errors = [f"$: invalid JSON: {e}"]
+        self._put(key, (tuple(errors),))
+        return errors
+
+    def validate_event(
+        self, raw: bytes | bytearray | memoryview | str | dict[str, Any]
+    ) -> EventValidationResult:
+        """
+        ``validate_event`` with memoized outcomes.
+
+        The cache key is the envelope fingerprint and the digest of the raw
+        event; the entry also records the fingerprint of the payload schema it
+        was checked against and is discarded if that schema has changed. A hit
+        still decodes the event (``result.event``) but skips validation.
+
+        Args:
+            raw: Event as JSON bytes/str (a dict is validated without caching)
+
+        Returns:
+            EventValidationResult, as from ``validate_event``
+        """
+        if not isinstance(raw, _RAW_TYPES):
+            return validate_event(raw)
+
+        key = (registry.schema_fingerprint("envelope", "event_envelope"), _digest(raw))
+        entry = self._get(key)
+        if entry is not None:
+            valid, decodes, event_type, event_version, payload_fingerprint, errors = entry
+            if _payload_fingerprint(event_type, event_version) == payload_fingerprint:
+                event = codec.loads(raw) if decodes else None
+                return EventValidationResult(valid, event, event_type, event_version, errors)
+            self._drop_stale(key)
+
+        result = validate_event(raw)
+        entry = (
+            result.valid,
+            result.event is not None,
+            result.event_type,
+            result.event_version,
+            _payload_fingerprint(result.event_type, result.event_version),
+            result.errors,
+        )
+        self._put(key, entry)
+        return result
+
+    def stats(self) -> ValidationCacheStats:
+        """Snapshot of the hit/miss counters."""
+        with self._lock:
+            return ValidationCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale=self._stale,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drop all outcomes and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._stale = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
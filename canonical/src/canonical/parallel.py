@@ -0,0 +1,260 @@
+"""Multi-process validation of NDJSON event archives.
+
+``validate_ndjson`` is CPU-bound on a single core. ``validate_parallel`` splits
+an NDJSON file, or every ``*.ndjson``/``*.jsonl`` file under a directory, into
+byte-range shards aligned on line boundaries and validates them on a
+``ProcessPoolExecutor``:
+
+- each worker process is initialised once with the parent's JSON backend and
+  the compiled envelope and event validators (``preload``), so tasks only
+  carry ``(path, start, end)`` and nothing schema-related is pickled
+- a worker maps the file itself and reads only its byte range
+- results are merged in input order: failure records keep their file line
+  numbers and the summary keeps per-shard counts and timings
+"""
+
+import logging
+import math
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from canonical import codec
+from canonical.stream import DEFAULT_CHUNK_SIZE, StreamSummary, _scan_lines, _validate_chunk
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_BYTES = 8 * 1024 * 1024
+# Shards are made small enough for several per worker, so one slow shard does
+# not leave the other workers idle at the end, but not smaller than this
+_MIN_SHARD_BYTES = 256 * 1024
+_SHARDS_PER_WORKER = 4
+
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+@dataclass
+class ShardSummary:
+    """Counts for one shard of a parallel validation.
+
+    Attributes:
+        path: File the shard belongs to
+        start: Byte offset of the shard's first line
+        end: Byte offset just past the shard's last line
+        first_line: 1-based line number of the shard's first line in the file
+        summary: Counts and validation time of the shard
+    """
+
+    path: str
+    start: int
+    end: int
+    first_line: int = 1
+    summary: StreamSummary = field(default_factory=StreamSummary)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the shard counts as a JSON-serialisable dict."""
+        return {
+            "path": self.path,
+            "start": self.start,
+            "end": self.end,
+            "first_line": self.first_line,
+            "total": self.summary.total,
+            "invalid": self.summary.invalid,
+            "elapsed_seconds": round(self.summary.elapsed_seconds, 6),
+        }
+
+
+@dataclass
+class ParallelSummary(StreamSummary):
+    """StreamSummary of a parallel validation, with per-shard counts.
+
+    Attributes:
+        workers: Number of worker processes
+        files: Number of files validated
+        shards: Per-shard counts, in input order
+    """
+
+    workers: int = 1
+    files: int = 0
+    shards: list[ShardSummary] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a JSON-serialisable dict."""
+        data = super().to_dict()
+        data["workers"] = self.workers
+        data["files"] = self.files
+        data["shards"] = [shard.to_dict() for shard in self.shards]
+        return data
+
+
+def _list_files(path: Path) -> list[Path]:
+    if not path.is_dir():
+        return [path]
+    return sorted(p for p in path.rglob("*") if p.suffix in _NDJSON_SUFFIXES and p.is_file())
+
+
+def _split(path: Path, shard_bytes: int) -> Iterator[tuple[str, int, int]]:
+    """Byte ranges of about ``shard_bytes``, each ending just past a newline."""
+    size = path.stat().st_size
+    if size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + shard_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            yield str(path), start, end
+            start = end
+
+
+def _init_worker(backend: str) -> None:
+    from canonical.warmup import preload
+
+    codec.set_json_backend(backend)
+    # Envelope and event validators, once per process (a no-op after fork
+    # from a warm parent)
+    preload(entities=False, semantics=False, workers=1)
+
+
+def _validate_shard(
+    path: str, start: int, end: int, chunk_size: int, collect_failures: bool
+) -> tuple[int, StreamSummary, list[dict[str, Any]]]:
+    """Validate ``path[start:end]``; returns (lines, summary, failure records)."""
+    summary = StreamSummary()
+    records: list[dict[str, Any]] = []
+    emit = records.append if collect_failures else None
+    started = time.perf_counter()
+
+    lines = 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+
+        def scan() -> Iterator[tuple[int, bytes]]:
+            nonlocal lines
+            # Lines in the range, blank ones included, to number the next shard
+            lines = yield from _scan_lines(mm, start, end)
+
+        chunk: list[tuple[int, bytes]] = []
+        for item in scan():
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                _validate_chunk(chunk, summary, emit)
+                chunk = []
+        if chunk:
+            _validate_chunk(chunk, summary, emit)
+
+    summary.elapsed_seconds = time.perf_counter() - started
+    return lines, summary, records
+
+
+def _merge(total: StreamSummary, part: StreamSummary) -> None:
+    total.total += part.total
+    total.valid += part.valid
+    total.invalid += part.invalid
+    total.invalid_json += part.invalid_json
+    for event_type, counts in part.by_event_type.items():
+        merged = total.by_event_type.get(event_type)
+        if merged is None:
+            total.by_event_type[event_type] = dict(counts)
+        else:
+            merged["total"] += counts["total"]
+            merged["invalid"] += counts["invalid"]
+
+
+def validate_parallel(
+    path: str | Path,
+    failures: IO[str] | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+) -> ParallelSummary:
+    """
+    Validate an NDJSON event log, or a directory of them, on several processes.
+
+    Produces the same counts and failure records as ``validate_ndjson``;
+    records of directory inputs also carry the ``file`` they come from.
+
+    Args:
+        path: NDJSON file, or directory searched recursively for ``*.ndjson``
+            and ``*.jsonl`` files (validated in sorted order)
+        failures: Text stream receiving one JSON object per invalid event, in
+            input order. If None, failures are only counted.
+        workers: Number of worker processes (default: ``os.cpu_count()``); 1
+            validates in this process
+        chunk_size: Number of events validated together
+        shard_bytes: Maximum shard size; smaller shards are used when needed
+            to give each worker several
+
+    Returns:
+        ParallelSummary with counts, throughput and per-shard counts
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        ValueError: If workers or shard_bytes is not positive
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"No such file or directory: {path}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or shard_bytes < 1:
+        raise ValueError("workers and shard_bytes must be at least 1")
+
+    started = time.perf_counter()
+    files = _list_files(path)
+    total_bytes = sum(f.stat().st_size for f in files)
+    target = math.ceil(total_bytes / (workers * _SHARDS_PER_WORKER)) if total_bytes else 1
+    shard_bytes = min(shard_bytes, max(_MIN_SHARD_BYTES, target))
+    shards = [shard for f in files for shard in _split(f, shard_bytes)]
+
+    summary = ParallelSummary(workers=workers, files=len(files))
+    tag_files = path.is_dir()
+    tasks = (
+        [shard[0] for shard in shards],
+        [shard[1] for shard in shards],
+        [shard[2] for shard in shards],
+        [chunk_size] * len(shards),
+        [failures is not None] * len(shards),
+    )
+    results: Iterator[tuple[int, StreamSummary, list[dict[str, Any]]]]
+    pool: ProcessPoolExecutor | None = None
+    if workers == 1:
+        results = map(_validate_shard, *tasks)
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(codec.get_json_backend(),),
+        )
+        results = pool.map(_validate_shard, *tasks)
+
+    try:
+        current_file = None
+        next_line = 1
+        # Results arrive in shard order, so failures are written in input order
+        for (shard_path, start, end), (lines, part, records) in zip(shards, results):
+            if shard_path != current_file:
+                current_file, next_line = shard_path, 1
+            summary.shards.append(ShardSummary(shard_path, start, end, next_line, part))
+            _merge(summary, part)
+            if failures is not None:
+                for record in records:
+                    record["line"] += next_line - 1
+                    if tag_files:
+                        record = {"file": shard_path, **record}
+                    failures.write(codec.dumps(record).decode("utf-8") + "\n")
+            next_line += lines
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    summary.elapsed_seconds = time.perf_counter() - started
+    logger.debug(
+        f"Validated {summary.total} events from {path} in {len(shards)} shards on "
+        f"{workers} workers: {summary.invalid} invalid, "
+        f"{summary.events_per_second:.0f} events/sec"
+    )
+    return summary
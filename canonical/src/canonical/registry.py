@@ -1,11 +1,20 @@
 """Registry for canonical schemas, events, and semantic constraints."""
 
+import hashlib
 import json
 import logging
+import os
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple
 
-import yaml
+from canonical import codec
+from canonical.frozen import freeze
+
+# yaml is imported where it is used so that importing the registry stays cheap
+# for processes that never read a YAML file
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +25,11 @@ _ENTITIES_DIR = _BASE_DIR / "entities"
 _EVENTS_DIR = _BASE_DIR / "events"
 _SEMANTICS_DIR = _BASE_DIR / "semantics"
 
+# Prebuilt bundle of all registry files (see canonical.bundle). Set
+# CANONICAL_REGISTRY_BUNDLE to another path, or to "0" to always use loose files.
+_BUNDLE_FILE = _BASE_DIR / "_registry.bundle"
+BUNDLE_FORMAT_VERSION = 3
+
 
 class SchemaNotFoundError(Exception):
     """Raised when a schema file is not found."""
@@ -35,11 +49,312 @@ class SemanticNotFoundError(Exception):
     pass
 
 
-# Cache for loaded schemas
+# Cache for loaded schemas. Cached values are deeply frozen (see canonical.frozen)
+# and shared by all callers, so no defensive copies are needed.
 _entity_schemas: dict[str, dict[str, Any]] = {}
 _event_schemas: dict[str, dict[str, Any]] = {}
 _semantic_constraints: dict[str, dict[str, Any]] = {}
 _envelope_schema: dict[str, Any] | None = None
+# Compiled validators keyed by (kind, name, version) - see canonical.validator
+_compiled_validators: dict[tuple[str, str, str], Callable[..., list[str]]] = {}
+# Compiled semantic checks keyed by (entity, version) - see canonical.constraints
+_semantic_checks: dict[tuple[str, str], Callable[[dict[str, Any]], list[str]]] = {}
+# Columnar semantic checks keyed by (entity, version) - see canonical.columnar
+_semantic_column_checks: dict[tuple[str, str], Callable[..., dict[str, Any]]] = {}
+# Schema content fingerprints keyed by (kind, name, version) - see schema_fingerprint
+_fingerprints: dict[tuple[str, str, str], str] = {}
+# Loaded registry bundle (None when running from loose files)
+_bundle: dict[str, Any] | None = None
+_bundle_checked = False
+# Names, versions and event file locations, built on first use (see _get_catalog)
+_catalog: "_Catalog | None" = None
+
+# Cache fills take one of a fixed set of locks (picked by key hash) so each key is
+# loaded once under concurrency, without keeping a lock per requested key
+_FILL_LOCKS = tuple(threading.Lock() for _ in range(64))
+_bundle_lock = threading.Lock()
+_catalog_lock = threading.Lock()
+
+
+def _fill_lock(kind: str, key: str) -> threading.Lock:
+    return _FILL_LOCKS[hash((kind, key)) % len(_FILL_LOCKS)]
+
+
+class _NegativeCache:
+    """Bounded, expiring record of lookups that found no registry file.
+
+    Unknown event types or versions tend to arrive in bursts; remembering the
+    miss turns each repeat into a dict lookup instead of filesystem checks.
+    Entries expire after ``ttl`` seconds so files added without a
+    ``refresh()`` are still picked up, and the oldest entries are evicted
+    beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (kind, cache_key) -> (expiry on the monotonic clock, error message)
+        self._entries: dict[tuple[str, str], tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, key: str) -> str | None:
+        """Return the cached error message for a known miss, or None."""
+        entry = self._entries.get((kind, key))
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            with self._lock:
+                if self._entries.get((kind, key)) is entry:
+                    del self._entries[(kind, key)]
+            return None
+        return entry[1]
+
+    def add(self, kind: str, key: str, message: str) -> None:
+        """Remember a miss."""
+        with self._lock:
+            self._entries.pop((kind, key), None)
+            self._entries[(kind, key)] = (time.monotonic() + self.ttl, message)
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Forget all misses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Missing entity/event schemas and semantic files (see _NegativeCache)
+_missing = _NegativeCache(maxsize=4096, ttl=30.0)
+
+
+def _get_bundle() -> dict[str, Any] | None:
+    """Load the prebuilt registry bundle once, if one is available."""
+    global _bundle, _bundle_checked
+
+    if _bundle_checked:
+        return _bundle
+    with _bundle_lock:
+        if not _bundle_checked:
+            _bundle = _load_bundle()
+            _bundle_checked = True
+    return _bundle
+
+
+def _read_bundle(bundle_file: Path) -> dict[str, Any]:
+    """
+    Read a registry bundle and check it against its manifest.
+
+    The bundle is plain JSON holding the parsed content of every registry
+    file; each artifact must match the ``schema_digest`` recorded for it in the
+    manifest.
+
+    Args:
+        bundle_file: Bundle file (see ``canonical.bundle``)
+
+    Returns:
+        The bundle dict (``manifest``, ``directories``, ``artifacts``, ...)
+
+    Raises:
+        ValueError: If the file is not valid JSON, not a bundle of the current
+            format, or an artifact does not match its manifest entry
+    """
+    with open(bundle_file, "rb") as f:
+        bundle = codec.loads(f.read())
+    if not isinstance(bundle, dict):
+        raise ValueError("not a registry bundle")
+    if bundle.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise ValueError(
+            f"bundle format {bundle.get('format_version')} (expected {BUNDLE_FORMAT_VERSION})"
+        )
+    manifest, artifacts = bundle.get("manifest"), bundle.get("artifacts")
+    if not isinstance(manifest, dict) or not isinstance(artifacts, dict):
+        raise ValueError("bundle has no manifest or artifacts")
+    if manifest.keys() != artifacts.keys():
+        raise ValueError("bundle artifacts do not match the manifest")
+    for rel, entry in manifest.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"malformed bundle entry: {rel}")
+        if schema_digest(artifacts[rel]) != entry.get("sha256"):
+            raise ValueError(f"content of {rel} does not match its manifest hash")
+    return bundle
+
+
+def _load_bundle() -> dict[str, Any] | None:
+    """Read and check the bundle file; None if there is no usable bundle."""
+    setting = os.environ.get("CANONICAL_REGISTRY_BUNDLE", "")
+    if setting == "0":
+        return None
+    bundle_file = Path(setting) if setting else _BUNDLE_FILE
+    if not bundle_file.exists():
+        return None
+
+    try:
+        bundle = _read_bundle(bundle_file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring registry bundle {bundle_file}: {str(e)}")
+        return None
+
+    logger.debug(f"Loaded canonical registry bundle: {bundle_file}")
+    return bundle
+
+
+def _relative(path: Path) -> str:
+    return path.relative_to(_BASE_DIR).as_posix()
+
+
+def _exists(path: Path) -> bool:
+    """Check whether a registry file exists (in the bundle or on disk)."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        return _relative(path) in bundle["manifest"]
+    return path.exists()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a registry JSON file, or take it already parsed from the bundle."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        return bundle["artifacts"][_relative(path)]
+    with open(path, "rb") as f:
+        return codec.loads(f.read())
+
+
+def _read_yaml(path: Path) -> Any:
+    """Parse a registry YAML file, or take it already parsed from the bundle."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        # Parsed at build time, so a bundled process never imports yaml
+        return bundle["artifacts"][_relative(path)]
+
+    import yaml
+
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+def _version_key(version: str) -> tuple[Any, ...]:
+    """
+    Sort key ordering versions numerically (``v2`` < ``v10``, ``v1.2`` < ``v1.10``).
+
+    Versions are ``v<major>[.<minor>[.<patch>]][-<prerelease>]``; a prerelease
+    sorts before its release. Versions that do not follow this pattern sort
+    after all numeric ones, alphabetically.
+    """
+    core, _, prerelease = version.lstrip("vV").partition("-")
+    parts = core.split(".")
+    if not all(part.isdigit() for part in parts):
+        return (1, version)
+    return (0, tuple(int(part) for part in parts), not prerelease, prerelease)
+
+
+class _Catalog(NamedTuple):
+    """Every registry artifact and its versions, from one scan of the registry."""
+
+    # kind ("entity", "event", "semantic") -> name -> versions, oldest first
+    versions: dict[str, dict[str, list[str]]]
+    # (kind, name) -> newest version
+    latest: dict[tuple[str, str], str]
+    # (event_type, version) -> schema file
+    event_paths: dict[tuple[str, str], Path]
+    # domain folder -> sorted event types with a file in that folder
+    event_domains: dict[str, list[str]]
+
+
+def _registry_files() -> list[str]:
+    """List every registry file, as paths relative to the package."""
+    bundle = _get_bundle()
+    if bundle is not None:
+        return list(bundle["manifest"])
+    files = [_relative(path) for path in _ENTITIES_DIR.glob("*.json")]
+    files.extend(_relative(path) for path in _EVENTS_DIR.rglob("*.json"))
+    files.extend(_relative(path) for path in _SEMANTICS_DIR.glob("*.semantic.yaml"))
+    return files
+
+
+def _build_catalog() -> _Catalog:
+    versions: dict[str, dict[str, list[str]]] = {"entity": {}, "event": {}, "semantic": {}}
+    # Rank each location of an event version: the event's own domain folder
+    # first, then the events root, then any other folder. Files stored under
+    # another domain (e.g. events/task/document.uploaded.v1.json) are found,
+    # but never shadow the owning domain's file.
+    event_locations: dict[tuple[str, str], list[tuple[int, str]]] = {}
+    event_domains: dict[str, set[str]] = {}
+
+    for rel in sorted(_registry_files()):
+        directory, _, rest = rel.partition("/")
+        folder, _, filename = rest.rpartition("/")
+        parts = filename.split(".")
+        if directory == "entities" and len(parts) == 3:
+            # entity.version.json
+            versions["entity"].setdefault(parts[0], []).append(parts[1])
+        elif directory == "semantics" and len(parts) == 4:
+            # entity.version.semantic.yaml
+            versions["semantic"].setdefault(parts[0], []).append(parts[1])
+        elif directory == "events" and len(parts) >= 4:
+            # event_type.version.json, where event_type is "domain.event_name"
+            event_type, version = ".".join(parts[:-2]), parts[-2]
+            owner = event_type.split(".", 1)[0]
+            rank = 0 if folder == owner else 1 if not folder else 2
+            event_locations.setdefault((event_type, version), []).append((rank, rel))
+            if folder:
+                event_domains.setdefault(folder.split("/", 1)[0], set()).add(event_type)
+
+    event_paths: dict[tuple[str, str], Path] = {}
+    for (event_type, version), locations in event_locations.items():
+        locations.sort()
+        event_paths[(event_type, version)] = _BASE_DIR / locations[0][1]
+        versions["event"].setdefault(event_type, []).append(version)
+        if len(locations) > 1:
+            logger.debug(
+                f"Event schema {event_type}.{version} found in {len(locations)} places; "
+                f"using {locations[0][1]}"
+            )
+
+    latest: dict[tuple[str, str], str] = {}
+    for kind, names in versions.items():
+        for name, found in names.items():
+            found.sort(key=_version_key)
+            latest[(kind, name)] = found[-1]
+
+    return _Catalog(
+        versions=versions,
+        latest=latest,
+        event_paths=event_paths,
+        event_domains={domain: sorted(found) for domain, found in event_domains.items()},
+    )
+
+
+def _get_catalog() -> _Catalog:
+    """Build the catalog once; later lookups are dict accesses."""
+    global _catalog
+
+    catalog = _catalog
+    if catalog is not None:
+        return catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = _build_catalog()
+            logger.debug(f"Indexed {len(_catalog.latest)} canonical registry artifacts")
+        return _catalog
+
+
+def _invalidate_catalog() -> None:
+    """Drop the catalog so the next lookup rescans (see canonical.reload)."""
+    global _catalog
+
+    with _catalog_lock:
+        _catalog = None
+
+
+def _check_event_type(event_type: str) -> None:
+    if "." not in event_type:
+        raise EventNotFoundError(
+            f"Invalid event type format: {event_type}. "
+            "Expected format: 'domain.event_name' (e.g., 'client.created')"
+        )
 
 
 def load_entity_schema(entity: str, version: str = "v1") -> dict[str, Any]:
@@ -51,32 +366,45 @@ def load_entity_schema(entity: str, version: str = "v1") -> dict[str, Any]:
         version: Schema version (default: "v1")
 
     Returns:
-        JSON Schema definition as a dictionary
+        JSON Schema definition as a read-only (deeply frozen) dictionary
 
     Raises:
         SchemaNotFoundError: If schema file not found
     """
     cache_key = f"{entity}.{version}"
 
-    if cache_key in _entity_schemas:
-        return _entity_schemas[cache_key]
+    schema = _entity_schemas.get(cache_key)
+    if schema is not None:
+        return schema
+    missing = _missing.get("entity", cache_key)
+    if missing is not None:
+        raise SchemaNotFoundError(missing)
+
+    with _fill_lock("entity", cache_key):
+        schema = _entity_schemas.get(cache_key)
+        if schema is None:
+            schema = _entity_schemas[cache_key] = _read_entity_schema(entity, version)
+    return schema
 
+
+def _read_entity_schema(entity: str, version: str) -> dict[str, Any]:
+    cache_key = f"{entity}.{version}"
     schema_file = _ENTITIES_DIR / f"{entity}.{version}.json"
 
-    if not schema_file.exists():
-        raise SchemaNotFoundError(
+    if not _exists(schema_file):
+        message = (
             f"Canonical entity schema not found: {schema_file}. "
             f"Available entities: {', '.join(list_entities())}"
         )
+        _missing.add("entity", cache_key, message)
+        raise SchemaNotFoundError(message)
 
     try:
-        with open(schema_file, "r") as f:
-            schema = json.load(f)
+        schema = freeze(_read_json(schema_file))
 
-        _entity_schemas[cache_key] = schema
         logger.debug(f"Loaded canonical entity schema: {cache_key}")
         return schema
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise SchemaNotFoundError(
             f"Invalid JSON in schema file {schema_file}: {str(e)}"
         ) from e
@@ -91,7 +419,7 @@ def load_event_envelope_schema() -> dict[str, Any]:
     Load the canonical event envelope schema.
 
     Returns:
-        Event envelope JSON schema definition
+        Event envelope JSON schema definition (read-only, deeply frozen)
 
     Raises:
         SchemaNotFoundError: If envelope schema file not found
@@ -101,20 +429,26 @@ def load_event_envelope_schema() -> dict[str, Any]:
     if _envelope_schema is not None:
         return _envelope_schema
 
+    with _fill_lock("envelope", "v1"):
+        if _envelope_schema is None:
+            _envelope_schema = _read_event_envelope_schema()
+    return _envelope_schema
+
+
+def _read_event_envelope_schema() -> dict[str, Any]:
     envelope_file = _EVENTS_DIR / "event_envelope.v1.json"
 
-    if not envelope_file.exists():
+    if not _exists(envelope_file):
         raise SchemaNotFoundError(
             f"Canonical event envelope schema not found: {envelope_file}"
         )
 
     try:
-        with open(envelope_file, "r") as f:
-            _envelope_schema = json.load(f)
+        schema = freeze(_read_json(envelope_file))
 
         logger.debug("Loaded canonical event envelope schema")
-        return _envelope_schema
-    except json.JSONDecodeError as e:
+        return schema
+    except ValueError as e:
         raise SchemaNotFoundError(
             f"Invalid JSON in envelope schema file {envelope_file}: {str(e)}"
         ) from e
@@ -133,45 +467,48 @@ def load_event_schema(event_type: str, version: str = "v1") -> dict[str, Any]:
         version: Schema version (default: "v1")
 
     Returns:
-        Event JSON schema definition as a dictionary
+        Event JSON schema definition as a read-only (deeply frozen) dictionary
 
     Raises:
         EventNotFoundError: If event schema file not found
     """
     cache_key = f"{event_type}.{version}"
 
-    if cache_key in _event_schemas:
-        return _event_schemas[cache_key]
+    schema = _event_schemas.get(cache_key)
+    if schema is not None:
+        return schema
+    missing = _missing.get("event", cache_key)
+    if missing is not None:
+        raise EventNotFoundError(missing)
+
+    with _fill_lock("event", cache_key):
+        schema = _event_schemas.get(cache_key)
+        if schema is None:
+            schema = _event_schemas[cache_key] = _read_event_schema(event_type, version)
+    return schema
+
+
+def _read_event_schema(event_type: str, version: str) -> dict[str, Any]:
+    cache_key = f"{event_type}.{version}"
 
     # Event schemas are organized by domain (e.g., client/, task/, etc.)
     # event_type format: "domain.event_name" (e.g., "client.created")
-    parts = event_type.split(".", 1)
-    if len(parts) != 2:
-        raise EventNotFoundError(
-            f"Invalid event type format: {event_type}. "
-            "Expected format: 'domain.event_name' (e.g., 'client.created')"
+    _check_event_type(event_type)
+    event_file = _get_catalog().event_paths.get((event_type, version))
+    if event_file is None:
+        message = (
+            f"Canonical event schema not found: {event_type}.{version}. "
+            f"No matching file under {_EVENTS_DIR}"
         )
-
-    domain, event_name = parts
-    event_file = _EVENTS_DIR / domain / f"{event_type}.{version}.json"
-
-    if not event_file.exists():
-        # Try alternative location (some events might be in root)
-        event_file = _EVENTS_DIR / f"{event_type}.{version}.json"
-        if not event_file.exists():
-            raise EventNotFoundError(
-                f"Canonical event schema not found: {event_type}.{version}. "
-                f"Checked: {_EVENTS_DIR / domain} and {_EVENTS_DIR}"
-            )
+        _missing.add("event", cache_key, message)
+        raise EventNotFoundError(message)
 
     try:
-        with open(event_file, "r") as f:
-            schema = json.load(f)
+        schema = freeze(_read_json(event_file))
 
-        _event_schemas[cache_key] = schema
         logger.debug(f"Loaded canonical event schema: {cache_key}")
         return schema
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise EventNotFoundError(
             f"Invalid JSON in event schema file {event_file}: {str(e)}"
         ) from e
@@ -192,7 +529,7 @@ def load_semantic_constraints(
         version: Schema version (default: "v1")
 
     Returns:
-        Semantic constraint definition as a dictionary.
+        Semantic constraint definition as a read-only (deeply frozen) dictionary.
         Returns empty constraints if file not found (semantics are optional).
 
     Raises:
@@ -200,36 +537,54 @@ def load_semantic_constraints(
     """
     cache_key = f"{entity}.{version}"
 
-    if cache_key in _semantic_constraints:
-        return _semantic_constraints[cache_key]
+    constraints = _semantic_constraints.get(cache_key)
+    if constraints is not None:
+        return constraints
 
     semantic_file = _SEMANTICS_DIR / f"{entity}.{version}.semantic.yaml"
 
-    if not semantic_file.exists():
-        # Semantic constraints are optional - return empty constraints
+    missing = _missing.get("semantic", cache_key) is not None
+    if not missing and not _exists(semantic_file):
         logger.debug(
             f"Semantic constraints not found: {semantic_file}, using empty constraints"
         )
-        return {
-            "entity": entity,
-            "version": version,
-            "required_fields": [],
-            "semantic_constraints": {},
-            "cross_field_constraints": [],
-        }
+        _missing.add("semantic", cache_key, f"Semantic constraints not found: {semantic_file}")
+        missing = True
+
+    if missing:
+        # Semantic constraints are optional - return empty constraints
+        return freeze(
+            {
+                "entity": entity,
+                "version": version,
+                "required_fields": [],
+                "semantic_constraints": {},
+                "cross_field_constraints": [],
+            }
+        )
+
+    with _fill_lock("semantic", cache_key):
+        constraints = _semantic_constraints.get(cache_key)
+        if constraints is None:
+            constraints = _semantic_constraints[cache_key] = _read_semantic_constraints(
+                semantic_file, cache_key
+            )
+    return constraints
 
+
+def _read_semantic_constraints(semantic_file: Path, cache_key: str) -> dict[str, Any]:
     try:
-        with open(semantic_file, "r") as f:
-            constraints = yaml.safe_load(f)
+        constraints = freeze(_read_yaml(semantic_file))
 
-        _semantic_constraints[cache_key] = constraints
         logger.debug(f"Loaded semantic constraints: {cache_key}")
         return constraints
-    except yaml.YAMLError as e:
-        raise SemanticNotFoundError(
-            f"Invalid YAML in semantic constraints file {semantic_file}: {str(e)}"
-        ) from e
     except Exception as e:
+        # yaml is only imported once a semantic file has actually been read
+        yaml = sys.modules.get("yaml")
+        if yaml is not None and isinstance(e, yaml.YAMLError):
+            raise SemanticNotFoundError(
+                f"Invalid YAML in semantic constraints file {semantic_file}: {str(e)}"
+            ) from e
         raise SemanticNotFoundError(
             f"Failed to load semantic constraints {cache_key}: {str(e)}"
         ) from e
@@ -242,13 +597,7 @@ def list_entities() -> list[str]:
     Returns:
         Sorted list of entity names
     """
-    entities = set()
-    for schema_file in _ENTITIES_DIR.glob("*.json"):
-        # Extract entity from filename: entity.version.json
-        parts = schema_file.stem.split(".")
-        if len(parts) >= 2:
-            entities.add(parts[0])
-    return sorted(entities)
+    return sorted(_get_catalog().versions["entity"])
 
 
 def list_entity_versions(entity: str) -> list[str]:
@@ -259,15 +608,9 @@ def list_entity_versions(entity: str) -> list[str]:
         entity: Entity name
 
     Returns:
-        Sorted list of version strings
+        Versions ordered numerically, oldest first (``v2`` before ``v10``)
     """
-    versions = []
-    for schema_file in _ENTITIES_DIR.glob(f"{entity}.*.json"):
-        # Extract version from filename: entity.version.json
-        parts = schema_file.stem.split(".")
-        if len(parts) >= 2:
-            versions.append(parts[1])
-    return sorted(versions)
+    return list(_get_catalog().versions["entity"].get(entity, ()))
 
 
 def list_events(domain: str | None = None) -> list[str]:
@@ -278,31 +621,13 @@ def list_events(domain: str | None = None) -> list[str]:
         domain: Domain name (e.g., "client", "task"). If None, lists all events.
 
     Returns:
-        Sorted list of event types (e.g., ["client.created", "client.updated"])
+        Sorted list of event types (e.g., ["client.created", "client.updated"]).
+        For a domain this includes other domains' events stored in its folder.
     """
-    events = set()
-
+    catalog = _get_catalog()
     if domain:
-        domain_dir = _EVENTS_DIR / domain
-        if domain_dir.exists():
-            for event_file in domain_dir.glob("*.json"):
-                # Extract event type from filename: event_type.version.json
-                parts = event_file.stem.split(".")
-                if len(parts) >= 2:
-                    # Reconstruct event type: domain.event_name
-                    event_name = ".".join(parts[:-1])  # Remove version
-                    events.add(event_name)
-    else:
-        # List all events from all domains
-        for domain_dir in _EVENTS_DIR.iterdir():
-            if domain_dir.is_dir():
-                for event_file in domain_dir.glob("*.json"):
-                    parts = event_file.stem.split(".")
-                    if len(parts) >= 2:
-                        event_name = ".".join(parts[:-1])
-                        events.add(event_name)
-
-    return sorted(events)
+        return list(catalog.event_domains.get(domain, ()))
+    return sorted(catalog.versions["event"])
 
 
 def list_event_versions(event_type: str) -> list[str]:
@@ -313,20 +638,41 @@ def list_event_versions(event_type: str) -> list[str]:
         event_type: Event type (e.g., "client.created")
 
     Returns:
-        Sorted list of version strings
+        Versions ordered numerically, oldest first (``v2`` before ``v10``)
     """
-    versions = []
-    parts = event_type.split(".", 1)
-    if len(parts) == 2:
-        domain, event_name = parts
-        event_dir = _EVENTS_DIR / domain
-        if event_dir.exists():
-            pattern = f"{event_type}.*.json"
-            for event_file in event_dir.glob(pattern):
-                parts = event_file.stem.split(".")
-                if len(parts) >= 2:
-                    versions.append(parts[-1])  # Last part is version
-    return sorted(versions)
+    return list(_get_catalog().versions["event"].get(event_type, ()))
+
+
+def latest_version(kind: str, name: str) -> str:
+    """
+    Get the newest available version of a registry artifact.
+
+    Versions are compared numerically, so ``v10`` is newer than ``v2``.
+
+    Args:
+        kind: "entity", "event" or "semantic"
+        name: Entity name or event type (e.g., "client", "client.created")
+
+    Returns:
+        Newest version string (e.g., "v2")
+
+    Raises:
+        ValueError: If kind is not one of the above
+        SchemaNotFoundError: If no entity schema exists for name
+        EventNotFoundError: If no event schema exists for name
+        SemanticNotFoundError: If no semantic constraints file exists for name
+    """
+    catalog = _get_catalog()
+    version = catalog.latest.get((kind, name))
+    if version is not None:
+        return version
+    if kind not in catalog.versions:
+        raise ValueError(f"Unknown registry kind: {kind} (expected entity, event or semantic)")
+    if kind == "event":
+        raise EventNotFoundError(f"Canonical event schema not found: {name}")
+    if kind == "semantic":
+        raise SemanticNotFoundError(f"Semantic constraints not found: {name}")
+    raise SchemaNotFoundError(f"Canonical entity schema not found: {name}")
 
 
 def get_event_schema_path(event_type: str, version: str = "v1") -> Path:
@@ -343,21 +689,75 @@ def get_event_schema_path(event_type: str, version: str = "v1") -> Path:
     Raises:
         EventNotFoundError: If event schema file not found
     """
-    parts = event_type.split(".", 1)
-    if len(parts) != 2:
-        raise EventNotFoundError(
-            f"Invalid event type format: {event_type}. "
-            "Expected format: 'domain.event_name'"
-        )
+    _check_event_type(event_type)
+    event_file = _get_catalog().event_paths.get((event_type, version))
+    if event_file is None:
+        raise EventNotFoundError(f"Event schema file not found: {event_type}.{version}")
+    return event_file
 
-    domain, event_name = parts
-    event_file = _EVENTS_DIR / domain / f"{event_type}.{version}.json"
 
-    if not event_file.exists():
-        event_file = _EVENTS_DIR / f"{event_type}.{version}.json"
-        if not event_file.exists():
-            raise EventNotFoundError(
-                f"Event schema file not found: {event_type}.{version}"
-            )
+def schema_digest(schema: dict[str, Any]) -> str:
+    """
+    Hash a parsed schema independently of key order and formatting.
 
-    return event_file
+    Args:
+        schema: Parsed JSON schema
+
+    Returns:
+        Hex sha256 of the schema's canonical JSON serialisation
+    """
+    # Stdlib json rather than canonical.codec: the digest must not depend on the backend
+    text = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _cached_schema(kind: str, name: str, version: str) -> dict[str, Any] | None:
+    if kind == "envelope":
+        return _envelope_schema
+    cache = _entity_schemas if kind == "entity" else _event_schemas
+    return cache.get(f"{name}.{version}")
+
+
+def schema_fingerprint(kind: str, name: str, version: str = "v1") -> str:
+    """
+    Get the content fingerprint of a schema.
+
+    The fingerprint is the ``schema_digest`` of the loaded schema: it only
+    changes when the schema's content does (not its formatting), and it is
+    recomputed after a hot reload replaces the schema.
+
+    Args:
+        kind: "entity", "event" or "envelope"
+        name: Entity name or event type (ignored for the envelope)
+        version: Schema version (default: "v1")
+
+    Returns:
+        Hex sha256 fingerprint
+
+    Raises:
+        ValueError: If kind is not one of the above
+        SchemaNotFoundError: If the entity or envelope schema does not exist
+        EventNotFoundError: If the event schema does not exist
+    """
+    if kind == "envelope":
+        name, version = "event_envelope", "v1"
+    key = (kind, name, version)
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    if kind == "entity":
+        schema = load_entity_schema(name, version)
+    elif kind == "event":
+        schema = load_event_schema(name, version)
+    elif kind == "envelope":
+        schema = load_event_envelope_schema()
+    else:
+        raise ValueError(f"Unknown schema kind: {kind}. Expected 'entity', 'event' or 'envelope'")
+    fingerprint = schema_digest(schema)
+    # Only cache it if a hot reload did not replace the schema meanwhile (refresh
+    # swaps schemas and drops their fingerprints under the same fill lock)
+    with _fill_lock(kind, "v1" if kind == "envelope" else f"{name}.{version}"):
+        if _cached_schema(kind, name, version) is schema:
+            _fingerprints[key] = fingerprint
+    return fingerprint
@@ -0,0 +1,356 @@
+"""Incremental hot reload of changed registry files.
+
+Cached schemas normally live for the lifetime of the process. ``refresh()``
+detects entity, event and semantic files that were changed, added or removed
+since the previous call and updates only the affected cache entries: changed
+entries that are cached are re-read, re-frozen and recompiled (validators
+and semantic checks), then swapped
+into the caches; removed ones are dropped. Unchanged files are only
+``stat()``-ed, never re-read.
+
+A file counts as changed when its mtime or size differs and its content
+hash differs from the last one seen, so touching a file without editing it
+does not trigger a reload. The first ``refresh()`` call only records the
+baseline (stat and hash of every file).
+
+``start_watcher()`` runs ``refresh()`` periodically on a daemon thread, for
+local development and long-running workers.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from canonical import registry
+
+logger = logging.getLogger(__name__)
+
+# Relative path -> (mtime_ns, size, sha256)
+_file_state: dict[str, tuple[int, int, str]] = {}
+_baseline_recorded = False
+_refresh_lock = threading.Lock()
+
+
+@dataclass
+class RefreshReport:
+    """Outcome of a ``refresh()`` call.
+
+    Attributes:
+        added: Registry files (relative paths) that appeared
+        changed: Registry files whose content changed
+        removed: Registry files that disappeared
+        reloaded: Cache entries that were re-read and swapped in, as
+            ``"kind:name.version"``
+        errors: Cache entries that could not be reloaded (the previous
+            version is kept), mapped to the error message
+        elapsed_seconds: Wall-clock time of the refresh
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    reloaded: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def has_changes(self) -> bool:
+        """True if any registry file was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serialisable dict."""
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "removed": self.removed,
+            "reloaded": self.reloaded,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+        }
+
+
+def _scan(
+    directory: str, rel_prefix: str, suffix: str, recursive: bool
+) -> dict[str, tuple[int, int]]:
+    stats: dict[str, tuple[int, int]] = {}
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return stats
+    for entry in entries:
+        rel = f"{rel_prefix}/{entry.name}"
+        if entry.is_dir():
+            if recursive:
+                stats.update(_scan(entry.path, rel, suffix, recursive))
+        elif entry.name.endswith(suffix):
+            st = entry.stat()
+            stats[rel] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+
+def _scan_registry() -> dict[str, tuple[int, int]]:
+    """Stat every registry file on disk, keyed by path relative to the package."""
+    stats = _scan(str(registry._ENTITIES_DIR), "entities", ".json", recursive=False)
+    stats.update(_scan(str(registry._EVENTS_DIR), "events", ".json", recursive=True))
+    stats.update(
+        _scan(str(registry._SEMANTICS_DIR), "semantics", ".semantic.yaml", recursive=False)
+    )
+    return stats
+
+
+def _hash(rel: str) -> str:
+    with open(registry._BASE_DIR / rel, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _entry(rel: str) -> tuple[str, str, str] | None:
+    """Map a registry file to its cache entry ``(kind, name, version)``."""
+    directory = rel.split("/", 1)[0]
+    filename = rel.rsplit("/", 1)[-1]
+    parts = filename.split(".")
+    if directory == "entities" and len(parts) == 3:
+        return ("entity", parts[0], parts[1])
+    if directory == "semantics" and len(parts) == 4:
+        return ("semantic", parts[0], parts[1])
+    if directory == "events" and len(parts) >= 3:
+        if filename == "event_envelope.v1.json":
+            return ("envelope", "event_envelope", "v1")
+        return ("event", ".".join(parts[:-2]), parts[-2])
+    return None
+
+
+def _cached(kind: str, name: str, version: str) -> bool:
+    if kind == "entity":
+        return f"{name}.{version}" in registry._entity_schemas
+    if kind == "event":
+        return f"{name}.{version}" in registry._event_schemas
+    if kind == "envelope":
+        return registry._envelope_schema is not None
+    return f"{name}.{version}" in registry._semantic_constraints
+
+
+def _read(kind: str, name: str, version: str) -> Any:
+    if kind == "entity":
+        return registry._read_entity_schema(name, version)
+    if kind == "event":
+        return registry._read_event_schema(name, version)
+    if kind == "envelope":
+        return registry._read_event_envelope_schema()
+    semantic_file = registry._SEMANTICS_DIR / f"{name}.{version}.semantic.yaml"
+    return registry._read_semantic_constraints(semantic_file, f"{name}.{version}")
+
+
+def _exists(kind: str, name: str, version: str) -> bool:
+    if kind == "entity":
+        return registry._exists(registry._ENTITIES_DIR / f"{name}.{version}.json")
+    if kind == "envelope":
+        return registry._exists(registry._EVENTS_DIR / "event_envelope.v1.json")
+    if kind == "semantic":
+        return registry._exists(registry._SEMANTICS_DIR / f"{name}.{version}.semantic.yaml")
+    try:
+        registry.get_event_schema_path(name, version)
+    except registry.EventNotFoundError:
+        return False
+    return True
+
+
+def _swap(kind: str, name: str, version: str, value: Any, validator: Callable | None) -> None:
+    """Replace (value given) or drop (value None) one cache entry and its compiled check."""
+    from canonical.validator import _COMPILE_LOCKS
+
+    cache_key = f"{name}.{version}"
+    # Same lock order as compile_validator: compile lock, then fill lock
+    compile_lock = _COMPILE_LOCKS[hash((kind, name, version)) % len(_COMPILE_LOCKS)]
+    fill_lock = registry._fill_lock(kind, "v1" if kind == "envelope" else cache_key)
+    with compile_lock, fill_lock:
+        if kind == "envelope":
+            registry._envelope_schema = value
+        else:
+            cache = {
+                "entity": registry._entity_schemas,
+                "event": registry._event_schemas,
+                "semantic": registry._semantic_constraints,
+            }[kind]
+            if value is None:
+                cache.pop(cache_key, None)
+            else:
+                cache[cache_key] = value
+
+        if kind == "semantic":
+            # Columnar checks are recompiled lazily from the new constraints
+            registry._semantic_column_checks.pop((name, version), None)
+            if validator is None:
+                registry._semantic_checks.pop((name, version), None)
+            else:
+                registry._semantic_checks[(name, version)] = validator
+        else:
+            registry._fingerprints.pop((kind, name, version), None)
+            if validator is None:
+                registry._compiled_validators.pop((kind, name, version), None)
+            else:
+                registry._compiled_validators[(kind, name, version)] = validator
+
+
+def _use_loose_files() -> None:
+    """Stop serving from the prebuilt bundle once loose files have diverged from it."""
+    with registry._bundle_lock:
+        if registry._bundle is not None:
+            logger.info("Registry files changed on disk; no longer using the registry bundle")
+        registry._bundle = None
+        registry._bundle_checked = True
+
+
+def refresh() -> RefreshReport:
+    """
+    Reload registry files that changed since the previous call.
+
+    The first call records a baseline and reports no changes; call it at
+    start-up (``start_watcher()`` does) so edits made before the first
+    refresh are not missed. Later calls
+    ``stat()`` the entity, event and semantic directories, hash only the
+    files whose mtime or size moved, and for each cache entry affected by a
+    real content change re-read and recompile it, then swap the new schema
+    and validator into the caches. Entries that were never loaded are left
+    to load lazily. If a changed file cannot be parsed or compiled, the old
+    entry stays in place and the error is reported.
+
+    Returns:
+        RefreshReport listing added, changed, removed and reloaded entries
+    """
+    global _baseline_recorded
+    from canonical.constraints import compile_constraints
+    from canonical.validator import compile_schema
+
+    with _refresh_lock:
+        started = time.perf_counter()
+        report = RefreshReport()
+        stats = _scan_registry()
+
+        if not _baseline_recorded:
+            for rel, (mtime, size) in stats.items():
+                _file_state[rel] = (mtime, size, _hash(rel))
+            _baseline_recorded = True
+            report.elapsed_seconds = time.perf_counter() - started
+            logger.debug(f"Recorded registry baseline of {len(stats)} files")
+            return report
+
+        for rel in sorted(stats.keys() - _file_state.keys()):
+            mtime, size = stats[rel]
+            _file_state[rel] = (mtime, size, _hash(rel))
+            report.added.append(rel)
+        for rel in sorted(_file_state.keys() - stats.keys()):
+            del _file_state[rel]
+            report.removed.append(rel)
+        for rel in sorted(stats.keys() & _file_state.keys()):
+            mtime, size = stats[rel]
+            old_mtime, old_size, old_digest = _file_state[rel]
+            if (mtime, size) == (old_mtime, old_size):
+                continue
+            digest = _hash(rel)
+            _file_state[rel] = (mtime, size, digest)
+            if digest != old_digest:
+                report.changed.append(rel)
+
+        if report.has_changes:
+            _use_loose_files()
+            # Files that were missing may exist now
+            registry._missing.clear()
+        if report.added or report.removed:
+            # Files moved in or out - rescan names, versions and event paths
+            registry._invalidate_catalog()
+
+        entries = set()
+        for rel in report.changed + report.added + report.removed:
+            entry = _entry(rel)
+            if entry is not None:
+                entries.add(entry)
+        for kind, name, version in sorted(entries):
+            if not _cached(kind, name, version):
+                if kind == "semantic":
+                    # compile_semantics() caches an always-pass check for entities
+                    # without a semantic file; drop it so the new file is compiled
+                    _swap(kind, name, version, None, None)
+                continue
+            label = f"{kind}:{name}.{version}"
+            if not _exists(kind, name, version):
+                # The file is gone - drop the entry so lookups report it missing
+                _swap(kind, name, version, None, None)
+                report.reloaded.append(label)
+                continue
+            try:
+                value = _read(kind, name, version)
+                if kind == "semantic":
+                    validator = compile_constraints(value)
+                else:
+                    validator = compile_schema(value, name=label)
+            except Exception as e:
+                report.errors[label] = f"{type(e).__name__}: {str(e)}"
+                continue
+            _swap(kind, name, version, value, validator)
+            report.reloaded.append(label)
+
+        report.elapsed_seconds = time.perf_counter() - started
+
+    if report.has_changes:
+        logger.info(
+            f"Refreshed canonical registry: {len(report.added)} added, "
+            f"{len(report.changed)} changed, {len(report.removed)} removed, "
+            f"{len(report.reloaded)} entries reloaded"
+        )
+    for label, error in report.errors.items():
+        logger.warning(f"Keeping previous {label}, reload failed: {error}")
+    return report
+
+
+class SchemaWatcher:
+    """Background thread calling ``refresh()`` at a fixed interval.
+
+    Attributes:
+        interval: Seconds between refreshes
+        last_report: Report of the most recent refresh (None before the first)
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self.last_report: RefreshReport | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="canonical-schema-watcher", daemon=True
+        )
+
+    def start(self) -> "SchemaWatcher":
+        """Record the baseline and start polling."""
+        self.last_report = refresh()
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.last_report = refresh()
+            except Exception as e:
+                logger.error(f"Canonical registry refresh failed: {str(e)}")
+
+
+def start_watcher(interval: float = 2.0) -> SchemaWatcher:
+    """
+    Start polling the registry directories for changes.
+
+    Args:
+        interval: Seconds between refreshes
+
+    Returns:
+        The running SchemaWatcher (call ``stop()`` to end it)
+    """
+    return SchemaWatcher(interval).start()
@@ -0,0 +1,206 @@
+"""Streaming validation of newline-delimited JSON (NDJSON) event logs.
+
+The event log is memory-mapped and split into lines lazily, and events are
+validated in fixed-size chunks, so memory stays flat regardless of file size.
+Only failures are written out; everything else is reduced to summary counts.
+"""
+
+import logging
+import mmap
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Generator, Iterator
+
+from canonical import codec
+from canonical.batch import _validate_decoded
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Already-consumed pages of the mapping are released every _RELEASE_WINDOW bytes
+# so resident memory does not grow with the file size
+_RELEASE_WINDOW = 16 * 1024 * 1024
+
+
+@dataclass
+class StreamSummary:
+    """Summary counts for a validated event log.
+
+    Attributes:
+        total: Number of events (non-blank lines) read
+        valid: Number of valid events
+        invalid: Number of invalid events (including undecodable lines)
+        invalid_json: Number of lines that were not valid JSON
+        by_event_type: Per event type ``{"total": n, "invalid": m}`` counts
+        elapsed_seconds: Wall-clock validation time
+    """
+
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    invalid_json: int = 0
+    by_event_type: dict[str, dict[str, int]] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Validation throughput."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a JSON-serialisable dict."""
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "invalid_json": self.invalid_json,
+            "by_event_type": self.by_event_type,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "events_per_second": round(self.events_per_second, 1),
+        }
+
+
+def iter_ndjson_lines(path: str | Path) -> Iterator[tuple[int, bytes]]:
+    """
+    Lazily yield the non-blank lines of an NDJSON file.
+
+    The file is memory-mapped; only the current line is copied out and pages
+    that have been consumed are released as the scan advances.
+
+    Args:
+        path: Path to the NDJSON file
+
+    Yields:
+        Tuples of ``(line_number, line_bytes)`` with 1-based line numbers
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _scan_lines(mm, 0, len(mm))
+
+
+def _scan_lines(mm: mmap.mmap, start: int, stop: int) -> Generator[tuple[int, bytes], None, int]:
+    """Non-blank lines of ``mm[start:stop]``, numbered from 1 at ``start``.
+
+    Returns the number of lines scanned, blank ones included.
+    """
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL, start - start % mmap.PAGESIZE)
+    can_release = hasattr(mmap, "MADV_DONTNEED")
+    pos = start
+    released = start - start % mmap.PAGESIZE
+    line_number = 0
+    while pos < stop:
+        if can_release and pos - released >= _RELEASE_WINDOW:
+            boundary = pos - pos % mmap.PAGESIZE
+            mm.madvise(mmap.MADV_DONTNEED, released, boundary - released)
+            released = boundary
+        newline = mm.find(b"\n", pos, stop)
+        line_end = stop if newline == -1 else newline
+        line_number += 1
+        line = mm[pos:line_end].strip()
+        if line:
+            yield line_number, line
+        pos = line_end + 1
+    return line_number
+
+
+def validate_ndjson(
+    path: str | Path,
+    failures: IO[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamSummary:
+    """
+    Validate every event in an NDJSON event log.
+
+    Each line is validated against the event envelope schema and the schema
+    for its ``(event_type, event_version)``.
+
+    Args:
+        path: Path to the NDJSON file
+        failures: Text stream receiving one JSON object per invalid event
+            (``line``, ``event_id``, ``event_type``, ``errors``). If None,
+            failures are only counted.
+        chunk_size: Number of events validated together
+
+    Returns:
+        StreamSummary with counts and throughput
+    """
+    summary = StreamSummary()
+    started = time.perf_counter()
+
+    emit = None
+    if failures is not None:
+
+        def emit(record: dict[str, Any]) -> None:
+            failures.write(codec.dumps(record).decode("utf-8") + "\n")
+
+    chunk: list[tuple[int, bytes]] = []
+    for item in iter_ndjson_lines(path):
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            _validate_chunk(chunk, summary, emit)
+            chunk = []
+    if chunk:
+        _validate_chunk(chunk, summary, emit)
+
+    summary.elapsed_seconds = time.perf_counter() - started
+    logger.debug(
+        f"Validated {summary.total} events from {path}: {summary.invalid} invalid, "
+        f"{summary.events_per_second:.0f} events/sec"
+    )
+    return summary
+
+
+def _validate_chunk(
+    chunk: list[tuple[int, bytes]],
+    summary: StreamSummary,
+    emit: Callable[[dict[str, Any]], None] | None,
+) -> None:
+    decoded: list[Any] = []
+    errors: list[list[str]] = []
+    rows: list[int] = []
+    for _, line in chunk:
+        try:
+            event = codec.loads(line)
+        except ValueError as e:
+            errors.append([f"$: invalid JSON: {e}"])
+            decoded.append(None)
+            summary.invalid_json += 1
+            continue
+        rows.append(len(decoded))
+        decoded.append(event)
+        errors.append([])
+
+    _validate_decoded(decoded, rows, errors)
+
+    by_type = summary.by_event_type
+    for (line_number, _), event, found in zip(chunk, decoded, errors):
+        event_type = event.get("event_type") if isinstance(event, dict) else None
+        if not isinstance(event_type, str):
+            event_type = "<unknown>"
+        counts = by_type.get(event_type)
+        if counts is None:
+            by_type[event_type] = counts = {"total": 0, "invalid": 0}
+        counts["total"] += 1
+        summary.total += 1
+        if not found:
+            summary.valid += 1
+            continue
+        counts["invalid"] += 1
+        summary.invalid += 1
+        if emit is not None:
+            emit(
+                {
+                    "line": line_number,
+                    "event_id": event.get("event_id") if isinstance(event, dict) else None,
+                    "event_type": event_type,
+                    "errors": found,
+                }
+            )
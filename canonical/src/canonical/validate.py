@@ -0,0 +1,77 @@
+"""Command-line validation of NDJSON event logs.
+
+Usage:
+    python -m canonical.validate events.ndjson [--failures failures.ndjson]
+    python -m canonical.validate archive/ --workers 0
+
+Invalid events are written as NDJSON to ``--failures`` (stdout by default) and
+a JSON summary with counts and events/sec is written to stderr. The exit
+status is 1 if any event is invalid.
+
+A directory is searched for ``*.ndjson``/``*.jsonl`` files. With ``--workers``
+other than 1 (0 for one per CPU core), the input is validated in shards on a
+process pool and the summary also has per-shard counts.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from canonical.stream import DEFAULT_CHUNK_SIZE, validate_ndjson
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m canonical.validate",
+        description="Validate an NDJSON event log against the canonical event schemas.",
+    )
+    parser.add_argument(
+        "path", help="NDJSON file with one event envelope per line, or a directory of them"
+    )
+    parser.add_argument(
+        "--failures",
+        default="-",
+        help="File receiving invalid events as NDJSON ('-' for stdout, the default)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Number of events validated together (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (default: 1; 0 for one per CPU core)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("--workers must be 0 or more")
+
+    if args.workers != 1 or Path(args.path).is_dir():
+        from canonical.parallel import validate_parallel
+
+        def validate(failures):
+            return validate_parallel(
+                args.path, failures, workers=args.workers or None, chunk_size=args.chunk_size
+            )
+
+    else:
+
+        def validate(failures):
+            return validate_ndjson(args.path, failures, args.chunk_size)
+
+    if args.failures == "-":
+        summary = validate(sys.stdout)
+    else:
+        with open(args.failures, "w") as failures:
+            summary = validate(failures)
+
+    print(json.dumps(summary.to_dict()), file=sys.stderr)
+    return 1 if summary.invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,511 @@
+"""Compiled validators for canonical entity and event schemas.
+
+Instead of interpreting a JSON Schema dict on every call, each schema is
+translated once into a specialised Python function containing only the checks
+that schema needs (required fields, type checks, enum membership against
+frozensets, nested objects, arrays and string formats). Compiled validators are
+cached in the registry alongside the raw schemas.
+
+A compiled validator takes an instance and returns a list of error messages.
+An empty list means the instance is valid.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from canonical import codec, registry
+from canonical.registry import EventNotFoundError
+
+logger = logging.getLogger(__name__)
+
+Validator = Callable[..., list[str]]
+
+_ENVELOPE_KEY = ("envelope", "event_envelope", "v1")
+
+# Each validator is compiled once even when many threads ask for it at once
+_COMPILE_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+
+class SchemaCompileError(Exception):
+    """Raised when a schema uses a keyword the compiler does not support."""
+
+    pass
+
+
+# Keywords that carry no validation semantics
+_ANNOTATION_KEYWORDS = frozenset(
+    {"$id", "$schema", "$comment", "title", "description", "default", "examples"}
+)
+
+_SUPPORTED_KEYWORDS = frozenset(
+    {
+        "type",
+        "enum",
+        "const",
+        "required",
+        "properties",
+        "additionalProperties",
+        "items",
+        "minItems",
+        "maxItems",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "minLength",
+        "maxLength",
+        "pattern",
+        "format",
+    }
+)
+
+# Expression templates for JSON Schema primitive types
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "({v} is True or {v} is False)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "null": "{v} is None",
+}
+
+# Keywords grouped by the instance type they apply to
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern", "format")
+_NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+_OBJECT_KEYWORDS = ("required", "properties", "additionalProperties")
+_ARRAY_KEYWORDS = ("items", "minItems", "maxItems")
+
+# Regular expressions for the string formats used by canonical schemas; \Z
+# rather than $, which would also match before a trailing newline
+_FORMAT_PATTERNS = {
+    "date-time": (
+        r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])[Tt ]"
+        r"(?:[01]\d|2[0-3]):[0-5]\d:(?:[0-5]\d|60)(?:\.\d+)?"
+        r"(?:[Zz]|[+-](?:[01]\d|2[0-3]):[0-5]\d)\Z"
+    ),
+    "date": r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])\Z",
+    "uuid": r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z",
+}
+
+
+class _Path:
+    """Runtime path expression, rendered lazily into error-path code."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: tuple[tuple[str, str], ...]):
+        self.parts = parts
+
+    def child(self, key: str) -> "_Path":
+        return _Path(self.parts + (("lit", f".{key}"),))
+
+    def index(self, var: str) -> "_Path":
+        return _Path(self.parts + (("lit", "["), ("expr", f"str({var})"), ("lit", "]")))
+
+    def render(self, suffix: str) -> str:
+        """Render a Python expression building ``<path><suffix>``."""
+        parts = list(self.parts) + [("lit", suffix)]
+        merged: list[tuple[str, str]] = []
+        for kind, value in parts:
+            if kind == "lit" and merged and merged[-1][0] == "lit":
+                merged[-1] = ("lit", merged[-1][1] + value)
+            else:
+                merged.append((kind, value))
+        return " + ".join(repr(value) if kind == "lit" else value for kind, value in merged)
+
+
+class _CodeGenerator:
+    """Translates a JSON Schema into the source of a validation module."""
+
+    def __init__(self):
+        self.constants: list[str] = []
+        self._const_names: dict[str, str] = {}
+        self.lines: list[str] = []
+        self.formats_used: set[str] = set()
+        self._var_counter = 0
+
+    def const(self, source: str) -> str:
+        """Register a module-level constant and return its name."""
+        name = self._const_names.get(source)
+        if name is None:
+            name = f"_C{len(self.constants)}"
+            self._const_names[source] = name
+            self.constants.append(f"{name} = {source}")
+        return name
+
+    def var(self, prefix: str = "v") -> str:
+        self._var_counter += 1
+        return f"{prefix}{self._var_counter}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent: int, path: _Path, message: str) -> None:
+        self.emit(indent, f"errors.append({path.render(': ' + message)})")
+
+    def generate(self, schema: Any, func_name: str = "validate") -> str:
+        """Generate the function source for ``schema``."""
+        self.emit(0, f"def {func_name}(data, path='$'):")
+        self.emit(1, "errors = []")
+        self.node(schema, "data", _Path((("expr", "path"),)), 1)
+        self.emit(1, "return errors")
+        return "\n".join(self.lines)
+
+    def node(self, schema: Any, var: str, path: _Path, indent: int) -> None:
+        """Emit checks for ``var`` against ``schema`` at the given indentation."""
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.error(indent, path, "no value is allowed here")
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"Invalid schema node at {path.render('')}: {schema!r}")
+
+        unknown = set(schema) - _SUPPORTED_KEYWORDS - _ANNOTATION_KEYWORDS
+        if unknown:
+            raise SchemaCompileError(
+                f"Unsupported schema keyword(s) {sorted(unknown)} at {path.render('')}"
+            )
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types is not None:
+            for type_name in types:
+                if type_name not in _TYPE_CHECKS:
+                    raise SchemaCompileError(f"Unsupported type '{type_name}'")
+
+        groups = [
+            (("string",), _STRING_KEYWORDS, self.string_checks),
+            (("number", "integer"), _NUMBER_KEYWORDS, self.number_checks),
+            (("object",), _OBJECT_KEYWORDS, self.object_checks),
+            (("array",), _ARRAY_KEYWORDS, self.array_checks),
+        ]
+
+        if types is not None:
+            condition = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+            expected = ", ".join(repr(t) for t in types)
+            self.emit(indent, f"if not ({condition}):")
+            self.error(indent + 1, path, f"expected type {expected}")
+            body_start = len(self.lines)
+            self.emit(indent, "else:")
+            inner = indent + 1
+            for group_types, keywords, emitter in groups:
+                if not any(k in schema for k in keywords):
+                    continue
+                if len(types) == 1 and types[0] in group_types:
+                    emitter(schema, var, path, inner)
+                elif any(t in group_types for t in types):
+                    self.guarded(group_types, schema, var, path, inner, emitter)
+            self.value_checks(schema, var, path, inner, hashable=_is_scalar_type(types))
+            if len(self.lines) == body_start + 1:
+                # Nothing beyond the type check - drop the empty else branch
+                self.lines.pop()
+        else:
+            for group_types, keywords, emitter in groups:
+                if any(k in schema for k in keywords):
+                    self.guarded(group_types, schema, var, path, indent, emitter)
+            self.value_checks(schema, var, path, indent, hashable=False)
+
+    def guarded(self, group_types, schema, var, path, indent, emitter) -> None:
+        condition = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in group_types)
+        self.emit(indent, f"if {condition}:")
+        before = len(self.lines)
+        emitter(schema, var, path, indent + 1)
+        if len(self.lines) == before:
+            self.lines.pop()
+
+    def value_checks(self, schema, var, path, indent, hashable: bool) -> None:
+        if "enum" in schema:
+            values = list(schema["enum"])
+            allowed = ", ".join(repr(v) for v in values)
+            if hashable and all(isinstance(v, (str, int, float, bool)) for v in values):
+                name = self.const(f"frozenset({{{allowed}}})" if values else "frozenset()")
+            else:
+                name = self.const(f"({allowed},)" if values else "()")
+            self.emit(indent, f"if {var} not in {name}:")
+            self.error(indent + 1, path, f"value is not one of [{allowed}]")
+        if "const" in schema:
+            name = self.const(repr(schema["const"]))
+            self.emit(indent, f"if {var} != {name}:")
+            self.error(indent + 1, path, f"value must be {schema['const']!r}")
+
+    def string_checks(self, schema, var, path, indent) -> None:
+        if "minLength" in schema:
+            self.emit(indent, f"if len({var}) < {int(schema['minLength'])}:")
+            self.error(indent + 1, path, f"shorter than {schema['minLength']} characters")
+        if "maxLength" in schema:
+            self.emit(indent, f"if len({var}) > {int(schema['maxLength'])}:")
+            self.error(indent + 1, path, f"longer than {schema['maxLength']} characters")
+        if "pattern" in schema:
+            name = self.const(f"re.compile({schema['pattern']!r})")
+            self.emit(indent, f"if {name}.search({var}) is None:")
+            self.error(indent + 1, path, f"does not match pattern {schema['pattern']!r}")
+        fmt = schema.get("format")
+        if fmt in _FORMAT_PATTERNS:
+            self.formats_used.add(fmt)
+            self.emit(indent, f"if {_format_const(fmt)}.match({var}) is None:")
+            self.error(indent + 1, path, f"not a valid '{fmt}' string")
+
+    def number_checks(self, schema, var, path, indent) -> None:
+        for keyword, op, text in (
+            ("minimum", "<", "less than minimum"),
+            ("maximum", ">", "greater than maximum"),
+            ("exclusiveMinimum", "<=", "not greater than exclusive minimum"),
+            ("exclusiveMaximum", ">=", "not less than exclusive maximum"),
+        ):
+            if keyword in schema:
+                bound = schema[keyword]
+                self.emit(indent, f"if {var} {op} {bound!r}:")
+                self.error(indent + 1, path, f"{text} {bound!r}")
+
+    def object_checks(self, schema, var, path, indent) -> None:
+        required = list(schema.get("required", ()))
+        if required:
+            req_set = self.const("frozenset({" + ", ".join(repr(k) for k in required) + "})")
+            req_order = self.const("(" + "".join(f"{k!r}, " for k in required) + ")")
+            key = self.var("_k")
+            self.emit(indent, f"if not {req_set} <= {var}.keys():")
+            self.emit(indent + 1, f"for {key} in {req_order}:")
+            self.emit(indent + 2, f"if {key} not in {var}:")
+            self.emit(
+                indent + 3,
+                f"errors.append({path.render(': missing required property ')} + repr({key}))",
+            )
+
+        properties = schema.get("properties", {})
+        for prop, prop_schema in properties.items():
+            if not _has_checks(prop_schema):
+                continue
+            child = self.var()
+            self.emit(indent, f"{child} = {var}.get({prop!r}, _MISSING)")
+            self.emit(indent, f"if {child} is not _MISSING:")
+            self.node(prop_schema, child, path.child(prop), indent + 1)
+
+        additional = schema.get("additionalProperties", True)
+        if additional is True:
+            return
+        known = self.const("frozenset({" + ", ".join(repr(k) for k in properties) + "})")
+        key = self.var("_k")
+        if additional is False:
+            self.emit(indent, f"if not {var}.keys() <= {known}:")
+            self.emit(indent + 1, f"for {key} in sorted({var}.keys() - {known}):")
+            self.emit(
+                indent + 2,
+                f"errors.append({path.render(': unexpected property ')} + repr({key}))",
+            )
+        elif _has_checks(additional):
+            child = self.var()
+            self.emit(indent, f"for {key}, {child} in {var}.items():")
+            self.emit(indent + 1, f"if {key} not in {known}:")
+            extra_path = _Path(path.parts + (("lit", "."), ("expr", f"str({key})")))
+            self.node(additional, child, extra_path, indent + 2)
+
+    def array_checks(self, schema, var, path, indent) -> None:
+        if "minItems" in schema:
+            self.emit(indent, f"if len({var}) < {int(schema['minItems'])}:")
+            self.error(indent + 1, path, f"fewer than {schema['minItems']} items")
+        if "maxItems" in schema:
+            self.emit(indent, f"if len({var}) > {int(schema['maxItems'])}:")
+            self.error(indent + 1, path, f"more than {schema['maxItems']} items")
+        items = schema.get("items")
+        if items is not None and _has_checks(items):
+            index = self.var("_i")
+            child = self.var()
+            self.emit(indent, f"for {index}, {child} in enumerate({var}):")
+            self.node(items, child, path.index(index), indent + 1)
+
+
+def _format_const(fmt: str) -> str:
+    return "_FORMAT_" + fmt.upper().replace("-", "_")
+
+
+def _is_scalar_type(types: list[str]) -> bool:
+    return all(t in ("string", "integer", "number", "boolean", "null") for t in types)
+
+
+def _has_checks(schema: Any) -> bool:
+    """Return True if ``schema`` constrains its instance in any way."""
+    if schema is True:
+        return False
+    if not isinstance(schema, dict):
+        return True
+    return any(key not in _ANNOTATION_KEYWORDS for key in schema)
+
+
+def generate_validator_source(schema: dict[str, Any], func_name: str = "validate") -> str:
+    """
+    Generate the source of a self-contained module validating ``schema``.
+
+    The module defines a single function ``func_name(data, path='$')`` that
+    returns a list of error messages.
+
+    Args:
+        schema: JSON Schema definition
+        func_name: Name of the generated validation function
+
+    Returns:
+        Python module source code
+
+    Raises:
+        SchemaCompileError: If the schema uses unsupported keywords
+    """
+    generator = _CodeGenerator()
+    function = generator.generate(schema, func_name)
+    header = ["import re", "", "_MISSING = object()"]
+    for fmt in sorted(generator.formats_used):
+        header.append(f"{_format_const(fmt)} = re.compile({_FORMAT_PATTERNS[fmt]!r}, re.ASCII)")
+    header.extend(generator.constants)
+    return "\n".join(header) + "\n\n\n" + function + "\n"
+
+
+def compile_schema(schema: dict[str, Any], name: str = "schema") -> Validator:
+    """
+    Compile a JSON Schema dict into a validation function.
+
+    Args:
+        schema: JSON Schema definition
+        name: Name used for the generated code object (for tracebacks)
+
+    Returns:
+        Callable ``validator(instance, path="$") -> list[str]``
+
+    Raises:
+        SchemaCompileError: If the schema uses unsupported keywords
+    """
+    source = generate_validator_source(schema)
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<canonical validator {name}>", "exec"), namespace)
+    return namespace["validate"]
+
+
+def _load_schema(kind: str, name: str, version: str) -> dict[str, Any]:
+    if kind == "entity":
+        return registry.load_entity_schema(name, version)
+    if kind == "event":
+        return registry.load_event_schema(name, version)
+    if kind == "envelope":
+        return registry.load_event_envelope_schema()
+    raise ValueError(f"Unknown schema kind: {kind}. Expected 'entity', 'event' or 'envelope'")
+
+
+def compile_validator(kind: str, name: str, version: str = "v1") -> Validator:
+    """
+    Get the compiled validator for a canonical schema.
+
+    Validators are loaded on first use - from the ahead-of-time generated
+    modules when they match the schema (see canonical.codegen), else compiled
+    at runtime - and cached for the lifetime of the process.
+
+    Args:
+        kind: Schema kind - "entity", "event" or "envelope"
+        name: Entity name or event type (e.g., "client", "task.completed").
+            Use "event_envelope" for the envelope.
+        version: Schema version (default: "v1")
+
+    Returns:
+        Callable ``validator(instance, path="$") -> list[str]`` returning
+        error messages (empty when valid)
+
+    Raises:
+        SchemaNotFoundError: If an entity or envelope schema is not found
+        EventNotFoundError: If an event schema is not found
+        SchemaCompileError: If the schema uses unsupported keywords
+    """
+    cache_key = (kind, name, version)
+    validator = registry._compiled_validators.get(cache_key)
+    if validator is not None:
+        return validator
+
+    # Separate from the registry's fill locks: compiling loads a schema (and so
+    # takes a registry lock) while holding one of these, never the other way round
+    with _COMPILE_LOCKS[hash(cache_key) % len(_COMPILE_LOCKS)]:
+        validator = registry._compiled_validators.get(cache_key)
+        if validator is None:
+            from canonical.codegen import load_validator
+
+            schema = _load_schema(kind, name, version)
+            # Ahead-of-time generated code if it matches the schema, else compile now
+            validator = load_validator(kind, name, version, schema)
+            if validator is None:
+                validator = compile_schema(schema, name=f"{kind}:{name}.{version}")
+                logger.debug(f"Compiled canonical validator: {kind}:{name}.{version}")
+            registry._compiled_validators[cache_key] = validator
+    return validator
+
+
+@dataclass(frozen=True, slots=True)
+class EventValidationResult:
+    """Outcome of validating a canonical event (envelope and payload).
+
+    Attributes:
+        valid: True if both the envelope and the payload are valid
+        event: Decoded event, or None if the input was not valid JSON
+        event_type: Envelope ``event_type`` (None if missing or not a string)
+        event_version: Envelope ``event_version`` (None if missing or not a string)
+        errors: Error messages; envelope paths start with ``$``, payload
+            paths with ``$.payload``
+    """
+
+    valid: bool
+    event: dict[str, Any] | None
+    event_type: str | None
+    event_version: str | None
+    errors: tuple[str, ...] = ()
+
+
+def validate_event(
+    raw: bytes | bytearray | memoryview | str | dict[str, Any],
+) -> EventValidationResult:
+    """
+    Validate a canonical event envelope and its payload in a single call.
+
+    The event is decoded once, checked against the envelope schema, and the
+    payload validator is selected by ``(event_type, event_version)`` from the
+    compiled validator cache.
+
+    Args:
+        raw: Event as JSON bytes/str (or another bytes-like buffer), or an
+            already decoded dict
+
+    Returns:
+        EventValidationResult describing the outcome
+    """
+    if isinstance(raw, dict):
+        event = raw
+    else:
+        try:
+            event = codec.loads(raw)
+        except (ValueError, TypeError) as e:
+            return EventValidationResult(False, None, None, None, (f"$: invalid JSON: {e}",))
+
+    validators = registry._compiled_validators
+    envelope_validator = validators.get(_ENVELOPE_KEY) or compile_validator(*_ENVELOPE_KEY)
+    errors = envelope_validator(event)
+    if not isinstance(event, dict):
+        return EventValidationResult(False, None, None, None, tuple(errors))
+
+    event_type = event.get("event_type")
+    event_version = event.get("event_version")
+    if not isinstance(event_type, str) or not isinstance(event_version, str):
+        return EventValidationResult(False, event, None, None, tuple(errors))
+
+    payload_validator = validators.get(("event", event_type, event_version))
+    if payload_validator is None:
+        try:
+            payload_validator = compile_validator("event", event_type, event_version)
+        except EventNotFoundError:
+            errors.append(
+                f"$.event_type: unknown event type '{event_type}' version '{event_version}'"
+            )
+            return EventValidationResult(False, event, event_type, event_version, tuple(errors))
+
+    # A missing or non-object payload is already reported by the envelope check
+    payload = event.get("payload")
+    if isinstance(payload, dict):
+        errors.extend(payload_validator(payload, "$.payload"))
+
+    return EventValidationResult(not errors, event, event_type, event_version, tuple(errors))
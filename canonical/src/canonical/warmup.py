@@ -0,0 +1,190 @@
+"""Parallel warm-up of the canonical registry.
+
+Schemas are loaded lazily, so on a fresh process the first request for each
+entity or event type pays file I/O, parsing and validator compilation. Calling
+``preload()`` during startup loads (and optionally compiles) every artifact on
+a thread pool so that cost is paid before traffic arrives, and returns a
+per-artifact timing report that can be logged or alerted on.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from canonical import registry
+from canonical.constraints import compile_semantics
+from canonical.validator import compile_validator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArtifactTiming:
+    """Warm-up timing for one registry artifact.
+
+    Attributes:
+        kind: "entity", "event", "envelope" or "semantic"
+        name: Entity name or event type
+        version: Schema version
+        load_seconds: Time spent reading and parsing the artifact
+        compile_seconds: Time spent compiling its validator or semantic check
+            (0 if not compiled)
+        error: Error message if loading or compiling failed, else None
+    """
+
+    kind: str
+    name: str
+    version: str
+    load_seconds: float = 0.0
+    compile_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        """Load plus compile time."""
+        return self.load_seconds + self.compile_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timing as a JSON-serialisable dict."""
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "version": self.version,
+            "load_ms": round(self.load_seconds * 1000, 3),
+            "compile_ms": round(self.compile_seconds * 1000, 3),
+            "error": self.error,
+        }
+
+
+@dataclass
+class PreloadReport:
+    """Result of ``preload()``.
+
+    Attributes:
+        artifacts: Timing for every artifact, in a stable (kind, name, version) order
+        workers: Number of worker threads used
+        elapsed_seconds: Wall-clock warm-up time
+    """
+
+    artifacts: list[ArtifactTiming] = field(default_factory=list)
+    workers: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[ArtifactTiming]:
+        """Artifacts that could not be loaded or compiled."""
+        return [artifact for artifact in self.artifacts if artifact.error is not None]
+
+    def slowest(self, n: int = 5) -> list[ArtifactTiming]:
+        """Return the ``n`` artifacts with the highest load plus compile time."""
+        return sorted(self.artifacts, key=lambda a: a.total_seconds, reverse=True)[:n]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serialisable dict."""
+        return {
+            "artifacts": len(self.artifacts),
+            "failed": len(self.failed),
+            "workers": self.workers,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "load_seconds": round(sum(a.load_seconds for a in self.artifacts), 6),
+            "compile_seconds": round(sum(a.compile_seconds for a in self.artifacts), 6),
+            "timings": [artifact.to_dict() for artifact in self.artifacts],
+        }
+
+
+def _list_artifacts(entities: bool, events: bool, semantics: bool) -> list[ArtifactTiming]:
+    artifacts = []
+    if entities:
+        for entity in registry.list_entities():
+            for version in registry.list_entity_versions(entity):
+                artifacts.append(ArtifactTiming("entity", entity, version))
+    if events:
+        artifacts.append(ArtifactTiming("envelope", "event_envelope", "v1"))
+        for event_type in registry.list_events():
+            for version in registry.list_event_versions(event_type):
+                artifacts.append(ArtifactTiming("event", event_type, version))
+    if semantics:
+        for entity, versions in registry._get_catalog().versions["semantic"].items():
+            for version in versions:
+                artifacts.append(ArtifactTiming("semantic", entity, version))
+    return sorted(artifacts, key=lambda a: (a.kind, a.name, a.version))
+
+
+_LOADERS: dict[str, Callable[[str, str], Any]] = {
+    "entity": registry.load_entity_schema,
+    "event": registry.load_event_schema,
+    "envelope": lambda name, version: registry.load_event_envelope_schema(),
+    "semantic": registry.load_semantic_constraints,
+}
+
+
+def _warm(artifact: ArtifactTiming, compile: bool) -> ArtifactTiming:
+    try:
+        started = time.perf_counter()
+        _LOADERS[artifact.kind](artifact.name, artifact.version)
+        artifact.load_seconds = time.perf_counter() - started
+
+        if compile:
+            started = time.perf_counter()
+            if artifact.kind == "semantic":
+                compile_semantics(artifact.name, artifact.version)
+            else:
+                compile_validator(artifact.kind, artifact.name, artifact.version)
+            artifact.compile_seconds = time.perf_counter() - started
+    except Exception as e:
+        artifact.error = f"{type(e).__name__}: {str(e)}"
+    return artifact
+
+
+def preload(
+    entities: bool = True,
+    events: bool = True,
+    semantics: bool = True,
+    compile: bool = True,
+    workers: int | None = None,
+) -> PreloadReport:
+    """
+    Load (and optionally compile) every registry artifact up front.
+
+    Artifacts are warmed concurrently on a thread pool. Failures do not stop
+    the warm-up; they are recorded on the corresponding timing entry.
+
+    Args:
+        entities: Load all entity schemas
+        events: Load the event envelope and all event schemas
+        semantics: Load all semantic constraint files
+        compile: Also compile validators (entity, envelope and event schemas) and
+            semantic checks
+        workers: Number of threads (default: ``min(32, cpu_count + 4)``, as for
+            ThreadPoolExecutor)
+
+    Returns:
+        PreloadReport with per-artifact load/compile timings
+
+    Example:
+        >>> report = canonical.preload(workers=8)
+        >>> logger.info(f"Registry warm-up: {report.to_dict()}")
+    """
+    started = time.perf_counter()
+    artifacts = _list_artifacts(entities, events, semantics)
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+
+    report = PreloadReport(workers=workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="canonical-preload") as pool:
+        report.artifacts = list(pool.map(lambda a: _warm(a, compile), artifacts))
+
+    report.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        f"Preloaded {len(report.artifacts)} canonical artifacts in "
+        f"{report.elapsed_seconds * 1000:.1f} ms ({len(report.failed)} failed)"
+    )
+    for artifact in report.failed:
+        logger.warning(
+            f"Failed to preload {artifact.kind} {artifact.name}.{artifact.version}: "
+            f"{artifact.error}"
+        )
+    return report
@@ -0,0 +1,81 @@
+"""Shared fixtures for the canonical test suite."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from canonical import registry, reload
+
+
+def _clear_registry_caches() -> None:
+    registry._entity_schemas.clear()
+    registry._event_schemas.clear()
+    registry._semantic_constraints.clear()
+    registry._envelope_schema = None
+    registry._compiled_validators.clear()
+    registry._semantic_checks.clear()
+    registry._semantic_column_checks.clear()
+    registry._fingerprints.clear()
+    registry._missing.clear()
+    registry._invalidate_catalog()
+    reload._file_state.clear()
+    reload._baseline_recorded = False
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch: pytest.MonkeyPatch):
+    """Give every test empty caches and serve the loose registry files."""
+    monkeypatch.setattr(registry, "_bundle", None)
+    monkeypatch.setattr(registry, "_bundle_checked", True)
+    _clear_registry_caches()
+    yield
+    _clear_registry_caches()
+
+
+@pytest.fixture
+def registry_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the registry at a writable copy of the packaged registry files."""
+    for name in ("entities", "events", "semantics"):
+        shutil.copytree(registry._BASE_DIR / name, tmp_path / name)
+    monkeypatch.setattr(registry, "_BASE_DIR", tmp_path)
+    monkeypatch.setattr(registry, "_ENTITIES_DIR", tmp_path / "entities")
+    monkeypatch.setattr(registry, "_EVENTS_DIR", tmp_path / "events")
+    monkeypatch.setattr(registry, "_SEMANTICS_DIR", tmp_path / "semantics")
+    return tmp_path
+
+
+def make_event(**overrides: Any) -> dict[str, Any]:
+    """A valid ``client.status_changed`` v1 event, with top-level fields overridden."""
+    event: dict[str, Any] = {
+        "event_id": "evt-1",
+        "event_type": "client.status_changed",
+        "event_version": "v1",
+        "source": {"service": "cds_client", "environment": "dev"},
+        "tenant_id": "tenant-1",
+        "entity": {"entity_type": "client", "entity_id": "c-1"},
+        "actor": {"actor_id": "u-1", "actor_role": "rm", "actor_type": "human_internal"},
+        "occurred_at": "2026-01-02T03:04:05Z",
+        "payload": {"client_id": "c-1", "status": "active"},
+    }
+    event.update(overrides)
+    return event
+
+
+def make_event_log(path: Path, n: int) -> Path:
+    """Write ``n`` NDJSON lines mixing valid, invalid, undecodable and blank lines."""
+    lines = []
+    for i in range(n):
+        if i % 10 == 3:
+            lines.append('{"event_id": "broken"')
+        elif i % 10 == 7:
+            lines.append("")
+        elif i % 4 == 1:
+            event = make_event(event_id=f"e{i}", payload={"client_id": "c", "status": "bogus"})
+            lines.append(json.dumps(event))
+        else:
+            lines.append(json.dumps(make_event(event_id=f"e{i}")))
+    path.write_text("\n".join(lines) + "\n")
+    return path
@@ -0,0 +1,131 @@
+"""Tests for canonical.aio."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Executor
+
+import pytest
+
+from canonical import aio, registry
+from canonical.registry import SchemaNotFoundError
+from canonical.validator import validate_event
+
+from conftest import make_event
+
+
+@pytest.fixture(autouse=True)
+def default_executor():
+    yield
+    aio.set_executor(None)
+
+
+class _RefusingExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise AssertionError("a cached entry went to the executor")
+
+
+def _gated_load(monkeypatch: pytest.MonkeyPatch, name: str, error: Exception | None = None):
+    """Replace ``registry.name`` with a load that blocks until ``release`` is set."""
+    original = getattr(registry, name)
+    calls = []
+    release = threading.Event()
+
+    def load(*args):
+        calls.append(args)
+        release.wait(5)
+        if error is not None:
+            raise error
+        return original(*args)
+
+    monkeypatch.setattr(registry, name, load)
+    return calls, release
+
+
+async def _release_when_waiting(release: threading.Event) -> None:
+    # Let every task reach the shared future before the load finishes
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+
+
+def test_concurrent_loads_share_one_read(monkeypatch):
+    calls, release = _gated_load(monkeypatch, "load_entity_schema")
+
+    async def main():
+        tasks = [asyncio.ensure_future(aio.aload_entity_schema("client")) for _ in range(10)]
+        await _release_when_waiting(release)
+        return await asyncio.gather(*tasks)
+
+    schemas = asyncio.run(main())
+    assert calls == [("client", "v1")]
+    assert all(schema is schemas[0] for schema in schemas)
+    assert schemas[0] is registry.load_entity_schema("client")
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_load(monkeypatch):
+    calls, release = _gated_load(monkeypatch, "load_event_schema")
+
+    async def main():
+        first = asyncio.ensure_future(aio.aload_event_schema("client.status_changed"))
+        second = asyncio.ensure_future(aio.aload_event_schema("client.status_changed"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await _release_when_waiting(release)
+        return await second, first.cancelled()
+
+    schema, cancelled = asyncio.run(main())
+    assert cancelled and len(calls) == 1
+    assert schema["title"]
+
+
+def test_errors_reach_every_waiter_and_are_not_cached(monkeypatch):
+    calls, release = _gated_load(monkeypatch, "load_entity_schema", SchemaNotFoundError("gone"))
+
+    async def main():
+        tasks = [asyncio.ensure_future(aio.aload_entity_schema("client")) for _ in range(3)]
+        await _release_when_waiting(release)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # The failed load is no longer in flight, so the next await retries it
+        with pytest.raises(SchemaNotFoundError):
+            await aio.aload_entity_schema("client")
+        return results
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, SchemaNotFoundError) for result in results)
+    assert len(calls) == 2
+
+
+def test_cached_entries_are_returned_inline():
+    registry.load_entity_schema("client")
+    registry.load_semantic_constraints("client")
+    aio.set_executor(_RefusingExecutor())
+
+    async def main():
+        return (
+            await aio.aload_entity_schema("client"),
+            await aio.aload_semantic_constraints("client"),
+        )
+
+    entity, semantic = asyncio.run(main())
+    assert entity is registry.load_entity_schema("client")
+    assert semantic is registry.load_semantic_constraints("client")
+
+
+def test_acompile_validator_matches_compile_validator():
+    validator = asyncio.run(aio.acompile_validator("entity", "client"))
+    assert registry._compiled_validators[("entity", "client", "v1")] is validator
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        make_event(),
+        json.dumps(make_event(payload={"status": "bogus"})),
+        json.dumps(make_event(event_type="nope.x")).encode(),
+        "[]",
+        b"{",
+    ],
+)
+def test_avalidate_event_matches_validate_event(raw):
+    assert asyncio.run(aio.avalidate_event(raw)) == validate_event(raw)
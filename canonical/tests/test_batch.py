@@ -0,0 +1,49 @@
+"""Tests for canonical.batch."""
+
+import json
+
+import pytest
+
+from canonical.batch import validate_events_batch
+from canonical.validator import validate_event
+
+from conftest import make_event
+
+EVENTS = [
+    make_event(),
+    make_event(payload={"client_id": "c-1", "status": "bogus"}),
+    make_event(payload={"status": "active"}),
+    make_event(payload=[1, 2]),
+    make_event(event_type="nope.x"),
+    make_event(occurred_at="yesterday"),
+    {"event_type": "nope.x", "event_version": "v1"},
+    {"event_type": "client.status_changed", "event_version": "v1"},
+    {},
+]
+
+
+def test_batch_matches_validate_event():
+    expected = [list(validate_event(event).errors) for event in EVENTS]
+    assert validate_events_batch(EVENTS) == expected
+    assert validate_events_batch(json.dumps(event) for event in EVENTS) == expected
+
+
+@pytest.mark.parametrize("raw", ["[]", "1", "null"])
+def test_json_that_is_not_an_object(raw):
+    assert validate_events_batch([raw]) == [list(validate_event(raw).errors)]
+
+
+def test_unknown_event_type_without_payload_is_reported():
+    (errors,) = validate_events_batch([{"event_type": "nope.x", "event_version": "v1"}])
+    assert "$.event_type: unknown event type 'nope.x' version 'v1'" in errors
+    assert "$: missing required property 'payload'" in errors
+
+
+@pytest.mark.parametrize("raw", [b"{", "not json", b"\xff"])
+def test_invalid_json(raw):
+    (errors,) = validate_events_batch([raw])
+    assert len(errors) == 1 and errors[0].startswith("$: invalid JSON:")
+
+
+def test_valid_event_has_no_errors():
+    assert validate_events_batch([make_event()]) == [[]]
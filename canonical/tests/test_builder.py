@@ -0,0 +1,137 @@
+"""Tests for canonical.builder."""
+
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from canonical.builder import EnvelopeBuildError, EnvelopeBuilder
+from canonical.envelope import EnvelopeView
+from canonical.registry import EventNotFoundError
+from canonical.validator import validate_event
+
+ACTOR = {"actor_id": "u-1", "actor_role": "rm", "actor_type": "human_internal"}
+PAYLOAD = {"client_id": "c-1", "status": "active"}
+
+
+def _build(builder: EnvelopeBuilder, payload=PAYLOAD, **overrides) -> bytes:
+    arguments = {
+        "tenant_id": "tenant-1",
+        "entity_type": "client",
+        "entity_id": "c-1",
+        "actor": ACTOR,
+    }
+    arguments.update(overrides)
+    return builder.build("client.status_changed", payload, **arguments)
+
+
+def test_output_is_a_valid_envelope():
+    raw = _build(EnvelopeBuilder("cds_client", environment="dev"), correlation_id="corr")
+    result = validate_event(raw)
+    assert result.valid, result.errors
+    assert result.event["source"] == {"service": "cds_client", "environment": "dev"}
+    assert result.event["payload"] == PAYLOAD
+    assert list(EnvelopeView(raw).keys())[-1] == "payload"
+
+
+def test_generated_ids_are_unique_and_time_ordered():
+    builder = EnvelopeBuilder("svc")
+    ids = [json.loads(_build(builder))["event_id"] for _ in range(2000)]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert all(event_id[14] == "7" for event_id in ids)
+
+
+@pytest.mark.parametrize(
+    "occurred_at",
+    [
+        datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone(timedelta(hours=-7))),
+        datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=5, seconds=15))),
+        "2026-01-02T03:04:05.5+01:00",
+    ],
+)
+def test_occurred_at(occurred_at):
+    event = validate_event(_build(EnvelopeBuilder("svc"), occurred_at=occurred_at))
+    assert event.valid, event.errors
+    if isinstance(occurred_at, datetime):
+        parsed = datetime.fromisoformat(event.event["occurred_at"])
+        assert parsed == occurred_at
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"occurred_at": datetime(2026, 1, 2)},
+        {"occurred_at": "yesterday"},
+        {"tenant_id": 1},
+        {"entity_type": "planet"},
+        {"actor": {"actor_id": "u-1"}},
+        {"correlation_id": 5},
+        {"event_id": 5},
+        {"payload": {"client_id": "c-1", "status": "bogus"}},
+        {"payload": b"[1]"},
+        {"payload": b'{"client_id": "c-1", "status": "bogus"}'},
+        {"payload": b'{"client_id": '},
+        {"payload": 7},
+    ],
+)
+def test_invalid_fields_raise(overrides):
+    payload = overrides.pop("payload", PAYLOAD)
+    with pytest.raises(EnvelopeBuildError):
+        _build(EnvelopeBuilder("svc"), payload, **overrides)
+
+
+def test_encoded_payload_is_spliced_verbatim():
+    payload = b'{"status": "active", "client_id": "c-1"}'
+    raw = _build(EnvelopeBuilder("svc"), payload, event_id="retry-1")
+    assert bytes(EnvelopeView(raw).payload_raw) == payload
+    assert validate_event(raw).valid
+
+
+def test_validate_payloads_false_skips_the_payload_check():
+    payload = {"client_id": "c-1", "status": "bogus"}
+    raw = _build(EnvelopeBuilder("svc", validate_payloads=False), payload)
+    assert validate_event(raw).errors == (
+        "$.payload.status: value is not one of "
+        "['prospect', 'active', 'inactive', 'restricted', 'closed', 'archived']",
+    )
+
+
+def test_unknown_event_type():
+    with pytest.raises(EventNotFoundError):
+        EnvelopeBuilder("svc").build(
+            "nope.x", PAYLOAD, tenant_id="t", entity_type="client", entity_id="c", actor=ACTOR
+        )
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    # Switch threads as often as possible so unguarded updates interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_actor_cache_is_thread_safe(frequent_thread_switches):
+    builder = EnvelopeBuilder("svc", max_actors=8)
+    actors = [{**ACTOR, "actor_id": f"u-{i}"} for i in range(64)]
+    raw = _build(builder, actor=actors[5])
+    assert json.loads(raw)["actor"] == actors[5]
+
+    start = threading.Barrier(8)
+
+    def lookup_all(offset: int) -> list[str]:
+        start.wait()
+        return [builder._actor(actors[(offset + i) % 64]) for i in range(20000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lookup_all, range(0, 64, 8)))
+    for offset, fragments in zip(range(0, 64, 8), results):
+        for i in (0, 1, 19999):
+            assert json.loads(fragments[i][len(',"actor":') :]) == actors[(offset + i) % 64]
+    assert len(builder._actors) <= builder.max_actors
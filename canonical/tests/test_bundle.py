@@ -0,0 +1,140 @@
+"""Tests for canonical.bundle and bundle loading in canonical.registry."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from canonical import bundle, registry
+
+
+@pytest.fixture
+def bundle_file(tmp_path: Path) -> Path:
+    return bundle.build_bundle(tmp_path / "_registry.bundle")
+
+
+def _use_bundle(monkeypatch: pytest.MonkeyPatch, path: Path) -> None:
+    monkeypatch.setenv("CANONICAL_REGISTRY_BUNDLE", str(path))
+    monkeypatch.setattr(registry, "_bundle_checked", False)
+
+
+def test_bundle_serves_the_same_schemas(monkeypatch: pytest.MonkeyPatch, bundle_file: Path):
+    loose = {entity: registry.load_entity_schema(entity) for entity in registry.list_entities()}
+    semantic = registry.load_semantic_constraints("client")
+    registry._entity_schemas.clear()
+    registry._semantic_constraints.clear()
+    registry._invalidate_catalog()
+
+    _use_bundle(monkeypatch, bundle_file)
+    assert registry._get_bundle() is not None
+    assert {e: registry.load_entity_schema(e) for e in registry.list_entities()} == loose
+    assert registry.load_semantic_constraints("client") == semantic
+
+
+def test_bundle_is_plain_json(bundle_file: Path):
+    data = json.loads(bundle_file.read_bytes())
+    assert data["format_version"] == registry.BUNDLE_FORMAT_VERSION
+    assert data["manifest"].keys() == data["artifacts"].keys()
+
+
+def test_artifacts_are_stored_parsed(bundle_file: Path):
+    import yaml
+
+    data = json.loads(bundle_file.read_bytes())
+    rel = "semantics/client.v1.semantic.yaml"
+    loose = yaml.safe_load((registry._BASE_DIR / rel).read_text())
+    assert data["artifacts"][rel] == loose
+    assert data["manifest"][rel]["sha256"] == registry.schema_digest(loose)
+    schema = registry.load_entity_schema("client")
+    assert data["manifest"]["entities/client.v1.json"]["sha256"] == registry.schema_digest(schema)
+
+
+def test_bundled_process_does_not_import_yaml(bundle_file: Path):
+    code = (
+        "import sys; from canonical import registry; "
+        "assert registry._get_bundle() is not None; "
+        "registry.load_semantic_constraints('client'); "
+        "print('yaml' in sys.modules)"
+    )
+    env = dict(
+        os.environ, PYTHONPATH=os.pathsep.join(sys.path), CANONICAL_REGISTRY_BUNDLE=str(bundle_file)
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_tampered_bundle_is_ignored(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, bundle_file: Path
+):
+    data = json.loads(bundle_file.read_bytes())
+    rel = "entities/task.v1.json"
+    data["artifacts"][rel]["required"][0] = "taskid"
+    tampered = tmp_path / "tampered.bundle"
+    tampered.write_text(json.dumps(data))
+
+    _use_bundle(monkeypatch, tampered)
+    assert registry._get_bundle() is None
+    assert bundle.check_bundle(tampered) == [
+        f"invalid bundle: content of {rel} does not match its manifest hash"
+    ]
+
+
+@pytest.mark.parametrize("content", ["[1, 2]", "null", "not json"])
+def test_malformed_bundle_is_ignored(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, content: str):
+    path = tmp_path / "bad.bundle"
+    path.write_text(content)
+    _use_bundle(monkeypatch, path)
+    assert registry._get_bundle() is None
+
+
+def test_check_reports_changed_files(registry_dir: Path, tmp_path: Path):
+    path = bundle.build_bundle(tmp_path / "out" / "_registry.bundle", base_dir=registry_dir)
+    assert bundle.check_bundle(path, base_dir=registry_dir) == []
+
+    (registry_dir / "semantics" / "client.v1.semantic.yaml").write_text("entity: client\n")
+    (registry_dir / "entities" / "task.v1.json").write_text("{broken")
+    assert bundle.check_bundle(path, base_dir=registry_dir) == [
+        "cannot parse entities/task.v1.json: " + _parse_error(b"{broken"),
+        "content changed: semantics/client.v1.semantic.yaml",
+    ]
+
+
+def _parse_error(raw: bytes) -> str:
+    try:
+        bundle.codec.loads(raw)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError("parsed")
+
+
+def test_formatting_changes_do_not_make_the_bundle_stale(registry_dir: Path, tmp_path: Path):
+    path = bundle.build_bundle(tmp_path / "_registry.bundle", base_dir=registry_dir)
+    schema_file = registry_dir / "entities" / "client.v1.json"
+    schema_file.write_text(json.dumps(json.loads(schema_file.read_text()), indent=8))
+    assert bundle.check_bundle(path, base_dir=registry_dir) == []
+
+
+@pytest.mark.parametrize(
+    "content, problem",
+    [
+        ("entity: client\nsince: 2024-01-01\n", "cannot be stored as JSON"),
+        ("entity: client\n1: one\n", "cannot be stored as JSON"),
+        ("entity: client\nlimit: .nan\n", "cannot be stored as JSON"),
+        ("entity: [client\n", "invalid YAML"),
+    ],
+)
+def test_yaml_that_json_cannot_hold_fails_the_build(
+    registry_dir: Path, tmp_path: Path, content: str, problem: str
+):
+    (registry_dir / "semantics" / "client.v1.semantic.yaml").write_text(content)
+    with pytest.raises(ValueError, match=problem):
+        bundle.build_bundle(tmp_path / "_registry.bundle", base_dir=registry_dir)
+
+
+def test_default_output_is_outside_the_package():
+    assert registry._BASE_DIR not in bundle.DEFAULT_OUTPUT.resolve().parents
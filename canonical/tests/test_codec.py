@@ -0,0 +1,57 @@
+"""Tests for canonical.codec."""
+
+import importlib.util
+
+import pytest
+
+from canonical import codec
+
+BACKENDS = [name for name in codec.BACKENDS if name == "json" or importlib.util.find_spec(name)]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = codec.get_json_backend()
+    codec.set_json_backend(request.param)
+    yield request.param
+    codec.set_json_backend(previous)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b'{"a": [1, 2.5, "\\u00e9", true, null]}', {"a": [1, 2.5, "é", True, None]}),
+        ("[1]", [1]),
+        (memoryview(b"[2]"), [2]),
+        (bytearray(b"[3]"), [3]),
+        (b"18446744073709551615", 18446744073709551615),
+        (b"-9223372036854775808", -9223372036854775808),
+        (b"18446744073709551616", 18446744073709551616.0),
+        (b"-9223372036854775809", -9223372036854775809.0),
+        (b"1e308", 1e308),
+    ],
+)
+def test_loads(backend, raw, expected):
+    value = codec.loads(raw)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"NaN", b"[Infinity]", b"-Infinity", b"1e400", b"{", b"\xff", b"\xef\xbb\xbf[1]", b""],
+)
+def test_loads_rejects(backend, raw):
+    with pytest.raises(ValueError):
+        codec.loads(raw)
+
+
+def test_dumps(backend):
+    assert codec.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode()
+    with pytest.raises(TypeError):
+        codec.dumps({"a": object()})
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        codec.set_json_backend("simplejson")
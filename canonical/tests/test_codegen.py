@@ -0,0 +1,67 @@
+"""Tests for canonical.codegen."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from canonical import codegen, registry
+from canonical.validator import compile_schema, compile_validator
+
+
+def test_shipped_modules_are_up_to_date():
+    assert codegen.check_modules() == []
+
+
+def test_write_then_check(tmp_path: Path):
+    touched = codegen.write_modules(tmp_path)
+    assert "__init__.py" in touched and "entity__client__v1.py" in touched
+    assert codegen.check_modules(tmp_path) == []
+    assert codegen.write_modules(tmp_path) == []
+
+    (tmp_path / "entity__client__v1.py").write_text("# edited\n")
+    (tmp_path / "entity__gone__v1.py").write_text("")
+    (tmp_path / "entity__task__v1.py").unlink()
+    assert codegen.check_modules(tmp_path) == [
+        "no longer generated: entity__gone__v1.py",
+        "out of date: entity__client__v1.py",
+        "missing: entity__task__v1.py",
+    ]
+    assert sorted(codegen.write_modules(tmp_path)) == [
+        "entity__client__v1.py",
+        "entity__gone__v1.py",
+        "entity__task__v1.py",
+    ]
+
+
+def test_main_check_exit_status(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    assert codegen.main(["--check", "--output", str(tmp_path)]) == 1
+    assert "Run: python -m canonical.codegen" in capsys.readouterr().err
+    assert codegen.main(["--output", str(tmp_path)]) == 0
+    assert codegen.main(["--check", "--output", str(tmp_path)]) == 0
+
+
+def test_generated_validator_is_used_when_the_schema_matches():
+    validator = compile_validator("entity", "client")
+    assert validator.__module__ == "canonical._generated.entity__client__v1"
+    schema = registry.load_entity_schema("client")
+    runtime = compile_schema(schema)
+    for instance in ({}, {"client_id": 1, "status": "bogus"}, [], {"created_at": "yesterday"}):
+        assert validator(instance) == runtime(instance)
+
+
+def test_stale_generated_validator_is_not_used(registry_dir: Path):
+    path = registry_dir / "entities" / "client.v1.json"
+    schema = json.loads(path.read_text())
+    schema["required"].append("extra_field")
+    path.write_text(json.dumps(schema))
+    validator = compile_validator("entity", "client")
+    assert validator.__module__ != "canonical._generated.entity__client__v1"
+    assert "$: missing required property 'extra_field'" in validator({})
+
+
+def test_generated_code_can_be_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("CANONICAL_PRECOMPILED_VALIDATORS", "0")
+    monkeypatch.setattr(codegen, "_index", False)
+    schema = registry.load_entity_schema("client")
+    assert codegen.load_validator("entity", "client", "v1", schema) is None
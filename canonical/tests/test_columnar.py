@@ -0,0 +1,73 @@
+"""Tests for canonical.columnar."""
+
+import random
+
+import pytest
+
+from canonical.columnar import check_columns, compile_column_constraints
+from canonical.constraints import compile_semantics
+
+STATUS = ["active", "inactive", "prospect", "closed", None]
+RISK = ["low", "medium", "high", "extreme", None]
+AUM = [0, 5, -1.5, 100.0, None, "lots"]
+DOMICILE = ["GB", "gb", "Us", None, 7]
+
+
+def _rows(n: int) -> list[dict]:
+    rng = random.Random(7)
+    rows = []
+    for i in range(n):
+        row = {
+            "client_id": f"c{i}" if rng.random() > 0.1 else None,
+            "name": "Acme",
+            "status": rng.choice(STATUS),
+            "risk_profile": rng.choice(RISK),
+            "aum": rng.choice(AUM),
+            "domicile": rng.choice(DOMICILE),
+        }
+        rows.append({k: v for k, v in row.items() if v is not None})
+    return rows
+
+
+def _columns(rows: list[dict]) -> dict[str, list]:
+    fields = ["client_id", "name", "status", "risk_profile", "aum", "domicile"]
+    return {field: [row.get(field) for row in rows] for field in fields}
+
+
+def test_masks_agree_with_record_checks():
+    rows = _rows(500)
+    masks = check_columns("client", _columns(rows))
+    check = compile_semantics("client")
+    for i, row in enumerate(rows):
+        violated = any(mask[i] for mask in masks.values())
+        assert violated == bool(check(row)), row
+
+
+def test_mask_keys():
+    masks = check_columns("client", {"status": ["active", "closed"], "aum": [10.0, -1.0]})
+    assert masks["status:allowed"] == [False, True]
+    assert masks["aum:min"] == [False, True]
+    assert masks["required:client_id"] == [True, True]
+    assert "rule:risk_profile == 'high' implies aum > 0" in masks
+
+
+def test_columns_of_different_lengths():
+    with pytest.raises(ValueError):
+        check_columns("client", {"status": ["active"], "aum": [1, 2]})
+
+
+def test_nested_fields_as_dotted_columns_or_dicts():
+    check = compile_column_constraints({"cross_field_constraints": ["a.b >= 0"]})
+    assert check({"a.b": [1, -1]})["rule:a.b >= 0"] == [False, True]
+    assert check({"a": [{"b": 1}, {"b": -1}]})["rule:a.b >= 0"] == [False, True]
+
+
+def test_numpy_arrays_match_lists():
+    np = pytest.importorskip("numpy")
+    rows = _rows(200)
+    columns = _columns(rows)
+    columns["name"] = np.array(columns["name"])
+    columns["aum"] = np.array(columns["aum"], dtype=object)
+    masks = check_columns("client", columns)
+    expected = check_columns("client", _columns(rows))
+    assert {key: list(mask) for key, mask in masks.items()} == expected
@@ -0,0 +1,111 @@
+"""Tests for canonical.constraints."""
+
+import pytest
+
+from canonical.constraints import (
+    SemanticRuleError,
+    compile_constraints,
+    compile_rule,
+    compile_semantics,
+)
+
+
+@pytest.mark.parametrize(
+    "rule, record, expected",
+    [
+        ("risk_profile == 'high' implies aum > 0", {"risk_profile": "high", "aum": 5}, True),
+        ("risk_profile == 'high' implies aum > 0", {"risk_profile": "high", "aum": 0}, False),
+        ("risk_profile == 'high' implies aum > 0", {"risk_profile": "low"}, True),
+        ("status in ['a', 'b'] and not closed", {"status": "a", "closed": False}, True),
+        ("status not in ['a', 'b'] or x == null", {"status": "a"}, True),
+        ("a.b >= 1.5e0", {"a": {"b": 2}}, True),
+        ("missing < 1", {}, False),
+        ("name == 'it\\'s'", {"name": "it's"}, True),
+        ("(a or b) and c", {"a": True, "c": True}, True),
+    ],
+)
+def test_rule_evaluation(rule, record, expected):
+    assert compile_rule(rule)(record) is expected
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "",
+        "   ",
+        "a ==",
+        "== 1",
+        "a == 1 and",
+        "(a == 1",
+        "a == 1)",
+        "a = 1",
+        "a == 1 b",
+        "[a] == 1",
+        "a in [b]",
+        "a == 'unterminated",
+        "a == 1 implies",
+        "__import__('os')",
+        "a; b",
+        None,
+        42,
+    ],
+)
+def test_parser_rejects_bad_rules(rule):
+    with pytest.raises(SemanticRuleError):
+        compile_rule(rule)
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        {"semantic_constraints": {"a": {"allowed": [1], "regex": ".*"}}},
+        {"semantic_constraints": {"a": {"type": "decimal"}}},
+        {"semantic_constraints": {"a": ["not", "a", "mapping"]}},
+        {"cross_field_constraints": [{"description": "no rule"}]},
+        {"cross_field_constraints": ["a >"]},
+    ],
+)
+def test_unsupported_constraints_are_rejected(constraints):
+    with pytest.raises(SemanticRuleError):
+        compile_constraints(constraints)
+
+
+def test_field_checks_report_their_own_message():
+    check = compile_constraints(
+        {
+            "required_fields": ["id"],
+            "semantic_constraints": {
+                "code": {"type": "string", "allowed": ["AB", "cd"], "uppercase": True},
+                "amount": {"type": "number", "min": 0, "max": 10},
+            },
+            "cross_field_constraints": [
+                {"rule": "amount > 0 implies code != null", "description": "needs a code"}
+            ],
+        }
+    )
+    assert check({"id": 1, "code": "AB", "amount": 5}) == []
+    assert check({"code": 1, "amount": -1}) == [
+        "$: missing required field 'id'",
+        "$.code: expected type 'string'",
+        "$.amount: value must be >= 0",
+    ]
+    assert check({"id": 1, "code": "XY", "amount": 11}) == [
+        "$.code: value is not one of ['AB', 'cd']",
+        "$.amount: value must be <= 10",
+    ]
+    assert check({"id": 1, "code": "cd"}) == ["$.code: value must be uppercase"]
+    assert check({"id": 1, "amount": 1}) == [
+        "$: cross-field rule violated: amount > 0 implies code != null (needs a code)"
+    ]
+
+
+def test_compile_semantics_is_cached():
+    check = compile_semantics("client")
+    assert compile_semantics("client") is check
+    assert check({"client_id": "c1", "name": "Acme", "status": "closed"}) == [
+        "$.status: value is not one of ['active', 'inactive', 'prospect']"
+    ]
+
+
+def test_entity_without_semantic_file_always_passes():
+    assert compile_semantics("document")({}) == []
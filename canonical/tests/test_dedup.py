@@ -0,0 +1,112 @@
+"""Tests for canonical.dedup."""
+
+import json
+
+import pytest
+
+from canonical.dedup import EventDeduplicator
+from conftest import make_event
+
+
+def test_default_window_is_the_exact_lru():
+    dedup = EventDeduplicator(lru_size=3)
+    assert [dedup.seen(event_id) for event_id in ("a", "b", "a")] == [False, False, True]
+    for event_id in ("c", "d", "e"):
+        dedup.seen(event_id)
+    # "a" was evicted from the LRU, so it counts as new again
+    assert "a" not in dedup
+    assert dedup.seen("a") is False
+    stats = dedup.stats()
+    assert (stats.checked, stats.duplicates, stats.unconfirmed) == (7, 1, 0)
+    assert (stats.filters, stats.filter_bytes, stats.tracked) == (0, 0, 3)
+    assert len(dedup) == 0
+
+
+def test_drop_unconfirmed_extends_the_window_with_the_filter():
+    dedup = EventDeduplicator(capacity=1000, lru_size=3, drop_unconfirmed=True)
+    for event_id in ("a", "b", "c", "d", "e"):
+        assert dedup.seen(event_id) is False
+    assert "a" in dedup
+    assert dedup.seen("a") is True
+    stats = dedup.stats()
+    assert (stats.duplicates, stats.unconfirmed, stats.filters) == (1, 1, 1)
+    assert len(dedup) == 5
+
+
+def test_filter_stays_within_its_error_budget():
+    dedup = EventDeduplicator(capacity=2000, error_rate=0.01, lru_size=1, drop_unconfirmed=True)
+    for i in range(2000):
+        dedup.seen(f"old-{i}")
+    false_positives = sum(f"new-{i}" in dedup for i in range(10_000))
+    assert false_positives < 100
+
+
+def test_filter_memory_is_bounded():
+    dedup = EventDeduplicator(
+        capacity=100, max_filter_bytes=4096, lru_size=10, drop_unconfirmed=True
+    )
+    for i in range(20_000):
+        dedup.seen(f"e{i}")
+    assert 0 < dedup.stats().filter_bytes <= 4096
+    # The oldest ids were forgotten along with their filter
+    assert "e0" not in dedup
+
+
+def test_seen_event_reads_event_id():
+    dedup = EventDeduplicator()
+    raw = json.dumps(make_event(event_id="evt-9")).encode()
+    assert dedup.seen_event(raw) is False
+    assert dedup.seen_event(make_event(event_id="evt-9")) is True
+    with pytest.raises(ValueError, match="event_id"):
+        dedup.seen_event(b'{"event_type": "x"}')
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "dedup.bin"
+    dedup = EventDeduplicator(capacity=1000, lru_size=2, snapshot_path=path, drop_unconfirmed=True)
+    for event_id in ("a", "b", "c"):
+        dedup.seen(event_id)
+    assert dedup.snapshot() == path
+
+    restored = EventDeduplicator(
+        capacity=1000, lru_size=2, snapshot_path=path, drop_unconfirmed=True
+    )
+    assert "a" in restored and "c" in restored
+    assert len(restored) == 3
+    # Restored without drop_unconfirmed, only the exact ids are kept
+    exact = EventDeduplicator(capacity=1000, lru_size=2, snapshot_path=path)
+    assert "a" not in exact and "c" in exact
+    assert exact.stats().filters == 0
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "dedup.bin"
+    path.write_bytes(b"not a snapshot")
+    dedup = EventDeduplicator(snapshot_path=path)
+    assert dedup.stats().tracked == 0
+    assert dedup.seen("a") is False
+
+
+def test_clear_resets_ids_and_counters():
+    dedup = EventDeduplicator(drop_unconfirmed=True)
+    dedup.seen("a")
+    dedup.seen("a")
+    dedup.clear()
+    assert "a" not in dedup
+    assert dedup.stats().to_dict() == {
+        "checked": 0,
+        "duplicates": 0,
+        "unconfirmed": 0,
+        "filters": 0,
+        "filter_bytes": 0,
+        "tracked": 0,
+    }
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="error_rate"):
+        EventDeduplicator(error_rate=1.5)
+    with pytest.raises(ValueError, match="at least 1"):
+        EventDeduplicator(lru_size=0)
+    with pytest.raises(ValueError, match="too small"):
+        EventDeduplicator(capacity=1_000_000, max_filter_bytes=1024)
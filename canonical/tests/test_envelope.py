@@ -0,0 +1,93 @@
+"""Tests for canonical.envelope."""
+
+import json
+
+import pytest
+
+from canonical import codec
+from canonical.envelope import EnvelopeParseError, EnvelopeView
+from canonical.validator import validate_event
+
+from conftest import make_event
+
+
+def test_header_fields_without_decoding_the_payload():
+    # The payload comes last and is malformed; the header fields still read fine
+    raw = json.dumps(make_event()).replace('"payload": {', '"payload": {oops', 1)
+    view = EnvelopeView(raw)
+    assert view.event_type == "client.status_changed"
+    assert view.event_version == "v1"
+    assert view.tenant_id == "tenant-1"
+    assert view.entity_type == "client"
+    with pytest.raises(EnvelopeParseError):
+        view.payload
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_to_dict_matches_json_loads(indent):
+    raw = json.dumps(make_event(), indent=indent)
+    assert EnvelopeView(raw).to_dict() == json.loads(raw)
+    assert EnvelopeView(raw.encode()).to_dict() == json.loads(raw)
+
+
+def test_payload_raw_is_a_slice_of_the_input():
+    event = make_event(payload={"client_id": "c-é", "status": "active"})
+    raw = json.dumps(event, ensure_ascii=False).encode()
+    view = EnvelopeView(raw)
+    assert json.loads(bytes(view.payload_raw)) == event["payload"]
+    assert view.payload == event["payload"]
+
+
+def test_missing_fields():
+    view = EnvelopeView(b'{"event_type": 1}')
+    assert view.event_type is None
+    assert view.payload is None and view.payload_raw is None
+    assert "tenant_id" not in view
+    with pytest.raises(KeyError):
+        view["tenant_id"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        '{"event_type": "a", "tenant_id": "t", "event_type": "b"}',
+        '{"event_type": "a", "payload": {}, "event_type": "a"}',
+    ],
+)
+def test_duplicate_keys_are_rejected(raw):
+    view = EnvelopeView(raw)
+    assert view.event_type == "a"
+    with pytest.raises(EnvelopeParseError, match="duplicate key"):
+        view.to_dict()
+    with pytest.raises(EnvelopeParseError, match="duplicate key"):
+        view.get("missing")
+
+
+@pytest.mark.parametrize("raw", [b"", b"[]", b"  ", b"\xff", b'{"a": 1} x', b'{"a" 1}'])
+def test_malformed_input(raw):
+    with pytest.raises(EnvelopeParseError):
+        EnvelopeView(raw).to_dict()
+
+
+def test_empty_object():
+    assert EnvelopeView(" { } ").to_dict() == {}
+
+
+@pytest.mark.parametrize(
+    "number", ["NaN", "-Infinity", "1e400", "18446744073709551616", "-9223372036854775809"]
+)
+def test_numbers_decode_as_with_the_codec(number):
+    raw = json.dumps(make_event()).replace('"payload": {', f'"payload": {{"n": {number}, ', 1)
+    result = validate_event(raw)
+    try:
+        decoded = codec.loads(raw)
+    except ValueError:
+        assert not result.valid and result.errors[0].startswith("$: invalid JSON")
+        with pytest.raises(EnvelopeParseError):
+            EnvelopeView(raw).to_dict()
+    else:
+        # Integers wider than 64 bits become floats, as with orjson and msgspec
+        assert isinstance(decoded["payload"]["n"], float)
+        view = EnvelopeView(raw).to_dict()
+        assert view == decoded
+        assert validate_event(view).errors == result.errors
@@ -0,0 +1,64 @@
+"""Tests for canonical.frozen."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from canonical import registry
+from canonical.frozen import FrozenDict, FrozenList, freeze
+
+
+def test_cached_schemas_are_shared_and_read_only():
+    schema = registry.load_entity_schema("client")
+    assert schema is registry.load_entity_schema("client")
+    assert isinstance(schema, FrozenDict) and isinstance(schema["required"], FrozenList)
+    with pytest.raises(TypeError, match="read-only"):
+        schema["title"] = "changed"
+    with pytest.raises(TypeError, match="read-only"):
+        schema["properties"].pop("client_id")
+    with pytest.raises(TypeError, match="read-only"):
+        schema["required"].append("extra")
+    with pytest.raises(TypeError, match="read-only"):
+        schema |= {"title": "changed"}
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.update(a=2),
+        lambda d: d.setdefault("b", 1),
+        lambda d: d.popitem(),
+        lambda d: d.clear(),
+        lambda d: d.__delitem__("a"),
+        lambda d: d["l"].extend([4]),
+        lambda d: d["l"].sort(),
+        lambda d: d["l"].__setitem__(0, 9),
+        lambda d: d["l"].__iadd__([4]),
+    ],
+)
+def test_every_mutation_raises(mutate):
+    value = freeze({"a": 1, "l": [3, 1, 2]})
+    with pytest.raises(TypeError):
+        mutate(value)
+    assert value == {"a": 1, "l": [3, 1, 2]}
+
+
+def test_behaves_like_parsed_json():
+    data = {"a": [1, {"b": None}], "c": "text"}
+    value = freeze(data)
+    assert value == data and isinstance(value, dict) and isinstance(value["a"], list)
+    assert json.dumps(value) == json.dumps(data)
+    assert freeze(value) is value
+
+
+def test_copies():
+    value = freeze({"a": [1, {"b": 2}]})
+    assert copy.copy(value) is value
+    mutable = copy.deepcopy(value)
+    assert type(mutable) is dict and type(mutable["a"]) is list and type(mutable["a"][1]) is dict
+    mutable["a"].append(3)
+    assert value == {"a": [1, {"b": 2}]}
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored == value and isinstance(restored["a"][1], FrozenDict)
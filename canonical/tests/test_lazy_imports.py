@@ -0,0 +1,32 @@
+"""Tests for the lazy exports of the canonical package."""
+
+import os
+import subprocess
+import sys
+
+import canonical
+
+
+def test_every_export_resolves():
+    assert set(canonical._LAZY_EXPORTS) <= set(canonical.__all__)
+    for name in canonical.__all__:
+        assert getattr(canonical, name) is not None, name
+
+
+def test_bare_import_defers_heavy_modules():
+    code = (
+        "import sys, canonical; "
+        "print(' '.join(m for m in ('yaml', 'pydantic', 'canonical.registry', "
+        "'canonical.validator', 'canonical._generated') if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_resolved_exports_are_cached_on_the_package():
+    function = canonical.load_entity_schema
+    assert function.__module__ == "canonical.registry"
+    assert vars(canonical)["load_entity_schema"] is function
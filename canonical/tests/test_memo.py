@@ -0,0 +1,70 @@
+"""Tests for canonical.memo."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from canonical import reload
+from canonical.memo import ValidationCache
+from canonical.validator import validate_event
+
+from conftest import make_event
+
+VALID = json.dumps(make_event()).encode()
+INVALID = json.dumps(make_event(payload={"client_id": "c-1", "status": "bogus"})).encode()
+
+
+@pytest.mark.parametrize("raw", [VALID, INVALID, b"{", VALID.decode(), memoryview(INVALID)])
+def test_hits_return_the_same_result(raw):
+    cache = ValidationCache()
+    first = cache.validate_event(raw)
+    second = cache.validate_event(raw)
+    assert first == second == validate_event(raw)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_dicts_are_not_cached():
+    cache = ValidationCache()
+    assert cache.validate_event(make_event()).valid
+    assert len(cache) == 0
+
+
+def test_validate_caches_per_schema():
+    cache = ValidationCache()
+    payload = b'{"client_id": "c-1", "status": "bogus"}'
+    errors = cache.validate("event", "client.status_changed", payload)
+    assert errors and cache.validate("event", "client.status_changed", payload) == errors
+    assert cache.validate("event", "client.created", payload) != errors
+    assert cache.stats().hits == 1
+
+
+def test_lru_eviction():
+    cache = ValidationCache(maxsize=2)
+    events = [json.dumps(make_event(event_id=f"e{i}")) for i in range(3)]
+    for raw in events:
+        cache.validate_event(raw)
+    cache.validate_event(events[0])
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits) == (2, 2, 0)
+
+
+def test_entry_is_dropped_when_payload_schema_changes(registry_dir: Path):
+    reload.refresh()
+    cache = ValidationCache()
+    assert not cache.validate_event(INVALID).valid
+
+    path = registry_dir / "events" / "client" / "client.status_changed.v1.json"
+    schema = json.loads(path.read_text())
+    schema["properties"]["status"]["enum"].append("bogus")
+    path.write_text(json.dumps(schema))
+    reload.refresh()
+
+    assert cache.validate_event(INVALID).valid
+    assert cache.stats().stale == 1
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
@@ -0,0 +1,55 @@
+"""Tests for canonical.parallel."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from canonical.parallel import validate_parallel
+from canonical.stream import validate_ndjson
+
+from conftest import make_event_log
+
+
+def _counts(summary) -> dict:
+    data = summary.to_dict()
+    return {
+        key: data[key] for key in ("total", "valid", "invalid", "invalid_json", "by_event_type")
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_merge_matches_serial_validation(tmp_path: Path, workers: int):
+    path = make_event_log(tmp_path / "events.ndjson", 300)
+    serial_failures, parallel_failures = io.StringIO(), io.StringIO()
+    serial = validate_ndjson(path, serial_failures)
+    summary = validate_parallel(path, parallel_failures, workers=workers, shard_bytes=2048)
+
+    assert len(summary.shards) > workers
+    assert _counts(summary) == _counts(serial)
+    assert parallel_failures.getvalue() == serial_failures.getvalue()
+    assert sum(shard.summary.total for shard in summary.shards) == summary.total
+    first_lines = [shard.first_line for shard in summary.shards]
+    assert first_lines == sorted(first_lines) and first_lines[0] == 1
+
+
+def test_directory_records_carry_the_file(tmp_path: Path):
+    (tmp_path / "sub").mkdir()
+    make_event_log(tmp_path / "a.ndjson", 20)
+    make_event_log(tmp_path / "sub" / "b.jsonl", 20)
+    failures = io.StringIO()
+    summary = validate_parallel(tmp_path, failures, workers=1)
+
+    records = [json.loads(line) for line in failures.getvalue().splitlines()]
+    assert summary.files == 2
+    assert summary.total == 36
+    assert {Path(record["file"]).name for record in records} == {"a.ndjson", "b.jsonl"}
+
+
+def test_invalid_arguments(tmp_path: Path):
+    path = make_event_log(tmp_path / "events.ndjson", 5)
+    with pytest.raises(ValueError):
+        validate_parallel(path, workers=0)
+    with pytest.raises(FileNotFoundError):
+        validate_parallel(tmp_path / "missing.ndjson")
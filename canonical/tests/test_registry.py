@@ -0,0 +1,125 @@
+"""Tests for canonical.registry."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from canonical import registry, reload
+from canonical.registry import EventNotFoundError, SchemaNotFoundError, _NegativeCache
+
+
+def test_events_stored_under_another_domain_are_found():
+    path = registry.get_event_schema_path("document.uploaded")
+    assert path.parent.name == "task"
+    assert registry.load_event_schema("document.uploaded")["title"]
+    assert "document.uploaded" in registry.list_events()
+    assert "document.uploaded" in registry.list_events("task")
+
+
+def test_owning_domain_wins_over_other_folders():
+    path = registry.get_event_schema_path("interaction.finalized")
+    assert path.parent.name == "interaction"
+
+
+def test_every_listed_event_resolves():
+    for event_type in registry.list_events():
+        for version in registry.list_event_versions(event_type):
+            assert registry.get_event_schema_path(event_type, version).is_file()
+
+
+@pytest.mark.parametrize("event_type", ["nope.created", "client.nope", "nodot"])
+def test_unknown_events(event_type):
+    with pytest.raises(EventNotFoundError):
+        registry.get_event_schema_path(event_type)
+    with pytest.raises(EventNotFoundError):
+        registry.load_event_schema(event_type)
+
+
+def test_events_root_is_indexed(registry_dir: Path):
+    source = registry.get_event_schema_path("client.created")
+    (registry_dir / "events" / "client.archived.v1.json").write_bytes(source.read_bytes())
+    registry._invalidate_catalog()
+    assert registry.get_event_schema_path("client.archived") == (
+        registry_dir / "events" / "client.archived.v1.json"
+    )
+    assert "client.archived" not in registry.list_events("client")
+
+
+def test_misses_are_remembered(monkeypatch: pytest.MonkeyPatch):
+    with pytest.raises(SchemaNotFoundError) as first:
+        registry.load_entity_schema("nope")
+    assert registry._missing.get("entity", "nope.v1") == str(first.value)
+
+    def no_filesystem(path):
+        raise AssertionError("a known miss touched the registry files")
+
+    monkeypatch.setattr(registry, "_exists", no_filesystem)
+    with pytest.raises(SchemaNotFoundError) as second:
+        registry.load_entity_schema("nope")
+    assert str(second.value) == str(first.value)
+    with pytest.raises(EventNotFoundError):
+        registry.load_event_schema("client.nope")
+    with pytest.raises(EventNotFoundError):
+        registry.load_event_schema("client.nope")
+
+
+def test_negative_cache_expiry_and_size(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(registry, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = _NegativeCache(maxsize=2, ttl=30.0)
+    for key in ("a", "b", "c"):
+        cache.add("entity", key, f"no {key}")
+    assert len(cache) == 2
+    assert cache.get("entity", "a") is None
+    assert cache.get("entity", "c") == "no c"
+    now[0] += 30.0
+    assert cache.get("entity", "c") is None
+    assert len(cache) == 1
+
+
+def test_refresh_forgets_misses_for_new_files(registry_dir: Path):
+    reload.refresh()
+    with pytest.raises(SchemaNotFoundError):
+        registry.load_entity_schema("client", "v2")
+    source = registry_dir / "entities" / "client.v1.json"
+    (registry_dir / "entities" / "client.v2.json").write_bytes(source.read_bytes())
+    assert reload.refresh().added == ["entities/client.v2.json"]
+    assert registry.load_entity_schema("client", "v2") == registry.load_entity_schema("client")
+
+
+@pytest.mark.parametrize(
+    "older, newer",
+    [("v2", "v10"), ("v1.2", "v1.10"), ("v2-beta", "v2"), ("v1", "v1.1"), ("v10", "vnext")],
+)
+def test_version_order(older, newer):
+    assert registry._version_key(older) < registry._version_key(newer)
+
+
+def test_latest_version_is_numeric(registry_dir: Path):
+    source = (registry_dir / "entities" / "client.v1.json").read_bytes()
+    for version in ("v2", "v10", "v10-rc1"):
+        (registry_dir / "entities" / f"client.{version}.json").write_bytes(source)
+    registry._invalidate_catalog()
+    assert registry.list_entity_versions("client") == ["v1", "v2", "v10-rc1", "v10"]
+    assert registry.latest_version("entity", "client") == "v10"
+
+
+def test_latest_version_of_each_kind():
+    assert registry.latest_version("event", "client.created") == "v1"
+    assert registry.latest_version("semantic", "client") == "v1"
+    with pytest.raises(SchemaNotFoundError):
+        registry.latest_version("entity", "nope")
+    with pytest.raises(EventNotFoundError):
+        registry.latest_version("event", "client.nope")
+    with pytest.raises(registry.SemanticNotFoundError):
+        registry.latest_version("semantic", "nope")
+    with pytest.raises(ValueError, match="Unknown registry kind"):
+        registry.latest_version("widget", "client")
+
+
+def test_catalog_is_built_once(monkeypatch: pytest.MonkeyPatch):
+    registry.list_entities()
+    monkeypatch.setattr(registry, "_build_catalog", lambda: pytest.fail("catalog rebuilt"))
+    assert registry.list_entities() == sorted(registry.list_entities())
+    assert registry.list_events("client")
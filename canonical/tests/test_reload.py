@@ -0,0 +1,108 @@
+"""Tests for canonical.reload."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from canonical import registry, reload
+from canonical.constraints import compile_semantics
+from canonical.validator import compile_validator
+
+
+def test_refresh_compiles_added_semantic_file(registry_dir: Path):
+    reload.refresh()
+    assert compile_semantics("task")({"status": "bogus"}) == []
+
+    (registry_dir / "semantics" / "task.v1.semantic.yaml").write_text(
+        "entity: task\n"
+        "version: v1\n"
+        "semantic_constraints:\n"
+        "  status:\n"
+        "    allowed: [open, completed]\n"
+    )
+    report = reload.refresh()
+
+    assert report.added == ["semantics/task.v1.semantic.yaml"]
+    assert compile_semantics("task")({"status": "bogus"}) == [
+        "$.status: value is not one of ['open', 'completed']"
+    ]
+
+
+def _edit_json(path: Path, **changes) -> None:
+    schema = json.loads(path.read_text())
+    schema.update(changes)
+    path.write_text(json.dumps(schema))
+
+
+def test_first_refresh_records_baseline(registry_dir: Path):
+    assert not reload.refresh().has_changes
+    assert not reload.refresh().has_changes
+
+
+def test_refresh_reloads_changed_entity(registry_dir: Path):
+    reload.refresh()
+    assert registry.load_entity_schema("task")["title"] != "Edited"
+    validator = compile_validator("entity", "task")
+
+    _edit_json(registry_dir / "entities" / "task.v1.json", title="Edited")
+    report = reload.refresh()
+
+    assert report.changed == ["entities/task.v1.json"]
+    assert report.reloaded == ["entity:task.v1"]
+    assert registry.load_entity_schema("task")["title"] == "Edited"
+    assert compile_validator("entity", "task") is not validator
+
+
+def test_refresh_ignores_touch_without_edit(registry_dir: Path):
+    reload.refresh()
+    path = registry_dir / "entities" / "task.v1.json"
+    path.write_text(path.read_text())
+    os.utime(path, ns=(1, 1))
+    assert not reload.refresh().has_changes
+
+
+def test_refresh_leaves_unloaded_entries_to_load_lazily(registry_dir: Path):
+    reload.refresh()
+    _edit_json(registry_dir / "entities" / "task.v1.json", title="Edited")
+    report = reload.refresh()
+    assert report.changed == ["entities/task.v1.json"]
+    assert report.reloaded == []
+    assert registry.load_entity_schema("task")["title"] == "Edited"
+
+
+def test_refresh_keeps_previous_schema_when_reload_fails(registry_dir: Path):
+    reload.refresh()
+    schema = registry.load_entity_schema("task")
+
+    (registry_dir / "entities" / "task.v1.json").write_text("{not json")
+    report = reload.refresh()
+
+    assert list(report.errors) == ["entity:task.v1"]
+    assert registry.load_entity_schema("task") is schema
+
+
+def test_refresh_drops_removed_event(registry_dir: Path):
+    reload.refresh()
+    registry.load_event_schema("client.status_changed")
+
+    (registry_dir / "events" / "client" / "client.status_changed.v1.json").unlink()
+    report = reload.refresh()
+
+    assert report.removed == ["events/client/client.status_changed.v1.json"]
+    assert report.reloaded == ["event:client.status_changed.v1"]
+    assert "client.status_changed" not in registry.list_events()
+    with pytest.raises(registry.EventNotFoundError):
+        registry.load_event_schema("client.status_changed")
+
+
+def test_refresh_picks_up_new_event_version(registry_dir: Path):
+    reload.refresh()
+    assert registry.list_event_versions("client.status_changed") == ["v1"]
+    folder = registry_dir / "events" / "client"
+    (folder / "client.status_changed.v2.json").write_text(
+        (folder / "client.status_changed.v1.json").read_text()
+    )
+    reload.refresh()
+    assert registry.list_event_versions("client.status_changed") == ["v1", "v2"]
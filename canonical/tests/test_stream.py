@@ -0,0 +1,48 @@
+"""Tests for canonical.stream."""
+
+import io
+import json
+from pathlib import Path
+
+from canonical.stream import validate_ndjson
+from canonical.validator import validate_event
+
+from conftest import make_event_log
+
+
+def test_counts_and_failures_match_validate_event(tmp_path: Path):
+    path = make_event_log(tmp_path / "events.ndjson", 100)
+    failures = io.StringIO()
+    summary = validate_ndjson(path, failures, chunk_size=7)
+
+    expected = {}
+    for number, line in enumerate(path.read_bytes().splitlines(), start=1):
+        if line.strip():
+            result = validate_event(line)
+            if not result.valid:
+                expected[number] = list(result.errors)
+    records = [json.loads(line) for line in failures.getvalue().splitlines()]
+
+    assert {record["line"]: record["errors"] for record in records} == expected
+    assert summary.total == 90
+    assert summary.invalid == len(expected)
+    assert summary.valid == summary.total - summary.invalid
+    assert summary.invalid_json == 10
+    assert summary.by_event_type["client.status_changed"]["total"] == 80
+
+
+def test_chunk_size_does_not_change_the_result(tmp_path: Path):
+    path = make_event_log(tmp_path / "events.ndjson", 50)
+    results = []
+    for chunk_size in (1, 3, 1000):
+        failures = io.StringIO()
+        summary = validate_ndjson(path, failures, chunk_size=chunk_size).to_dict()
+        del summary["elapsed_seconds"], summary["events_per_second"]
+        results.append((summary, failures.getvalue()))
+    assert results[0] == results[1] == results[2]
+
+
+def test_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.ndjson"
+    path.write_bytes(b"")
+    assert validate_ndjson(path).total == 0
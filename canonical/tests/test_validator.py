@@ -0,0 +1,316 @@
+"""Tests for canonical.validator."""
+
+import copy
+import json
+import re
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Iterator
+
+import pytest
+
+from canonical import registry
+from canonical.validator import (
+    SchemaCompileError,
+    compile_schema,
+    compile_validator,
+    validate_event,
+)
+
+from conftest import make_event
+
+_PYTHON_TYPES = {
+    "string": lambda v: isinstance(v, str),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _format_ok(fmt: str, value: str) -> bool:
+    try:
+        if fmt == "date":
+            return len(value) == 10 and date.fromisoformat(value) is not None
+        if fmt == "date-time":
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            return "T" in value and parsed.tzinfo is not None
+    except ValueError:
+        return False
+    return True
+
+
+def reference_valid(schema: Any, value: Any) -> bool:
+    """Straightforward interpreter of the JSON Schema subset the canonical schemas use."""
+    if schema is False:
+        return False
+    if schema is True or not schema:
+        return True
+    types = schema.get("type")
+    if types is not None:
+        types = [types] if isinstance(types, str) else list(types)
+        if not any(_PYTHON_TYPES[t](value) for t in types):
+            return False
+    if "enum" in schema and value not in list(schema["enum"]):
+        return False
+    if "const" in schema and value != schema["const"]:
+        return False
+    if isinstance(value, str):
+        if "format" in schema and not _format_ok(schema["format"], value):
+            return False
+        if "pattern" in schema and re.search(schema["pattern"], value) is None:
+            return False
+        if len(value) < schema.get("minLength", 0):
+            return False
+        if len(value) > schema.get("maxLength", len(value)):
+            return False
+    if _PYTHON_TYPES["number"](value):
+        if value < schema.get("minimum", value) or value > schema.get("maximum", value):
+            return False
+    if isinstance(value, dict):
+        if any(key not in value for key in schema.get("required", ())):
+            return False
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        for key, item in value.items():
+            if key in properties:
+                if not reference_valid(properties[key], item):
+                    return False
+            elif not reference_valid(additional, item):
+                return False
+    if isinstance(value, list):
+        if not schema.get("minItems", 0) <= len(value) <= schema.get("maxItems", len(value)):
+            return False
+        return all(reference_valid(schema.get("items", True), item) for item in value)
+    return True
+
+
+def generate(schema: Any) -> Any:
+    """A valid instance of ``schema`` with every property present."""
+    if not isinstance(schema, Mapping):
+        return "anything"
+    if "enum" in schema:
+        return copy.deepcopy(list(schema["enum"])[0])
+    types = schema.get("type", "object")
+    kind = types if isinstance(types, str) else next(t for t in types if t != "null")
+    if kind == "object":
+        return {key: generate(prop) for key, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [generate(schema.get("items", {})) for _ in range(max(1, schema.get("minItems", 0)))]
+    if kind == "string":
+        return {"date-time": "2026-01-02T03:04:05Z", "date": "2026-01-02"}.get(
+            schema.get("format"), "text"
+        )
+    if kind in ("number", "integer"):
+        return schema.get("minimum", schema.get("maximum", 0))
+    if kind == "boolean":
+        return True
+    return None
+
+
+def _wrong_type(schema: Mapping[str, Any]) -> Any:
+    types = schema.get("type", ())
+    types = [types] if isinstance(types, str) else list(types)
+    for candidate in ("text", 12345, 1.5, True, {}, [], None):
+        if not any(_PYTHON_TYPES[t](candidate) for t in types):
+            return candidate
+    return None
+
+
+def mutations(schema: Any, value: Any) -> Iterator[Any]:
+    """Yield copies of ``value`` broken in one place each (some may stay valid)."""
+    if not isinstance(schema, Mapping):
+        return
+    if "type" in schema:
+        yield _wrong_type(schema)
+    if "enum" in schema:
+        yield "__bogus__"
+    if "format" in schema:
+        yield "not a date"
+    if "minimum" in schema:
+        yield schema["minimum"] - 1
+    if "maximum" in schema:
+        yield schema["maximum"] + 1
+    if isinstance(value, dict):
+        for key in schema.get("required", ()):
+            yield {k: v for k, v in value.items() if k != key}
+        if schema.get("additionalProperties", True) is not True:
+            yield {**value, "__extra__": 1}
+        for key, prop in schema.get("properties", {}).items():
+            for broken in mutations(prop, value.get(key)):
+                yield {**value, key: broken}
+    if isinstance(value, list) and value:
+        if "minItems" in schema:
+            yield []
+        for broken in mutations(schema.get("items"), value[0]):
+            yield [broken, *value[1:]]
+
+
+def _registry_schemas() -> list[tuple[str, str, str]]:
+    keys = [
+        ("entity", entity, version)
+        for entity in registry.list_entities()
+        for version in registry.list_entity_versions(entity)
+    ]
+    keys += [
+        ("event", event_type, version)
+        for event_type in registry.list_events()
+        for version in registry.list_event_versions(event_type)
+    ]
+    return keys + [("envelope", "event_envelope", "v1")]
+
+
+def _schema(kind: str, name: str, version: str) -> Any:
+    if kind == "entity":
+        return registry.load_entity_schema(name, version)
+    if kind == "event":
+        return registry.load_event_schema(name, version)
+    return registry.load_event_envelope_schema()
+
+
+@pytest.mark.parametrize("key", _registry_schemas(), ids=lambda key: f"{key[0]}:{key[1]}")
+def test_compiled_validator_agrees_with_schema(key):
+    schema = _schema(*key)
+    validator = compile_validator(*key)
+    instance = generate(schema)
+    assert reference_valid(schema, instance)
+    assert validator(instance) == []
+    for broken in mutations(schema, instance):
+        expected = reference_valid(schema, broken)
+        assert (validator(broken) == []) == expected, broken
+
+
+@pytest.mark.parametrize("key", _registry_schemas()[:5], ids=lambda key: f"{key[0]}:{key[1]}")
+def test_compiled_validator_agrees_with_jsonschema(key):
+    jsonschema = pytest.importorskip("jsonschema")
+    format_checker = jsonschema.FormatChecker()
+    if "date-time" not in format_checker.checkers:
+        pytest.skip("jsonschema cannot check date-time strings here")
+    schema = _schema(*key)
+    checker = jsonschema.validators.validator_for(schema)(schema, format_checker=format_checker)
+    validator = compile_validator(*key)
+    instance = generate(schema)
+    for broken in [instance, *mutations(schema, instance)]:
+        assert (validator(broken) == []) == checker.is_valid(broken), broken
+
+
+def test_validators_are_cached():
+    assert compile_validator("entity", "client") is compile_validator("entity", "client")
+    assert ("entity", "client", "v1") in registry._compiled_validators
+
+
+def test_error_messages_carry_paths():
+    validator = compile_validator("entity", "client")
+    instance = generate(registry.load_entity_schema("client"))
+    del instance["client_id"]
+    assert "$: missing required property 'client_id'" in validator(instance)
+    assert validator(instance, "$.entity") == ["$.entity: missing required property 'client_id'"]
+    assert validator([]) == ["$: expected type 'object'"]
+
+
+def test_keywords_outside_the_registry_schemas():
+    validator = compile_schema(
+        {
+            "type": "object",
+            "properties": {
+                "code": {"type": "string", "pattern": "^[A-Z]+$", "minLength": 2, "maxLength": 4},
+                "ratio": {"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 1},
+                "kind": {"const": "fixed"},
+                "note": {"type": ["string", "null"]},
+            },
+            "additionalProperties": {"type": "integer"},
+        }
+    )
+    assert validator({"code": "AB", "ratio": 0.5, "kind": "fixed", "note": None, "n": 3}) == []
+    assert validator({"code": "a", "ratio": 1, "kind": "other", "note": 1, "n": "x"}) == [
+        "$.code: shorter than 2 characters",
+        "$.code: does not match pattern '^[A-Z]+$'",
+        "$.ratio: not less than exclusive maximum 1",
+        "$.kind: value must be 'fixed'",
+        "$.note: expected type 'string', 'null'",
+        "$.n: expected type 'integer'",
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2026-01-02T03:04:05Z", "2026-01-02T03:04:05.123+05:30", "2026-01-02 03:04:05z"],
+)
+def test_date_time_format_accepts(value):
+    assert compile_schema({"type": "string", "format": "date-time"})(value) == []
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2026-01-02",
+        "2026-13-02T03:04:05Z",
+        "2026-01-02T03:04:05",
+        "2026-01-02T03:04:05Z\n",
+        "２０２６-01-02T03:04:05Z",  # full-width digits
+    ],
+)
+def test_date_time_format_rejects(value):
+    assert compile_schema({"type": "string", "format": "date-time"})(value) != []
+
+
+@pytest.mark.parametrize("schema", [{"oneOf": [{"type": "string"}]}, {"type": "tuple"}, []])
+def test_unsupported_schema_raises(schema):
+    with pytest.raises(SchemaCompileError):
+        compile_schema({"type": "object", "properties": {"x": schema}})
+
+
+@pytest.mark.parametrize("convert", [json.dumps, lambda e: json.dumps(e).encode(), dict])
+def test_validate_event_valid(convert):
+    result = validate_event(convert(make_event()))
+    assert result.valid and result.errors == ()
+    assert (result.event_type, result.event_version) == ("client.status_changed", "v1")
+    assert result.event == make_event()
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+def test_validate_event_buffers(wrap):
+    assert validate_event(wrap(json.dumps(make_event()).encode())).valid
+
+
+def test_validate_event_reports_envelope_and_payload_errors():
+    event = make_event(tenant_id=42, payload={"status": "bogus"})
+    result = validate_event(event)
+    assert not result.valid
+    assert result.errors == (
+        "$.tenant_id: expected type 'string'",
+        "$.payload: missing required property 'client_id'",
+        "$.payload.status: value is not one of ['prospect', 'active', 'inactive', "
+        "'restricted', 'closed', 'archived']",
+    )
+
+
+def test_validate_event_unknown_type():
+    result = validate_event(make_event(event_type="nope.x"))
+    assert result.errors == ("$.event_type: unknown event type 'nope.x' version 'v1'",)
+    assert result.event_type == "nope.x"
+
+
+def test_validate_event_without_type():
+    event = make_event()
+    del event["event_type"]
+    result = validate_event(event)
+    assert not result.valid and result.event is event
+    assert result.event_type is None
+    assert "$: missing required property 'event_type'" in result.errors
+
+
+@pytest.mark.parametrize("raw", ["[1]", "null", b"42"])
+def test_validate_event_not_an_object(raw):
+    result = validate_event(raw)
+    assert (result.valid, result.event) == (False, None)
+    assert result.errors == ("$: expected type 'object'",)
+
+
+@pytest.mark.parametrize("raw", [b"{", "", b"\xff"])
+def test_validate_event_invalid_json(raw):
+    result = validate_event(raw)
+    assert not result.valid and result.event is None
+    assert len(result.errors) == 1 and result.errors[0].startswith("$: invalid JSON:")
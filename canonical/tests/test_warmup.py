@@ -0,0 +1,57 @@
+"""Tests for canonical.warmup."""
+
+from pathlib import Path
+
+from canonical import registry
+from canonical.warmup import preload
+
+
+def test_preload_fills_every_cache():
+    report = preload(workers=4)
+    assert report.failed == [] and report.workers == 4
+    kinds = {artifact.kind for artifact in report.artifacts}
+    assert kinds == {"entity", "event", "envelope", "semantic"}
+    for artifact in report.artifacts:
+        key = (artifact.name, artifact.version)
+        if artifact.kind == "semantic":
+            assert key in registry._semantic_checks
+        else:
+            assert (artifact.kind, *key) in registry._compiled_validators
+    assert len(registry._entity_schemas) == len(registry.list_entities())
+    assert registry._envelope_schema is not None
+
+
+def test_preload_without_compiling():
+    report = preload(events=False, semantics=False, compile=False, workers=2)
+    assert [artifact.kind for artifact in report.artifacts] == ["entity"] * len(
+        registry.list_entities()
+    )
+    assert all(artifact.compile_seconds == 0 for artifact in report.artifacts)
+    assert registry._compiled_validators == {}
+
+
+def test_failures_are_reported_not_raised(registry_dir: Path):
+    (registry_dir / "entities" / "client.v1.json").write_text("{not json")
+    report = preload(events=False, semantics=False, workers=2)
+    (failed,) = report.failed
+    assert (failed.kind, failed.name) == ("entity", "client")
+    assert failed.error.startswith("SchemaNotFoundError: Invalid JSON")
+    assert "task.v1" in registry._entity_schemas
+
+
+def test_report_to_dict():
+    report = preload(entities=False, semantics=False, workers=1)
+    summary = report.to_dict()
+    assert summary["artifacts"] == len(report.artifacts) == len(summary["timings"])
+    assert summary["failed"] == 0 and summary["workers"] == 1
+    assert set(summary["timings"][0]) == {
+        "kind",
+        "name",
+        "version",
+        "load_ms",
+        "compile_ms",
+        "error",
+    }
+    slowest = report.slowest(3)
+    assert len(slowest) == 3
+    assert slowest[0].total_seconds >= slowest[-1].total_seconds
@@ -3,22 +3,63 @@
 This package provides Python implementations of canonical schemas that are
 shared across all services. These schemas correspond to the JSON schemas
 defined in the `canonical/` directory.
+
+The enums and helpers are plain Python; Pydantic models such as ``Actor`` are
+imported lazily on first access so that processes which only need the enum
+constants never import Pydantic.
 """
 
 from canonical_schemas.actor import (
-    Actor,
     ActorRole,
     ActorType,
     ACTOR_ROLES_BY_TYPE,
+    ACTOR_TYPE_BY_ROLE,
     validate_actor_role_type,
+    validate_actors,
 )
 
+from canonical_schemas._entity_model_names import ENTITY_MODEL_NAMES
+
+# Same as typing.TYPE_CHECKING (type checkers treat it as True) without paying
+# for importing typing
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from canonical_schemas._actor_model import Actor
+    from canonical_schemas._entity_models import *  # noqa: F403
+    from canonical_schemas.actor_cache import ActorCache, FrozenActor
+
 __version__ = "1.0.0"
 
+# Names that need Pydantic -> module that defines them
+_LAZY_EXPORTS = {
+    "Actor": "canonical_schemas._actor_model",
+    "ActorCache": "canonical_schemas.actor_cache",
+    "FrozenActor": "canonical_schemas.actor_cache",
+    # Generated entity models (Client, Task, ...)
+    **{name: "canonical_schemas._entity_models" for name in ENTITY_MODEL_NAMES},
+}
+
 __all__ = [
     "Actor",
+    "ActorCache",
+    "FrozenActor",
     "ActorRole",
     "ActorType",
     "ACTOR_ROLES_BY_TYPE",
+    "ACTOR_TYPE_BY_ROLE",
     "validate_actor_role_type",
+    "validate_actors",
+    *ENTITY_MODEL_NAMES,
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,56 @@
+"""Canonical Actor Pydantic model.
+
+Kept apart from ``canonical_schemas.actor`` so that the model (and Pydantic
+itself) is only imported when ``Actor`` is first used. Import it as
+``canonical_schemas.Actor`` or ``canonical_schemas.actor.Actor``.
+"""
+
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from canonical_schemas.actor import ActorRole, ActorType
+
+
+class Actor(BaseModel):
+    """Canonical Actor schema.
+
+    This is the standard actor representation used across all services.
+    All actor definitions should conform to this schema for consistency.
+
+    Attributes:
+        actor_id: Unique identifier for the actor
+        actor_role: Role of the actor (from ActorRole enum)
+        actor_type: Type of the actor (from ActorType enum)
+        display_name: Optional human-readable display name
+
+    Example:
+        >>> actor = Actor(
+        ...     actor_id="rm_123",
+        ...     actor_role=ActorRole.RM,
+        ...     actor_type=ActorType.HUMAN_INTERNAL,
+        ...     display_name="John Doe"
+        ... )
+    """
+
+    actor_id: str = Field(..., description="Unique identifier for the actor")
+    actor_role: ActorRole = Field(
+        ..., description="Role of the actor from canonical actor taxonomy"
+    )
+    actor_type: ActorType = Field(
+        ..., description="Type of the actor (human_internal, human_external, system, service)"
+    )
+    display_name: Optional[str] = Field(
+        None, description="Optional human-readable display name for the actor"
+    )
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
+            "example": {
+                "actor_id": "rm_123",
+                "actor_role": "rm",
+                "actor_type": "human_internal",
+                "display_name": "John Doe",
+            }
+        },
+    )
@@ -0,0 +1,17 @@
+"""Names of the generated entity models (see _entity_models).
+
+Generated by scripts/generate_entity_models.py - do not edit by hand.
+"""
+
+# Model name -> (entity, version)
+ENTITY_MODEL_NAMES = {
+    "Client": ("client", "v1"),
+    "ClientLink": ("client_link", "v1"),
+    "Document": ("document", "v1"),
+    "Interaction": ("interaction", "v1"),
+    "Product": ("product", "v1"),
+    "Relationship": ("relationship", "v1"),
+    "Riskprofile": ("riskprofile", "v1"),
+    "SuitabilityAssessment": ("suitability_assessment", "v1"),
+    "Task": ("task", "v1"),
+}
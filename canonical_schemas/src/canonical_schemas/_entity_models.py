@@ -0,0 +1,828 @@
+"""Pydantic v2 models for the canonical entity schemas.
+
+Generated by scripts/generate_entity_models.py from
+canonical/src/canonical/entities/*.json - do not edit by hand.
+
+Models are strict (no type coercion). Parse raw JSON with
+``Model.model_validate_json(data)`` or ``canonical_schemas.get_type_adapter(...)``
+so that JSON strings become ``datetime``/``date`` values in a single pass;
+date-times must carry a UTC offset, as RFC 3339 requires.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Annotated, Any, Callable, Literal
+
+from pydantic import AwareDatetime, BaseModel, BeforeValidator, ConfigDict, Field
+
+# Default of optional, non-nullable fields: an absent field reads as None, but
+# the annotation stays non-optional so an explicit null is rejected
+_ABSENT: Any = None
+
+
+def _is_none(value: Any) -> bool:
+    """Leave absent optional fields out of ``model_dump()`` output."""
+    return value is None
+
+
+def _parse_format(pattern: re.Pattern[str], fmt: str, parse: type[date]) -> Callable[[Any], Any]:
+    """Parse a string that matches ``pattern``; reject any other string."""
+
+    def check(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if pattern.match(value) is None:
+            raise ValueError(f"not a valid '{fmt}' string")
+        # fromisoformat() only takes an upper-case "T" and "Z"
+        return parse.fromisoformat(value.upper())
+
+    return check
+
+
+# String formats, checked against the patterns canonical.validator uses so
+# that a model accepts the same strings as the JSON schema (on its own,
+# Pydantic also reads digit strings as Unix timestamps). Strings are parsed
+# here, as strict mode only parses them in JSON input. A string that matches
+# but names no real moment (February 30, a ":60" leap second) still fails.
+_DATE_TIME_PATTERN = re.compile(
+    r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])[Tt ](?:[01]\d|2[0-3]):[0-5]\d:(?:[0-5]"
+    r"\d|60)(?:\.\d+)?(?:[Zz]|[+-](?:[01]\d|2[0-3]):[0-5]\d)\Z",
+    re.ASCII,
+)
+_DATE_PATTERN = re.compile(r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])\Z", re.ASCII)
+
+_DateTime = Annotated[
+    AwareDatetime, BeforeValidator(_parse_format(_DATE_TIME_PATTERN, "date-time", datetime))
+]
+_Date = Annotated[date, BeforeValidator(_parse_format(_DATE_PATTERN, "date", date))]
+
+
+ClientClientType = Literal[
+    "individual",
+    "company",
+    "family",
+    "family_office",
+    "trust",
+    "partnership",
+    "fund",
+    "spv",
+    "estate",
+    "llp",
+]
+
+
+ClientStatus = Literal[
+    "prospect",
+    "active",
+    "inactive",
+    "restricted",
+    "closed",
+    "archived",
+]
+
+
+class Client(BaseModel):
+    """Canonical client entity (v1), from entities/client.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    client_id: str
+    tenant_id: str
+    client_type: ClientClientType
+    status: ClientStatus
+    identifiers: dict[str, Any] = Field(..., description="Legal and regulatory identifiers")
+    profile: dict[str, Any] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Human-readable profile information",
+    )
+    roles: list[str] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Contextual roles played by this client",
+    )
+    attributes: dict[str, Any] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Flexible attributes",
+    )
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+ClientLinkLinkType = Literal[
+    "owns",
+    "controls",
+    "manages",
+    "beneficiary_of",
+    "guarantor_for",
+    "director_of",
+    "shareholder_of",
+    "member_of",
+    "related_to",
+    "advisor_to",
+]
+
+
+class ClientLink(BaseModel):
+    """Canonical client_link entity (v1), from entities/client_link.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    link_id: str
+    tenant_id: str
+    from_client_id: str
+    to_client_id: str
+    link_type: ClientLinkLinkType
+    roles: list[str] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Contextual roles for this link",
+    )
+    status: Literal["active", "inactive", "terminated"]
+    effective_from: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    effective_to: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    created_at: _DateTime
+
+
+DocumentDocumentType = Literal[
+    "pdf",
+    "email",
+    "note",
+    "audio",
+    "video",
+    "transcript",
+    "image",
+    "spreadsheet",
+    "presentation",
+    "ai_generated",
+    "other",
+]
+
+
+DocumentStatus = Literal[
+    "draft",
+    "under_review",
+    "active",
+    "superseded",
+    "archived",
+    "suspended",
+    "removed",
+]
+
+
+DocumentAccessScope = Literal[
+    "tenant",
+    "team",
+    "rm",
+    "client",
+    "relationship",
+    "system",
+]
+
+
+class DocumentAccess(BaseModel):
+    """Object in ``Document.access``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    scope: DocumentAccessScope
+    team_ids: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    rm_ids: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    client_ids: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    relationship_ids: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    effective_from: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    effective_to: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    read_only: bool = True
+
+
+class DocumentStorage(BaseModel):
+    """Object in ``Document.storage``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    provider: Literal["s3", "gcs", "azure_blob", "filesystem"]
+    uri: str
+    content_hash: str = Field(_ABSENT, exclude_if=_is_none)
+    size_bytes: float = Field(_ABSENT, exclude_if=_is_none)
+    mime_type: str = Field(_ABSENT, exclude_if=_is_none)
+
+
+DocumentLinksItemEntityType = Literal[
+    "client",
+    "product",
+    "portfolio",
+    "proposal",
+    "interaction",
+    "relationship",
+]
+
+
+class DocumentLinksItem(BaseModel):
+    """Object in ``Document.links`` items."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    entity_type: DocumentLinksItemEntityType
+    entity_id: str
+
+
+class DocumentProvenance(BaseModel):
+    """Object in ``Document.provenance``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    source: str
+    generated_by: str = Field(_ABSENT, exclude_if=_is_none)
+    confidence: float = Field(_ABSENT, ge=0, le=1, exclude_if=_is_none)
+
+
+class Document(BaseModel):
+    """Canonical document entity (v1), from entities/document.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    document_id: str
+    tenant_id: str
+    document_type: DocumentDocumentType
+    status: DocumentStatus = Field(..., description="Lifecycle status of the document")
+    title: str = Field(_ABSENT, exclude_if=_is_none)
+    description: str = Field(_ABSENT, exclude_if=_is_none)
+    category: str = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Category used to group documents in the UI",
+    )
+    access: DocumentAccess
+    storage: DocumentStorage
+    links: list[DocumentLinksItem] = Field(_ABSENT, exclude_if=_is_none)
+    tags: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    version: str = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Human-readable document version",
+    )
+    provenance: DocumentProvenance
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+InteractionInteractionType = Literal[
+    "meeting",
+    "call",
+    "email",
+    "chat",
+    "note",
+    "audio",
+    "video",
+    "system",
+]
+
+
+InteractionStatus = Literal[
+    "initiated",
+    "in_progress",
+    "completed",
+    "documents_attached",
+    "under_review",
+    "finalized",
+    "superseded",
+    "archived",
+    "cancelled",
+]
+
+
+InteractionParticipantsItemActorType = Literal[
+    "human_internal",
+    "human_external",
+    "system",
+    "service",
+]
+
+
+class InteractionParticipantsItem(BaseModel):
+    """Object in ``Interaction.participants`` items."""
+
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    actor_id: str = Field(..., description="User or system identifier")
+    actor_role: str = Field(..., description="Role from canonical actor taxonomy")
+    actor_type: InteractionParticipantsItemActorType = Field(..., description="Type of the actor")
+    display_name: str = Field(_ABSENT, exclude_if=_is_none)
+
+
+class InteractionProvenance(BaseModel):
+    """Object in ``Interaction.provenance``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    source: str
+    confidence: float = Field(_ABSENT, ge=0, le=1, exclude_if=_is_none)
+
+
+class Interaction(BaseModel):
+    """Canonical interaction entity (v1), from entities/interaction.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    interaction_id: str
+    tenant_id: str
+    interaction_type: InteractionInteractionType
+    status: InteractionStatus
+    participants: list[InteractionParticipantsItem] = Field(
+        ...,
+        min_length=1,
+        description="Actors involved in the interaction",
+    )
+    timestamp: _DateTime = Field(..., description="Start time of interaction")
+    duration_seconds: int = Field(_ABSENT, ge=0, exclude_if=_is_none)
+    summary: str = Field(_ABSENT, exclude_if=_is_none, description="Optional human-entered summary")
+    documents: list[str] = Field(_ABSENT, exclude_if=_is_none, description="Linked document IDs")
+    signals: dict[str, Any] = Field(_ABSENT, exclude_if=_is_none, description="Non-AI signals only")
+    tags: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    provenance: InteractionProvenance
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+ProductProductType = Literal[
+    "mutual_fund",
+    "pms",
+    "aif",
+    "bond",
+    "structured_product",
+    "insurance",
+    "reit",
+    "invit",
+    "private_credit",
+    "pe_vc_fund",
+    "cash",
+]
+
+
+ProductAssetClass = Literal[
+    "equity",
+    "debt",
+    "hybrid",
+    "alternatives",
+    "cash",
+]
+
+
+ProductStatus = Literal[
+    "under_review",
+    "active",
+    "rejected",
+    "on_hold",
+    "inactive",
+    "restricted",
+    "closed",
+]
+
+
+class ProductRisk(BaseModel):
+    """Object in ``Product.risk``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    risk_level: Literal["low", "moderate", "high", "very_high"]
+    volatility_band: str = Field(_ABSENT, exclude_if=_is_none)
+    drawdown_profile: str = Field(_ABSENT, exclude_if=_is_none)
+
+
+ProductEligibilityLiquidity = Literal[
+    "daily",
+    "monthly",
+    "quarterly",
+    "illiquid",
+]
+
+
+class ProductEligibility(BaseModel):
+    """Object in ``Product.eligibility``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    min_investment: float
+    investor_types: list[Literal["retail", "hni", "uhni", "institutional"]] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+    )
+    allowed_risk_profiles: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    lock_in_months: int = Field(_ABSENT, exclude_if=_is_none)
+    liquidity: ProductEligibilityLiquidity = Field(_ABSENT, exclude_if=_is_none)
+
+
+ProductArtefactsItemType = Literal[
+    "factsheet",
+    "brochure",
+    "sid",
+    "fund_manager_note",
+    "risk_disclosure",
+    "presentation",
+    "video",
+    "other",
+]
+
+
+class ProductArtefactsItem(BaseModel):
+    """Object in ``Product.artefacts`` items."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    artefact_id: str = Field(..., description="Document ID from Document Service")
+    type: ProductArtefactsItemType
+    version: str = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Human-readable version (e.g. v2024-Q3)",
+    )
+    effective_from: _Date = Field(_ABSENT, exclude_if=_is_none)
+    effective_to: _Date = Field(_ABSENT, exclude_if=_is_none)
+    mandatory_for_advice: bool = False
+
+
+class ProductRegulatory(BaseModel):
+    """Object in ``Product.regulatory``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    regulator: str = Field(_ABSENT, exclude_if=_is_none)
+    category_code: str = Field(_ABSENT, exclude_if=_is_none)
+    restricted_jurisdictions: list[str] = Field(_ABSENT, exclude_if=_is_none)
+
+
+class ProductProvenance(BaseModel):
+    """Object in ``Product.provenance``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    source: str
+    confidence: float = Field(_ABSENT, ge=0, le=1, exclude_if=_is_none)
+    last_verified_at: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+
+
+class Product(BaseModel):
+    """Canonical product entity (v1), from entities/product.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    product_id: str
+    tenant_id: str
+    name: str
+    product_type: ProductProductType
+    asset_class: ProductAssetClass
+    status: ProductStatus = Field(
+        ...,
+        description="Product status indicating lifecycle and workflow state",
+    )
+    issuer: str = Field(_ABSENT, exclude_if=_is_none)
+    risk: ProductRisk
+    eligibility: ProductEligibility
+    artefacts: list[ProductArtefactsItem] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Semantic references to product-related artefacts",
+    )
+    regulatory: ProductRegulatory = Field(_ABSENT, exclude_if=_is_none)
+    attributes: dict[str, Any] = Field(_ABSENT, exclude_if=_is_none)
+    tags: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    provenance: ProductProvenance
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+class RelationshipDerivedFrom(BaseModel):
+    """Metadata indicating which client or client_link triggered relationship creation"""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    entity_type: Literal["client", "client_link"] = Field(_ABSENT, exclude_if=_is_none)
+    entity_id: str = Field(_ABSENT, exclude_if=_is_none)
+
+
+RelationshipActorsItemActorType = Literal[
+    "human_internal",
+    "human_external",
+    "system",
+    "service",
+]
+
+
+class RelationshipActorsItem(BaseModel):
+    """Object in ``Relationship.actors`` items."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    actor_id: str
+    actor_role: str = Field(..., description="Role from canonical actor taxonomy")
+    actor_type: RelationshipActorsItemActorType
+    display_name: str = Field(_ABSENT, exclude_if=_is_none)
+
+
+RelationshipRelationshipType = Literal[
+    "primary_coverage",
+    "secondary_coverage",
+    "investment_specialist",
+    "product_specialist",
+    "relationship_manager",
+    "system_managed",
+]
+
+
+RelationshipStatus = Literal[
+    "prospective",
+    "active",
+    "dormant",
+    "at_risk",
+    "terminated",
+    "archived",
+]
+
+
+class RelationshipHealth(BaseModel):
+    """Object in ``Relationship.health``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    overall_score: float = Field(..., ge=0, le=100)
+    engagement_score: float = Field(_ABSENT, exclude_if=_is_none)
+    responsiveness: float = Field(_ABSENT, exclude_if=_is_none)
+    trust_signal: float = Field(_ABSENT, exclude_if=_is_none)
+    satisfaction_signal: float = Field(_ABSENT, exclude_if=_is_none)
+    trend: Literal["improving", "stable", "declining"] = Field(_ABSENT, exclude_if=_is_none)
+    last_calculated_at: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+
+
+class Relationship(BaseModel):
+    """Canonical relationship entity (v1), from entities/relationship.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    relationship_id: str
+    tenant_id: str
+    primary_client_id: str
+    scope_client_ids: list[str] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description=(
+            "Additional related client entities (family members, holding companies, SPVs, "
+            "trusts, etc.)"
+        ),
+    )
+    derived_from: RelationshipDerivedFrom = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description=(
+            "Metadata indicating which client or client_link triggered relationship creation"
+        ),
+    )
+    actors: list[RelationshipActorsItem] = Field(
+        ...,
+        min_length=1,
+        description="Actors participating in the relationship",
+    )
+    relationship_type: RelationshipRelationshipType
+    status: RelationshipStatus
+    health: RelationshipHealth
+    preferences: dict[str, Any] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Explicit client preferences",
+    )
+    engagement_signals: dict[str, Any] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Observed, non-AI signals",
+    )
+    notes: str = Field(_ABSENT, exclude_if=_is_none)
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+RiskprofileStatus = Literal[
+    "draft",
+    "under_review",
+    "active",
+    "superseded",
+    "expired",
+    "archived",
+]
+
+
+class RiskprofileRiskDimensions(BaseModel):
+    """Object in ``Riskprofile.risk_dimensions``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    risk_tolerance: str
+    risk_capacity: str
+    investment_objectives: list[str]
+    time_horizon: str
+    liquidity_needs: str = Field(_ABSENT, exclude_if=_is_none)
+    knowledge_experience: str = Field(_ABSENT, exclude_if=_is_none)
+    constraints: list[str] = Field(_ABSENT, exclude_if=_is_none)
+
+
+RiskprofileScoreRiskBand = Literal[
+    "conservative",
+    "moderate",
+    "balanced",
+    "aggressive",
+]
+
+
+class RiskprofileScore(BaseModel):
+    """Object in ``Riskprofile.score``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    numeric_score: float = Field(..., ge=0, le=100)
+    risk_band: RiskprofileScoreRiskBand
+
+
+class RiskprofileDerivedFromItem(BaseModel):
+    """Object in ``Riskprofile.derived_from`` items."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    entity_type: Literal["interaction", "document"]
+    entity_id: str
+
+
+class Riskprofile(BaseModel):
+    """Canonical riskprofile entity (v1), from entities/riskprofile.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    riskprofile_id: str
+    tenant_id: str
+    client_id: str
+    status: RiskprofileStatus
+    risk_dimensions: RiskprofileRiskDimensions
+    score: RiskprofileScore
+    derived_from: list[RiskprofileDerivedFromItem] = Field(
+        _ABSENT,
+        exclude_if=_is_none,
+        description="Supporting interactions/documents",
+    )
+    valid_from: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    valid_to: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+SuitabilityAssessmentOutcome = Literal[
+    "suitable",
+    "conditionally_suitable",
+    "unsuitable",
+]
+
+
+class SuitabilityAssessmentDerivedFromItem(BaseModel):
+    """Object in ``SuitabilityAssessment.derived_from`` items."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    entity_type: Literal["riskprofile", "product", "document"]
+    entity_id: str
+
+
+class SuitabilityAssessment(BaseModel):
+    """Canonical suitability_assessment entity (v1), from entities/suitability_assessment.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    assessment_id: str
+    tenant_id: str
+    client_id: str
+    product_id: str
+    riskprofile_id: str
+    outcome: SuitabilityAssessmentOutcome
+    reasons: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    constraints_triggered: list[str] = Field(_ABSENT, exclude_if=_is_none)
+    derived_from: list[SuitabilityAssessmentDerivedFromItem] = Field(_ABSENT, exclude_if=_is_none)
+    assessed_at: _DateTime
+
+
+TaskTaskType = Literal[
+    "review_document",
+    "review_interaction",
+    "follow_up_client",
+    "relationship_intervention",
+    "update_risk_profile",
+    "suitability_check",
+    "compliance_review",
+    "product_update_required",
+    "information_missing",
+    "client_structure_review",
+    "system_followup",
+]
+
+
+TaskStatus = Literal[
+    "open",
+    "in_progress",
+    "blocked",
+    "completed",
+    "cancelled",
+    "expired",
+    "superseded",
+    "archived",
+]
+
+
+TaskAssigneeActorType = Literal[
+    "human_internal",
+    "human_external",
+    "system",
+    "service",
+]
+
+
+class TaskAssignee(BaseModel):
+    """Object in ``Task.assignee``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    actor_id: str
+    actor_role: str
+    actor_type: TaskAssigneeActorType
+
+
+class TaskScope(BaseModel):
+    """Object in ``Task.scope``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    relationship_id: str = Field(_ABSENT, exclude_if=_is_none)
+    primary_client_id: str
+    scope_client_ids: list[str] = Field(_ABSENT, exclude_if=_is_none)
+
+
+TaskSourceEventEntityType = Literal[
+    "client",
+    "client_link",
+    "relationship",
+    "interaction",
+    "document",
+    "product",
+    "riskprofile",
+    "suitability",
+]
+
+
+class TaskSourceEvent(BaseModel):
+    """Object in ``Task.source_event``."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    event_type: str
+    entity_type: TaskSourceEventEntityType
+    entity_id: str
+
+
+class Task(BaseModel):
+    """Canonical task entity (v1), from entities/task.v1.json."""
+
+    model_config = ConfigDict(strict=True, extra="allow")
+
+    task_id: str
+    tenant_id: str
+    task_type: TaskTaskType
+    status: TaskStatus
+    priority: Literal["low", "medium", "high", "critical"]
+    assignee: TaskAssignee
+    scope: TaskScope
+    source_event: TaskSourceEvent
+    due_by: _DateTime = Field(_ABSENT, exclude_if=_is_none)
+    context: dict[str, Any] = Field(_ABSENT, exclude_if=_is_none)
+    created_at: _DateTime
+    updated_at: _DateTime
+
+
+# (entity, version) -> model
+ENTITY_MODELS: dict[tuple[str, str], type[BaseModel]] = {
+    ("client", "v1"): Client,
+    ("client_link", "v1"): ClientLink,
+    ("document", "v1"): Document,
+    ("interaction", "v1"): Interaction,
+    ("product", "v1"): Product,
+    ("relationship", "v1"): Relationship,
+    ("riskprofile", "v1"): Riskprofile,
+    ("suitability_assessment", "v1"): SuitabilityAssessment,
+    ("task", "v1"): Task,
+}
+
+__all__ = [
+    "Client",
+    "ClientLink",
+    "Document",
+    "Interaction",
+    "Product",
+    "Relationship",
+    "Riskprofile",
+    "SuitabilityAssessment",
+    "Task",
+    "ENTITY_MODELS",
+]
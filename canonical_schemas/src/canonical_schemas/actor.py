@@ -15,20 +15,26 @@ Actor Roles (by type):
                   portfolio_manager, risk_manager, compliance_officer, service_rm
 - Human External: client, prospect, external_advisor
 - System/Service: system, scheduler, workflow_engine, cds_relationship
+
+The Pydantic ``Actor`` model lives in ``canonical_schemas._actor_model`` and is
+only built on first access, so importing the enums does not import Pydantic.
 """
 
+from collections.abc import Iterable, Mapping
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+
+# typing is not imported here: it would more than double the import time of the
+# package (see scripts/check_import_time.py)
 
 
 class ActorType(str, Enum):
     """Canonical actor type enum.
-    
+
     Matches the actor_type enum values defined in canonical JSON schemas.
     All services should use these exact values for consistency.
     """
-    
+
     HUMAN_INTERNAL = "human_internal"
     HUMAN_EXTERNAL = "human_external"
     SYSTEM = "system"
@@ -37,14 +43,14 @@ class ActorType(str, Enum):
 
 class ActorRole(str, Enum):
     """Canonical actor role enum.
-    
+
     These roles are documented in relationship_service/docs/relationship_service.md
     (lines 42-62). All services should use these exact role values.
-    
+
     Note: Actor roles are distinct from permissions. Permissions are enforced
     by the Policy Engine.
     """
-    
+
     # Human Internal Roles
     RM = "rm"
     RELATIONSHIP_MANAGER = "relationship_manager"
@@ -54,12 +60,12 @@ class ActorRole(str, Enum):
     RISK_MANAGER = "risk_manager"
     COMPLIANCE_OFFICER = "compliance_officer"
     SERVICE_RM = "service_rm"
-    
+
     # Human External Roles
     CLIENT = "client"
     PROSPECT = "prospect"
     EXTERNAL_ADVISOR = "external_advisor"
-    
+
     # System/Service Roles
     SYSTEM = "system"
     SCHEDULER = "scheduler"
@@ -67,57 +73,6 @@ class ActorRole(str, Enum):
     CDS_RELATIONSHIP = "cds_relationship"
 
 
-class Actor(BaseModel):
-    """Canonical Actor schema.
-    
-    This is the standard actor representation used across all services.
-    All actor definitions should conform to this schema for consistency.
-    
-    Attributes:
-        actor_id: Unique identifier for the actor
-        actor_role: Role of the actor (from ActorRole enum)
-        actor_type: Type of the actor (from ActorType enum)
-        display_name: Optional human-readable display name
-    
-    Example:
-        >>> actor = Actor(
-        ...     actor_id="rm_123",
-        ...     actor_role=ActorRole.RM,
-        ...     actor_type=ActorType.HUMAN_INTERNAL,
-        ...     display_name="John Doe"
-        ... )
-    """
-    
-    actor_id: str = Field(
-        ...,
-        description="Unique identifier for the actor"
-    )
-    actor_role: ActorRole = Field(
-        ...,
-        description="Role of the actor from canonical actor taxonomy"
-    )
-    actor_type: ActorType = Field(
-        ...,
-        description="Type of the actor (human_internal, human_external, system, service)"
-    )
-    display_name: Optional[str] = Field(
-        None,
-        description="Optional human-readable display name for the actor"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_schema_extra = {
-            "example": {
-                "actor_id": "rm_123",
-                "actor_role": "rm",
-                "actor_type": "human_internal",
-                "display_name": "John Doe"
-            }
-        }
-
-
 # Convenience mappings for role validation by type
 ACTOR_ROLES_BY_TYPE = {
     ActorType.HUMAN_INTERNAL: [
@@ -146,21 +101,95 @@ ACTOR_ROLES_BY_TYPE = {
 }
 
 
+# Precomputed from ACTOR_ROLES_BY_TYPE: every role belongs to exactly one type.
+# The enums are str subclasses that hash like their values, so these tables also
+# answer lookups made with plain strings (e.g. from decoded JSON).
+ACTOR_TYPE_BY_ROLE: Mapping[ActorRole, ActorType] = MappingProxyType(
+    {role: actor_type for actor_type, roles in ACTOR_ROLES_BY_TYPE.items() for role in roles}
+)
+_ROLE_TYPE_PAIRS = frozenset(ACTOR_TYPE_BY_ROLE.items())
+_ROLE_VALUES = ", ".join(repr(role.value) for role in ActorRole)
+_TYPE_VALUES = ", ".join(repr(actor_type.value) for actor_type in ActorType)
+
+
 def validate_actor_role_type(actor_role: ActorRole, actor_type: ActorType) -> bool:
     """Validate that an actor role is valid for the given actor type.
-    
+
     Args:
         actor_role: The actor role to validate
         actor_type: The actor type to validate against
-        
+
     Returns:
         True if the role is valid for the type, False otherwise
-        
+
     Example:
         >>> validate_actor_role_type(ActorRole.RM, ActorType.HUMAN_INTERNAL)
         True
         >>> validate_actor_role_type(ActorRole.CLIENT, ActorType.HUMAN_INTERNAL)
         False
     """
-    valid_roles = ACTOR_ROLES_BY_TYPE.get(actor_type, [])
-    return actor_role in valid_roles
+    return (actor_role, actor_type) in _ROLE_TYPE_PAIRS
+
+
+def _actor_errors(actor: object) -> list[str]:
+    if not isinstance(actor, Mapping):
+        return ["$: expected type object"]
+    actor_id = actor.get("actor_id")
+    actor_role = actor.get("actor_role")
+    actor_type = actor.get("actor_type")
+    display_name = actor.get("display_name")
+
+    errors = []
+    if actor_id is None:
+        errors.append("$: missing required property 'actor_id'")
+    elif not isinstance(actor_id, str):
+        errors.append("$.actor_id: expected type string")
+    if actor_role is None:
+        errors.append("$: missing required property 'actor_role'")
+    elif not isinstance(actor_role, str) or actor_role not in ACTOR_TYPE_BY_ROLE:
+        errors.append(f"$.actor_role: value is not one of [{_ROLE_VALUES}]")
+    if actor_type is None:
+        errors.append("$: missing required property 'actor_type'")
+    elif not isinstance(actor_type, str) or actor_type not in ACTOR_ROLES_BY_TYPE:
+        errors.append(f"$.actor_type: value is not one of [{_TYPE_VALUES}]")
+    if display_name is not None and not isinstance(display_name, str):
+        errors.append("$.display_name: expected type string")
+    if not errors and (actor_role, actor_type) not in _ROLE_TYPE_PAIRS:
+        errors.append(
+            f"$: actor_role {str.__str__(actor_role)!r} is not valid for "
+            f"actor_type {str.__str__(actor_type)!r}"
+        )
+    return errors
+
+
+def validate_actors(actors: Iterable[Mapping[str, object]]) -> list[list[str]]:
+    """Validate many actor dicts without building ``Actor`` models.
+
+    Checks the same fields as ``Actor`` (``actor_id`` and ``display_name`` are
+    strings, ``actor_role`` and ``actor_type`` are canonical values) and, unlike
+    the model, that the role is valid for the type. Each check is a set or dict
+    lookup, so this is suitable for validating every actor in an event stream.
+
+    Args:
+        actors: Actor dicts (e.g. the ``actor`` object of decoded events)
+
+    Returns:
+        One list of error messages per actor, in input order (empty when the
+        actor is valid)
+
+    Example:
+        >>> validate_actors([
+        ...     {"actor_id": "rm_123", "actor_role": "rm", "actor_type": "human_internal"},
+        ...     {"actor_id": "c_1", "actor_role": "client", "actor_type": "system"},
+        ... ])
+        [[], ["$: actor_role 'client' is not valid for actor_type 'system'"]]
+    """
+    return [_actor_errors(actor) for actor in actors]
+
+
+def __getattr__(name: str):
+    if name == "Actor":
+        from canonical_schemas._actor_model import Actor
+
+        return Actor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
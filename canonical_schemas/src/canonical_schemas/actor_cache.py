@@ -0,0 +1,116 @@
+"""Flyweight cache of shared, immutable Actor instances.
+
+Events carry the same few thousand actors (RMs, system actors) over and over,
+so building a new ``Actor`` model for each event mostly allocates duplicates.
+``ActorCache`` returns one shared instance per distinct
+``(actor_id, actor_role, actor_type, display_name)`` and evicts the least
+recently used actors beyond ``maxsize``.
+
+Shared instances are ``FrozenActor`` models (an ``Actor`` subclass with
+``frozen=True``) so that no caller can modify an actor seen by others.
+Importing this module imports Pydantic.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Mapping
+
+from pydantic import ConfigDict
+
+from canonical_schemas._actor_model import Actor
+
+
+class FrozenActor(Actor):
+    """Immutable (and hashable) ``Actor``, as handed out by ``ActorCache``."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+def _value(field: Any) -> Any:
+    # ActorRole/ActorType members and their plain string values share one entry
+    return getattr(field, "value", field)
+
+
+class ActorCache:
+    """Bounded LRU cache returning shared ``FrozenActor`` instances.
+
+    Thread-safe. Invalid actors raise Pydantic's ``ValidationError`` exactly
+    as ``Actor(**data)`` would and are not cached.
+
+    Attributes:
+        maxsize: Maximum number of distinct actors kept
+        hits: Lookups answered from the cache
+        misses: Lookups that built a new model
+
+    Example:
+        >>> actors = ActorCache(maxsize=10_000)
+        >>> actor = actors.get(event["actor"])
+        >>> actor is actors.get(dict(event["actor"]))
+        True
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._actors: OrderedDict[tuple[Any, ...], FrozenActor] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, data: Mapping[str, Any]) -> FrozenActor:
+        """
+        Return the shared actor for an actor dict, building it on first use.
+
+        Args:
+            data: Actor fields (``actor_id``, ``actor_role``, ``actor_type`` and
+                optionally ``display_name``); other keys are ignored
+
+        Returns:
+            Shared immutable actor
+
+        Raises:
+            pydantic.ValidationError: If the actor is not valid
+        """
+        key: tuple[Any, ...] = (
+            data.get("actor_id"),
+            _value(data.get("actor_role")),
+            _value(data.get("actor_type")),
+            data.get("display_name"),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # Not a valid actor anyway - let the model report why
+            return FrozenActor(**dict(data))
+        with self._lock:
+            actor = self._actors.get(key)
+            if actor is not None:
+                self._actors.move_to_end(key)
+                self.hits += 1
+                return actor
+
+        actor = FrozenActor(
+            actor_id=key[0], actor_role=key[1], actor_type=key[2], display_name=key[3]
+        )
+        with self._lock:
+            self.misses += 1
+            # Another thread may have built the same actor meanwhile; keep the first
+            actor = self._actors.setdefault(key, actor)
+            while len(self._actors) > self.maxsize:
+                self._actors.popitem(last=False)
+        return actor
+
+    def get_many(self, items: Iterable[Mapping[str, Any]]) -> list[FrozenActor]:
+        """Return the shared actor for each actor dict, in input order."""
+        return [self.get(data) for data in items]
+
+    def clear(self) -> None:
+        """Drop all cached actors and reset the hit/miss counters."""
+        with self._lock:
+            self._actors.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._actors)
@@ -4,17 +4,34 @@ This module provides a registry pattern for accessing canonical schemas.
 Currently focused on actor schemas, but can be extended for other schema types.
 """
 
-from typing import Type, get_type_hints
-from canonical_schemas.actor import Actor, ActorRole, ActorType
+from importlib import import_module
+from typing import Any, Type, get_type_hints
+from canonical_schemas._entity_model_names import ENTITY_MODEL_NAMES
+from canonical_schemas.actor import ActorRole, ActorType
 
 
 # Registry of available schema classes
 _SCHEMA_REGISTRY: dict[str, Type] = {
-    "Actor": Actor,
     "ActorRole": ActorRole,
     "ActorType": ActorType,
 }
 
+# Schema classes imported on first lookup (name -> defining module), so that
+# importing the registry does not build the Pydantic models
+_LAZY_SCHEMAS: dict[str, str] = {
+    "Actor": "canonical_schemas._actor_model",
+    # Entity models generated by scripts/generate_entity_models.py
+    **{name: "canonical_schemas._entity_models" for name in ENTITY_MODEL_NAMES},
+}
+
+# (entity, version) -> generated model name
+_ENTITY_MODELS: dict[tuple[str, str], str] = {
+    key: name for name, key in ENTITY_MODEL_NAMES.items()
+}
+
+# TypeAdapters keyed by (entity, version, many), built on first use
+_TYPE_ADAPTERS: dict[tuple[str, str, bool], Any] = {}
+
 
 def get_schema_class(schema_name: str) -> Type:
     """
@@ -29,8 +46,14 @@ def get_schema_class(schema_name: str) -> Type:
     Raises:
         KeyError: If schema class not found in registry
     """
+    module_name = _LAZY_SCHEMAS.get(schema_name)
+    if schema_name not in _SCHEMA_REGISTRY and module_name is not None:
+        # Store before forgetting the module name, so a concurrent lookup always
+        # finds the name in one of the two dicts and a failed import can be retried
+        _SCHEMA_REGISTRY[schema_name] = getattr(import_module(module_name), schema_name)
+        _LAZY_SCHEMAS.pop(schema_name, None)
     if schema_name not in _SCHEMA_REGISTRY:
-        available = ", ".join(_SCHEMA_REGISTRY.keys())
+        available = ", ".join(list_schemas())
         raise KeyError(
             f"Schema class '{schema_name}' not found in registry. "
             f"Available schemas: {available}"
@@ -45,7 +68,7 @@ def list_schemas() -> list[str]:
     Returns:
         List of schema class names
     """
-    return sorted(_SCHEMA_REGISTRY.keys())
+    return sorted(_SCHEMA_REGISTRY.keys() | _LAZY_SCHEMAS.keys())
 
 
 def register_schema(schema_name: str, schema_class: Type) -> None:
@@ -60,11 +83,93 @@ def register_schema(schema_name: str, schema_class: Type) -> None:
         >>> from canonical_schemas.registry import register_schema
         >>> register_schema("MySchema", MySchemaClass)
     """
+    _LAZY_SCHEMAS.pop(schema_name, None)
     _SCHEMA_REGISTRY[schema_name] = schema_class
 
 
+def get_entity_model(entity: str, version: str = "v1") -> Type:
+    """
+    Get the generated Pydantic model for a canonical entity.
+    
+    Args:
+        entity: Entity name (e.g., "client", "client_link")
+        version: Schema version (default: "v1")
+        
+    Returns:
+        Strict Pydantic v2 model class (e.g., ``Client``)
+        
+    Raises:
+        KeyError: If no model was generated for the entity version
+    """
+    name = _ENTITY_MODELS.get((entity, version))
+    if name is None:
+        available = ", ".join(f"{e}.{v}" for e, v in sorted(_ENTITY_MODELS))
+        raise KeyError(
+            f"No generated model for entity '{entity}.{version}'. "
+            f"Available entities: {available}"
+        )
+    return get_schema_class(name)
+
+
+def get_type_adapter(entity: str, version: str = "v1", many: bool = False) -> Any:
+    """
+    Get the cached ``TypeAdapter`` for a canonical entity model.
+    
+    Use ``adapter.validate_json(data)`` to parse raw JSON bytes straight into
+    the model: parsing and validation happen in one pass in pydantic-core,
+    without building an intermediate ``dict``.
+    
+    Args:
+        entity: Entity name (e.g., "client")
+        version: Schema version (default: "v1")
+        many: Adapt ``list[Model]`` instead, to parse a JSON array of entities
+            in one call
+        
+    Returns:
+        ``pydantic.TypeAdapter`` for the model (or list of models)
+        
+    Raises:
+        KeyError: If no model was generated for the entity version
+        
+    Example:
+        >>> adapter = get_type_adapter("client")
+        >>> client = adapter.validate_json(message_bytes)
+    """
+    cache_key = (entity, version, many)
+    adapter = _TYPE_ADAPTERS.get(cache_key)
+    if adapter is None:
+        from pydantic import TypeAdapter
+
+        model = get_entity_model(entity, version)
+        adapter = TypeAdapter(list[model] if many else model)  # type: ignore[valid-type]
+        adapter = _TYPE_ADAPTERS.setdefault(cache_key, adapter)
+    return adapter
+
+
+def parse_entity_json(entity: str, data: bytes | str, version: str = "v1") -> Any:
+    """
+    Parse and validate a JSON document as a canonical entity.
+    
+    Args:
+        entity: Entity name (e.g., "client")
+        data: JSON document (bytes or str)
+        version: Schema version (default: "v1")
+        
+    Returns:
+        Model instance
+        
+    Raises:
+        KeyError: If no model was generated for the entity version
+        pydantic.ValidationError: If the document is not a valid entity
+    """
+    return get_type_adapter(entity, version).validate_json(data)
+
+
 __all__ = [
     "get_schema_class",
     "list_schemas",
     "register_schema",
+    "get_entity_model",
+    "get_type_adapter",
+    "parse_entity_json",
 ]
@@ -0,0 +1,99 @@
+"""Tests for canonical_schemas.actor and canonical_schemas.actor_cache."""
+
+import pytest
+from pydantic import ValidationError
+
+from canonical_schemas import (
+    ACTOR_ROLES_BY_TYPE,
+    ACTOR_TYPE_BY_ROLE,
+    Actor,
+    ActorCache,
+    ActorRole,
+    ActorType,
+    FrozenActor,
+    validate_actor_role_type,
+    validate_actors,
+)
+
+RM = {"actor_id": "rm_1", "actor_role": "rm", "actor_type": "human_internal"}
+
+
+def test_every_role_has_exactly_one_type():
+    assert set(ACTOR_TYPE_BY_ROLE) == set(ActorRole)
+    for actor_type, roles in ACTOR_ROLES_BY_TYPE.items():
+        for role in roles:
+            assert ACTOR_TYPE_BY_ROLE[role] is actor_type
+
+
+def test_role_type_check_matches_the_role_table():
+    for role in ActorRole:
+        for actor_type in ActorType:
+            expected = role in ACTOR_ROLES_BY_TYPE[actor_type]
+            assert validate_actor_role_type(role, actor_type) is expected
+            assert validate_actor_role_type(role.value, actor_type.value) is expected
+    assert validate_actor_role_type("nope", "system") is False
+
+
+def test_validate_actors():
+    assert validate_actors(
+        [
+            RM,
+            {"actor_id": "c_1", "actor_role": "client", "actor_type": "system"},
+            {"actor_id": 7, "actor_role": "boss", "display_name": 1},
+            "rm",
+        ]
+    ) == [
+        [],
+        ["$: actor_role 'client' is not valid for actor_type 'system'"],
+        [
+            "$.actor_id: expected type string",
+            "$.actor_role: value is not one of ["
+            + ", ".join(repr(role.value) for role in ActorRole)
+            + "]",
+            "$: missing required property 'actor_type'",
+            "$.display_name: expected type string",
+        ],
+        ["$: expected type object"],
+    ]
+
+
+def test_validate_actors_accepts_what_the_model_accepts():
+    for role, actor_type in ACTOR_TYPE_BY_ROLE.items():
+        actor = {"actor_id": "a", "actor_role": role.value, "actor_type": actor_type.value}
+        assert validate_actors([actor]) == [[]]
+        assert Actor(**actor).actor_role == role.value
+
+
+def test_cache_shares_one_frozen_instance():
+    cache = ActorCache()
+    actor = cache.get(RM)
+    assert isinstance(actor, FrozenActor)
+    assert cache.get(dict(RM)) is actor
+    assert cache.get({**RM, "actor_role": ActorRole.RM}) is actor
+    assert cache.get({**RM, "display_name": "Ann"}) is not actor
+    assert (cache.hits, cache.misses) == (2, 2)
+    with pytest.raises(ValidationError):
+        actor.actor_id = "other"
+    assert cache.get_many([RM, RM]) == [actor, actor]
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ActorCache(maxsize=2)
+    first = cache.get({**RM, "actor_id": "a"})
+    cache.get({**RM, "actor_id": "b"})
+    cache.get({**RM, "actor_id": "a"})
+    cache.get({**RM, "actor_id": "c"})
+    assert len(cache) == 2
+    assert cache.get({**RM, "actor_id": "a"}) is first
+    assert cache.get({**RM, "actor_id": "b"}) is not None and cache.misses == 4
+
+
+def test_invalid_actors_raise_and_are_not_cached():
+    cache = ActorCache()
+    with pytest.raises(ValidationError):
+        cache.get({"actor_id": "a", "actor_role": "boss", "actor_type": "system"})
+    with pytest.raises(ValidationError):
+        cache.get({**RM, "display_name": ["unhashable"]})
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        ActorCache(maxsize=0)
@@ -0,0 +1,119 @@
+"""Tests for the generated entity models and their TypeAdapters."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+import canonical_schemas
+from canonical_schemas import ENTITY_MODEL_NAMES
+from canonical_schemas.registry import get_entity_model, get_type_adapter, parse_entity_json
+
+ENTITIES_DIR = Path(__file__).resolve().parents[2] / "canonical" / "src" / "canonical" / "entities"
+
+
+def _schema(entity: str, version: str) -> dict[str, Any]:
+    path = ENTITIES_DIR / f"{entity}.{version}.json"
+    if not path.exists():
+        pytest.skip(f"canonical registry not found at {ENTITIES_DIR}")
+    return json.loads(path.read_text())
+
+
+def _value(schema: dict[str, Any]) -> Any:
+    """A valid JSON value for a (sub)schema."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next(t for t in kind if t != "null")
+    if kind == "object":
+        return {key: _value(prop) for key, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [_value(schema.get("items", {})) for _ in range(max(1, schema.get("minItems", 0)))]
+    if kind == "string":
+        return {"date-time": "2026-01-02T03:04:05Z", "date": "2026-01-02"}.get(
+            schema.get("format"), "text"
+        )
+    if kind in ("number", "integer"):
+        return schema.get("minimum", 0)
+    return True
+
+
+def _broken(schema: dict[str, Any], instance: dict[str, Any]):
+    """Top-level changes the JSON schema rejects, as (description, instance)."""
+    for key in schema.get("required", ()):
+        yield f"without {key}", {k: v for k, v in instance.items() if k != key}
+    for key, prop in schema["properties"].items():
+        types = prop.get("type")
+        if "null" not in (types if isinstance(types, list) else [types]):
+            yield f"{key}=null", {**instance, key: None}
+        if "enum" in prop:
+            yield f"{key} not in enum", {**instance, key: "__bogus__"}
+        if types == "string" and "enum" not in prop:
+            yield f"{key} not a string", {**instance, key: 12345}
+        if "minimum" in prop:
+            yield f"{key} below minimum", {**instance, key: prop["minimum"] - 1}
+        if prop.get("format") in ("date-time", "date"):
+            # Pydantic alone would read these as a Unix timestamp
+            yield f"{key} as a digit string", {**instance, key: "1704067200"}
+            yield f"{key} with a trailing newline", {**instance, key: instance[key] + "\n"}
+        if prop.get("format") == "date-time":
+            yield f"{key} without an offset", {**instance, key: "2024-01-01T00:00:00"}
+            yield f"{key} with an underscore", {**instance, key: "2024-01-01_00:00:00Z"}
+
+
+@pytest.mark.parametrize("name", sorted(ENTITY_MODEL_NAMES))
+def test_models_agree_with_the_json_schemas(name):
+    entity, version = ENTITY_MODEL_NAMES[name]
+    schema = _schema(entity, version)
+    instance = _value(schema)
+    model = parse_entity_json(entity, json.dumps(instance), version)
+    assert isinstance(model, getattr(canonical_schemas, name))
+    assert set(model.model_dump()) == set(instance)
+    for description, broken in _broken(schema, instance):
+        with pytest.raises(ValidationError):
+            parse_entity_json(entity, json.dumps(broken), version)
+            pytest.fail(f"{name} accepted an instance {description}")
+
+
+def test_absent_optional_fields_are_left_out():
+    schema = _schema("client", "v1")
+    instance = {key: _value(schema["properties"][key]) for key in schema["required"]}
+    client = parse_entity_json("client", json.dumps(instance))
+    assert client.profile is None
+    assert "profile" not in client.model_dump()
+    with pytest.raises(ValidationError):
+        parse_entity_json("client", json.dumps({**instance, "profile": None}))
+
+
+def test_models_are_strict():
+    schema = _schema("interaction", "v1")
+    instance = _value(schema)
+    model = get_entity_model("interaction")
+    assert model.model_validate_json(json.dumps(instance)).duration_seconds == 0
+    with pytest.raises(ValidationError, match="duration_seconds"):
+        model.model_validate_json(json.dumps({**instance, "duration_seconds": "60"}))
+
+
+def test_date_times_keep_their_offset():
+    schema = _schema("task", "v1")
+    instance = {**_value(schema), "created_at": "2024-01-01 02:00:00.5+02:00"}
+    task = parse_entity_json("task", json.dumps(instance))
+    assert task.created_at.isoformat() == "2024-01-01T02:00:00.500000+02:00"
+    assert task.created_at.utcoffset().total_seconds() == 7200
+
+
+def test_adapters_are_cached():
+    adapter = get_type_adapter("client")
+    assert get_type_adapter("client") is adapter
+    assert get_type_adapter("client", many=True) is not adapter
+    instance = _value(_schema("client", "v1"))
+    clients = get_type_adapter("client", many=True).validate_json(json.dumps([instance] * 2))
+    assert len(clients) == 2 and all(isinstance(client, BaseModel) for client in clients)
+
+
+def test_unknown_entity():
+    with pytest.raises(KeyError, match="Available entities: client.v1"):
+        get_entity_model("nope")
@@ -0,0 +1,61 @@
+"""Tests for canonical_schemas.registry."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from canonical_schemas import registry
+
+
+@pytest.fixture
+def lazy_client(monkeypatch: pytest.MonkeyPatch):
+    """Put ``Client`` back in the not-yet-imported state for one test."""
+    monkeypatch.setattr(registry, "_SCHEMA_REGISTRY", dict(registry._SCHEMA_REGISTRY))
+    monkeypatch.setattr(registry, "_LAZY_SCHEMAS", dict(registry._LAZY_SCHEMAS))
+    registry._SCHEMA_REGISTRY.pop("Client", None)
+    registry._LAZY_SCHEMAS["Client"] = "canonical_schemas._entity_models"
+
+
+def test_concurrent_first_lookups_all_succeed(lazy_client, monkeypatch: pytest.MonkeyPatch):
+    import_module = registry.import_module
+
+    def slow_import(name):
+        # Hold every thread inside the import so the lookups overlap
+        time.sleep(0.05)
+        return import_module(name)
+
+    monkeypatch.setattr(registry, "import_module", slow_import)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        classes = list(pool.map(lambda _: registry.get_schema_class("Client"), range(8)))
+    assert all(cls is classes[0] for cls in classes)
+    assert classes[0].__name__ == "Client"
+    assert "Client" not in registry._LAZY_SCHEMAS
+
+
+def test_failed_import_can_be_retried(lazy_client, monkeypatch: pytest.MonkeyPatch):
+    import_module = registry.import_module
+
+    def missing(name):
+        raise ModuleNotFoundError("No module named 'pydantic'")
+
+    monkeypatch.setattr(registry, "import_module", missing)
+    for _ in range(2):
+        with pytest.raises(ModuleNotFoundError, match="pydantic"):
+            registry.get_schema_class("Client")
+    assert "Client" in registry.list_schemas()
+
+    monkeypatch.setattr(registry, "import_module", import_module)
+    assert registry.get_schema_class("Client").__name__ == "Client"
+
+
+def test_registered_schema_replaces_lazy_entry(lazy_client):
+    registry.register_schema("Client", dict)
+    assert registry.get_schema_class("Client") is dict
+    assert "Client" not in registry._LAZY_SCHEMAS
+
+
+def test_unknown_schema():
+    with pytest.raises(KeyError, match="Schema class 'Nope' not found"):
+        registry.get_schema_class("Nope")
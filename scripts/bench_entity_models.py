@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark parsing canonical entities with the generated Pydantic models.
+
+For every generated entity model, a sample document is built from the entity's
+JSON schema and parsed three ways:
+
+- two-step: ``json.loads`` into a dict, then ``Model.model_validate(dict)``
+  (the hand-written-model approach services use today)
+- validate_json: the cached ``TypeAdapter.validate_json(bytes)``, which parses
+  and validates in one pass in pydantic-core with no intermediate dict
+- batch: one ``validate_json`` call over a JSON array of ``--batch`` documents
+
+Usage:
+    python scripts/bench_entity_models.py [--number N] [--batch N]
+
+Requires pydantic (and canonical_schemas importable, e.g. installed or on
+PYTHONPATH).
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Get repository root (parent of this script's directory)
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+ENTITIES_DIR = REPO_ROOT / "canonical" / "src" / "canonical" / "entities"
+sys.path.insert(0, str(REPO_ROOT / "canonical_schemas" / "src"))
+
+from canonical_schemas._entity_model_names import ENTITY_MODEL_NAMES  # noqa: E402
+from canonical_schemas.registry import get_entity_model, get_type_adapter  # noqa: E402
+
+_FORMAT_SAMPLES = {"date-time": "2024-01-15T10:30:00Z", "date": "2024-01-15"}
+
+
+def sample(schema: dict[str, Any], name: str = "value") -> Any:
+    """Build a document that satisfies ``schema``, filling optional fields too."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties")
+        if not properties:
+            return {"key": "value"}
+        return {prop: sample(prop_schema, prop) for prop, prop_schema in properties.items()}
+    if kind == "array":
+        items = schema.get("items", {"type": "string"})
+        return [sample(items, name) for _ in range(max(2, schema.get("minItems", 0)))]
+    if kind == "string":
+        return _FORMAT_SAMPLES.get(schema.get("format"), f"{name}-123")
+    if kind in ("number", "integer"):
+        low, high = schema.get("minimum", 0), schema.get("maximum", 100)
+        middle = (low + high) / 2
+        return int(middle) if kind == "integer" else float(middle)
+    if kind == "boolean":
+        return True
+    return None
+
+
+def best_of(function: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Best time per call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - started)
+    return best / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=2000, help="Parses per timing run (default: 2000)"
+    )
+    parser.add_argument(
+        "--batch", type=int, default=100, help="Documents per JSON array (default: 100)"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'entity':<24} {'two-step us':>12} {'validate_json us':>17} {'batch us/doc':>13}")
+    for entity, version in sorted(ENTITY_MODEL_NAMES.values()):
+        with open(ENTITIES_DIR / f"{entity}.{version}.json", "r") as f:
+            document = sample(json.load(f))
+        raw = json.dumps(document).encode()
+        raw_batch = json.dumps([document] * args.batch).encode()
+
+        model = get_entity_model(entity, version)
+        adapter = get_type_adapter(entity, version)
+        batch_adapter = get_type_adapter(entity, version, many=True)
+
+        # Both paths must agree before timing them
+        two_step = model.model_validate(json.loads(raw), strict=False)
+        if two_step != adapter.validate_json(raw):
+            print(f"{entity}: two-step and validate_json results differ", file=sys.stderr)
+            return 1
+
+        two_step_us = best_of(
+            lambda: model.model_validate(json.loads(raw), strict=False), args.number
+        )
+        direct_us = best_of(lambda: adapter.validate_json(raw), args.number)
+        batch_us = (
+            best_of(
+                lambda: batch_adapter.validate_json(raw_batch), max(1, args.number // args.batch)
+            )
+            / args.batch
+        )
+        print(f"{entity:<24} {two_step_us:>12.2f} {direct_us:>17.2f} {batch_us:>13.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark the canonical JSON backends on real schema and event shapes.
+
+For every installed backend (orjson, msgspec, stdlib json), times:
+
+- schema load: parsing every entity and event schema under
+  ``canonical/src/canonical/{entities,events}`` (file contents read up front)
+- envelope decode: ``loads`` of one sample event per event schema, each a full
+  envelope whose payload is built from the event's JSON schema
+- event encode: ``dumps`` of the same events
+
+Usage:
+    python scripts/bench_json_backends.py [--number N]
+
+Install orjson and/or msgspec to compare them with the standard library.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Get repository root (parent of this script's directory)
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+PACKAGE_DIR = REPO_ROOT / "canonical" / "src" / "canonical"
+sys.path.insert(0, str(PACKAGE_DIR.parent))
+
+from canonical import codec, registry  # noqa: E402
+
+_FORMAT_SAMPLES = {"date-time": "2024-01-15T10:30:00Z", "date": "2024-01-15"}
+
+
+def sample(schema: dict[str, Any], name: str = "value") -> Any:
+    """Build a document that satisfies ``schema``, filling optional fields too."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties")
+        if not properties:
+            return {"key": "value"}
+        return {prop: sample(prop_schema, prop) for prop, prop_schema in properties.items()}
+    if kind == "array":
+        items = schema.get("items", {"type": "string"})
+        return [sample(items, name) for _ in range(max(3, schema.get("minItems", 0)))]
+    if kind == "string":
+        return _FORMAT_SAMPLES.get(schema.get("format"), f"{name}-0f8fad5b-d9cb-469f-a165")
+    if kind in ("number", "integer"):
+        low, high = schema.get("minimum", 0), schema.get("maximum", 1000)
+        middle = (low + high) / 2
+        return int(middle) if kind == "integer" else middle + 0.25
+    if kind == "boolean":
+        return True
+    return None
+
+
+def sample_events() -> list[dict[str, Any]]:
+    """One envelope per event schema version, with a schema-shaped payload."""
+    events = []
+    for event_type in registry.list_events():
+        for version in registry.list_event_versions(event_type):
+            domain = event_type.split(".")[0]
+            events.append(
+                {
+                    "event_id": "0f8fad5b-d9cb-469f-a165-70867728950e",
+                    "event_type": event_type,
+                    "event_version": version,
+                    "source": {"service": f"cds_{domain}", "environment": "prod"},
+                    "tenant_id": "tenant-001",
+                    "entity": {"entity_type": "client", "entity_id": "client-123"},
+                    "actor": {
+                        "actor_id": "rm-42",
+                        "actor_role": "rm",
+                        "actor_type": "human_internal",
+                    },
+                    "occurred_at": "2024-01-15T10:30:00Z",
+                    "payload": sample(registry.load_event_schema(event_type, version)),
+                }
+            )
+    return events
+
+
+def best_of(function: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Best time per call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - started)
+    return best / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=200, help="Passes over the corpus per run (default: 200)"
+    )
+    args = parser.parse_args(argv)
+
+    schema_files = sorted(PACKAGE_DIR.glob("entities/*.json"))
+    schema_files += sorted(PACKAGE_DIR.glob("events/**/*.json"))
+    schemas = [path.read_bytes() for path in schema_files]
+    events = sample_events()
+    encoded = [json.dumps(event).encode() for event in events]
+    size = sum(len(raw) for raw in encoded) / len(encoded)
+    print(
+        f"{len(schemas)} schema files, {len(events)} events "
+        f"(mean {size:.0f} bytes), {args.number} passes"
+    )
+
+    results: dict[str, tuple[float, float, float]] = {}
+    for backend in codec.BACKENDS:
+        try:
+            codec.set_json_backend(backend)
+        except ImportError:
+            print(f"{backend}: not installed")
+            continue
+        loads, dumps = codec.loads, codec.dumps
+        # Every backend must decode to the same structures before timing it
+        if [loads(raw) for raw in encoded] != events:
+            print(f"{backend}: decoded events differ from the stdlib", file=sys.stderr)
+            return 1
+        results[backend] = (
+            best_of(lambda: [loads(raw) for raw in schemas], args.number) / len(schemas),
+            best_of(lambda: [loads(raw) for raw in encoded], args.number) / len(encoded),
+            best_of(lambda: [dumps(event) for event in events], args.number) / len(events),
+        )
+
+    baseline = results["json"]
+    header = ("schema load us", "envelope decode us", "event encode us")
+    print(f"{'backend':<10} {header[0]:>15} {header[1]:>19} {header[2]:>16}")
+    for backend, timings in results.items():
+        cells = [
+            f"{value:>{width}.2f} ({base / value:.1f}x)"
+            for value, base, width in zip(timings, baseline, (8, 12, 9))
+        ]
+        print(f"{backend:<10} {' '.join(cells)}")
+    codec.set_json_backend("auto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
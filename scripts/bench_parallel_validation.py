@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark multi-process NDJSON validation against the single-process stream.
+
+Writes a synthetic event log (sample events from every event schema, see
+``bench_json_backends.sample_events``) and validates it with
+``validate_ndjson`` and with ``validate_parallel`` on 1, 2, 4, ... workers up to
+the number of CPU cores, reporting throughput, speedup and parallel efficiency
+(speedup / workers).
+
+Usage:
+    python scripts/bench_parallel_validation.py [--events N] [--max-workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_json_backends import sample_events  # noqa: E402
+
+from canonical.parallel import validate_parallel  # noqa: E402
+from canonical.stream import validate_ndjson  # noqa: E402
+from canonical.warmup import preload  # noqa: E402
+
+
+def write_log(path: Path, count: int) -> None:
+    """Write ``count`` events, cycling through the sample events."""
+    events = sample_events()
+    with open(path, "w") as f:
+        for i in range(count):
+            event = events[i % len(events)]
+            event["event_id"] = f"evt-{i:09d}"
+            f.write(json.dumps(event) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--events", type=int, default=400_000, help="Events in the log (default: 400000)"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Largest worker count to try (default: CPU cores)",
+    )
+    args = parser.parse_args(argv)
+
+    preload(entities=False, semantics=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "events.ndjson"
+        write_log(log, args.events)
+        size_mb = log.stat().st_size / 1e6
+        print(f"{args.events} events, {size_mb:.0f} MB, {os.cpu_count()} CPU cores")
+
+        baseline = validate_ndjson(log)
+        print(f"{'stream':<10} {baseline.events_per_second:>12.0f} events/s")
+
+        worker_counts = []
+        workers = 1
+        while workers <= args.max_workers:
+            worker_counts.append(workers)
+            workers *= 2
+        if worker_counts[-1] != args.max_workers:
+            worker_counts.append(args.max_workers)
+
+        print(f"{'workers':<10} {'events/s':>12} {'speedup':>8} {'efficiency':>11}")
+        for workers in worker_counts:
+            summary = validate_parallel(log, workers=workers)
+            if summary.total != baseline.total or summary.invalid != baseline.invalid:
+                print(f"{workers} workers: counts differ from the stream", file=sys.stderr)
+                return 1
+            speedup = summary.events_per_second / baseline.events_per_second
+            print(
+                f"{workers:<10} {summary.events_per_second:>12.0f} {speedup:>7.2f}x "
+                f"{speedup / workers:>10.0%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the canonical registry, validation and actor hot paths.
+
+Benchmarks (time per operation, in microseconds):
+
+- ``registry.*``: ``load_entity_schema``, ``load_event_schema``,
+  ``load_event_envelope_schema`` and ``load_semantic_constraints`` over every
+  schema, cold (registry caches emptied first, so each call reads, parses and
+  freezes the file) and warm; ``list_events()`` cold (catalog rebuilt from the
+  directory tree) and warm
+- ``validation.*``: ``validate_event`` (envelope plus payload) on one
+  generated event per schema in ``events/``, valid and invalid, and
+  ``validate_events_batch`` on the same events
+- ``semantics.*``: the compiled semantic checks on generated entities
+- ``actor.*``: ``validate_actor_role_type`` over every role and type pair,
+  ``validate_actors`` and, with Pydantic installed, ``Actor`` construction and
+  ``ActorCache.get``
+
+Payloads are generated from the JSON schemas with a fixed seed: required and
+most optional fields, enum values, formatted dates, bounded numbers and
+arrays of several items. Each benchmark is calibrated to run for at least
+``--min-time`` seconds per repeat and the best and median of ``--repeat``
+repeats are recorded. Every repeat also times a fixed reference workload
+(plain dict, list and ``json`` work) and the best benchmark time is recorded
+relative to the best reference time as ``normalized``, which factors out most
+of the difference in speed between machines and runs.
+
+Usage:
+    python scripts/bench_suite.py [--output results.json] [--filter registry.]
+    python scripts/bench_suite.py --check   # compare with scripts/bench_baseline.json
+    python scripts/bench_suite.py --update-baseline
+
+Results are written as JSON (benchmarks plus Python, platform and JSON backend
+details). With ``--check`` each benchmark's ``normalized`` time is compared
+with the baseline; one that is more than ``threshold`` (a fraction, from the
+baseline file or ``--threshold``) slower is measured again up to ``--retries``
+times, and the exit status is 1 if it is still slower. Timings still vary with
+the Python version and JSON backend, so compare against a baseline recorded
+in the same environment (``--update-baseline``); ``--check`` warns when the
+baseline's Python version or JSON backend differs from the current one.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+# Get repository root (parent of this script's directory)
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(REPO_ROOT / "canonical" / "src"))
+sys.path.insert(0, str(REPO_ROOT / "canonical_schemas" / "src"))
+
+from canonical import codec, registry  # noqa: E402
+from canonical.batch import validate_events_batch  # noqa: E402
+from canonical.constraints import compile_semantics  # noqa: E402
+from canonical.validator import validate_event  # noqa: E402
+from canonical_schemas.actor import (  # noqa: E402
+    ACTOR_ROLES_BY_TYPE,
+    ActorRole,
+    ActorType,
+    validate_actor_role_type,
+    validate_actors,
+)
+
+SEMANTICS_DIR = REPO_ROOT / "canonical" / "src" / "canonical" / "semantics"
+BASELINE_FILE = Path(__file__).parent / "bench_baseline.json"
+DEFAULT_THRESHOLD = 0.5
+SEED = 20240115
+
+_WORDS = (
+    "portfolio review quarterly client meeting pension transfer income growth "
+    "allocation mandate rebalance advisory discretionary update follow-up"
+).split()
+_EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+Benchmark = tuple[Callable[[], Any], int]
+
+
+def generate(schema: dict[str, Any], rng: random.Random, name: str = "value") -> Any:
+    """Build a realistic document satisfying ``schema`` (most optional fields filled)."""
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object":
+        properties = schema.get("properties")
+        if not properties:
+            return {"source": rng.choice(_WORDS), "count": rng.randint(1, 50)}
+        required = set(schema.get("required", ()))
+        return {
+            prop: generate(prop_schema, rng, prop)
+            for prop, prop_schema in properties.items()
+            if prop in required or rng.random() < 0.8
+        }
+    if kind == "array":
+        low = max(1, schema.get("minItems", 0))
+        count = rng.randint(low, max(low, schema.get("maxItems", low + 4)))
+        return [generate(schema.get("items", {"type": "string"}), rng, name) for _ in range(count)]
+    if kind == "string":
+        fmt = schema.get("format")
+        if fmt in ("date-time", "date"):
+            moment = _EPOCH + datetime.timedelta(seconds=rng.randrange(365 * 86400))
+            if fmt == "date":
+                return moment.date().isoformat()
+            return moment.isoformat().replace("+00:00", "Z")
+        if name.endswith("_id") or name.endswith("_ids"):
+            return f"{name.split('_')[0]}-{rng.getrandbits(64):016x}"
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 8)))
+    if kind in ("number", "integer"):
+        low, high = schema.get("minimum", 0), schema.get("maximum", 1_000_000)
+        return rng.randint(int(low), int(high)) if kind == "integer" else rng.uniform(low, high)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    return None
+
+
+def generate_events(rng: random.Random) -> list[dict[str, Any]]:
+    """One envelope per event schema version, with a generated payload."""
+    envelope = registry.load_event_envelope_schema()
+    events = []
+    for event_type in registry.list_events():
+        for version in registry.list_event_versions(event_type):
+            event = generate(envelope, rng)
+            event.update(
+                event_type=event_type,
+                event_version=version,
+                payload=generate(registry.load_event_schema(event_type, version), rng),
+            )
+            events.append(event)
+    return events
+
+
+def _clear_caches() -> None:
+    """Empty the registry caches so the next load reads the file again."""
+    registry._entity_schemas.clear()
+    registry._event_schemas.clear()
+    registry._semantic_constraints.clear()
+    registry._envelope_schema = None
+    registry._missing.clear()
+    # Cold loads include reading the prebuilt bundle, when there is one
+    registry._bundle = None
+    registry._bundle_checked = False
+
+
+def build_benchmarks(rng: random.Random) -> dict[str, Benchmark]:
+    """Benchmark name -> (function running ``ops`` operations, ops)."""
+    entities = [(e, v) for e in registry.list_entities() for v in registry.list_entity_versions(e)]
+    event_keys = [(t, v) for t in registry.list_events() for v in registry.list_event_versions(t)]
+    semantic_files = sorted(SEMANTICS_DIR.glob("*.semantic.yaml"))
+    semantic_keys = [tuple(path.name.split(".")[:2]) for path in semantic_files]
+
+    def load_all(load: Callable[..., Any], keys: list[tuple[str, str]], cold: bool):
+        def run() -> None:
+            if cold:
+                _clear_caches()
+            for key in keys:
+                load(*key)
+
+        return run
+
+    def list_events(cold: bool):
+        def run() -> None:
+            if cold:
+                registry._invalidate_catalog()
+            registry.list_events()
+
+        return run
+
+    benchmarks: dict[str, Benchmark] = {}
+    for cold in (True, False):
+        temperature = "cold" if cold else "warm"
+        benchmarks[f"registry.load_entity_schema.{temperature}"] = (
+            load_all(registry.load_entity_schema, entities, cold),
+            len(entities),
+        )
+        benchmarks[f"registry.load_event_schema.{temperature}"] = (
+            load_all(registry.load_event_schema, event_keys, cold),
+            len(event_keys),
+        )
+        benchmarks[f"registry.load_event_envelope_schema.{temperature}"] = (
+            load_all(registry.load_event_envelope_schema, [()], cold),
+            1,
+        )
+        benchmarks[f"registry.load_semantic_constraints.{temperature}"] = (
+            load_all(registry.load_semantic_constraints, semantic_keys, cold),
+            len(semantic_keys),
+        )
+        benchmarks[f"registry.list_events.{temperature}"] = (list_events(cold), 1)
+
+    events = generate_events(rng)
+    raw_events = [codec.dumps(event) for event in events]
+    invalid_events = []
+    for event in events:
+        broken = dict(event, payload=dict(event["payload"]))
+        # A wrong envelope type and a payload without its required fields
+        broken["tenant_id"] = 42
+        required = registry.load_event_schema(event["event_type"], event["event_version"])
+        for prop in required.get("required", ())[:2]:
+            broken["payload"].pop(prop, None)
+        invalid_events.append(codec.dumps(broken))
+    for raw in raw_events:
+        errors = validate_event(raw).errors
+        if errors:
+            raise RuntimeError(f"Generated event is invalid: {errors}")
+
+    def validate_all(raws: list[bytes]):
+        def run() -> None:
+            for raw in raws:
+                validate_event(raw)
+
+        return run
+
+    benchmarks["validation.validate_event.valid"] = (validate_all(raw_events), len(raw_events))
+    benchmarks["validation.validate_event.invalid"] = (
+        validate_all(invalid_events),
+        len(invalid_events),
+    )
+    benchmarks["validation.validate_events_batch"] = (
+        lambda: validate_events_batch(raw_events),
+        len(raw_events),
+    )
+
+    for entity, version in semantic_keys:
+        check = compile_semantics(entity, version)
+        schema = registry.load_entity_schema(entity, version)
+        records = [generate(schema, rng) for _ in range(100)]
+
+        def check_all(check=check, records=records) -> None:
+            for record in records:
+                check(record)
+
+        benchmarks[f"semantics.{entity}.{version}"] = (check_all, len(records))
+
+    pairs = [(role, actor_type) for role in ActorRole for actor_type in ActorType]
+    string_pairs = [(role.value, actor_type.value) for role, actor_type in pairs]
+    actors = [
+        {
+            "actor_id": f"{actor_type.value}-{i}",
+            "actor_role": rng.choice(roles).value,
+            "actor_type": actor_type.value,
+            "display_name": " ".join(rng.choice(_WORDS) for _ in range(2)),
+        }
+        for i, (actor_type, roles) in enumerate(
+            rng.choice(list(ACTOR_ROLES_BY_TYPE.items())) for _ in range(200)
+        )
+    ]
+
+    def role_type(pairs=pairs) -> None:
+        for role, actor_type in pairs:
+            validate_actor_role_type(role, actor_type)
+
+    benchmarks["actor.validate_actor_role_type.enum"] = (role_type, len(pairs))
+    benchmarks["actor.validate_actor_role_type.str"] = (
+        lambda: role_type(string_pairs),
+        len(string_pairs),
+    )
+    benchmarks["actor.validate_actors"] = (lambda: validate_actors(actors), len(actors))
+
+    try:
+        from canonical_schemas.actor import Actor
+        from canonical_schemas.actor_cache import ActorCache
+    except ImportError:
+        # Pydantic is not installed: the Actor benchmarks are reported as skipped
+        return benchmarks
+
+    def construct() -> None:
+        for actor in actors:
+            Actor(**actor)
+
+    cache = ActorCache()
+    benchmarks["actor.Actor"] = (construct, len(actors))
+    benchmarks["actor.ActorCache.get"] = (lambda: [cache.get(a) for a in actors], len(actors))
+    return benchmarks
+
+
+def reference() -> None:
+    """Fixed workload each benchmark is normalized against."""
+    table = {}
+    for i in range(200):
+        table[str(i)] = [i, i * 2.5, {"key": i}]
+    json.dumps(table)
+    sorted(table, key=len)
+
+
+def _calibrate(timer: timeit.Timer, min_time: float) -> int:
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return number
+
+
+def measure(function: Callable[[], Any], ops: int, repeat: int, min_time: float) -> dict[str, Any]:
+    """Calibrated best and median time per operation, in microseconds."""
+    timer, reference_timer = timeit.Timer(function), timeit.Timer(reference)
+    number = _calibrate(timer, min_time)
+    reference_number = _calibrate(reference_timer, min_time)
+    timings, reference_timings = [], []
+    # Interleaved, so both see the same machine load
+    for _ in range(repeat):
+        timings.append(timer.timeit(number) / (number * ops) * 1e6)
+        reference_timings.append(reference_timer.timeit(reference_number) / reference_number * 1e6)
+    return {
+        "best_us": round(min(timings), 4),
+        "median_us": round(statistics.median(timings), 4),
+        "normalized": round(min(timings) / min(reference_timings), 6),
+        "reference_us": round(min(reference_timings), 4),
+        "ops": ops,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def environment() -> dict[str, Any]:
+    """Details that make results comparable (or not)."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": codec.get_json_backend(),
+        "date": datetime.date.today().isoformat(),
+    }
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    remeasure: Callable[[str], dict[str, Any]],
+    retries: int,
+) -> list[str]:
+    """Print a comparison table; return the names of regressed benchmarks."""
+    regressions = []
+    base = baseline["benchmarks"]
+    print(f"\n{'benchmark':<46} {'baseline':>10} {'now':>10} {'change':>8}  (normalized)")
+    for name, result in results["benchmarks"].items():
+        if name not in base:
+            print(f"{name:<46} {'-':>10} {result['normalized']:>10.4g} {'new':>8}")
+            continue
+        before = base[name]["normalized"]
+        for _ in range(retries):
+            if result["normalized"] / before - 1 <= threshold:
+                break
+            # Often a noisy repeat rather than a regression: measure again
+            retry = remeasure(name)
+            if retry["normalized"] < result["normalized"]:
+                result = results["benchmarks"][name] = retry
+        change = result["normalized"] / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<46} {before:>10.4g} {result['normalized']:>10.4g} {change:>+7.0%}{flag}")
+    for name in sorted(base.keys() - results["benchmarks"].keys()):
+        print(f"{name:<46} {base[name]['normalized']:>10.4g} {'-':>10} {'skipped':>8}")
+    return regressions
+
+
+def environment_mismatches(current: dict[str, Any], recorded: dict[str, Any]) -> list[str]:
+    """Environment details that differ from the baseline's and skew the comparison."""
+    return [
+        f"{key}: baseline {recorded.get(key)}, now {current[key]}"
+        for key in ("python", "json_backend")
+        if recorded.get(key) != current[key]
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this")
+    parser.add_argument("--repeat", type=int, default=15, help="Timing repeats (default: 15)")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.02,
+        help="Minimum seconds per repeat, used to calibrate loop counts (default: 0.02)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_FILE,
+        help=f"Baseline file (default: {BASELINE_FILE.relative_to(REPO_ROOT)})",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 if a benchmark regressed past the threshold"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help=f"Allowed slowdown as a fraction (default: the baseline's, else {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Re-measurements of a benchmark past the threshold (default: 2)",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the results as the new baseline"
+    )
+    args = parser.parse_args(argv)
+
+    benchmarks = build_benchmarks(random.Random(SEED))
+    skipped = []
+    if not any(name.startswith("actor.Actor") for name in benchmarks):
+        skipped.append("actor.Actor* (pydantic not installed)")
+
+    def run(name: str) -> dict[str, Any]:
+        function, ops = benchmarks[name]
+        return measure(function, ops, args.repeat, args.min_time)
+
+    results: dict[str, Any] = {"environment": environment(), "benchmarks": {}}
+    print(f"{'benchmark':<46} {'best us':>10} {'median us':>10} {'normalized':>11}")
+    for name in benchmarks:
+        if args.filter not in name:
+            continue
+        result = results["benchmarks"][name] = run(name)
+        print(
+            f"{name:<46} {result['best_us']:>10.3f} {result['median_us']:>10.3f} "
+            f"{result['normalized']:>11.4g}"
+        )
+    for name in skipped:
+        print(f"skipped: {name}")
+    results["skipped"] = skipped
+
+    status = 0
+    if args.update_baseline:
+        threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+        args.baseline.write_text(json.dumps({"threshold": threshold, **results}, indent=2) + "\n")
+        print(f"\nWrote baseline {args.baseline}")
+    elif args.check:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --update-baseline", file=sys.stderr)
+            return 1
+        baseline = json.loads(args.baseline.read_text())
+        mismatches = environment_mismatches(results["environment"], baseline.get("environment", {}))
+        if mismatches:
+            print(
+                "Warning: the baseline was recorded in a different environment, so timings "
+                f"may not be comparable ({'; '.join(mismatches)}); re-record it with "
+                "--update-baseline",
+                file=sys.stderr,
+            )
+        results["environment_mismatches"] = mismatches
+        baseline["benchmarks"] = {
+            name: result for name, result in baseline["benchmarks"].items() if args.filter in name
+        }
+        threshold = args.threshold
+        if threshold is None:
+            threshold = baseline.get("threshold", DEFAULT_THRESHOLD)
+        # Regressed benchmarks are measured again; results keep the retried timings
+        regressions = compare(results, baseline, threshold, run, args.retries)
+        results["check"] = {"threshold": threshold, "regressions": regressions}
+        if regressions:
+            print(
+                f"\n{len(regressions)} benchmark(s) more than {threshold:.0%} slower than "
+                f"the baseline: {', '.join(regressions)}",
+                file=sys.stderr,
+            )
+            status = 1
+        else:
+            print(f"\nNo benchmark more than {threshold:.0%} slower than the baseline")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Check the import time of the canonical packages against a budget.
+
+Each package is imported in a fresh interpreter with ``python -X importtime``
+and the best cumulative time over several runs is compared with its budget.
+The script also checks that heavy dependencies (PyYAML, Pydantic) are not
+imported until they are actually used.
+
+Usage:
+    python scripts/check_import_time.py [--runs N]
+
+Exits with status 1 if any budget is exceeded or a deferred module was
+imported eagerly.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Get repository root (parent of this script's directory)
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+SOURCE_DIRS = [
+    REPO_ROOT / "canonical" / "src",
+    REPO_ROOT / "canonical_schemas" / "src",
+]
+
+# Module -> import time budget in milliseconds (cumulative, including any
+# standard library modules it pulls in)
+BUDGETS_MS = {
+    "canonical": 20.0,
+    "canonical_schemas": 30.0,
+}
+
+# Module -> modules that must not be imported by a bare ``import <module>``
+DEFERRED_MODULES = {
+    "canonical": [
+        "yaml",
+        "pydantic",
+        "canonical.registry",
+        "canonical.validator",
+        "canonical._generated",
+    ],
+    "canonical_schemas": [
+        "pydantic",
+        "canonical_schemas._actor_model",
+        "canonical_schemas.actor_cache",
+        "canonical_schemas._entity_models",
+    ],
+}
+
+
+def _environment() -> dict[str, str]:
+    env = dict(os.environ)
+    paths = [str(path) for path in SOURCE_DIRS]
+    if env.get("PYTHONPATH"):
+        paths.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(paths)
+    return env
+
+
+def measure_import_ms(module: str, runs: int) -> float:
+    """Return the best cumulative import time of ``module`` over ``runs`` fresh interpreters."""
+    best = float("inf")
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=_environment(),
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                best = min(best, int(parts[1]) / 1000)
+    return best
+
+
+def eagerly_imported(module: str, deferred: list[str]) -> list[str]:
+    """Return the modules in ``deferred`` that a bare ``import module`` pulls in."""
+    code = (
+        "import sys\n"
+        f"import {module}\n"
+        f"print('\\n'.join(name for name in {deferred!r} if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=_environment(),
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreters per module (default: 5)"
+    )
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, budget in BUDGETS_MS.items():
+        elapsed = measure_import_ms(module, args.runs)
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        failed |= elapsed > budget
+        print(f"{module}: {elapsed:.1f} ms (budget {budget:.1f} ms) {status}")
+
+        eager = eagerly_imported(module, DEFERRED_MODULES.get(module, []))
+        for name in eager:
+            print(f"  {name} imported eagerly by 'import {module}'")
+        failed |= bool(eager)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Generate the canonical_schemas Pydantic models from the entity JSON schemas.
+
+Reads ``canonical/src/canonical/entities/<entity>.<version>.json`` and writes
+two modules into ``canonical_schemas/src/canonical_schemas/``:
+
+- ``_entity_models.py``: strict Pydantic v2 models, one per entity version
+  (``Client`` for client.v1, ``ClientV2`` for client.v2, ...) plus a model per
+  nested object
+- ``_entity_model_names.py``: model name -> (entity, version), plain Python so
+  the schema registry can list the models without importing Pydantic
+
+Usage:
+    python scripts/generate_entity_models.py            # regenerate
+    python scripts/generate_entity_models.py --check    # fail if out of date
+
+``--check`` exits with status 1 if the checked-in modules differ from what the
+current JSON schemas produce; run it in CI.
+"""
+
+import argparse
+import json
+import keyword
+import sys
+from pathlib import Path
+from typing import Any
+
+# Get repository root (parent of this script's directory)
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(REPO_ROOT / "canonical" / "src"))
+
+from canonical.validator import _FORMAT_PATTERNS  # noqa: E402
+
+ENTITIES_DIR = REPO_ROOT / "canonical" / "src" / "canonical" / "entities"
+OUTPUT_DIR = REPO_ROOT / "canonical_schemas" / "src" / "canonical_schemas"
+MODELS_FILE = "_entity_models.py"
+NAMES_FILE = "_entity_model_names.py"
+
+LINE_LENGTH = 100
+
+# Attribute names a Pydantic field must not shadow; such properties get a
+# trailing underscore and an alias
+_RESERVED = {
+    "construct",
+    "copy",
+    "dict",
+    "fields",
+    "from_orm",
+    "json",
+    "parse_file",
+    "parse_obj",
+    "parse_raw",
+    "schema",
+    "schema_json",
+    "update_forward_refs",
+    "validate",
+}
+
+_SCALARS = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+}
+# String format -> (annotation, Python type, pattern constant, parser); the
+# generated annotation checks the string against canonical.validator's pattern
+_FORMATS = {
+    "date-time": ("_DateTime", "AwareDatetime", "_DATE_TIME_PATTERN", "datetime"),
+    "date": ("_Date", "date", "_DATE_PATTERN", "date"),
+}
+
+# JSON Schema keyword -> Field() argument
+_CONSTRAINTS = {
+    "minimum": "ge",
+    "maximum": "le",
+    "minItems": "min_length",
+}
+
+_HEADER = '''"""Pydantic v2 models for the canonical entity schemas.
+
+Generated by scripts/generate_entity_models.py from
+canonical/src/canonical/entities/*.json - do not edit by hand.
+
+Models are strict (no type coercion). Parse raw JSON with
+``Model.model_validate_json(data)`` or ``canonical_schemas.get_type_adapter(...)``
+so that JSON strings become ``datetime``/``date`` values in a single pass;
+date-times must carry a UTC offset, as RFC 3339 requires.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Annotated, Any, Callable, Literal
+
+from pydantic import AwareDatetime, BaseModel, BeforeValidator, ConfigDict, Field
+
+# Default of optional, non-nullable fields: an absent field reads as None, but
+# the annotation stays non-optional so an explicit null is rejected
+_ABSENT: Any = None
+
+
+def _is_none(value: Any) -> bool:
+    """Leave absent optional fields out of ``model_dump()`` output."""
+    return value is None
+
+
+def _parse_format(pattern: re.Pattern[str], fmt: str, parse: type[date]) -> Callable[[Any], Any]:
+    """Parse a string that matches ``pattern``; reject any other string."""
+
+    def check(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if pattern.match(value) is None:
+            raise ValueError(f"not a valid '{fmt}' string")
+        # fromisoformat() only takes an upper-case "T" and "Z"
+        return parse.fromisoformat(value.upper())
+
+    return check
+
+
+# String formats, checked against the patterns canonical.validator uses so
+# that a model accepts the same strings as the JSON schema (on its own,
+# Pydantic also reads digit strings as Unix timestamps). Strings are parsed
+# here, as strict mode only parses them in JSON input. A string that matches
+# but names no real moment (February 30, a ":60" leap second) still fails.
+'''
+
+
+def _pattern(name: str, pattern: str) -> list[str]:
+    """Render ``name = re.compile(pattern)``, wrapped to fit the line length."""
+    line = f'{name} = re.compile(r"{pattern}", re.ASCII)'
+    if len(line) <= LINE_LENGTH and '"' not in pattern:
+        return [line]
+    # Implicit raw string concatenation, broken after a group or character class
+    width = LINE_LENGTH - 8
+    chunks = []
+    while len(pattern) > width:
+        end = max(pattern.rfind(")", 0, width), pattern.rfind("]", 0, width)) + 1
+        chunks.append(pattern[: end or width])
+        pattern = pattern[end or width :]
+    chunks.append(pattern)
+    lines = [f"{name} = re.compile("]
+    lines.extend(f'    r"{chunk}"' for chunk in chunks)
+    lines[-1] += ","
+    return [*lines, "    re.ASCII,", ")"]
+
+
+def _format_types() -> str:
+    """Source of the pattern constants and format annotations of the header."""
+    lines = []
+    for fmt, (_, _, constant, _) in _FORMATS.items():
+        lines.extend(_pattern(constant, _FORMAT_PATTERNS[fmt]))
+    lines.append("")
+    for fmt, (annotation, python_type, constant, parser) in _FORMATS.items():
+        arguments = f'{python_type}, BeforeValidator(_parse_format({constant}, "{fmt}", {parser}))'
+        line = f"{annotation} = Annotated[{arguments}]"
+        if len(line) <= LINE_LENGTH:
+            lines.append(line)
+        else:
+            lines.extend([f"{annotation} = Annotated[", f"    {arguments}", "]"])
+    return "\n".join(lines) + "\n"
+
+
+def _types(schema: dict[str, Any]) -> list[str]:
+    """JSON Schema ``type`` as a list (``"string"`` -> ``["string"]``)."""
+    kind = schema.get("type")
+    if kind is None:
+        return []
+    return list(kind) if isinstance(kind, list) else [kind]
+
+
+def nullable(schema: dict[str, Any]) -> bool:
+    """True if the property schema accepts JSON ``null``."""
+    return "null" in _types(schema) or None in schema.get("enum", ())
+
+
+def pascal_case(name: str) -> str:
+    """``client_link`` -> ``ClientLink``."""
+    return "".join(part[:1].upper() + part[1:] for part in name.replace("-", "_").split("_"))
+
+
+def model_name(entity: str, version: str) -> str:
+    """Model name for an entity version: ``Client`` for v1, ``ClientV2`` for v2."""
+    name = pascal_case(entity)
+    return name if version == "v1" else f"{name}{version.upper()}"
+
+
+def _string(text: str, indent: int, prefix: str = "", suffix: str = ",") -> list[str]:
+    """Render ``text`` as a string literal after ``prefix``, wrapped to fit the line length."""
+    pad = " " * indent
+    line = f"{pad}{prefix}{json.dumps(text)}{suffix}"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    # Implicit string concatenation, broken at spaces
+    width = LINE_LENGTH - indent - 8
+    chunks, current = [], ""
+    for word in text.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if current and len(json.dumps(candidate)) > width:
+            chunks.append(current + " ")
+            current = word
+        else:
+            current = candidate
+    chunks.append(current)
+    lines = [f"{pad}{prefix}("]
+    lines.extend(f"{pad}    {json.dumps(chunk)}" for chunk in chunks)
+    lines.append(f"{pad}){suffix}")
+    return lines
+
+
+def _docstring(text: str, indent: int) -> list[str]:
+    """Render a docstring, wrapped at word boundaries to fit the line length."""
+    pad = " " * indent
+    text = text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+    if len(pad) + len(text) + 6 <= LINE_LENGTH:
+        return [f'{pad}"""{text}"""']
+    lines, current = [], f'{pad}"""'
+    for word in text.split(" "):
+        if len(current) + 1 + len(word) > LINE_LENGTH and current.strip() != '"""':
+            lines.append(current)
+            current = f"{pad}{word}"
+        else:
+            current = f"{current}{word}" if current.endswith('"""') else f"{current} {word}"
+    if not lines:
+        # Only the closing quotes overflowed: keep them on the line, as black does
+        return [f'{current}"""']
+    lines.extend([current, f'{pad}"""'])
+    return lines
+
+
+class _Generator:
+    """Turns entity schemas into module-level blocks, dependencies first."""
+
+    def __init__(self) -> None:
+        self.blocks: list[list[str]] = []
+        self.names: set[str] = set()
+
+    def _unique(self, name: str) -> str:
+        candidate, n = name, 2
+        while candidate in self.names:
+            candidate, n = f"{name}{n}", n + 1
+        self.names.add(candidate)
+        return candidate
+
+    def annotation(self, schema: dict[str, Any], context: str, where: str) -> str:
+        """Python type for the property schema at ``where``; nested objects become models."""
+        if "enum" in schema:
+            values = [json.dumps(value) for value in schema["enum"] if value is not None]
+            literal = f"Literal[{', '.join(values)}]"
+            if len(literal) <= 50:
+                return literal
+            # Long enums become a named alias, one value per line
+            alias = self._unique(context)
+            self.blocks.append([f"{alias} = Literal[", *(f"    {v}," for v in values), "]"])
+            return alias
+        types = [t for t in _types(schema) if t != "null"]
+        kind = types[0] if len(types) == 1 else None
+        if kind == "object":
+            if schema.get("properties"):
+                doc = schema.get("description") or f"Object in {where}."
+                return self.model(schema, context, doc=doc)
+            return "dict[str, Any]"
+        if kind == "array":
+            items = schema.get("items")
+            if not items:
+                return "list[Any]"
+            return f"list[{self.annotation(items, f'{context}Item', f'{where} items')}]"
+        if kind == "string" and schema.get("format") in _FORMATS:
+            return _FORMATS[schema["format"]][0]
+        if kind in _SCALARS:
+            return _SCALARS[kind]
+        return "Any"
+
+    def model(self, schema: dict[str, Any], name: str, doc: str | None = None) -> str:
+        """Emit a model class for an object schema and return its name."""
+        name = self._unique(name)
+        required = set(schema.get("required", ()))
+        fields: list[str] = []
+        for prop, prop_schema in schema.get("properties", {}).items():
+            fields.extend(self.field(prop, prop_schema, prop in required, name))
+
+        extra = "forbid" if schema.get("additionalProperties") is False else "allow"
+        description = doc or schema.get("description") or schema.get("title") or name
+        lines = [f"class {name}(BaseModel):", *_docstring(description, 4), ""]
+        lines.append(f'    model_config = ConfigDict(strict=True, extra="{extra}")')
+        if fields:
+            lines.append("")
+            lines.extend(fields)
+        self.blocks.append(lines)
+        return name
+
+    def field(self, prop: str, schema: dict[str, Any], required: bool, owner: str) -> list[str]:
+        """Source lines for one model field."""
+        attribute = prop
+        if not prop.isidentifier() or keyword.iskeyword(prop) or prop in _RESERVED:
+            attribute = "".join(c if c.isalnum() else "_" for c in prop).lstrip("_") + "_"
+            if attribute[0].isdigit():
+                attribute = f"field_{attribute}"
+
+        annotation = self.annotation(schema, f"{owner}{pascal_case(prop)}", f"``{owner}.{prop}``")
+        if nullable(schema) and annotation != "Any":
+            annotation = f"{annotation} | None"
+        arguments: list[str] = []
+        if attribute != prop:
+            arguments.append(f"alias={json.dumps(prop)}")
+        for schema_keyword, argument in _CONSTRAINTS.items():
+            if schema_keyword in schema:
+                arguments.append(f"{argument}={schema[schema_keyword]!r}")
+        if "default" in schema:
+            default = repr(schema["default"])
+        elif required:
+            default = "..."
+        elif nullable(schema):
+            default = "None"
+        else:
+            default = "_ABSENT"
+            arguments.append("exclude_if=_is_none")
+        description = schema.get("description")
+
+        if not arguments and not description:
+            if default == "...":
+                return [f"    {attribute}: {annotation}"]
+            return [f"    {attribute}: {annotation} = {default}"]
+
+        call = [default, *arguments]
+        if description:
+            call.append(f"description={json.dumps(description)}")
+        one_line = f"    {attribute}: {annotation} = Field({', '.join(call)})"
+        if len(one_line) <= LINE_LENGTH:
+            return [one_line]
+
+        lines = [f"    {attribute}: {annotation} = Field("]
+        lines.extend(f"        {value}," for value in [default, *arguments])
+        if description:
+            lines.extend(_string(description, 8, prefix="description="))
+        lines.append("    )")
+        return lines
+
+
+def _entity_files(entities_dir: Path) -> list[tuple[str, str, Path]]:
+    files = []
+    for path in sorted(entities_dir.glob("*.json")):
+        parts = path.name.split(".")
+        if len(parts) == 3:
+            files.append((parts[0], parts[1], path))
+    return files
+
+
+def generate(entities_dir: Path = ENTITIES_DIR) -> dict[str, str]:
+    """
+    Generate the model modules from the entity schemas.
+
+    Args:
+        entities_dir: Directory holding ``<entity>.<version>.json`` schemas
+
+    Returns:
+        File name -> source for ``_entity_models.py`` and ``_entity_model_names.py``
+    """
+    generator = _Generator()
+    entries: list[tuple[str, str, str]] = []
+    for entity, version, path in _entity_files(entities_dir):
+        with open(path, "r") as f:
+            schema = json.load(f)
+        doc = f"Canonical {entity} entity ({version}), from entities/{path.name}."
+        name = generator.model(schema, model_name(entity, version), doc=doc)
+        entries.append((name, entity, version))
+
+    models = [_HEADER, _format_types()]
+    for lines in generator.blocks:
+        models.append("\n\n" + "\n".join(lines) + "\n")
+    models.append("\n\n")
+    models.append("# (entity, version) -> model\n")
+    models.append("ENTITY_MODELS: dict[tuple[str, str], type[BaseModel]] = {\n")
+    models.extend(f'    ("{entity}", "{version}"): {name},\n' for name, entity, version in entries)
+    models.append("}\n")
+    models.append("\n__all__ = [\n")
+    models.extend(f'    "{name}",\n' for name, _, _ in entries)
+    models.append('    "ENTITY_MODELS",\n]\n')
+
+    names = [
+        '"""Names of the generated entity models (see _entity_models).\n\n'
+        "Generated by scripts/generate_entity_models.py - do not edit by hand.\n"
+        '"""\n\n'
+        "# Model name -> (entity, version)\n"
+        "ENTITY_MODEL_NAMES = {\n"
+    ]
+    names.extend(f'    "{name}": ("{entity}", "{version}"),\n' for name, entity, version in entries)
+    names.append("}\n")
+    return {MODELS_FILE: "".join(models), NAMES_FILE: "".join(names)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if the generated modules are out of date"
+    )
+    parser.add_argument(
+        "--entities-dir", type=Path, default=ENTITIES_DIR, help="Entity JSON schema directory"
+    )
+    parser.add_argument(
+        "--output-dir", type=Path, default=OUTPUT_DIR, help="Where to write the modules"
+    )
+    args = parser.parse_args(argv)
+
+    stale = []
+    for filename, source in generate(args.entities_dir).items():
+        target = args.output_dir / filename
+        current = target.read_text() if target.exists() else None
+        if current == source:
+            continue
+        if args.check:
+            stale.append(filename)
+        else:
+            target.write_text(source)
+            print(f"Wrote {target}")
+
+    if stale:
+        print(
+            f"Out of date: {', '.join(stale)}. Run: python scripts/generate_entity_models.py",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())